@@ -1,4256 +1,8193 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, font
-from enum import Enum
-from datetime import datetime
-import pickle
-import os
-import re
-import random
-import uuid
-
-# =================================================================
-# ENUM CLASSES
-# =================================================================
-
-# This Enum defines types of payment methods users can choose from
-class PaymentType(Enum):
-    CREDIT_CARD = "Credit Card" # Paying with a credit card
-    DIGITAL = "Digital" # Paying using digital methods like PayPal
-
-# This Enum defines the result of a payment transaction
-class PaymentTransactionStatus(Enum):
-    SUCCESSFUL = "Successful" # Payment was successful
-    FAILED = "Failed" # Payment failed
-    PENDING = "Pending" # Payment is still processing
-
-# This Enum defines the current status of a user's account
-class AccountStatus(Enum):
-    ACTIVE = "Active" # Account is active and usable
-    INACTIVE = "Inactive" # Account exists but is not currently in use
-    SUSPENDED = "Suspended" # Account has been temporarily blocked
-
-# This Enum defines the status of a booking
-class BookingStatus(Enum):
-    PENDING = "Pending" # Booking request is waiting for confirmation
-    CONFIRMED = "Confirmed" # Booking is confirmed
-    CANCELLED = "Cancelled" # Booking has been cancelled
-
-# This Enum defines the types of credit cards accepted
-class CardType(Enum):
-    VISA = "Visa"
-    MASTERCARD = "MasterCard"
-    AMEX = "Amex"
-
-# =================================================================
-# FILE OPERATIONS
-# =================================================================
-
-# Dictionary to store file paths for different data types
-DATA_FILES = {
-    'users': 'users.pkl',
-    'customers': 'customers.pkl',
-    'admins': 'admins.pkl',
-    'events': 'events.pkl',
-    'bookings': 'bookings.pkl',
-    'tickets': 'tickets.pkl',
-    'payments': 'payments.pkl',
-    'discounts': 'discounts.pkl'
-}
-
-# Function to save data to a pickle file
-def save_data(data, file_key):
-    # Create a data directory if it does not exist
-    if not os.path.exists('data'):
-        os.makedirs('data')
-    
-    # Save the data to the corresponding file
-    filepath = os.path.join('data', DATA_FILES[file_key])
-    with open(filepath, 'wb') as file:
-        pickle.dump(data, file)
-
-# Function to load data from a pickle file
-def load_data(file_key):
-    filepath = os.path.join('data', DATA_FILES[file_key])
-    
-    # If the file exists, load and return the data
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'rb') as file:
-                return pickle.load(file)
-        except Exception as e:
-            print("Error loading data: " + str(e))
-            return []
-    # If the file does not exist return an empty list
-    return []
-
-# =================================================================
-# CORE CLASSES IMPLEMENTATION
-# =================================================================
-
-# Base class for any user in the system
-class User:
-    def __init__(self, user_name, user_id, user_password, user_email, registration_date):
-        self._user_name = user_name # Name of the user
-        self._user_id = user_id # Unique ID for the user
-        self._user_password = user_password # User password should be encrypted
-        self._user_email = user_email # Email address of the user
-        self._registration_date = registration_date # Date user registered
-    
-    # Show user information
-    def display_user_info(self):
-        return "User: " + self._user_name + ", ID: " + str(self._user_id) + ", Email: " + self._user_email + ", Registered: " + str(self._registration_date)
-    
-    # Method to simulate a user requesting a special service
-    def request_special_service(self):
-        print(self._user_name + " requested a special service.")
-    
-    # Method to simulate user giving feedback
-    def provide_feedback(self, feedback):
-        print(self._user_name + " provided feedback: " + feedback)
-    
-    # Getters and setters for user attributes
-    def get_user_name(self): return self._user_name
-    def set_user_name(self, user_name): self._user_name = user_name
-    
-    def get_user_id(self): return self._user_id
-    def set_user_id(self, user_id): self._user_id = user_id
-    
-    def get_user_password(self): return self._user_password
-    def set_user_password(self, user_password): self._user_password = user_password
-    
-    def get_user_email(self): return self._user_email
-    def set_user_email(self, user_email): self._user_email = user_email
-    
-    def get_registration_date(self): return self._registration_date
-    def set_registration_date(self, registration_date): self._registration_date = registration_date
-
-# Represents a customer inherits from User
-class Customer(User):
-    def __init__(self, user_name, user_id, user_password, user_email, registration_date, customer_address, customer_phone, payment_info):
-        super().__init__(user_name, user_id, user_password, user_email, registration_date)
-        self._customer_address = customer_address # Customer home or billing address
-        self._customer_phone = customer_phone # Contact number
-        self._payment_info = payment_info # Information about payment methods
-    
-    # Show customer details
-    def display_customer_info(self):
-        return self.display_user_info() + ", Address: " + self._customer_address + ", Phone: " + str(self._customer_phone) + ", Payment Info: " + self._payment_info
-    
-    # Getters and setters
-    def get_customer_address(self): return self._customer_address
-    def set_customer_address(self, customer_address): self._customer_address = customer_address
-    
-    def get_customer_phone(self): return self._customer_phone
-    def set_customer_phone(self, customer_phone): self._customer_phone = customer_phone
-    
-    def get_payment_info(self): return self._payment_info
-    def set_payment_info(self, payment_info): self._payment_info = payment_info
-
-# Represents an admin user inherit from User
-class Admin(User):
-    def __init__(self, user_name, user_id, user_password, user_email, registration_date, admin_role, employee_id, account_status):
-        super().__init__(user_name, user_id, user_password, user_email, registration_date)
-        self._admin_role = admin_role # Role of the admin e.g Manager
-        self._employee_id = employee_id # ID number assigned to employee
-        self._account_status = account_status # Current status of the admin's account
-    
-    # Show admin details
-    def display_admin_info(self):
-        return self.display_user_info() + ", Role: " + self._admin_role + ", Employee ID: " + str(self._employee_id) + ", Account Status: " + self._account_status.value
-    
-    # Getters and setters
-    def get_admin_role(self): return self._admin_role
-    def set_admin_role(self, admin_role): self._admin_role = admin_role
-    
-    def get_employee_id(self): return self._employee_id
-    def set_employee_id(self, employee_id): self._employee_id = employee_id
-    
-    def get_account_status(self): return self._account_status
-    def set_account_status(self, account_status): self._account_status = account_status
-
-# Class that represents a general payment made by a user
-class Payment:
-    def __init__(self, booking_id, payment_id, payment_type, transaction_date, transaction_status, refund_id=None, refund_reason=""):
-        # Store all the payment details
-        self._booking_id = booking_id # ID of the booking this payment is for
-        self._payment_id = payment_id # Unique ID of the payment
-        self._payment_type = payment_type # Type of payment Digital or Credit Card
-        self._transaction_date = transaction_date # Date the payment was made
-        self._transaction_status = transaction_status # Status of the payment Success, Failed, etc
-        self._refund_id = refund_id # Optional refund ID if refunded
-        self._refund_reason = refund_reason # Reason for the refund if any
-    
-    # Show payment information in a readable format
-    def display_payment_info(self):
-        return "Payment ID: " + str(self._payment_id) + ", Booking ID: " + str(self._booking_id) + ", Type: " + self._payment_type.value + ", Date: " + str(self._transaction_date) + ", Status: " + self._transaction_status.value + ", Refund ID: " + str(self._refund_id) + ", Reason: " + self._refund_reason
-    
-    # Return the payment details as a dictionary key value pairs
-    def get_payment_details(self):
-        return {
-            "payment_id": self._payment_id,
-            "booking_id": self._booking_id,
-            "payment_type": self._payment_type,
-            "transaction_date": self._transaction_date,
-            "transaction_status": self._transaction_status,
-            "refund_id": self._refund_id,
-            "refund_reason": self._refund_reason,
-        }
-    
-    # Get and set methods for each private attribute
-    def get_payment_id(self): return self._payment_id
-    def set_payment_id(self, payment_id): self._payment_id = payment_id
-    
-    def get_booking_id(self): return self._booking_id
-    def set_booking_id(self, booking_id): self._booking_id = booking_id
-    
-    def get_payment_type(self): return self._payment_type
-    def set_payment_type(self, payment_type): self._payment_type = payment_type
-    
-    def get_transaction_date(self): return self._transaction_date
-    def set_transaction_date(self, transaction_date): self._transaction_date = transaction_date
-    
-    def get_transaction_status(self): return self._transaction_status
-    def set_transaction_status(self, transaction_status): self._transaction_status = transaction_status
-    
-    def get_refund_id(self): return self._refund_id
-    def set_refund_id(self, refund_id): self._refund_id = refund_id
-    
-    def get_refund_reason(self): return self._refund_reason
-    def set_refund_reason(self, refund_reason): self._refund_reason = refund_reason
-
-# Class for handling digital payments like PayPal, Apple Pay
-class DigitalPayment(Payment):
-    def __init__(self, booking_id, payment_id, transaction_id, account_identifier, authorization_code, transaction_date, transaction_status):
-        # Call the Payment class constructor and set digital specific values
-        super().__init__(booking_id, payment_id, PaymentType.DIGITAL, transaction_date, transaction_status)
-        self._transaction_id = transaction_id # ID from the payment processor like PayPal
-        self._account_identifier = account_identifier # Account email or username used for payment
-        self._authorization_code = authorization_code # Code confirming authorization
-    
-    # Show all details about the digital payment
-    def display_digital_payment_info(self):
-        return self.display_payment_info() + ", Transaction ID: " + str(self._transaction_id) + ", Account: " + self._account_identifier + ", Auth Code: " + self._authorization_code
-    
-    # Getters and setters for digital payment fields
-    def get_transaction_id(self): return self._transaction_id
-    def set_transaction_id(self, transaction_id): self._transaction_id = transaction_id
-    
-    def get_account_identifier(self): return self._account_identifier
-    def set_account_identifier(self, account_identifier): self._account_identifier = account_identifier
-    
-    def get_authorization_code(self): return self._authorization_code
-    def set_authorization_code(self, authorization_code): self._authorization_code = authorization_code
-
-# Class for credit card payments
-class CreditCard(Payment):
-    def __init__(self, booking_id, payment_id, card_number, expiry_date, card_type, transaction_date, transaction_status):
-        # Call the Payment constructor and set credit card specific fields
-        super().__init__(booking_id, payment_id, PaymentType.CREDIT_CARD, transaction_date, transaction_status)
-        self._card_number = card_number # Credit card number should be stored securely
-        self._expiry_date = expiry_date # Card expiration date
-        self._card_type = card_type # Visa, MasterCard, etc
-    
-    # Show all credit card payment details
-    def display_credit_card_info(self):
-        return self.display_payment_info() + ", Card Number: " + self._card_number + ", Expiry: " + self._expiry_date + ", Type: " + self._card_type.value
-    
-    # Getters and setters for credit card details
-    def get_card_number(self): return self._card_number
-    def set_card_number(self, card_number): self._card_number = card_number
-    
-    def get_expiry_date(self): return self._expiry_date
-    def set_expiry_date(self, expiry_date): self._expiry_date = expiry_date
-    
-    def get_card_type(self): return self._card_type
-    def set_card_type(self, card_type): self._card_type = card_type
-
-# Represents a booking for an event
-class Booking:
-    def __init__(self, user_id, event_id, booking_id, booking_date, number_of_tickets,
-                 total_price, booking_status):
-        # Initialize booking details
-        self._user_id = user_id # ID of the user making the booking
-        self._event_id = event_id # ID of the event
-        self._booking_id = booking_id # Unique ID for the booking
-        self._booking_date = booking_date # Date the booking was made
-        self._number_of_tickets = number_of_tickets # Number of tickets booked
-        self._total_price = total_price # Total price for the booking
-        self._booking_status = booking_status # Status of the booking e.g confirmed, cancelled
-        self._list_reservation = [] # List to hold reservations associated with the booking
-    
-    # Returns a formatted string of booking information
-    def display_booking_info(self):
-        return "Booking ID: " + str(self._booking_id) + ", User ID: " + str(self._user_id) + ", Event ID: " + str(self._event_id) + ", Date: " + str(self._booking_date) + ", Tickets: " + str(self._number_of_tickets) + ", Total Price: " + str(self._total_price) + ", Status: " + self._booking_status.value
-    
-    # Getter and setter methods for each attribute
-    def get_user_id(self): return self._user_id
-    def set_user_id(self, user_id): self._user_id = user_id
-    
-    def get_event_id(self): return self._event_id
-    def set_event_id(self, event_id): self._event_id = event_id
-    
-    def get_booking_id(self): return self._booking_id
-    def set_booking_id(self, booking_id): self._booking_id = booking_id
-    
-    def get_booking_date(self): return self._booking_date
-    def set_booking_date(self, booking_date): self._booking_date = booking_date
-    
-    def get_number_of_tickets(self): return self._number_of_tickets
-    def set_number_of_tickets(self, number_of_tickets): self._number_of_tickets = number_of_tickets
-    
-    def get_total_price(self): return self._total_price
-    def set_total_price(self, total_price): self._total_price = total_price
-    
-    def get_booking_status(self): return self._booking_status
-    def set_booking_status(self, booking_status): self._booking_status = booking_status
-    
-    def get_list_reservation(self): return self._list_reservation
-    def set_list_reservation(self, list_reservation): self._list_reservation = list_reservation
-
-# Represents a discount applied to a booking or ticket
-class Discount:
-    def __init__(self, discount_id, discount_percentage, discount_amount, discount_code,
-                 max_discount_amount):
-        self._discount_id = discount_id # Unique ID for the discount
-        self._discount_percentage = discount_percentage # Percentage discount
-        self._discount_amount = discount_amount # Flat amount discount
-        self._discount_code = discount_code # Code used to apply the discount
-        self._max_discount_amount = max_discount_amount # Max discount value allowed
-    
-    # Display discount information
-    def display_discount_info(self):
-        return "Discount ID: " + str(self._discount_id) + ", Percentage: " + str(self._discount_percentage) + "%, Amount: $" + str(self._discount_amount) + ", Code: " + self._discount_code + ", Max: $" + str(self._max_discount_amount)
-    
-    # Apply the discount to a price
-    def apply_discount(self, original_price):
-        # Calculate discount
-        percentage_discount = original_price * (self._discount_percentage / 100)
-        total_discount = percentage_discount + self._discount_amount
-        
-        # Ensure discount does not exceed maximum allowed
-        if total_discount > self._max_discount_amount:
-            total_discount = self._max_discount_amount
-        
-        # Return the discounted price
-        return original_price - total_discount
-    
-    # Getter and setter methods
-    def get_discount_id(self): return self._discount_id
-    def set_discount_id(self, discount_id): self._discount_id = discount_id
-    
-    def get_discount_percentage(self): return self._discount_percentage
-    def set_discount_percentage(self, discount_percentage): self._discount_percentage = discount_percentage
-    
-    def get_discount_amount(self): return self._discount_amount
-    def set_discount_amount(self, discount_amount): self._discount_amount = discount_amount
-    
-    def get_discount_code(self): return self._discount_code
-    def set_discount_code(self, discount_code): self._discount_code = discount_code
-    
-    def get_max_discount_amount(self): return self._max_discount_amount
-    def set_max_discount_amount(self, max_discount_amount): self._max_discount_amount = max_discount_amount
-
-# Represents a basic ticket for an event
-class Ticket:
-    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id=None):
-        self._type_id = type_id # Type of ticket could be general, VIP, etc
-        self._booking_id = booking_id # Associated booking ID
-        self._ticket_id = ticket_id # Unique ticket ID
-        self._seat_number = seat_number # Seat assigned to the ticket
-        self._ticket_price = ticket_price # Price of the ticket
-        self._check_in_time = check_in_time # Check-in time for the ticket holder
-        self._event_id = event_id # ID of the event this ticket belongs to
-    
-    # Returns formatted ticket info
-    def display_ticket_info(self):
-        return "Ticket ID: " + str(self._ticket_id) + ", Booking ID: " + str(self._booking_id) + ", Seat: " + str(self._seat_number) + ", Price: " + str(self._ticket_price) + ", Check-in Time: " + str(self._check_in_time) + ", Event ID: " + str(self._event_id)
-    
-    # Getter and setter methods
-    def get_type_id(self): return self._type_id
-    def set_type_id(self, type_id): self._type_id = type_id
-    
-    def get_booking_id(self): return self._booking_id
-    def set_booking_id(self, booking_id): self._booking_id = booking_id
-    
-    def get_ticket_id(self): return self._ticket_id
-    def set_ticket_id(self, ticket_id): self._ticket_id = ticket_id
-    
-    def get_seat_number(self): return self._seat_number
-    def set_seat_number(self, seat_number): self._seat_number = seat_number
-    
-    def get_ticket_price(self): return self._ticket_price
-    def set_ticket_price(self, ticket_price): self._ticket_price = ticket_price
-    
-    def get_check_in_time(self): return self._check_in_time
-    def set_check_in_time(self, check_in_time): self._check_in_time = check_in_time
-    
-    def get_event_id(self): return self._event_id
-    def set_event_id(self, event_id): self._event_id = event_id
-
-# Represents a group discounted ticket inherits from Ticket
-class GroupDiscount(Ticket):
-    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time,
-                 group_id, group_count, group_gifts, event_id):
-        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
-        self._group_id = group_id # ID of the group
-        self._group_count = group_count # Number of people in the group
-        self._group_gifts = group_gifts # Gifts provided to the group
-    
-    # Displays ticket + group discount info
-    def display_group_discount_info(self):
-        return self.display_ticket_info() + ", Group ID: " + str(self._group_id) + ", Group Count: " + str(self._group_count) + ", Group Gifts: " + self._group_gifts
-    
-    # Getter/setter for additional attribute
-    def get_group_id(self): return self._group_id
-    def set_group_id(self, group_id): self._group_id = group_id
-    
-    def get_group_count(self): return self._group_count
-    def set_group_count(self, group_count): self._group_count = group_count
-    
-    def get_group_gifts(self): return self._group_gifts
-    def set_group_gifts(self, group_gifts): self._group_gifts = group_gifts
-
-# Represents a season membership ticket inherit from Ticket
-class SeasonMembership(Ticket):
-    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, member_id, member_name, included_gifts, event_id):
-        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
-        self._member_id = member_id # Unique member ID
-        self._member_name = member_name # Member full name
-        self._included_gifts = included_gifts # Gifts included in membership
-    
-    def display_season_membership_info(self):
-        return self.display_ticket_info() + ", Member ID: " + str(self._member_id) + ", Name: " + self._member_name + ", Included Gifts: " + self._included_gifts
-    
-    def get_member_id(self): return self._member_id
-    def set_member_id(self, member_id): self._member_id = member_id
-    
-    def get_member_name(self): return self._member_name
-    def set_member_name(self, member_name): self._member_name = member_name
-    
-    def get_included_gifts(self): return self._included_gifts
-    def set_included_gifts(self, included_gifts): self._included_gifts = included_gifts
-
-# Represents a single-race access pass inherits from Ticket
-class SingleRacePass(Ticket):
-    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time,
-                 single_race_pass_id, pass_expiry, pass_benefits, event_id):
-        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
-        self._single_race_pass_id = single_race_pass_id # Unique ID for the pass
-        self._pass_expiry = pass_expiry # Expiration date/time of the pass
-        self._pass_benefits = pass_benefits # Benefits included with the pass
-    
-    def display_single_race_pass_info(self):
-        return self.display_ticket_info() + ", Pass ID: " + str(self._single_race_pass_id) + ", Expiry: " + self._pass_expiry + ", Benefits: " + self._pass_benefits
-    
-    # Getter/setters
-    def get_single_race_pass_id(self): return self._single_race_pass_id
-    def set_single_race_pass_id(self, single_race_pass_id): self._single_race_pass_id = single_race_pass_id
-    
-    def get_pass_expiry(self): return self._pass_expiry
-    def set_pass_expiry(self, pass_expiry): self._pass_expiry = pass_expiry
-    
-    def get_pass_benefits(self): return self._pass_benefits
-    def set_pass_benefits(self, pass_benefits): self._pass_benefits = pass_benefits
-
-# Represents a weekend package ticket with added benefits inherits from Ticket
-class WeekendPackage(Ticket):
-    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time,
-                 package_id, package_type, package_benefits, event_id):
-        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
-        self._package_id = package_id # ID of the package
-        self._package_type = package_type # Type e.g deluxe, standard
-        self._package_benefits = package_benefits # List of benefits included
-    
-    def display_weekend_package_info(self):
-        return self.display_ticket_info() + ", Package ID: " + str(self._package_id) + ", Type: " + self._package_type + ", Benefits: " + self._package_benefits
-    
-    def get_package_id(self): return self._package_id
-    def set_package_id(self, package_id): self._package_id = package_id
-    
-    def get_package_type(self): return self._package_type
-    def set_package_type(self, package_type): self._package_type = package_type
-    
-    def get_package_benefits(self): return self._package_benefits
-    def set_package_benefits(self, package_benefits): self._package_benefits = package_benefits
-
-# Represents an event such as a Grand Prix race
-class Event:
-    # Initializes a new Event with details like name, ID, date, location, and capacity
-    def __init__(self, event_name, event_id, event_date, event_location, event_capacity):
-        self._event_name = event_name # Name of the event
-        self._event_id = event_id # Unique identifier for the event
-        self._event_date = event_date # Date of the event
-        self._event_location = event_location # Location of the event
-        self._event_capacity = event_capacity # Total number of tickets available
-        self._list_user_tickets = [] # List to store Ticket objects for this event
-        self._next_ticket_id = 1 # Simple way to generate unique ticket IDs for this event
-    
-    # Method to create a new ticket for this event
-    def create_ticket(self, type_id, booking_id, seat_number, ticket_price, check_in_time):
-        ticket_id = "TKT-" + str(self._event_id) + "-" + str(self._next_ticket_id)
-        new_ticket = Ticket(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, self._event_id)
-        self._list_user_tickets.append(new_ticket)
-        self._next_ticket_id += 1
-        return new_ticket
-    
-    # Returns a formatted string with the event's key information
-    def display_event_info(self):
-        return "Event: " + self._event_name + ", ID: " + str(self._event_id) + ", Date: " + str(self._event_date) + ", Location: " + self._event_location + ", Capacity: " + str(self._event_capacity)
-    
-    # Calculates and returns how many tickets are still available for the event
-    def get_remaining_capacity(self):
-        return self._event_capacity - len(self._list_user_tickets)
-    
-    # Returns the event's start time (simplified as the event date)
-    def get_start_time(self): return self._event_date
-    
-    # Returns the event's end time (simplified as the event date)
-    def get_end_time(self): return self._event_date
-    
-    # Getter and setter for event name
-    def get_event_name(self): return self._event_name
-    def set_event_name(self, event_name): self._event_name = event_name
-    
-    # Getter and setter for event ID
-    def get_event_id(self): return self._event_id
-    def set_event_id(self, event_id): self._event_id = event_id
-    
-    # Getter and setter for event date
-    def get_event_date(self): return self._event_date
-    def set_event_date(self, event_date): self._event_date = event_date
-    
-    # Getter and setter for event location
-    def get_event_location(self): return self._event_location
-    def set_event_location(self, event_location): self._event_location = event_location
-    
-    # Getter and setter for event capacity
-    def get_event_capacity(self): return self._event_capacity
-    def set_event_capacity(self, event_capacity): self._event_capacity = event_capacity
-    
-    # Getter for the list of user tickets
-    def get_tickets(self): return self._list_user_tickets
-    
-    # Setter for the list of user tickets
-    def set_tickets(self, tickets): self._list_user_tickets = tickets
-
-# =================================================================
-# DATA MANAGEMENT CLASS
-# =================================================================
-
-class DataManager:
-    def __init__(self):
-        # Initialize or load data from pickle files
-        self.users = load_data('users')
-        self.customers = load_data('customers')
-        self.admins = load_data('admins')
-        self.events = load_data('events')
-        self.bookings = load_data('bookings')
-        self.tickets = load_data('tickets')
-        self.payments = load_data('payments')
-        self.discounts = load_data('discounts')
-        
-        # Create sample data if nothing exists
-        if not self.events:
-            self._create_sample_data()
-    
-    # Create sample data for testing
-    def _create_sample_data(self):
-        # Create sample events
-        event1 = Event("Grand Prix - Abu Dhabi", 201, datetime(2024, 11, 26), "Abu Dhabi Circuit", 1000)
-        event2 = Event("Grand Prix - Silverstone", 202, datetime(2024, 12, 15), "Silverstone Circuit", 1200)
-        self.events = [event1, event2]
-        save_data(self.events, 'events')
-        
-        # Create sample discounts
-        discount1 = Discount(1, 10, 0, "EARLY10", 100)  # 10% discount up to $100
-        discount2 = Discount(2, 0, 15, "FLAT15", 15)    # Flat $15 discount
-        self.discounts = [discount1, discount2]
-        save_data(self.discounts, 'discounts')
-        
-        # Create admin user
-        admin = Admin("Admin", 1, "111222333444555", "admin@zu.ac.ae", datetime.now(), "System Admin", 1001, AccountStatus.ACTIVE)
-        self.admins = [admin]
-        save_data(self.admins, 'admins')
-    
-    # User related methods
-    def add_customer(self, customer):
-        self.customers.append(customer)
-        save_data(self.customers, 'customers')
-    
-    def add_admin(self, admin):
-        self.admins.append(admin)
-        save_data(self.admins, 'admins')
-    
-    def get_customer_by_id(self, customer_id):
-        for customer in self.customers:
-            if customer.get_user_id() == customer_id:
-                return customer
-        return None
-    
-    def get_admin_by_id(self, admin_id):
-        for admin in self.admins:
-            if admin.get_user_id() == admin_id:
-                return admin
-        return None
-    
-    def get_customer_by_email(self, email):
-        for customer in self.customers:
-            if customer.get_user_email() == email:
-                return customer
-        return None
-    
-    def get_admin_by_email(self, email):
-        for admin in self.admins:
-            if admin.get_user_email() == email:
-                return admin
-        return None
-    
-    def authenticate_user(self, email, password, is_admin=False):
-        if is_admin:
-            admin = self.get_admin_by_email(email)
-            if admin and admin.get_user_password() == password:
-                return admin
-        else:
-            customer = self.get_customer_by_email(email)
-            if customer and customer.get_user_password() == password:
-                return customer
-        return None
-    
-    def update_customer(self, customer):
-        for i, c in enumerate(self.customers):
-            if c.get_user_id() == customer.get_user_id():
-                self.customers[i] = customer
-                save_data(self.customers, 'customers')
-                return True
-        return False
-    
-    def delete_customer(self, customer_id):
-        for i, customer in enumerate(self.customers):
-            if customer.get_user_id() == customer_id:
-                del self.customers[i]
-                save_data(self.customers, 'customers')
-                return True
-        return False
-    
-    # Event related methods
-    def add_event(self, event):
-        self.events.append(event)
-        save_data(self.events, 'events')
-    
-    def get_event_by_id(self, event_id):
-        for event in self.events:
-            if event.get_event_id() == event_id:
-                return event
-        return None
-    
-    def update_event(self, event):
-        for i, e in enumerate(self.events):
-            if e.get_event_id() == event.get_event_id():
-                self.events[i] = event
-                save_data(self.events, 'events')
-                return True
-        return False
-    
-    def delete_event(self, event_id):
-        for i, event in enumerate(self.events):
-            if event.get_event_id() == event_id:
-                del self.events[i]
-                save_data(self.events, 'events')
-                return True
-        return False
-    
-    # Booking related methods
-    def add_booking(self, booking):
-        self.bookings.append(booking)
-        save_data(self.bookings, 'bookings')
-        return booking
-    
-    def get_booking_by_id(self, booking_id):
-        for booking in self.bookings:
-            if booking.get_booking_id() == booking_id:
-                return booking
-        return None
-    
-    def get_bookings_by_user_id(self, user_id):
-        return [booking for booking in self.bookings if booking.get_user_id() == user_id]
-    
-    def get_bookings_by_event_id(self, event_id):
-        return [booking for booking in self.bookings if booking.get_event_id() == event_id]
-    
-    def update_booking(self, booking):
-        for i, b in enumerate(self.bookings):
-            if b.get_booking_id() == booking.get_booking_id():
-                self.bookings[i] = booking
-                save_data(self.bookings, 'bookings')
-                return True
-        return False
-    
-    def delete_booking(self, booking_id):
-        for i, booking in enumerate(self.bookings):
-            if booking.get_booking_id() == booking_id:
-                del self.bookings[i]
-                save_data(self.bookings, 'bookings')
-                return True
-        return False
-    
-    # Ticket related methods
-    def add_ticket(self, ticket):
-        self.tickets.append(ticket)
-        save_data(self.tickets, 'tickets')
-        return ticket
-    
-    def get_ticket_by_id(self, ticket_id):
-        for ticket in self.tickets:
-            if ticket.get_ticket_id() == ticket_id:
-                return ticket
-        return None
-    
-    def get_tickets_by_booking_id(self, booking_id):
-        return [ticket for ticket in self.tickets if ticket.get_booking_id() == booking_id]
-    
-    def get_tickets_by_event_id(self, event_id):
-        return [ticket for ticket in self.tickets if ticket.get_event_id() == event_id]
-    
-    def update_ticket(self, ticket):
-        for i, t in enumerate(self.tickets):
-            if t.get_ticket_id() == ticket.get_ticket_id():
-                self.tickets[i] = ticket
-                save_data(self.tickets, 'tickets')
-                return True
-        return False
-    
-    def delete_ticket(self, ticket_id):
-        for i, ticket in enumerate(self.tickets):
-            if ticket.get_ticket_id() == ticket_id:
-                del self.tickets[i]
-                save_data(self.tickets, 'tickets')
-                return True
-        return False
-    
-    # Payment related methods
-    def add_payment(self, payment):
-        self.payments.append(payment)
-        save_data(self.payments, 'payments')
-        return payment
-    
-    def get_payment_by_id(self, payment_id):
-        for payment in self.payments:
-            if payment.get_payment_id() == payment_id:
-                return payment
-        return None
-    
-    def get_payments_by_booking_id(self, booking_id):
-        return [payment for payment in self.payments if payment.get_booking_id() == booking_id]
-    
-    def update_payment(self, payment):
-        for i, p in enumerate(self.payments):
-            if p.get_payment_id() == payment.get_payment_id():
-                self.payments[i] = payment
-                save_data(self.payments, 'payments')
-                return True
-        return False
-    
-    # Discount related methods
-    def add_discount(self, discount):
-        self.discounts.append(discount)
-        save_data(self.discounts, 'discounts')
-    
-    def get_discount_by_id(self, discount_id):
-        for discount in self.discounts:
-            if discount.get_discount_id() == discount_id:
-                return discount
-        return None
-    
-    def get_discount_by_code(self, discount_code):
-        for discount in self.discounts:
-            if discount.get_discount_code() == discount_code:
-                return discount
-        return None
-    
-    def update_discount(self, discount):
-        for i, d in enumerate(self.discounts):
-            if d.get_discount_id() == discount.get_discount_id():
-                self.discounts[i] = discount
-                save_data(self.discounts, 'discounts')
-                return True
-        return False
-    
-    def delete_discount(self, discount_id):
-        for i, discount in enumerate(self.discounts):
-            if discount.get_discount_id() == discount_id:
-                del self.discounts[i]
-                save_data(self.discounts, 'discounts')
-                return True
-        return False
-
-# =================================================================
-# GUI IMPLEMENTATION
-# =================================================================
-
-class GrandPrixApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Grand Prix Experience Ticket Booking System")
-        self.root.state('zoomed')  # Full screen
-        
-        # Set light blue color as background
-        self.bg_color = "#e6f2ff"
-        self.accent_color = "#4da6ff"
-        self.root.configure(bg=self.bg_color)
-        
-        # Initialize data manager
-        self.data_manager = DataManager()
-        
-        # Keep track of current user
-        self.current_user = None
-        self.is_admin = False
-        
-        # Create login frame
-        self.create_login_frame()
-    
-    # Create the login screen
-    def create_login_frame(self):
-        # Clear any existing frames
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Create a main frame for the login screen
-        self.login_frame = tk.Frame(self.root, bg=self.bg_color)
-        self.login_frame.pack(expand=True, fill='both', padx=20, pady=20)
-        
-        # Add title
-        title_font = font.Font(family='Helvetica', size=24, weight='bold')
-        title = tk.Label(self.login_frame, text="Grand Prix Experience", font=title_font, bg=self.bg_color)
-        title.pack(pady=(20, 10))
-        
-        subtitle_font = font.Font(family='Helvetica', size=14)
-        subtitle = tk.Label(self.login_frame, text="Ticket Booking System", font=subtitle_font, bg=self.bg_color)
-        subtitle.pack(pady=(0, 30))
-        
-        # Create login container
-        login_container = tk.Frame(self.login_frame, bg=self.bg_color, padx=20, pady=20, bd=1, relief=tk.SOLID)
-        login_container.pack(padx=300, pady=20)
-        
-        # Header
-        header_font = font.Font(family='Helvetica', size=16, weight='bold')
-        login_header = tk.Label(login_container, text="Login to Your Account", font=header_font, bg=self.bg_color)
-        login_header.pack(pady=(0, 20))
-        
-        # Email
-        email_frame = tk.Frame(login_container, bg=self.bg_color)
-        email_frame.pack(fill='x', pady=10)
-        
-        email_label = tk.Label(email_frame, text="Email:", width=15, anchor='w', bg=self.bg_color)
-        email_label.pack(side=tk.LEFT)
-        
-        self.email_entry = tk.Entry(email_frame, width=30)
-        self.email_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Password
-        password_frame = tk.Frame(login_container, bg=self.bg_color)
-        password_frame.pack(fill='x', pady=10)
-        
-        password_label = tk.Label(password_frame, text="Password:", width=15, anchor='w', bg=self.bg_color)
-        password_label.pack(side=tk.LEFT)
-        
-        self.password_entry = tk.Entry(password_frame, show="*", width=30)
-        self.password_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Admin checkbox
-        self.is_admin_var = tk.BooleanVar()
-        admin_check = tk.Checkbutton(login_container, text="Login as Admin", variable=self.is_admin_var, bg=self.bg_color)
-        admin_check.pack(pady=10)
-        
-        # Login button
-        login_button = tk.Button(login_container, text="Login", 
-                                command=self.handle_login,
-                                bg=self.accent_color, fg="white",
-                                width=20, height=2)
-        login_button.pack(pady=10)
-        
-        # Register new account button
-        register_button = tk.Button(login_container, text="Create New Account", 
-                                   command=self.show_registration,
-                                   bg="#ffffff", fg="black",
-                                   width=20, height=2)
-        register_button.pack(pady=10)
-    
-    # Handle login attempt
-    def handle_login(self):
-        email = self.email_entry.get()
-        password = self.password_entry.get()
-        is_admin = self.is_admin_var.get()
-        
-        user = self.data_manager.authenticate_user(email, password, is_admin)
-        
-        if user:
-            self.current_user = user
-            self.is_admin = is_admin
-            messagebox.showinfo("Login Successful", "Welcome " + user.get_user_name() + "!")
-            
-            if is_admin:
-                self.show_admin_dashboard()
-            else:
-                self.show_customer_dashboard()
-        else:
-            messagebox.showerror("Login Failed", "Invalid email or password")
-    
-    # Show registration screen
-    def show_registration(self):
-        # Clear login frame
-        self.login_frame.destroy()
-        
-        # Create registration frame
-        self.registration_frame = tk.Frame(self.root, bg=self.bg_color)
-        self.registration_frame.pack(expand=True, fill='both', padx=20, pady=20)
-        
-        # Add title
-        title_font = font.Font(family='Helvetica', size=24, weight='bold')
-        title = tk.Label(self.registration_frame, text="Create Your Account", font=title_font, bg=self.bg_color)
-        title.pack(pady=(20, 30))
-        
-        # Create registration form container
-        form_container = tk.Frame(self.registration_frame, bg=self.bg_color, padx=20, pady=20, bd=1, relief=tk.SOLID)
-        form_container.pack(padx=200, pady=20)
-        
-        # Name field
-        name_frame = tk.Frame(form_container, bg=self.bg_color)
-        name_frame.pack(fill='x', pady=10)
-        
-        name_label = tk.Label(name_frame, text="Full Name:", width=15, anchor='w', bg=self.bg_color)
-        name_label.pack(side=tk.LEFT)
-        
-        self.name_entry = tk.Entry(name_frame, width=40)
-        self.name_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Email field
-        email_frame = tk.Frame(form_container, bg=self.bg_color)
-        email_frame.pack(fill='x', pady=10)
-        
-        email_label = tk.Label(email_frame, text="Email:", width=15, anchor='w', bg=self.bg_color)
-        email_label.pack(side=tk.LEFT)
-        
-        self.reg_email_entry = tk.Entry(email_frame, width=40)
-        self.reg_email_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Password field
-        password_frame = tk.Frame(form_container, bg=self.bg_color)
-        password_frame.pack(fill='x', pady=10)
-        
-        password_label = tk.Label(password_frame, text="Password:", width=15, anchor='w', bg=self.bg_color)
-        password_label.pack(side=tk.LEFT)
-        
-        self.reg_password_entry = tk.Entry(password_frame, show="*", width=40)
-        self.reg_password_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Address field
-        address_frame = tk.Frame(form_container, bg=self.bg_color)
-        address_frame.pack(fill='x', pady=10)
-        
-        address_label = tk.Label(address_frame, text="Address:", width=15, anchor='w', bg=self.bg_color)
-        address_label.pack(side=tk.LEFT)
-        
-        self.address_entry = tk.Entry(address_frame, width=40)
-        self.address_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Phone field
-        phone_frame = tk.Frame(form_container, bg=self.bg_color)
-        phone_frame.pack(fill='x', pady=10)
-        
-        phone_label = tk.Label(phone_frame, text="Phone:", width=15, anchor='w', bg=self.bg_color)
-        phone_label.pack(side=tk.LEFT)
-        
-        self.phone_entry = tk.Entry(phone_frame, width=40)
-        self.phone_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Payment info field
-        payment_frame = tk.Frame(form_container, bg=self.bg_color)
-        payment_frame.pack(fill='x', pady=10)
-        
-        payment_label = tk.Label(payment_frame, text="Payment Info:", width=15, anchor='w', bg=self.bg_color)
-        payment_label.pack(side=tk.LEFT)
-        
-        self.payment_entry = tk.Entry(payment_frame, width=40)
-        self.payment_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Buttons
-        button_frame = tk.Frame(form_container, bg=self.bg_color)
-        button_frame.pack(fill='x', pady=20)
-        
-        # Register button
-        register_button = tk.Button(button_frame, text="Register", 
-                                   command=self.handle_registration,
-                                   bg=self.accent_color, fg="white",
-                                   width=15, height=2)
-        register_button.pack(side=tk.LEFT, padx=10)
-        
-        # Back button
-        back_button = tk.Button(button_frame, text="Back to Login", 
-                               command=self.create_login_frame,
-                               bg="#ffffff", fg="black", 
-                               width=15, height=2)
-        back_button.pack(side=tk.LEFT, padx=10)
-    
-    # Handle registration form submission
-    def handle_registration(self):
-        # Get form values
-        name = self.name_entry.get()
-        email = self.reg_email_entry.get()
-        password = self.reg_password_entry.get()
-        address = self.address_entry.get()
-        phone = self.phone_entry.get()
-        payment_info = self.payment_entry.get()
-        
-        # Validate inputs
-        if not name or not email or not password or not address or not phone:
-            messagebox.showerror("Registration Error", "All fields are required")
-            return
-        
-        # Check if email is already registered
-        if self.data_manager.get_customer_by_email(email) or self.data_manager.get_admin_by_email(email):
-            messagebox.showerror("Registration Error", "Email already registered")
-            return
-        
-        # Validate email format
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-            messagebox.showerror("Registration Error", "Invalid email format")
-            return
-        
-        # Create user ID
-        user_id = len(self.data_manager.customers) + 100  # Start IDs from 100
-        
-        # Create customer object
-        customer = Customer(
-            name, 
-            user_id, 
-            password, 
-            email, 
-            datetime.now(), 
-            address, 
-            phone, 
-            payment_info
-        )
-        
-        # Add customer to data manager
-        self.data_manager.add_customer(customer)
-        
-        messagebox.showinfo("Registration Successful", "Your account has been created. You can now login.")
-        
-        # Return to login screen
-        self.create_login_frame()
-    
-    # Show customer dashboard
-    def show_customer_dashboard(self):
-        # Clear any existing frames
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Create dashboard frame
-        self.dashboard_frame = tk.Frame(self.root, bg=self.bg_color)
-        self.dashboard_frame.pack(expand=True, fill='both')
-        
-        # Create sidebar and main content area
-        self.sidebar_frame = tk.Frame(self.dashboard_frame, bg="#d4e6ff", width=200)
-        self.sidebar_frame.pack(side=tk.LEFT, fill='y')
-        
-        # Make sure sidebar maintains its width
-        self.sidebar_frame.pack_propagate(False)
-        
-        # Main content area
-        self.content_frame = tk.Frame(self.dashboard_frame, bg=self.bg_color)
-        self.content_frame.pack(side=tk.RIGHT, expand=True, fill='both')
-        
-        # Add user info to sidebar
-        user_info_frame = tk.Frame(self.sidebar_frame, bg="#d4e6ff", pady=20)
-        user_info_frame.pack(fill='x')
-        
-        # User avatar (placeholder)
-        avatar_label = tk.Label(user_info_frame, text="👤", font=("Helvetica", 24), bg="#d4e6ff")
-        avatar_label.pack()
-        
-        # User name
-        name_label = tk.Label(user_info_frame, text=self.current_user.get_user_name(), font=("Helvetica", 12, "bold"), bg="#d4e6ff")
-        name_label.pack(pady=(5, 0))
-        
-        # User email
-        email_label = tk.Label(user_info_frame, text=self.current_user.get_user_email(), 
-                              font=("Helvetica", 10), bg="#d4e6ff")
-        email_label.pack()
-        
-        # Add separator
-        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
-        
-        # Navigation menu
-        menu_font = font.Font(family='Helvetica', size=11)
-        
-        # Dashboard button (selected by default)
-        dashboard_btn = tk.Button(self.sidebar_frame, text="Dashboard", font=menu_font,
-                               bg="#4da6ff", fg="white", bd=0, pady=8,
-                               command=lambda: self.show_customer_dashboard_content())
-        dashboard_btn.pack(fill='x', pady=2)
-        
-        # Events button
-        events_btn = tk.Button(self.sidebar_frame, text="Browse Events", font=menu_font,
-                            bg="#d4e6ff", fg="black", bd=0, pady=8,
-                            command=lambda: self.show_events_list())
-        events_btn.pack(fill='x', pady=2)
-        
-        # My Bookings button
-        bookings_btn = tk.Button(self.sidebar_frame, text="My Bookings", font=menu_font,
-                              bg="#d4e6ff", fg="black", bd=0, pady=8,
-                              command=lambda: self.show_my_bookings())
-        bookings_btn.pack(fill='x', pady=2)
-        
-        # Account button
-        account_btn = tk.Button(self.sidebar_frame, text="My Account", font=menu_font,
-                             bg="#d4e6ff", fg="black", bd=0, pady=8,
-                             command=lambda: self.show_account_settings())
-        account_btn.pack(fill='x', pady=2)
-        
-        # Add separator
-        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
-        
-        # Logout button at bottom of sidebar
-        logout_btn = tk.Button(self.sidebar_frame, text="Logout", font=menu_font,
-                            bg="#ff6666", fg="white", bd=0, pady=8,
-                            command=lambda: self.logout())
-        logout_btn.pack(fill='x', pady=2, side=tk.BOTTOM)
-        
-        # Show default dashboard content
-        self.show_customer_dashboard_content()
-    
-    # Show main dashboard content for customer
-    def show_customer_dashboard_content(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create welcome header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        welcome_label = tk.Label(header_frame, text="Welcome to Grand Prix Experience", 
-                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        welcome_label.pack()
-        
-        date_label = tk.Label(header_frame, text="Today: " + datetime.now().strftime("%B %d, %Y"), 
-                             font=("Helvetica", 10), bg=self.bg_color)
-        date_label.pack()
-        
-        # Create dashboard cards
-        cards_frame = tk.Frame(self.content_frame, bg=self.bg_color)
-        cards_frame.pack(fill='both', expand=True, padx=20, pady=20)
-        
-        # Configure grid
-        cards_frame.columnconfigure(0, weight=1)
-        cards_frame.columnconfigure(1, weight=1)
-        cards_frame.rowconfigure(0, weight=1)
-        cards_frame.rowconfigure(1, weight=1)
-        
-        # Card 1: Upcoming Events
-        card1 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        card1.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        
-        card1_title = tk.Label(card1, text="Upcoming Events", font=("Helvetica", 14, "bold"), bg="white")
-        card1_title.pack(anchor='w')
-        
-        ttk.Separator(card1, orient='horizontal').pack(fill='x', pady=5)
-        
-        # Get upcoming events (showing max 3)
-        upcoming_events = sorted(self.data_manager.events, key=lambda e: e.get_event_date())[:3]
-        
-        if upcoming_events:
-            for event in upcoming_events:
-                event_frame = tk.Frame(card1, bg="white", pady=5)
-                event_frame.pack(fill='x')
-                
-                event_name = tk.Label(event_frame, text=event.get_event_name(), font=("Helvetica", 11), bg="white")
-                event_name.pack(anchor='w')
-                
-                event_info = tk.Label(event_frame, text="Date: " + event.get_event_date().strftime("%B %d, %Y") + 
-                                     " • " + event.get_event_location(), font=("Helvetica", 9), bg="white", fg="gray")
-                event_info.pack(anchor='w')
-                
-                ttk.Separator(card1, orient='horizontal').pack(fill='x', pady=2)
-        else:
-            no_events = tk.Label(card1, text="No upcoming events", bg="white")
-            no_events.pack(pady=10)
-        
-        view_all_btn = tk.Button(card1, text="View All Events", bg=self.accent_color, fg="white",
-                              command=lambda: self.show_events_list())
-        view_all_btn.pack(pady=10)
-        
-        # Card 2: My Tickets
-        card2 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        card2.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        
-        card2_title = tk.Label(card2, text="My Tickets", font=("Helvetica", 14, "bold"), bg="white")
-        card2_title.pack(anchor='w')
-        
-        ttk.Separator(card2, orient='horizontal').pack(fill='x', pady=5)
-        
-        # Get user bookings
-        user_bookings = self.data_manager.get_bookings_by_user_id(self.current_user.get_user_id())
-        
-        if user_bookings:
-            ticket_count = sum(booking.get_number_of_tickets() for booking in user_bookings)
-            ticket_label = tk.Label(card2, text="You have " + str(ticket_count) + " tickets", 
-                                 font=("Helvetica", 12), bg="white")
-            ticket_label.pack(pady=10)
-            
-            # Show recent bookings
-            for i, booking in enumerate(sorted(user_bookings, key=lambda b: b.get_booking_date(), reverse=True)):
-                if i >= 2:  # Show only the 2 most recent bookings
-                    break
-                
-                event = self.data_manager.get_event_by_id(booking.get_event_id())
-                if event:
-                    booking_frame = tk.Frame(card2, bg="white", pady=5)
-                    booking_frame.pack(fill='x')
-                    
-                    booking_info = tk.Label(booking_frame, 
-                                          text=event.get_event_name() + " - " + str(booking.get_number_of_tickets()) + " tickets",
-                                          font=("Helvetica", 11), bg="white")
-                    booking_info.pack(anchor='w')
-                    
-                    booking_date = tk.Label(booking_frame, 
-                                          text="Booked on: " + booking.get_booking_date().strftime("%B %d, %Y"),
-                                          font=("Helvetica", 9), bg="white", fg="gray")
-                    booking_date.pack(anchor='w')
-                    
-                    ttk.Separator(card2, orient='horizontal').pack(fill='x', pady=2)
-        else:
-            no_tickets = tk.Label(card2, text="You don't have any tickets yet", bg="white")
-            no_tickets.pack(pady=10)
-        
-        view_tickets_btn = tk.Button(card2, text="View All Tickets", bg=self.accent_color, fg="white",
-                                 command=lambda: self.show_my_bookings())
-        view_tickets_btn.pack(pady=10)
-        
-        # Card 3: Quick Actions
-        card3 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        card3.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
-        
-        card3_title = tk.Label(card3, text="Quick Actions", font=("Helvetica", 14, "bold"), bg="white")
-        card3_title.pack(anchor='w')
-        
-        ttk.Separator(card3, orient='horizontal').pack(fill='x', pady=5)
-        
-        # Quick action buttons
-        book_ticket_btn = tk.Button(card3, text="Book a New Ticket", bg="#4caf50", fg="white", width=20,
-                                 command=lambda: self.show_events_list())
-        book_ticket_btn.pack(pady=5)
-        
-        view_bookings_btn = tk.Button(card3, text="View My Bookings", bg="#2196f3", fg="white", width=20,
-                                    command=lambda: self.show_my_bookings())
-        view_bookings_btn.pack(pady=5)
-        
-        update_profile_btn = tk.Button(card3, text="Update My Profile", bg="#ff9800", fg="white", width=20,
-                                     command=lambda: self.show_account_settings())
-        update_profile_btn.pack(pady=5)
-        
-        # Card 4: Information
-        card4 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        card4.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
-        
-        card4_title = tk.Label(card4, text="Information", font=("Helvetica", 14, "bold"), bg="white")
-        card4_title.pack(anchor='w')
-        
-        ttk.Separator(card4, orient='horizontal').pack(fill='x', pady=5)
-        
-        info_text = """
-        Welcome to the Grand Prix Experience Ticket Booking System!
-        
-        Here you can:
-        • Book tickets for upcoming Formula One events
-        • View and manage your bookings
-        • Update your account information
-        
-        Need help? Contact our support team at support@grandprix.com
-        """
-        
-        info_label = tk.Label(card4, text=info_text, bg="white", justify=tk.LEFT, wraplength=300)
-        info_label.pack(pady=10, fill='both', expand=True)
-    
-    # Show events list for booking
-    def show_events_list(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create events header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        events_label = tk.Label(header_frame, text="Upcoming Events", 
-                              font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        events_label.pack()
-        
-        subtitle_label = tk.Label(header_frame, text="Browse and book tickets for upcoming races", 
-                                font=("Helvetica", 10), bg=self.bg_color)
-        subtitle_label.pack()
-        
-        # Create scrollable events list
-        events_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        events_container.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Create canvas with scrollbar for events
-        canvas = tk.Canvas(events_container, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(events_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Get sorted events by date
-        sorted_events = sorted(self.data_manager.events, key=lambda e: e.get_event_date())
-        
-        if sorted_events:
-            for event in sorted_events:
-                # Create event card
-                event_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
-                event_card.pack(fill='x', padx=10, pady=10)
-                
-                # Event details
-                event_name = tk.Label(event_card, text=event.get_event_name(), 
-                                    font=("Helvetica", 14, "bold"), bg="white")
-                event_name.grid(row=0, column=0, sticky='w', pady=(0, 5))
-                
-                event_date = tk.Label(event_card, text="Date: " + event.get_event_date().strftime("%B %d, %Y"), 
-                                    bg="white")
-                event_date.grid(row=1, column=0, sticky='w')
-                
-                event_location = tk.Label(event_card, text="Location: " + event.get_event_location(), 
-                                        bg="white")
-                event_location.grid(row=2, column=0, sticky='w')
-                
-                event_capacity = tk.Label(event_card, 
-                                        text="Available Tickets: " + str(event.get_remaining_capacity()) + 
-                                        " of " + str(event.get_event_capacity()),
-                                        bg="white")
-                event_capacity.grid(row=3, column=0, sticky='w')
-                
-                # Book button
-                book_button = tk.Button(event_card, text="Book Tickets", 
-                                      bg=self.accent_color, fg="white",
-                                      command=lambda e=event: self.show_booking_form(e))
-                book_button.grid(row=1, column=1, rowspan=2, padx=(20, 0))
-                
-                # Set grid configuration
-                event_card.columnconfigure(0, weight=1)
-                event_card.columnconfigure(1, weight=0)
-        else:
-            no_events = tk.Label(scrollable_frame, text="No upcoming events available", 
-                              font=("Helvetica", 12), bg=self.bg_color)
-            no_events.pack(pady=50)
-    
-    def show_booking_form(self, event):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create booking form header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=10)
-        header_frame.pack(fill='x')
-        
-        booking_label = tk.Label(header_frame, text="Book Tickets: " + event.get_event_name(), 
-                            font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        booking_label.pack()
-        
-        event_info = tk.Label(header_frame, 
-                            text="Date: " + event.get_event_date().strftime("%B %d, %Y") + 
-                            " • " + event.get_event_location(),
-                            font=("Helvetica", 10), bg=self.bg_color)
-        event_info.pack()
-        
-        # Create main container
-        main_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        main_container.pack(fill='both', expand=True, padx=20, pady=5)
-        
-        # Create canvas with scrollbar
-        canvas = tk.Canvas(main_container, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
-        
-        # Configure canvas
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Create form container inside canvas
-        form_container = tk.Frame(canvas, bg="white", bd=1, relief=tk.SOLID)
-        
-        # Create window in canvas
-        canvas_window = canvas.create_window((0, 0), window=form_container, anchor="nw", width=canvas.winfo_width())
-        
-        # Function to update canvas scroll region
-        def update_scrollregion(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            
-        # Function to update form width
-        def update_form_width(event):
-            canvas_width = event.width
-            canvas.itemconfig(canvas_window, width=canvas_width)
-        
-        # Bind events
-        form_container.bind("<Configure>", update_scrollregion)
-        canvas.bind("<Configure>", update_form_width)
-        
-        # Bind mousewheel - using a more reliable approach that's contained to this canvas
-        def on_mousewheel(event):
-            # Only scroll if the canvas is visible and has a scrollable area
-            if canvas.winfo_exists():
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        # Bind only to the canvas widget itself, not globally
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        
-        # Ticket type selection
-        ticket_type_frame = tk.Frame(form_container, bg="white", pady=15)
-        ticket_type_frame.pack(fill='x', padx=20)
-        
-        ticket_type_label = tk.Label(ticket_type_frame, text="Select Ticket Type:", 
-                                    font=("Helvetica", 12, "bold"), bg="white")
-        ticket_type_label.pack(anchor='w')
-        
-        # Ticket types (radio buttons)
-        self.ticket_type_var = tk.StringVar(value="standard")
-        
-        ticket_types_frame = tk.Frame(ticket_type_frame, bg="white", pady=10)
-        ticket_types_frame.pack(fill='x')
-        
-        # Standard ticket
-        standard_frame = tk.Frame(ticket_types_frame, bg="white", pady=5, bd=1, relief=tk.SOLID)
-        standard_frame.pack(fill='x', pady=5)
-        
-        standard_radio = tk.Radiobutton(standard_frame, text="Standard Ticket", 
-                                    variable=self.ticket_type_var, value="standard", bg="white")
-        standard_radio.grid(row=0, column=0, sticky='w', padx=10)
-        
-        standard_price = tk.Label(standard_frame, text="$100", font=("Helvetica", 12, "bold"), bg="white")
-        standard_price.grid(row=0, column=1, sticky='e', padx=10)
-        
-        standard_desc = tk.Label(standard_frame, 
-                            text="Regular seating with good view of the track",
-                            bg="white", wraplength=400, justify=tk.LEFT)
-        standard_desc.grid(row=1, column=0, columnspan=2, sticky='w', padx=35, pady=(0, 5))
-        
-        # VIP ticket
-        vip_frame = tk.Frame(ticket_types_frame, bg="white", pady=5, bd=1, relief=tk.SOLID)
-        vip_frame.pack(fill='x', pady=5)
-        
-        vip_radio = tk.Radiobutton(vip_frame, text="VIP Experience", 
-                                variable=self.ticket_type_var, value="vip", bg="white")
-        vip_radio.grid(row=0, column=0, sticky='w', padx=10)
-        
-        vip_price = tk.Label(vip_frame, text="$250", font=("Helvetica", 12, "bold"), bg="white")
-        vip_price.grid(row=0, column=1, sticky='e', padx=10)
-        
-        vip_desc = tk.Label(vip_frame, 
-                        text="Premium seating with complimentary food and drinks",
-                        bg="white", wraplength=400, justify=tk.LEFT)
-        vip_desc.grid(row=1, column=0, columnspan=2, sticky='w', padx=35, pady=(0, 5))
-        
-        # Weekend package
-        weekend_frame = tk.Frame(ticket_types_frame, bg="white", pady=5, bd=1, relief=tk.SOLID)
-        weekend_frame.pack(fill='x', pady=5)
-        
-        weekend_radio = tk.Radiobutton(weekend_frame, text="Weekend Package", 
-                                    variable=self.ticket_type_var, value="weekend", bg="white")
-        weekend_radio.grid(row=0, column=0, sticky='w', padx=10)
-        
-        weekend_price = tk.Label(weekend_frame, text="$400", font=("Helvetica", 12, "bold"), bg="white")
-        weekend_price.grid(row=0, column=1, sticky='e', padx=10)
-        
-        weekend_desc = tk.Label(weekend_frame, 
-                            text="3-day pass with access to practice, qualifying, and race sessions",
-                            bg="white", wraplength=400, justify=tk.LEFT)
-        weekend_desc.grid(row=1, column=0, columnspan=2, sticky='w', padx=35, pady=(0, 5))
-        
-        # Configure grid columns for all frames
-        standard_frame.columnconfigure(0, weight=1)
-        standard_frame.columnconfigure(1, weight=0)
-        vip_frame.columnconfigure(0, weight=1)
-        vip_frame.columnconfigure(1, weight=0)
-        weekend_frame.columnconfigure(0, weight=1)
-        weekend_frame.columnconfigure(1, weight=0)
-        
-        # Number of tickets
-        quantity_frame = tk.Frame(form_container, bg="white", pady=15)
-        quantity_frame.pack(fill='x', padx=20)
-        
-        quantity_label = tk.Label(quantity_frame, text="Number of Tickets:", 
-                                font=("Helvetica", 12, "bold"), bg="white")
-        quantity_label.pack(anchor='w')
-        
-        # Ticket quantity spinner
-        self.ticket_quantity_var = tk.StringVar(value="1")
-        quantity_spinner = ttk.Spinbox(quantity_frame, from_=1, to=10, textvariable=self.ticket_quantity_var, 
-                                    width=5, state="readonly")
-        quantity_spinner.pack(anchor='w', pady=5)
-        
-        # Add separator
-        ttk.Separator(form_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
-        
-        # Discount code
-        discount_frame = tk.Frame(form_container, bg="white", pady=10)
-        discount_frame.pack(fill='x', padx=20)
-        
-        discount_label = tk.Label(discount_frame, text="Discount Code (if any):", 
-                                font=("Helvetica", 12, "bold"), bg="white")
-        discount_label.pack(anchor='w')
-        
-        self.discount_code_entry = tk.Entry(discount_frame, width=20)
-        self.discount_code_entry.pack(anchor='w', pady=5)
-        
-        # Add separator
-        ttk.Separator(form_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
-        
-        # Payment method
-        payment_frame = tk.Frame(form_container, bg="white", pady=15)
-        payment_frame.pack(fill='x', padx=20)
-        
-        payment_label = tk.Label(payment_frame, text="Payment Method:", 
-                            font=("Helvetica", 12, "bold"), bg="white")
-        payment_label.pack(anchor='w')
-        
-        # Payment type selection
-        self.payment_type_var = tk.StringVar(value="credit_card")
-        
-        credit_card_radio = tk.Radiobutton(payment_frame, text="Credit Card", 
-                                        variable=self.payment_type_var, value="credit_card", 
-                                        bg="white", command=self.toggle_payment_form)
-        credit_card_radio.pack(anchor='w', pady=5)
-        
-        digital_radio = tk.Radiobutton(payment_frame, text="Digital Payment (PayPal, etc)", 
-                                    variable=self.payment_type_var, value="digital", 
-                                    bg="white", command=self.toggle_payment_form)
-        digital_radio.pack(anchor='w')
-        
-        # Credit card form (default)
-        self.credit_card_frame = tk.Frame(payment_frame, bg="white", pady=10)
-        self.credit_card_frame.pack(fill='x')
-        
-        # Card number
-        card_num_frame = tk.Frame(self.credit_card_frame, bg="white")
-        card_num_frame.pack(fill='x', pady=5)
-        
-        card_num_label = tk.Label(card_num_frame, text="Card Number:", width=15, anchor='w', bg="white")
-        card_num_label.pack(side=tk.LEFT)
-        
-        self.card_num_entry = tk.Entry(card_num_frame, width=25)
-        self.card_num_entry.pack(side=tk.LEFT)
-        
-        # Expiry date
-        expiry_frame = tk.Frame(self.credit_card_frame, bg="white")
-        expiry_frame.pack(fill='x', pady=5)
-        
-        expiry_label = tk.Label(expiry_frame, text="Expiry Date (MM/YY):", width=15, anchor='w', bg="white")
-        expiry_label.pack(side=tk.LEFT)
-        
-        self.expiry_entry = tk.Entry(expiry_frame, width=10)
-        self.expiry_entry.pack(side=tk.LEFT)
-        
-        # CVV
-        cvv_frame = tk.Frame(self.credit_card_frame, bg="white")
-        cvv_frame.pack(fill='x', pady=5)
-        
-        cvv_label = tk.Label(cvv_frame, text="CVV:", width=15, anchor='w', bg="white")
-        cvv_label.pack(side=tk.LEFT)
-        
-        self.cvv_entry = tk.Entry(cvv_frame, width=5, show="*")
-        self.cvv_entry.pack(side=tk.LEFT)
-        
-        # Card type
-        card_type_frame = tk.Frame(self.credit_card_frame, bg="white")
-        card_type_frame.pack(fill='x', pady=5)
-        
-        card_type_label = tk.Label(card_type_frame, text="Card Type:", width=15, anchor='w', bg="white")
-        card_type_label.pack(side=tk.LEFT)
-        
-        self.card_type_var = tk.StringVar(value="VISA")
-        card_types = ["VISA", "MASTERCARD", "AMEX"]
-        card_type_dropdown = ttk.Combobox(card_type_frame, textvariable=self.card_type_var, 
-                                    values=card_types, state="readonly", width=12)
-        card_type_dropdown.pack(side=tk.LEFT)
-        
-        # Digital payment form (hidden by default)
-        self.digital_frame = tk.Frame(payment_frame, bg="white", pady=10)
-        
-        # Digital account id
-        account_frame = tk.Frame(self.digital_frame, bg="white")
-        account_frame.pack(fill='x', pady=5)
-        
-        account_label = tk.Label(account_frame, text="Email/Account ID:", width=15, anchor='w', bg="white")
-        account_label.pack(side=tk.LEFT)
-        
-        self.account_entry = tk.Entry(account_frame, width=25)
-        self.account_entry.pack(side=tk.LEFT)
-        
-        # Digital provider
-        provider_frame = tk.Frame(self.digital_frame, bg="white")
-        provider_frame.pack(fill='x', pady=5)
-        
-        provider_label = tk.Label(provider_frame, text="Provider:", width=15, anchor='w', bg="white")
-        provider_label.pack(side=tk.LEFT)
-        
-        self.provider_var = tk.StringVar(value="PayPal")
-        providers = ["PayPal", "Apple Pay", "Google Pay", "Other"]
-        provider_dropdown = ttk.Combobox(provider_frame, textvariable=self.provider_var, 
-                                    values=providers, state="readonly", width=12)
-        provider_dropdown.pack(side=tk.LEFT)
-        
-        # Summary
-        summary_frame = tk.Frame(form_container, bg="#f5f5f5", pady=15)
-        summary_frame.pack(fill='x', padx=20, pady=10)
-        
-        summary_label = tk.Label(summary_frame, text="Booking Summary", 
-                            font=("Helvetica", 12, "bold"), bg="#f5f5f5")
-        summary_label.pack(anchor='w')
-        
-        # Calculate prices based on selection
-        def update_price(*args):
-            ticket_type = self.ticket_type_var.get()
-            quantity = int(self.ticket_quantity_var.get())
-            
-            # Base prices
-            if ticket_type == "standard":
-                base_price = 100
-            elif ticket_type == "vip":
-                base_price = 250
-            else:  # weekend
-                base_price = 400
-            
-            total = base_price * quantity
-            
-            # Update labels
-            base_price_label.config(text="$" + str(base_price) + " × " + str(quantity))
-            subtotal_value_label.config(text="$" + str(total))
-            total_value_label.config(text="$" + str(total))
-        
-        # Track changes to update price
-        self.ticket_type_var.trace_add("write", update_price)
-        self.ticket_quantity_var.trace_add("write", update_price)
-        
-        # Price breakdown
-        price_frame = tk.Frame(summary_frame, bg="#f5f5f5", pady=5)
-        price_frame.pack(fill='x')
-        
-        base_label = tk.Label(price_frame, text="Base Price:", bg="#f5f5f5")
-        base_label.grid(row=0, column=0, sticky='w')
-        
-        base_price_label = tk.Label(price_frame, text="$100 × 1", bg="#f5f5f5")
-        base_price_label.grid(row=0, column=1, sticky='e')
-        
-        subtotal_label = tk.Label(price_frame, text="Subtotal:", bg="#f5f5f5")
-        subtotal_label.grid(row=1, column=0, sticky='w')
-        
-        subtotal_value_label = tk.Label(price_frame, text="$100", bg="#f5f5f5")
-        subtotal_value_label.grid(row=1, column=1, sticky='e')
-        
-        discount_label = tk.Label(price_frame, text="Discount:", bg="#f5f5f5")
-        discount_label.grid(row=2, column=0, sticky='w')
-        
-        discount_value_label = tk.Label(price_frame, text="$0", bg="#f5f5f5")
-        discount_value_label.grid(row=2, column=1, sticky='e')
-        
-        ttk.Separator(price_frame, orient='horizontal').grid(row=3, column=0, columnspan=2, sticky='ew', pady=5)
-        
-        total_label = tk.Label(price_frame, text="Total:", font=("Helvetica", 12, "bold"), bg="#f5f5f5")
-        total_label.grid(row=4, column=0, sticky='w')
-        
-        total_value_label = tk.Label(price_frame, text="$100", font=("Helvetica", 12, "bold"), bg="#f5f5f5")
-        total_value_label.grid(row=4, column=1, sticky='e')
-        
-        # Configure grid
-        price_frame.columnconfigure(0, weight=1)
-        price_frame.columnconfigure(1, weight=1)
-        
-        # Buttons
-        button_frame = tk.Frame(form_container, bg="white", pady=15)
-        button_frame.pack(fill='x', padx=20)
-        
-        # Back button
-        back_button = tk.Button(button_frame, text="Back to Events", 
-                            command=lambda: self.show_events_list(),
-                            bg="#f0f0f0", fg="black", width=15)
-        back_button.pack(side=tk.LEFT, padx=5)
-        
-        # Book button
-        book_button = tk.Button(button_frame, text="Complete Booking", 
-                            command=lambda: self.process_booking(event),
-                            bg="#4caf50", fg="white", width=15)
-        book_button.pack(side=tk.RIGHT, padx=5)
-        
-        # Initialize price
-        update_price()    
-    # Toggle between credit card and digital payment forms
-    def toggle_payment_form(self):
-        payment_type = self.payment_type_var.get()
-        
-        if payment_type == "credit_card":
-            self.digital_frame.pack_forget()
-            self.credit_card_frame.pack(fill='x')
-        else:
-            self.credit_card_frame.pack_forget()
-            self.digital_frame.pack(fill='x')
-    
-    # Process booking submission
-    def process_booking(self, event):
-        # Get form values
-        ticket_type = self.ticket_type_var.get()
-        quantity = int(self.ticket_quantity_var.get())
-        discount_code = self.discount_code_entry.get()
-        payment_type = self.payment_type_var.get()
-        
-        # Calculate prices
-        if ticket_type == "standard":
-            base_price = 100
-            ticket_type_id = 1
-        elif ticket_type == "vip":
-            base_price = 250
-            ticket_type_id = 2
-        else:  # weekend
-            base_price = 400
-            ticket_type_id = 3
-        
-        total_price = base_price * quantity
-        
-        # Check discount code
-        discount = None
-        if discount_code:
-            discount = self.data_manager.get_discount_by_code(discount_code)
-            if discount:
-                total_price = discount.apply_discount(total_price)
-        
-        # Check if enough tickets are available
-        if event.get_remaining_capacity() < quantity:
-            messagebox.showerror("Booking Error", "Not enough tickets available for this event")
-            return
-        
-        # Create booking ID
-        booking_id = len(self.data_manager.bookings) + 1001  # Start IDs from 1001
-        
-        # Create booking
-        new_booking = Booking(
-            self.current_user.get_user_id(),
-            event.get_event_id(),
-            booking_id,
-            datetime.now(),
-            quantity,
-            total_price,
-            BookingStatus.CONFIRMED
-        )
-        
-        # Add booking to data manager
-        self.data_manager.add_booking(new_booking)
-        
-        # Process payment
-        payment_id = len(self.data_manager.payments) + 2001  # Start payment IDs from 2001
-        
-        if payment_type == "credit_card":
-            # Get credit card details
-            card_number = self.card_num_entry.get()
-            expiry_date = self.expiry_entry.get()
-            card_type_str = self.card_type_var.get()
-            
-            # Validate card details
-            if not card_number or not expiry_date:
-                messagebox.showerror("Payment Error", "Please enter all card details")
-                return
-            
-            # Map string to enum
-            card_type_map = {
-                "VISA": CardType.VISA,
-                "MASTERCARD": CardType.MASTERCARD,
-                "AMEX": CardType.AMEX
-            }
-            
-            # Create credit card payment
-            payment = CreditCard(
-                booking_id,
-                payment_id,
-                card_number,
-                expiry_date,
-                card_type_map[card_type_str],
-                datetime.now(),
-                PaymentTransactionStatus.SUCCESSFUL
-            )
-        else:
-            # Get digital payment details
-            account = self.account_entry.get()
-            provider = self.provider_var.get()
-            
-            # Validate details
-            if not account:
-                messagebox.showerror("Payment Error", "Please enter your account/email")
-                return
-            
-            # Create auth code
-            auth_code = "AUTH-" + str(random.randint(10000, 99999))
-            
-            # Create digital payment
-            payment = DigitalPayment(
-                booking_id,
-                payment_id,
-                random.randint(100000, 999999),  # Transaction ID
-                account,
-                auth_code,
-                datetime.now(),
-                PaymentTransactionStatus.SUCCESSFUL
-            )
-        
-        # Add payment to data manager
-        self.data_manager.add_payment(payment)
-        
-        # Create tickets
-        seat_prefix = "A" if ticket_type == "standard" else ("B" if ticket_type == "vip" else "C")
-        
-        for i in range(quantity):
-            seat_number = seat_prefix + str(100 + i)
-            
-            # Create ticket based on type
-            if ticket_type == "weekend":
-                new_ticket = WeekendPackage(
-                    ticket_type_id,
-                    booking_id,
-                    f"T{booking_id}-{i+1}",
-                    seat_number,
-                    base_price,
-                    event.get_event_date(),
-                    random.randint(5001, 5999),  # Package ID
-                    "Standard Weekend",
-                    "Access to all weekend events, pit lane walk, driver autograph session",
-                    event.get_event_id()
-                )
-            elif ticket_type == "vip":
-                new_ticket = SeasonMembership(
-                    ticket_type_id,
-                    booking_id,
-                    f"T{booking_id}-{i+1}",
-                    seat_number,
-                    base_price,
-                    event.get_event_date(),
-                    random.randint(3001, 3999),  # Member ID
-                    self.current_user.get_user_name(),
-                    "VIP Lounge access, complimentary food and drinks",
-                    event.get_event_id()
-                )
-            else:  # standard
-                new_ticket = SingleRacePass(
-                    ticket_type_id,
-                    booking_id,
-                    f"T{booking_id}-{i+1}",
-                    seat_number,
-                    base_price,
-                    event.get_event_date(),
-                    random.randint(4001, 4999),  # Pass ID
-                    event.get_event_date().strftime("%Y-%m-%d"),
-                    "Standard race day access",
-                    event.get_event_id()
-                )
-            
-            # Add ticket to data manager
-            self.data_manager.add_ticket(new_ticket)
-        
-        # Show success message
-        messagebox.showinfo("Booking Successful", 
-                           "Your booking is confirmed! " + str(quantity) + " tickets for " + 
-                           event.get_event_name() + " have been booked.")
-        
-        # Show bookings
-        self.show_my_bookings()
-    
-    # Show user's bookings
-    def show_my_bookings(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create bookings header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        bookings_label = tk.Label(header_frame, text="My Bookings", 
-                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        bookings_label.pack()
-        
-        subtitle_label = tk.Label(header_frame, text="View and manage your bookings", 
-                                font=("Helvetica", 10), bg=self.bg_color)
-        subtitle_label.pack()
-        
-        # Create scrollable bookings list
-        bookings_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        bookings_container.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Create canvas with scrollbar for bookings
-        canvas = tk.Canvas(bookings_container, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(bookings_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Get user's bookings
-        user_bookings = self.data_manager.get_bookings_by_user_id(self.current_user.get_user_id())
-        
-        if user_bookings:
-            # Sort bookings by date (newest first)
-            sorted_bookings = sorted(user_bookings, key=lambda b: b.get_booking_date(), reverse=True)
-            
-            for booking in sorted_bookings:
-                # Get related event
-                event = self.data_manager.get_event_by_id(booking.get_event_id())
-                if not event:
-                    continue
-                
-                # Get related tickets
-                tickets = self.data_manager.get_tickets_by_booking_id(booking.get_booking_id())
-                
-                # Create booking card
-                booking_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
-                booking_card.pack(fill='x', padx=10, pady=10)
-                
-                # Booking details
-                booking_title = tk.Label(booking_card, 
-                                       text=event.get_event_name() + " (" + str(len(tickets)) + " tickets)",
-                                       font=("Helvetica", 14, "bold"), bg="white")
-                booking_title.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 10))
-                
-                # Event date and location
-                event_info = tk.Label(booking_card, 
-                                    text="Event: " + event.get_event_date().strftime("%B %d, %Y") + 
-                                    " at " + event.get_event_location(),
-                                    bg="white")
-                event_info.grid(row=1, column=0, sticky='w')
-                
-                # Booking date
-                booking_date = tk.Label(booking_card, 
-                                      text="Booked on: " + booking.get_booking_date().strftime("%B %d, %Y"),
-                                      bg="white")
-                booking_date.grid(row=2, column=0, sticky='w')
-                
-                # Total price
-                price_label = tk.Label(booking_card, 
-                                     text="Total Price: $" + str(booking.get_total_price()),
-                                     bg="white")
-                price_label.grid(row=3, column=0, sticky='w')
-                
-                # Status
-                status_label = tk.Label(booking_card, 
-                                      text="Status: " + booking.get_booking_status().value,
-                                      bg="white", fg="green" if booking.get_booking_status() == BookingStatus.CONFIRMED else "orange")
-                status_label.grid(row=4, column=0, sticky='w')
-                
-                # View tickets button
-                view_button = tk.Button(booking_card, text="View Tickets", 
-                                      bg=self.accent_color, fg="white",
-                                      command=lambda b=booking, e=event: self.show_booking_details(b, e))
-                view_button.grid(row=2, column=1, rowspan=2, padx=(20, 0))
-                
-                # Cancel button (only for upcoming events)
-                if event.get_event_date() > datetime.now() and booking.get_booking_status() != BookingStatus.CANCELLED:
-                    cancel_button = tk.Button(booking_card, text="Cancel Booking", 
-                                           bg="#ff6666", fg="white",
-                                           command=lambda b=booking: self.cancel_booking(b))
-                    cancel_button.grid(row=4, column=1, padx=(20, 0))
-                
-                # Set grid configuration
-                booking_card.columnconfigure(0, weight=1)
-                booking_card.columnconfigure(1, weight=0)
-        else:
-            no_bookings = tk.Label(scrollable_frame, text="You don't have any bookings yet", 
-                                 font=("Helvetica", 12), bg=self.bg_color)
-            no_bookings.pack(pady=50)
-    
-    # Show booking details
-    def show_booking_details(self, booking, event):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create booking details header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=10)
-        header_frame.pack(fill='x')
-        
-        details_label = tk.Label(header_frame, text="Booking Details", 
-                            font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        details_label.pack()
-        
-        event_label = tk.Label(header_frame, text=event.get_event_name(), 
-                            font=("Helvetica", 14), bg=self.bg_color)
-        event_label.pack()
-        
-        # Create main container
-        main_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        main_container.pack(fill='both', expand=True, padx=20, pady=5)
-        
-        # Create canvas with scrollbar
-        canvas = tk.Canvas(main_container, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
-        
-        # Configure canvas
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Create details container inside canvas
-        details_container = tk.Frame(canvas, bg="white", bd=1, relief=tk.SOLID)
-        
-        # Create window in canvas
-        canvas_window = canvas.create_window((0, 0), window=details_container, anchor="nw", width=canvas.winfo_width())
-        
-        # Function to update canvas scroll region
-        def update_scrollregion(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            
-        # Function to update details width
-        def update_details_width(event):
-            canvas_width = event.width
-            canvas.itemconfig(canvas_window, width=canvas_width)
-        
-        # Bind events
-        details_container.bind("<Configure>", update_scrollregion)
-        canvas.bind("<Configure>", update_details_width)
-        
-        # Bind mousewheel specifically to this canvas
-        def on_mousewheel(event):
-            if canvas.winfo_exists():
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        
-        # Booking summary
-        summary_frame = tk.Frame(details_container, bg="white", pady=15)
-        summary_frame.pack(fill='x', padx=20)
-        
-        # Booking ID
-        booking_id_label = tk.Label(summary_frame, text="Booking Reference: " + str(booking.get_booking_id()), 
-                                font=("Helvetica", 12, "bold"), bg="white")
-        booking_id_label.pack(anchor='w', pady=(0, 10))
-        
-        # Event details
-        event_date_label = tk.Label(summary_frame, text="Event Date: " + event.get_event_date().strftime("%B %d, %Y"), 
-                                bg="white")
-        event_date_label.pack(anchor='w', pady=2)
-        
-        event_location_label = tk.Label(summary_frame, text="Location: " + event.get_event_location(), 
-                                    bg="white")
-        event_location_label.pack(anchor='w', pady=2)
-        
-        # Booking details
-        booking_date_label = tk.Label(summary_frame, text="Booking Date: " + booking.get_booking_date().strftime("%B %d, %Y"), 
-                                    bg="white")
-        booking_date_label.pack(anchor='w', pady=2)
-        
-        ticket_count_label = tk.Label(summary_frame, text="Number of Tickets: " + str(booking.get_number_of_tickets()), 
-                                    bg="white")
-        ticket_count_label.pack(anchor='w', pady=2)
-        
-        total_price_label = tk.Label(summary_frame, text="Total Price: $" + str(booking.get_total_price()), 
-                                bg="white")
-        total_price_label.pack(anchor='w', pady=2)
-        
-        status_label = tk.Label(summary_frame, text="Status: " + booking.get_booking_status().value, 
-                            bg="white", fg="green" if booking.get_booking_status() == BookingStatus.CONFIRMED else "orange")
-        status_label.pack(anchor='w', pady=2)
-        
-        # Add separator
-        ttk.Separator(details_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
-        
-        # Tickets section
-        tickets_frame = tk.Frame(details_container, bg="white", pady=15)
-        tickets_frame.pack(fill='x', padx=20)
-        
-        tickets_label = tk.Label(tickets_frame, text="Your Tickets", 
-                            font=("Helvetica", 12, "bold"), bg="white")
-        tickets_label.pack(anchor='w', pady=(0, 10))
-        
-        # Get tickets for this booking
-        tickets = self.data_manager.get_tickets_by_booking_id(booking.get_booking_id())
-        
-        if tickets:
-            for i, ticket in enumerate(tickets):
-                ticket_frame = tk.Frame(tickets_frame, bg="#f9f9f9", bd=1, relief=tk.SOLID, padx=10, pady=10)
-                ticket_frame.pack(fill='x', pady=5)
-                
-                # Basic ticket info
-                ticket_id_label = tk.Label(ticket_frame, text="Ticket #" + str(i+1) + ": " + ticket.get_ticket_id(), 
-                                        font=("Helvetica", 11, "bold"), bg="#f9f9f9")
-                ticket_id_label.grid(row=0, column=0, sticky='w')
-                
-                # Determine ticket type and display appropriate info
-                if isinstance(ticket, WeekendPackage):
-                    ticket_type_label = tk.Label(ticket_frame, text="Weekend Package", 
-                                            bg="#f9f9f9", fg="#9c27b0")
-                    ticket_type_label.grid(row=0, column=1, sticky='e')
-                    
-                    benefits_label = tk.Label(ticket_frame, text="Benefits: " + ticket.get_package_benefits(), 
-                                        bg="#f9f9f9", wraplength=400, justify=tk.LEFT)
-                    benefits_label.grid(row=2, column=0, columnspan=2, sticky='w')
-                    
-                elif isinstance(ticket, SeasonMembership):
-                    ticket_type_label = tk.Label(ticket_frame, text="VIP Experience", 
-                                            bg="#f9f9f9", fg="#2196f3")
-                    ticket_type_label.grid(row=0, column=1, sticky='e')
-                    
-                    benefits_label = tk.Label(ticket_frame, text="Benefits: " + ticket.get_included_gifts(), 
-                                        bg="#f9f9f9", wraplength=400, justify=tk.LEFT)
-                    benefits_label.grid(row=2, column=0, columnspan=2, sticky='w')
-                    
-                elif isinstance(ticket, SingleRacePass):
-                    ticket_type_label = tk.Label(ticket_frame, text="Standard Ticket", 
-                                            bg="#f9f9f9", fg="#4caf50")
-                    ticket_type_label.grid(row=0, column=1, sticky='e')
-                    
-                    benefits_label = tk.Label(ticket_frame, text="Benefits: " + ticket.get_pass_benefits(), 
-                                        bg="#f9f9f9", wraplength=400, justify=tk.LEFT)
-                    benefits_label.grid(row=2, column=0, columnspan=2, sticky='w')
-                    
-                else:
-                    ticket_type_label = tk.Label(ticket_frame, text="Regular Ticket", 
-                                            bg="#f9f9f9")
-                    ticket_type_label.grid(row=0, column=1, sticky='e')
-                
-                # Common ticket info
-                seat_label = tk.Label(ticket_frame, text="Seat: " + ticket.get_seat_number(), 
-                                    bg="#f9f9f9")
-                seat_label.grid(row=1, column=0, sticky='w')
-                
-                price_label = tk.Label(ticket_frame, text="Price: $" + str(ticket.get_ticket_price()), 
-                                    bg="#f9f9f9")
-                price_label.grid(row=1, column=1, sticky='e')
-                
-                # Configure grid
-                ticket_frame.columnconfigure(0, weight=1)
-                ticket_frame.columnconfigure(1, weight=1)
-        else:
-            no_tickets = tk.Label(tickets_frame, text="No tickets found for this booking", 
-                                bg="white")
-            no_tickets.pack(pady=20)
-        
-        # Add separator
-        ttk.Separator(details_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
-        
-        # Payment section
-        payment_frame = tk.Frame(details_container, bg="white", pady=15)
-        payment_frame.pack(fill='x', padx=20)
-        
-        payment_label = tk.Label(payment_frame, text="Payment Information", 
-                            font=("Helvetica", 12, "bold"), bg="white")
-        payment_label.pack(anchor='w', pady=(0, 10))
-        
-        # Get payments for this booking
-        payments = self.data_manager.get_payments_by_booking_id(booking.get_booking_id())
-        
-        if payments:
-            for payment in payments:
-                payment_info_frame = tk.Frame(payment_frame, bg="#f9f9f9", bd=1, relief=tk.SOLID, padx=10, pady=10)
-                payment_info_frame.pack(fill='x', pady=5)
-                
-                # Payment ID
-                payment_id_label = tk.Label(payment_info_frame, text="Payment ID: " + str(payment.get_payment_id()), 
-                                        bg="#f9f9f9", font=("Helvetica", 11, "bold"))
-                payment_id_label.pack(anchor='w')
-                
-                # Payment type
-                payment_type_label = tk.Label(payment_info_frame, text="Payment Type: " + payment.get_payment_type().value, 
-                                        bg="#f9f9f9")
-                payment_type_label.pack(anchor='w')
-                
-                # Transaction date
-                transaction_date_label = tk.Label(payment_info_frame, 
-                                            text="Transaction Date: " + payment.get_transaction_date().strftime("%B %d, %Y %H:%M"), 
-                                            bg="#f9f9f9")
-                transaction_date_label.pack(anchor='w')
-                
-                # Transaction status
-                status_color = "green" if payment.get_transaction_status() == PaymentTransactionStatus.SUCCESSFUL else "red"
-                transaction_status_label = tk.Label(payment_info_frame, 
-                                                text="Status: " + payment.get_transaction_status().value, 
-                                                bg="#f9f9f9", fg=status_color)
-                transaction_status_label.pack(anchor='w')
-                
-                # Show additional details based on payment type
-                if isinstance(payment, CreditCard):
-                    card_info_label = tk.Label(payment_info_frame, 
-                                            text="Card: " + payment.get_card_type().value + " ending in " + 
-                                            payment.get_card_number()[-4:], 
-                                            bg="#f9f9f9")
-                    card_info_label.pack(anchor='w')
-                    
-                elif isinstance(payment, DigitalPayment):
-                    digital_info_label = tk.Label(payment_info_frame, 
-                                            text="Account: " + payment.get_account_identifier(),
-                                            bg="#f9f9f9")
-                    digital_info_label.pack(anchor='w')
-        else:
-            no_payment = tk.Label(payment_frame, text="No payment information found", 
-                                bg="white")
-            no_payment.pack(pady=20)
-        
-        # Buttons
-        button_frame = tk.Frame(details_container, bg="white", pady=15)
-        button_frame.pack(fill='x', padx=20)
-        
-        back_button = tk.Button(button_frame, text="Back to My Bookings", 
-                            command=lambda: self.show_my_bookings(),
-                            bg="#f0f0f0", fg="black", width=20)
-        back_button.pack(side=tk.LEFT)
-        
-        # Add print button
-        print_button = tk.Button(button_frame, text="Print Tickets", 
-                            command=lambda: messagebox.showinfo("Print Tickets", "Tickets sent to printer"),
-                            bg=self.accent_color, fg="white", width=20)
-        print_button.pack(side=tk.RIGHT)
-        
-    # Cancel a booking
-    def cancel_booking(self, booking):
-        # Ask for confirmation
-        confirm = messagebox.askyesno("Cancel Booking", 
-                                     "Are you sure you want to cancel this booking? This action cannot be undone.")
-        
-        if confirm:
-            # Update booking status
-            booking.set_booking_status(BookingStatus.CANCELLED)
-            self.data_manager.update_booking(booking)
-            
-            messagebox.showinfo("Booking Cancelled", "Your booking has been cancelled successfully")
-            
-            # Refresh bookings view
-            self.show_my_bookings()
-    
-    # Show account settings
-    def show_account_settings(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create account settings header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        settings_label = tk.Label(header_frame, text="Account Settings", 
-                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        settings_label.pack()
-        
-        subtitle_label = tk.Label(header_frame, text="Manage your account information", 
-                                font=("Helvetica", 10), bg=self.bg_color)
-        subtitle_label.pack()
-        
-        # Create settings container
-        settings_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
-        settings_container.pack(fill='both', expand=True, padx=100, pady=20)
-        
-        # User information section
-        user_info_frame = tk.Frame(settings_container, bg="white", pady=15)
-        user_info_frame.pack(fill='x', padx=20)
-        
-        user_info_label = tk.Label(user_info_frame, text="Your Information", 
-                                 font=("Helvetica", 12, "bold"), bg="white")
-        user_info_label.pack(anchor='w', pady=(0, 10))
-        
-        # Form fields - prepopulated with current user data
-        
-        # Name field
-        name_frame = tk.Frame(user_info_frame, bg="white")
-        name_frame.pack(fill='x', pady=10)
-        
-        name_label = tk.Label(name_frame, text="Full Name:", width=15, anchor='w', bg="white")
-        name_label.pack(side=tk.LEFT)
-        
-        self.settings_name_entry = tk.Entry(name_frame, width=40)
-        self.settings_name_entry.insert(0, self.current_user.get_user_name())
-        self.settings_name_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Email field
-        email_frame = tk.Frame(user_info_frame, bg="white")
-        email_frame.pack(fill='x', pady=10)
-        
-        email_label = tk.Label(email_frame, text="Email:", width=15, anchor='w', bg="white")
-        email_label.pack(side=tk.LEFT)
-        
-        self.settings_email_entry = tk.Entry(email_frame, width=40)
-        self.settings_email_entry.insert(0, self.current_user.get_user_email())
-        self.settings_email_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Get customer-specific fields if current user is a customer
-        if isinstance(self.current_user, Customer):
-            # Address field
-            address_frame = tk.Frame(user_info_frame, bg="white")
-            address_frame.pack(fill='x', pady=10)
-            
-            address_label = tk.Label(address_frame, text="Address:", width=15, anchor='w', bg="white")
-            address_label.pack(side=tk.LEFT)
-            
-            self.settings_address_entry = tk.Entry(address_frame, width=40)
-            self.settings_address_entry.insert(0, self.current_user.get_customer_address())
-            self.settings_address_entry.pack(side=tk.LEFT, padx=5)
-            
-            # Phone field
-            phone_frame = tk.Frame(user_info_frame, bg="white")
-            phone_frame.pack(fill='x', pady=10)
-            
-            phone_label = tk.Label(phone_frame, text="Phone:", width=15, anchor='w', bg="white")
-            phone_label.pack(side=tk.LEFT)
-            
-            self.settings_phone_entry = tk.Entry(phone_frame, width=40)
-            self.settings_phone_entry.insert(0, self.current_user.get_customer_phone())
-            self.settings_phone_entry.pack(side=tk.LEFT, padx=5)
-            
-            # Payment info field
-            payment_frame = tk.Frame(user_info_frame, bg="white")
-            payment_frame.pack(fill='x', pady=10)
-            
-            payment_label = tk.Label(payment_frame, text="Payment Info:", width=15, anchor='w', bg="white")
-            payment_label.pack(side=tk.LEFT)
-            
-            self.settings_payment_entry = tk.Entry(payment_frame, width=40)
-            self.settings_payment_entry.insert(0, self.current_user.get_payment_info())
-            self.settings_payment_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Password change section
-        password_section = tk.Frame(settings_container, bg="white", pady=15)
-        password_section.pack(fill='x', padx=20)
-        
-        # Add separator before password section
-        ttk.Separator(settings_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
-        
-        password_label = tk.Label(password_section, text="Change Password", 
-                                font=("Helvetica", 12, "bold"), bg="white")
-        password_label.pack(anchor='w', pady=(0, 10))
-        
-        # Current password field
-        current_pw_frame = tk.Frame(password_section, bg="white")
-        current_pw_frame.pack(fill='x', pady=10)
-        
-        current_pw_label = tk.Label(current_pw_frame, text="Current Password:", width=15, anchor='w', bg="white")
-        current_pw_label.pack(side=tk.LEFT)
-        
-        self.current_pw_entry = tk.Entry(current_pw_frame, width=40, show="*")
-        self.current_pw_entry.pack(side=tk.LEFT, padx=5)
-        
-        # New password field
-        new_pw_frame = tk.Frame(password_section, bg="white")
-        new_pw_frame.pack(fill='x', pady=10)
-        
-        new_pw_label = tk.Label(new_pw_frame, text="New Password:", width=15, anchor='w', bg="white")
-        new_pw_label.pack(side=tk.LEFT)
-        
-        self.new_pw_entry = tk.Entry(new_pw_frame, width=40, show="*")
-        self.new_pw_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Confirm new password field
-        confirm_pw_frame = tk.Frame(password_section, bg="white")
-        confirm_pw_frame.pack(fill='x', pady=10)
-        
-        confirm_pw_label = tk.Label(confirm_pw_frame, text="Confirm Password:", width=15, anchor='w', bg="white")
-        confirm_pw_label.pack(side=tk.LEFT)
-        
-        self.confirm_pw_entry = tk.Entry(confirm_pw_frame, width=40, show="*")
-        self.confirm_pw_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Update buttons
-        button_frame = tk.Frame(settings_container, bg="white", pady=15)
-        button_frame.pack(fill='x', padx=20)
-        
-        # Update profile button
-        update_profile_button = tk.Button(button_frame, text="Update Profile", 
-                                       command=lambda: self.update_user_profile(),
-                                       bg=self.accent_color, fg="white",
-                                       width=15)
-        update_profile_button.pack(side=tk.LEFT, padx=5)
-        
-        # Change password button
-        change_pw_button = tk.Button(button_frame, text="Change Password", 
-                                   command=lambda: self.change_password(),
-                                   bg="#ff9800", fg="white",
-                                   width=15)
-        change_pw_button.pack(side=tk.LEFT, padx=5)
-    
-    # Update user profile
-    def update_user_profile(self):
-        # Get updated values
-        new_name = self.settings_name_entry.get()
-        new_email = self.settings_email_entry.get()
-        
-        # Basic validation
-        if not new_name or not new_email:
-            messagebox.showerror("Update Error", "Name and email cannot be empty")
-            return
-        
-        # Check email format
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", new_email):
-            messagebox.showerror("Update Error", "Invalid email format")
-            return
-        
-        # Check if email is already used by another user
-        if new_email != self.current_user.get_user_email():
-            existing_customer = self.data_manager.get_customer_by_email(new_email)
-            existing_admin = self.data_manager.get_admin_by_email(new_email)
-            
-            if (existing_customer and existing_customer.get_user_id() != self.current_user.get_user_id()) or \
-               (existing_admin and existing_admin.get_user_id() != self.current_user.get_user_id()):
-                messagebox.showerror("Update Error", "Email is already used by another account")
-                return
-        
-        # Update user information
-        self.current_user.set_user_name(new_name)
-        self.current_user.set_user_email(new_email)
-        
-        # Update customer-specific fields if applicable
-        if isinstance(self.current_user, Customer):
-            new_address = self.settings_address_entry.get()
-            new_phone = self.settings_phone_entry.get()
-            new_payment_info = self.settings_payment_entry.get()
-            
-            if not new_address or not new_phone:
-                messagebox.showerror("Update Error", "Address and phone cannot be empty")
-                return
-            
-            self.current_user.set_customer_address(new_address)
-            self.current_user.set_customer_phone(new_phone)
-            self.current_user.set_payment_info(new_payment_info)
-            
-            # Update in data manager
-            self.data_manager.update_customer(self.current_user)
-        elif isinstance(self.current_user, Admin):
-            # Update in data manager
-            self.data_manager.update_admin(self.current_user)
-        
-        messagebox.showinfo("Profile Updated", "Your profile has been updated successfully")
-    
-    # Change password
-    def change_password(self):
-        current_pw = self.current_pw_entry.get()
-        new_pw = self.new_pw_entry.get()
-        confirm_pw = self.confirm_pw_entry.get()
-        
-        # Validate inputs
-        if not current_pw or not new_pw or not confirm_pw:
-            messagebox.showerror("Password Error", "All password fields are required")
-            return
-        
-        # Check current password
-        if current_pw != self.current_user.get_user_password():
-            messagebox.showerror("Password Error", "Current password is incorrect")
-            return
-        
-        # Check if new passwords match
-        if new_pw != confirm_pw:
-            messagebox.showerror("Password Error", "New passwords do not match")
-            return
-        
-        # Update password
-        self.current_user.set_user_password(new_pw)
-        
-        # Update in data manager
-        if isinstance(self.current_user, Customer):
-            self.data_manager.update_customer(self.current_user)
-        elif isinstance(self.current_user, Admin):
-            self.data_manager.update_admin(self.current_user)
-        
-        messagebox.showinfo("Password Changed", "Your password has been changed successfully")
-        
-        # Clear password fields
-        self.current_pw_entry.delete(0, tk.END)
-        self.new_pw_entry.delete(0, tk.END)
-        self.confirm_pw_entry.delete(0, tk.END)
-    
-    # Show admin dashboard
-    def show_admin_dashboard(self):
-        # Clear any existing frames
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Create dashboard frame
-        self.dashboard_frame = tk.Frame(self.root, bg=self.bg_color)
-        self.dashboard_frame.pack(expand=True, fill='both')
-        
-        # Create sidebar and main content area
-        self.sidebar_frame = tk.Frame(self.dashboard_frame, bg="#d4e6ff", width=200)
-        self.sidebar_frame.pack(side=tk.LEFT, fill='y')
-        
-        # Make sure sidebar maintains its width
-        self.sidebar_frame.pack_propagate(False)
-        
-        # Main content area
-        self.content_frame = tk.Frame(self.dashboard_frame, bg=self.bg_color)
-        self.content_frame.pack(side=tk.RIGHT, expand=True, fill='both')
-        
-        # Add admin info to sidebar
-        admin_info_frame = tk.Frame(self.sidebar_frame, bg="#d4e6ff", pady=20)
-        admin_info_frame.pack(fill='x')
-        
-        # Admin avatar (placeholder)
-        avatar_label = tk.Label(admin_info_frame, text="👨‍💼", font=("Helvetica", 24), bg="#d4e6ff")
-        avatar_label.pack()
-        
-        # Admin name
-        name_label = tk.Label(admin_info_frame, text=self.current_user.get_user_name(), 
-                            font=("Helvetica", 12, "bold"), bg="#d4e6ff")
-        name_label.pack(pady=(5, 0))
-        
-        # Admin role
-        role_label = tk.Label(admin_info_frame, text=self.current_user.get_admin_role(), 
-                            font=("Helvetica", 10), bg="#d4e6ff")
-        role_label.pack()
-        
-        # Add separator
-        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
-        
-        # Navigation menu
-        menu_font = font.Font(family='Helvetica', size=11)
-        
-        # Dashboard button (selected by default)
-        dashboard_btn = tk.Button(self.sidebar_frame, text="Dashboard", font=menu_font,
-                               bg="#4da6ff", fg="white", bd=0, pady=8,
-                               command=lambda: self.show_admin_dashboard_content())
-        dashboard_btn.pack(fill='x', pady=2)
-        
-        # Manage events button
-        events_btn = tk.Button(self.sidebar_frame, text="Manage Events", font=menu_font,
-                            bg="#d4e6ff", fg="black", bd=0, pady=8,
-                            command=lambda: self.show_manage_events())
-        events_btn.pack(fill='x', pady=2)
-        
-        # Manage users button
-        users_btn = tk.Button(self.sidebar_frame, text="Manage Users", font=menu_font,
-                           bg="#d4e6ff", fg="black", bd=0, pady=8,
-                           command=lambda: self.show_manage_users())
-        users_btn.pack(fill='x', pady=2)
-        
-        # Manage discounts button
-        discounts_btn = tk.Button(self.sidebar_frame, text="Manage Discounts", font=menu_font,
-                               bg="#d4e6ff", fg="black", bd=0, pady=8,
-                               command=lambda: self.show_manage_discounts())
-        discounts_btn.pack(fill='x', pady=2)
-        
-        # Booking reports button
-        reports_btn = tk.Button(self.sidebar_frame, text="Booking Reports", font=menu_font,
-                             bg="#d4e6ff", fg="black", bd=0, pady=8,
-                             command=lambda: self.show_booking_reports())
-        reports_btn.pack(fill='x', pady=2)
-        
-        # Add separator
-        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
-        
-        # Logout button at bottom of sidebar
-        logout_btn = tk.Button(self.sidebar_frame, text="Logout", font=menu_font,
-                            bg="#ff6666", fg="white", bd=0, pady=8,
-                            command=lambda: self.logout())
-        logout_btn.pack(fill='x', pady=2, side=tk.BOTTOM)
-        
-        # Show default admin dashboard content
-        self.show_admin_dashboard_content()
-    
-    # Admin dashboard content
-    def show_admin_dashboard_content(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create welcome header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        welcome_label = tk.Label(header_frame, text="Admin Dashboard", 
-                              font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        welcome_label.pack()
-        
-        date_label = tk.Label(header_frame, text="Today: " + datetime.now().strftime("%B %d, %Y"), 
-                           font=("Helvetica", 10), bg=self.bg_color)
-        date_label.pack()
-        
-        # Create dashboard stats
-        stats_frame = tk.Frame(self.content_frame, bg=self.bg_color)
-        stats_frame.pack(fill='both', expand=True, padx=20, pady=20)
-        
-        # Configure grid
-        stats_frame.columnconfigure(0, weight=1)
-        stats_frame.columnconfigure(1, weight=1)
-        stats_frame.columnconfigure(2, weight=1)
-        stats_frame.rowconfigure(0, weight=1)
-        stats_frame.rowconfigure(1, weight=1)
-        
-        # Stat 1: Total Events
-        stat1 = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        stat1.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        
-        stat1_title = tk.Label(stat1, text="Total Events", font=("Helvetica", 14, "bold"), bg="white")
-        stat1_title.pack()
-        
-        stat1_value = tk.Label(stat1, text=str(len(self.data_manager.events)), 
-                            font=("Helvetica", 24), bg="white", fg="#2196f3")
-        stat1_value.pack()
-        
-        # Stat 2: Total Bookings
-        stat2 = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        stat2.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        
-        stat2_title = tk.Label(stat2, text="Total Bookings", font=("Helvetica", 14, "bold"), bg="white")
-        stat2_title.pack()
-        
-        stat2_value = tk.Label(stat2, text=str(len(self.data_manager.bookings)), 
-                            font=("Helvetica", 24), bg="white", fg="#4caf50")
-        stat2_value.pack()
-        
-        # Stat 3: Total Users
-        stat3 = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        stat3.grid(row=0, column=2, padx=10, pady=10, sticky="nsew")
-        
-        stat3_title = tk.Label(stat3, text="Total Users", font=("Helvetica", 14, "bold"), bg="white")
-        stat3_title.pack()
-        
-        stat3_value = tk.Label(stat3, text=str(len(self.data_manager.customers)), 
-                            font=("Helvetica", 24), bg="white", fg="#ff9800")
-        stat3_value.pack()
-        
-        # Upcoming events section
-        upcoming_frame = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        upcoming_frame.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
-        
-        upcoming_title = tk.Label(upcoming_frame, text="Upcoming Events", 
-                               font=("Helvetica", 14, "bold"), bg="white")
-        upcoming_title.pack(anchor='w')
-        
-        ttk.Separator(upcoming_frame, orient='horizontal').pack(fill='x', pady=5)
-        
-        # Get upcoming events
-        upcoming_events = sorted(self.data_manager.events, key=lambda e: e.get_event_date())
-        upcoming_events = [e for e in upcoming_events if e.get_event_date() > datetime.now()][:5]
-        
-        if upcoming_events:
-            for event in upcoming_events:
-                event_frame = tk.Frame(upcoming_frame, bg="white", pady=5)
-                event_frame.pack(fill='x')
-                
-                event_name = tk.Label(event_frame, text=event.get_event_name(), 
-                                   font=("Helvetica", 11), bg="white")
-                event_name.pack(side=tk.LEFT, anchor='w')
-                
-                event_date = tk.Label(event_frame, text=event.get_event_date().strftime("%B %d, %Y"), 
-                                   bg="white", fg="gray")
-                event_date.pack(side=tk.RIGHT, anchor='e')
-                
-                ttk.Separator(upcoming_frame, orient='horizontal').pack(fill='x', pady=2)
-        else:
-            no_events = tk.Label(upcoming_frame, text="No upcoming events", bg="white")
-            no_events.pack(pady=10)
-        
-        # Quick actions
-        actions_frame = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
-        actions_frame.grid(row=1, column=2, padx=10, pady=10, sticky="nsew")
-        
-        actions_title = tk.Label(actions_frame, text="Quick Actions", 
-                              font=("Helvetica", 14, "bold"), bg="white")
-        actions_title.pack(anchor='w')
-        
-        ttk.Separator(actions_frame, orient='horizontal').pack(fill='x', pady=5)
-        
-        # Action buttons
-        add_event_btn = tk.Button(actions_frame, text="Add New Event", 
-                               bg="#4caf50", fg="white", width=20,
-                               command=lambda: self.show_add_event_form())
-        add_event_btn.pack(pady=5)
-        
-        view_bookings_btn = tk.Button(actions_frame, text="View All Bookings", 
-                                   bg="#2196f3", fg="white", width=20,
-                                   command=lambda: self.show_booking_reports())
-        view_bookings_btn.pack(pady=5)
-        
-        add_discount_btn = tk.Button(actions_frame, text="Add New Discount", 
-                                  bg="#ff9800", fg="white", width=20,
-                                  command=lambda: self.show_add_discount_form())
-        add_discount_btn.pack(pady=5)
-    
-    # Manage events
-    def show_manage_events(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        events_label = tk.Label(header_frame, text="Manage Events", 
-                             font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        events_label.pack()
-        
-        subtitle_label = tk.Label(header_frame, text="Add, edit, or delete events", 
-                               font=("Helvetica", 10), bg=self.bg_color)
-        subtitle_label.pack()
-        
-        # Add event button
-        add_btn = tk.Button(header_frame, text="Add New Event", 
-                         bg="#4caf50", fg="white", padx=10, pady=5,
-                         command=lambda: self.show_add_event_form())
-        add_btn.pack(pady=10)
-        
-        # Create scrollable events list
-        events_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        events_container.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Create canvas with scrollbar for events
-        canvas = tk.Canvas(events_container, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(events_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Get sorted events by date
-        sorted_events = sorted(self.data_manager.events, key=lambda e: e.get_event_date())
-        
-        if sorted_events:
-            for event in sorted_events:
-                # Create event card
-                event_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
-                event_card.pack(fill='x', padx=10, pady=10)
-                
-                # Event details
-                event_name = tk.Label(event_card, text=event.get_event_name(), 
-                                   font=("Helvetica", 14, "bold"), bg="white")
-                event_name.grid(row=0, column=0, sticky='w', pady=(0, 5))
-                
-                event_id = tk.Label(event_card, text="ID: " + str(event.get_event_id()), 
-                                 bg="white", fg="gray")
-                event_id.grid(row=0, column=1, sticky='e')
-                
-                event_date = tk.Label(event_card, text="Date: " + event.get_event_date().strftime("%B %d, %Y"), 
-                                   bg="white")
-                event_date.grid(row=1, column=0, sticky='w')
-                
-                event_location = tk.Label(event_card, text="Location: " + event.get_event_location(), 
-                                       bg="white")
-                event_location.grid(row=2, column=0, sticky='w')
-                
-                event_capacity = tk.Label(event_card, 
-                                       text="Available Tickets: " + str(event.get_remaining_capacity()) + 
-                                       " of " + str(event.get_event_capacity()),
-                                       bg="white")
-                event_capacity.grid(row=3, column=0, sticky='w')
-                
-                # Edit button
-                edit_button = tk.Button(event_card, text="Edit", 
-                                     bg=self.accent_color, fg="white",
-                                     command=lambda e=event: self.show_edit_event_form(e))
-                edit_button.grid(row=1, column=1, padx=(20, 0))
-                
-                # Delete button
-                delete_button = tk.Button(event_card, text="Delete", 
-                                       bg="#ff6666", fg="white",
-                                       command=lambda e=event: self.delete_event(e))
-                delete_button.grid(row=2, column=1, padx=(20, 0))
-                
-                # Set grid configuration
-                event_card.columnconfigure(0, weight=1)
-                event_card.columnconfigure(1, weight=0)
-        else:
-            no_events = tk.Label(scrollable_frame, text="No events available", 
-                              font=("Helvetica", 12), bg=self.bg_color)
-            no_events.pack(pady=50)
-    
-    # Show add event form
-    def show_add_event_form(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        add_label = tk.Label(header_frame, text="Add New Event", 
-                          font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        add_label.pack()
-        
-        # Create form container
-        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
-        form_container.pack(fill='both', expand=True, padx=100, pady=20)
-        
-        # Event name field
-        name_frame = tk.Frame(form_container, bg="white", pady=10)
-        name_frame.pack(fill='x', padx=20)
-        
-        name_label = tk.Label(name_frame, text="Event Name:", width=15, anchor='w', bg="white")
-        name_label.pack(side=tk.LEFT)
-        
-        self.event_name_entry = tk.Entry(name_frame, width=40)
-        self.event_name_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Event ID field
-        id_frame = tk.Frame(form_container, bg="white", pady=10)
-        id_frame.pack(fill='x', padx=20)
-        
-        id_label = tk.Label(id_frame, text="Event ID:", width=15, anchor='w', bg="white")
-        id_label.pack(side=tk.LEFT)
-        
-        # Auto-generate an event ID
-        next_id = max([e.get_event_id() for e in self.data_manager.events], default=200) + 1
-        
-        self.event_id_entry = tk.Entry(id_frame, width=10)
-        self.event_id_entry.insert(0, str(next_id))
-        self.event_id_entry.config(state='readonly')
-        self.event_id_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Event date field
-        date_frame = tk.Frame(form_container, bg="white", pady=10)
-        date_frame.pack(fill='x', padx=20)
-        
-        date_label = tk.Label(date_frame, text="Event Date (YYYY-MM-DD):", width=15, anchor='w', bg="white")
-        date_label.pack(side=tk.LEFT)
-        
-        self.event_date_entry = tk.Entry(date_frame, width=15)
-        self.event_date_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Event location field
-        location_frame = tk.Frame(form_container, bg="white", pady=10)
-        location_frame.pack(fill='x', padx=20)
-        
-        location_label = tk.Label(location_frame, text="Location:", width=15, anchor='w', bg="white")
-        location_label.pack(side=tk.LEFT)
-        
-        self.event_location_entry = tk.Entry(location_frame, width=40)
-        self.event_location_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Capacity field
-        capacity_frame = tk.Frame(form_container, bg="white", pady=10)
-        capacity_frame.pack(fill='x', padx=20)
-        
-        capacity_label = tk.Label(capacity_frame, text="Capacity:", width=15, anchor='w', bg="white")
-        capacity_label.pack(side=tk.LEFT)
-        
-        self.event_capacity_entry = tk.Entry(capacity_frame, width=10)
-        self.event_capacity_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Buttons
-        button_frame = tk.Frame(form_container, bg="white", pady=20)
-        button_frame.pack(fill='x', padx=20)
-        
-        # Back button
-        back_button = tk.Button(button_frame, text="Cancel", 
-                             command=lambda: self.show_manage_events(),
-                             bg="#f0f0f0", fg="black", width=10)
-        back_button.pack(side=tk.LEFT, padx=5)
-        
-        # Save button
-        save_button = tk.Button(button_frame, text="Save Event", 
-                             command=lambda: self.save_event(),
-                             bg="#4caf50", fg="white", width=10)
-        save_button.pack(side=tk.RIGHT, padx=5)
-    
-    # Save new event
-    def save_event(self):
-        # Get form values
-        name = self.event_name_entry.get()
-        event_id = int(self.event_id_entry.get())
-        date_str = self.event_date_entry.get()
-        location = self.event_location_entry.get()
-        capacity_str = self.event_capacity_entry.get()
-        
-        # Validate inputs
-        if not name or not date_str or not location or not capacity_str:
-            messagebox.showerror("Input Error", "All fields are required")
-            return
-        
-        try:
-            # Parse date
-            date_parts = date_str.split('-')
-            if len(date_parts) != 3:
-                raise ValueError("Invalid date format")
-                
-            year, month, day = map(int, date_parts)
-            date = datetime(year, month, day)
-            
-            # Parse capacity
-            capacity = int(capacity_str)
-            if capacity <= 0:
-                raise ValueError("Capacity must be positive")
-                
-        except ValueError as e:
-            messagebox.showerror("Input Error", str(e))
-            return
-        
-        # Create new event
-        new_event = Event(name, event_id, date, location, capacity)
-        
-        # Add to data manager
-        self.data_manager.add_event(new_event)
-        
-        messagebox.showinfo("Event Added", "The event has been added successfully")
-        
-        # Return to events list
-        self.show_manage_events()
-    
-    # Show edit event form
-    def show_edit_event_form(self, event):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        edit_label = tk.Label(header_frame, text="Edit Event", 
-                           font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        edit_label.pack()
-        
-        # Create form container
-        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
-        form_container.pack(fill='both', expand=True, padx=100, pady=20)
-        
-        # Event name field
-        name_frame = tk.Frame(form_container, bg="white", pady=10)
-        name_frame.pack(fill='x', padx=20)
-        
-        name_label = tk.Label(name_frame, text="Event Name:", width=15, anchor='w', bg="white")
-        name_label.pack(side=tk.LEFT)
-        
-        self.event_name_entry = tk.Entry(name_frame, width=40)
-        self.event_name_entry.insert(0, event.get_event_name())
-        self.event_name_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Event ID field
-        id_frame = tk.Frame(form_container, bg="white", pady=10)
-        id_frame.pack(fill='x', padx=20)
-        
-        id_label = tk.Label(id_frame, text="Event ID:", width=15, anchor='w', bg="white")
-        id_label.pack(side=tk.LEFT)
-        
-        self.event_id_entry = tk.Entry(id_frame, width=10)
-        self.event_id_entry.insert(0, str(event.get_event_id()))
-        self.event_id_entry.config(state='readonly')
-        self.event_id_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Event date field
-        date_frame = tk.Frame(form_container, bg="white", pady=10)
-        date_frame.pack(fill='x', padx=20)
-        
-        date_label = tk.Label(date_frame, text="Event Date (YYYY-MM-DD):", width=15, anchor='w', bg="white")
-        date_label.pack(side=tk.LEFT)
-        
-        self.event_date_entry = tk.Entry(date_frame, width=15)
-        self.event_date_entry.insert(0, event.get_event_date().strftime("%Y-%m-%d"))
-        self.event_date_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Event location field
-        location_frame = tk.Frame(form_container, bg="white", pady=10)
-        location_frame.pack(fill='x', padx=20)
-        
-        location_label = tk.Label(location_frame, text="Location:", width=15, anchor='w', bg="white")
-        location_label.pack(side=tk.LEFT)
-        
-        self.event_location_entry = tk.Entry(location_frame, width=40)
-        self.event_location_entry.insert(0, event.get_event_location())
-        self.event_location_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Capacity field
-        capacity_frame = tk.Frame(form_container, bg="white", pady=10)
-        capacity_frame.pack(fill='x', padx=20)
-        
-        capacity_label = tk.Label(capacity_frame, text="Capacity:", width=15, anchor='w', bg="white")
-        capacity_label.pack(side=tk.LEFT)
-        
-        self.event_capacity_entry = tk.Entry(capacity_frame, width=10)
-        self.event_capacity_entry.insert(0, str(event.get_event_capacity()))
-        self.event_capacity_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Buttons
-        button_frame = tk.Frame(form_container, bg="white", pady=20)
-        button_frame.pack(fill='x', padx=20)
-        
-        # Back button
-        back_button = tk.Button(button_frame, text="Cancel", 
-                             command=lambda: self.show_manage_events(),
-                             bg="#f0f0f0", fg="black", width=10)
-        back_button.pack(side=tk.LEFT, padx=5)
-        
-        # Update button
-        update_button = tk.Button(button_frame, text="Update Event", 
-                               command=lambda: self.update_event(event),
-                               bg="#4caf50", fg="white", width=10)
-        update_button.pack(side=tk.RIGHT, padx=5)
-    
-    # Update existing event
-    def update_event(self, event):
-        # Get form values
-        name = self.event_name_entry.get()
-        date_str = self.event_date_entry.get()
-        location = self.event_location_entry.get()
-        capacity_str = self.event_capacity_entry.get()
-        
-        # Validate inputs
-        if not name or not date_str or not location or not capacity_str:
-            messagebox.showerror("Input Error", "All fields are required")
-            return
-        
-        try:
-            # Parse date
-            date_parts = date_str.split('-')
-            if len(date_parts) != 3:
-                raise ValueError("Invalid date format")
-                
-            year, month, day = map(int, date_parts)
-            date = datetime(year, month, day)
-            
-            # Parse capacity
-            capacity = int(capacity_str)
-            if capacity <= 0:
-                raise ValueError("Capacity must be positive")
-                
-            # Check if new capacity is less than tickets sold
-            tickets_sold = event.get_event_capacity() - event.get_remaining_capacity()
-            if capacity < tickets_sold:
-                raise ValueError("New capacity cannot be less than tickets already sold")
-                
-        except ValueError as e:
-            messagebox.showerror("Input Error", str(e))
-            return
-        
-        # Update event
-        event.set_event_name(name)
-        event.set_event_date(date)
-        event.set_event_location(location)
-        event.set_event_capacity(capacity)
-        
-        # Update in data manager
-        self.data_manager.update_event(event)
-        
-        messagebox.showinfo("Event Updated", "The event has been updated successfully")
-        
-        # Return to events list
-        self.show_manage_events()
-    
-    # Delete event
-    def delete_event(self, event):
-        # Check if there are bookings for this event
-        event_bookings = self.data_manager.get_bookings_by_event_id(event.get_event_id())
-        
-        if event_bookings:
-            messagebox.showerror("Delete Error", 
-                              "Cannot delete this event because there are bookings associated with it")
-            return
-        
-        # Ask for confirmation
-        confirm = messagebox.askyesno("Delete Event", 
-                                    "Are you sure you want to delete this event? This action cannot be undone.")
-        
-        if confirm:
-            # Delete event
-            self.data_manager.delete_event(event.get_event_id())
-            
-            messagebox.showinfo("Event Deleted", "The event has been deleted successfully")
-            
-            # Refresh events list
-            self.show_manage_events()
-    
-    # Manage users
-    def show_manage_users(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        users_label = tk.Label(header_frame, text="Manage Users", 
-                            font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        users_label.pack()
-        
-        subtitle_label = tk.Label(header_frame, text="View and manage user accounts", 
-                               font=("Helvetica", 10), bg=self.bg_color)
-        subtitle_label.pack()
-        
-        # Create scrollable users list
-        users_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        users_container.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Create canvas with scrollbar for users
-        canvas = tk.Canvas(users_container, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(users_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Get sorted customers by name
-        sorted_customers = sorted(self.data_manager.customers, key=lambda c: c.get_user_name())
-        
-        if sorted_customers:
-            for customer in sorted_customers:
-                # Create user card
-                user_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
-                user_card.pack(fill='x', padx=10, pady=10)
-                
-                # User details
-                user_name = tk.Label(user_card, text=customer.get_user_name(), 
-                                  font=("Helvetica", 14, "bold"), bg="white")
-                user_name.grid(row=0, column=0, sticky='w', pady=(0, 5))
-                
-                user_id = tk.Label(user_card, text="ID: " + str(customer.get_user_id()), 
-                                bg="white", fg="gray")
-                user_id.grid(row=0, column=1, sticky='e')
-                
-                user_email = tk.Label(user_card, text="Email: " + customer.get_user_email(), 
-                                   bg="white")
-                user_email.grid(row=1, column=0, sticky='w')
-                
-                user_phone = tk.Label(user_card, text="Phone: " + str(customer.get_customer_phone()), 
-                                   bg="white")
-                user_phone.grid(row=2, column=0, sticky='w')
-                
-                user_address = tk.Label(user_card, text="Address: " + customer.get_customer_address(), 
-                                     bg="white")
-                user_address.grid(row=3, column=0, sticky='w')
-                
-                user_registered = tk.Label(user_card, 
-                                        text="Registered: " + customer.get_registration_date().strftime("%B %d, %Y"),
-                                        bg="white")
-                user_registered.grid(row=4, column=0, sticky='w')
-                
-                # View bookings button
-                bookings_button = tk.Button(user_card, text="View Bookings", 
-                                         bg=self.accent_color, fg="white",
-                                         command=lambda c=customer: self.show_user_bookings(c))
-                bookings_button.grid(row=1, column=1, padx=(20, 0))
-                
-                # Delete button
-                delete_button = tk.Button(user_card, text="Delete User", 
-                                       bg="#ff6666", fg="white",
-                                       command=lambda c=customer: self.delete_user(c))
-                delete_button.grid(row=2, column=1, padx=(20, 0))
-                
-                # Set grid configuration
-                user_card.columnconfigure(0, weight=1)
-                user_card.columnconfigure(1, weight=0)
-        else:
-            no_users = tk.Label(scrollable_frame, text="No users available", 
-                             font=("Helvetica", 12), bg=self.bg_color)
-            no_users.pack(pady=50)
-    
-    # Show user's bookings
-    def show_user_bookings(self, customer):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        bookings_label = tk.Label(header_frame, text="Bookings for " + customer.get_user_name(), 
-                               font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        bookings_label.pack()
-        
-        # Back button
-        back_button = tk.Button(header_frame, text="Back to Users", 
-                             command=lambda: self.show_manage_users(),
-                             bg="#f0f0f0", fg="black")
-        back_button.pack(pady=10)
-        
-        # Create scrollable bookings list
-        bookings_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        bookings_container.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Get user's bookings
-        user_bookings = self.data_manager.get_bookings_by_user_id(customer.get_user_id())
-        
-        if user_bookings:
-            # Sort bookings by date (newest first)
-            sorted_bookings = sorted(user_bookings, key=lambda b: b.get_booking_date(), reverse=True)
-            
-            for booking in sorted_bookings:
-                # Get related event
-                event = self.data_manager.get_event_by_id(booking.get_event_id())
-                if not event:
-                    continue
-                
-                # Create booking card
-                booking_card = tk.Frame(bookings_container, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
-                booking_card.pack(fill='x', padx=10, pady=10)
-                
-                # Booking details
-                booking_title = tk.Label(booking_card, 
-                                      text="Booking ID: " + str(booking.get_booking_id()),
-                                      font=("Helvetica", 14, "bold"), bg="white")
-                booking_title.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 10))
-                
-                # Event name
-                event_name = tk.Label(booking_card, text="Event: " + event.get_event_name(), bg="white")
-                event_name.grid(row=1, column=0, sticky='w')
-                
-                # Event date and location
-                event_info = tk.Label(booking_card, 
-                                   text="Date: " + event.get_event_date().strftime("%B %d, %Y") + 
-                                   " at " + event.get_event_location(),
-                                   bg="white")
-                event_info.grid(row=2, column=0, sticky='w')
-                
-                # Booking date
-                booking_date = tk.Label(booking_card, 
-                                     text="Booked on: " + booking.get_booking_date().strftime("%B %d, %Y"),
-                                     bg="white")
-                booking_date.grid(row=3, column=0, sticky='w')
-                
-                # Ticket count
-                tickets_label = tk.Label(booking_card, text="Tickets: " + str(booking.get_number_of_tickets()), 
-                                      bg="white")
-                tickets_label.grid(row=4, column=0, sticky='w')
-                
-                # Total price
-                price_label = tk.Label(booking_card, text="Total Price: $" + str(booking.get_total_price()), 
-                                    bg="white")
-                price_label.grid(row=5, column=0, sticky='w')
-                
-                # Status
-                status_label = tk.Label(booking_card, 
-                                     text="Status: " + booking.get_booking_status().value,
-                                     bg="white", 
-                                     fg="green" if booking.get_booking_status() == BookingStatus.CONFIRMED 
-                                     else "orange" if booking.get_booking_status() == BookingStatus.PENDING
-                                     else "red")
-                status_label.grid(row=6, column=0, sticky='w')
-                
-                # Set grid configuration
-                booking_card.columnconfigure(0, weight=1)
-                booking_card.columnconfigure(1, weight=0)
-        else:
-            no_bookings = tk.Label(bookings_container, text="This user has no bookings", 
-                                font=("Helvetica", 12), bg=self.bg_color)
-            no_bookings.pack(pady=50)
-    
-    # Delete user
-    def delete_user(self, customer):
-        # Check if there are bookings for this user
-        user_bookings = self.data_manager.get_bookings_by_user_id(customer.get_user_id())
-        
-        if user_bookings:
-            messagebox.showerror("Delete Error", 
-                              "Cannot delete this user because they have bookings associated with them")
-            return
-        
-        # Ask for confirmation
-        confirm = messagebox.askyesno("Delete User", 
-                                    "Are you sure you want to delete this user? This action cannot be undone.")
-        
-        if confirm:
-            # Delete user
-            self.data_manager.delete_customer(customer.get_user_id())
-            
-            messagebox.showinfo("User Deleted", "The user has been deleted successfully")
-            
-            # Refresh users list
-            self.show_manage_users()
-    
-    # Manage discounts
-    def show_manage_discounts(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        discounts_label = tk.Label(header_frame, text="Manage Discounts", 
-                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        discounts_label.pack()
-        
-        subtitle_label = tk.Label(header_frame, text="Add, edit, or delete discount codes", 
-                               font=("Helvetica", 10), bg=self.bg_color)
-        subtitle_label.pack()
-        
-        # Add discount button
-        add_btn = tk.Button(header_frame, text="Add New Discount", 
-                         bg="#4caf50", fg="white", padx=10, pady=5,
-                         command=lambda: self.show_add_discount_form())
-        add_btn.pack(pady=10)
-        
-        # Create discount list
-        discounts_container = tk.Frame(self.content_frame, bg=self.bg_color)
-        discounts_container.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Get discounts
-        if self.data_manager.discounts:
-            for discount in self.data_manager.discounts:
-                # Create discount card
-                discount_card = tk.Frame(discounts_container, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
-                discount_card.pack(fill='x', padx=10, pady=10)
-                
-                # Discount details
-                discount_code = tk.Label(discount_card, text=discount.get_discount_code(), 
-                                      font=("Helvetica", 14, "bold"), bg="white")
-                discount_code.grid(row=0, column=0, sticky='w', pady=(0, 5))
-                
-                discount_id = tk.Label(discount_card, text="ID: " + str(discount.get_discount_id()), 
-                                    bg="white", fg="gray")
-                discount_id.grid(row=0, column=1, sticky='e')
-                
-                # Display percentage or fixed amount
-                if discount.get_discount_percentage() > 0:
-                    discount_value = tk.Label(discount_card, 
-                                           text="Discount: " + str(discount.get_discount_percentage()) + "%", 
-                                           bg="white")
-                else:
-                    discount_value = tk.Label(discount_card, 
-                                           text="Discount: $" + str(discount.get_discount_amount()), 
-                                           bg="white")
-                discount_value.grid(row=1, column=0, sticky='w')
-                
-                # Max amount
-                max_amount = tk.Label(discount_card, 
-                                   text="Maximum Discount: $" + str(discount.get_max_discount_amount()),
-                                   bg="white")
-                max_amount.grid(row=2, column=0, sticky='w')
-                
-                # Edit button
-                edit_button = tk.Button(discount_card, text="Edit", 
-                                     bg=self.accent_color, fg="white",
-                                     command=lambda d=discount: self.show_edit_discount_form(d))
-                edit_button.grid(row=1, column=1, padx=(20, 0))
-                
-                # Delete button
-                delete_button = tk.Button(discount_card, text="Delete", 
-                                       bg="#ff6666", fg="white",
-                                       command=lambda d=discount: self.delete_discount(d))
-                delete_button.grid(row=2, column=1, padx=(20, 0))
-                
-                # Set grid configuration
-                discount_card.columnconfigure(0, weight=1)
-                discount_card.columnconfigure(1, weight=0)
-        else:
-            no_discounts = tk.Label(discounts_container, text="No discounts available", 
-                                 font=("Helvetica", 12), bg=self.bg_color)
-            no_discounts.pack(pady=50)
-    
-    # Show add discount form
-    def show_add_discount_form(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        add_label = tk.Label(header_frame, text="Add New Discount", 
-                          font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        add_label.pack()
-        
-        # Create form container
-        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
-        form_container.pack(fill='both', expand=True, padx=100, pady=20)
-        
-        # Discount code field
-        code_frame = tk.Frame(form_container, bg="white", pady=10)
-        code_frame.pack(fill='x', padx=20)
-        
-        code_label = tk.Label(code_frame, text="Discount Code:", width=15, anchor='w', bg="white")
-        code_label.pack(side=tk.LEFT)
-        
-        self.discount_code_entry = tk.Entry(code_frame, width=20)
-        self.discount_code_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Discount ID field
-        id_frame = tk.Frame(form_container, bg="white", pady=10)
-        id_frame.pack(fill='x', padx=20)
-        
-        id_label = tk.Label(id_frame, text="Discount ID:", width=15, anchor='w', bg="white")
-        id_label.pack(side=tk.LEFT)
-        
-        # Auto-generate a discount ID
-        next_id = max([d.get_discount_id() for d in self.data_manager.discounts], default=0) + 1
-        
-        self.discount_id_entry = tk.Entry(id_frame, width=10)
-        self.discount_id_entry.insert(0, str(next_id))
-        self.discount_id_entry.config(state='readonly')
-        self.discount_id_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Discount type selection
-        type_frame = tk.Frame(form_container, bg="white", pady=10)
-        type_frame.pack(fill='x', padx=20)
-        
-        type_label = tk.Label(type_frame, text="Discount Type:", width=15, anchor='w', bg="white")
-        type_label.pack(side=tk.LEFT)
-        
-        self.discount_type_var = tk.StringVar(value="percentage")
-        
-        percentage_radio = tk.Radiobutton(type_frame, text="Percentage", 
-                                        variable=self.discount_type_var, value="percentage", 
-                                        bg="white", command=self.toggle_discount_fields)
-        percentage_radio.pack(side=tk.LEFT, padx=5)
-        
-        amount_radio = tk.Radiobutton(type_frame, text="Fixed Amount", 
-                                    variable=self.discount_type_var, value="amount", 
-                                    bg="white", command=self.toggle_discount_fields)
-        amount_radio.pack(side=tk.LEFT, padx=5)
-        
-        # Percentage field
-        self.percentage_frame = tk.Frame(form_container, bg="white", pady=10)
-        self.percentage_frame.pack(fill='x', padx=20)
-        
-        percentage_label = tk.Label(self.percentage_frame, text="Percentage (%):", width=15, anchor='w', bg="white")
-        percentage_label.pack(side=tk.LEFT)
-        
-        self.percentage_entry = tk.Entry(self.percentage_frame, width=10)
-        self.percentage_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Amount field (hidden by default)
-        self.amount_frame = tk.Frame(form_container, bg="white", pady=10)
-        
-        amount_label = tk.Label(self.amount_frame, text="Amount ($):", width=15, anchor='w', bg="white")
-        amount_label.pack(side=tk.LEFT)
-        
-        self.amount_entry = tk.Entry(self.amount_frame, width=10)
-        self.amount_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Maximum discount amount field
-        max_frame = tk.Frame(form_container, bg="white", pady=10)
-        max_frame.pack(fill='x', padx=20)
-        
-        max_label = tk.Label(max_frame, text="Max Amount ($):", width=15, anchor='w', bg="white")
-        max_label.pack(side=tk.LEFT)
-        
-        self.max_amount_entry = tk.Entry(max_frame, width=10)
-        self.max_amount_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Buttons
-        button_frame = tk.Frame(form_container, bg="white", pady=20)
-        button_frame.pack(fill='x', padx=20)
-        
-        # Back button
-        back_button = tk.Button(button_frame, text="Cancel", 
-                             command=lambda: self.show_manage_discounts(),
-                             bg="#f0f0f0", fg="black", width=10)
-        back_button.pack(side=tk.LEFT, padx=5)
-        
-        # Save button
-        save_button = tk.Button(button_frame, text="Save Discount", 
-                             command=lambda: self.save_discount(),
-                             bg="#4caf50", fg="white", width=10)
-        save_button.pack(side=tk.RIGHT, padx=5)
-    
-    # Toggle between percentage and amount discount fields
-    def toggle_discount_fields(self):
-        discount_type = self.discount_type_var.get()
-        
-        if discount_type == "percentage":
-            self.amount_frame.pack_forget()
-            self.percentage_frame.pack(fill='x', padx=20, after=self.discount_type_var.get())
-        else:
-            self.percentage_frame.pack_forget()
-            self.amount_frame.pack(fill='x', padx=20, after=self.discount_type_var.get())
-    
-    # Save new discount
-    def save_discount(self):
-        # Get form values
-        code = self.discount_code_entry.get()
-        discount_id = int(self.discount_id_entry.get())
-        discount_type = self.discount_type_var.get()
-        max_amount_str = self.max_amount_entry.get()
-        
-        # Validate inputs
-        if not code or not max_amount_str:
-            messagebox.showerror("Input Error", "Discount code and maximum amount are required")
-            return
-        
-        try:
-            # Parse max amount
-            max_amount = float(max_amount_str)
-            if max_amount <= 0:
-                raise ValueError("Maximum amount must be positive")
-            
-            # Parse percentage or amount based on type
-            if discount_type == "percentage":
-                percentage_str = self.percentage_entry.get()
-                if not percentage_str:
-                    raise ValueError("Percentage is required")
-                    
-                percentage = float(percentage_str)
-                if percentage <= 0 or percentage > 100:
-                    raise ValueError("Percentage must be between 1 and 100")
-                
-                amount = 0
-            else:
-                amount_str = self.amount_entry.get()
-                if not amount_str:
-                    raise ValueError("Amount is required")
-                    
-                amount = float(amount_str)
-                if amount <= 0:
-                    raise ValueError("Amount must be positive")
-                
-                percentage = 0
-                
-        except ValueError as e:
-            messagebox.showerror("Input Error", str(e))
-            return
-        
-        # Check if discount code already exists
-        if self.data_manager.get_discount_by_code(code):
-            messagebox.showerror("Input Error", "Discount code already exists")
-            return
-        
-        # Create new discount
-        new_discount = Discount(discount_id, percentage, amount, code, max_amount)
-        
-        # Add to data manager
-        self.data_manager.add_discount(new_discount)
-        
-        messagebox.showinfo("Discount Added", "The discount has been added successfully")
-        
-        # Return to discounts list
-        self.show_manage_discounts()
-    
-    # Show edit discount form
-    def show_edit_discount_form(self, discount):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        edit_label = tk.Label(header_frame, text="Edit Discount", 
-                           font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        edit_label.pack()
-        
-        # Create form container
-        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
-        form_container.pack(fill='both', expand=True, padx=100, pady=20)
-        
-        # Discount code field
-        code_frame = tk.Frame(form_container, bg="white", pady=10)
-        code_frame.pack(fill='x', padx=20)
-        
-        code_label = tk.Label(code_frame, text="Discount Code:", width=15, anchor='w', bg="white")
-        code_label.pack(side=tk.LEFT)
-        
-        self.discount_code_entry = tk.Entry(code_frame, width=20)
-        self.discount_code_entry.insert(0, discount.get_discount_code())
-        self.discount_code_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Discount ID field
-        id_frame = tk.Frame(form_container, bg="white", pady=10)
-        id_frame.pack(fill='x', padx=20)
-        
-        id_label = tk.Label(id_frame, text="Discount ID:", width=15, anchor='w', bg="white")
-        id_label.pack(side=tk.LEFT)
-        
-        self.discount_id_entry = tk.Entry(id_frame, width=10)
-        self.discount_id_entry.insert(0, str(discount.get_discount_id()))
-        self.discount_id_entry.config(state='readonly')
-        self.discount_id_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Discount type selection
-        type_frame = tk.Frame(form_container, bg="white", pady=10)
-        type_frame.pack(fill='x', padx=20)
-        
-        type_label = tk.Label(type_frame, text="Discount Type:", width=15, anchor='w', bg="white")
-        type_label.pack(side=tk.LEFT)
-        
-        # Determine current discount type
-        current_type = "percentage" if discount.get_discount_percentage() > 0 else "amount"
-        self.discount_type_var = tk.StringVar(value=current_type)
-        
-        percentage_radio = tk.Radiobutton(type_frame, text="Percentage", 
-                                        variable=self.discount_type_var, value="percentage", 
-                                        bg="white", command=self.toggle_discount_fields)
-        percentage_radio.pack(side=tk.LEFT, padx=5)
-        
-        amount_radio = tk.Radiobutton(type_frame, text="Fixed Amount", 
-                                    variable=self.discount_type_var, value="amount", 
-                                    bg="white", command=self.toggle_discount_fields)
-        amount_radio.pack(side=tk.LEFT, padx=5)
-        
-        # Percentage field
-        self.percentage_frame = tk.Frame(form_container, bg="white", pady=10)
-        
-        percentage_label = tk.Label(self.percentage_frame, text="Percentage (%):", width=15, anchor='w', bg="white")
-        percentage_label.pack(side=tk.LEFT)
-        
-        self.percentage_entry = tk.Entry(self.percentage_frame, width=10)
-        self.percentage_entry.insert(0, str(discount.get_discount_percentage()))
-        self.percentage_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Amount field
-        self.amount_frame = tk.Frame(form_container, bg="white", pady=10)
-        
-        amount_label = tk.Label(self.amount_frame, text="Amount ($):", width=15, anchor='w', bg="white")
-        amount_label.pack(side=tk.LEFT)
-        
-        self.amount_entry = tk.Entry(self.amount_frame, width=10)
-        self.amount_entry.insert(0, str(discount.get_discount_amount()))
-        self.amount_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Show appropriate frame based on current discount type
-        if current_type == "percentage":
-            self.percentage_frame.pack(fill='x', padx=20)
-        else:
-            self.amount_frame.pack(fill='x', padx=20)
-        
-        # Maximum discount amount field
-        max_frame = tk.Frame(form_container, bg="white", pady=10)
-        max_frame.pack(fill='x', padx=20)
-        
-        max_label = tk.Label(max_frame, text="Max Amount ($):", width=15, anchor='w', bg="white")
-        max_label.pack(side=tk.LEFT)
-        
-        self.max_amount_entry = tk.Entry(max_frame, width=10)
-        self.max_amount_entry.insert(0, str(discount.get_max_discount_amount()))
-        self.max_amount_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Buttons
-        button_frame = tk.Frame(form_container, bg="white", pady=20)
-        button_frame.pack(fill='x', padx=20)
-        
-        # Back button
-        back_button = tk.Button(button_frame, text="Cancel", 
-                             command=lambda: self.show_manage_discounts(),
-                             bg="#f0f0f0", fg="black", width=10)
-        back_button.pack(side=tk.LEFT, padx=5)
-        
-        # Update button
-        update_button = tk.Button(button_frame, text="Update Discount", 
-                               command=lambda: self.update_discount(discount),
-                               bg="#4caf50", fg="white", width=10)
-        update_button.pack(side=tk.RIGHT, padx=5)
-    
-    # Update existing discount
-    def update_discount(self, discount):
-        # Get form values
-        code = self.discount_code_entry.get()
-        discount_type = self.discount_type_var.get()
-        max_amount_str = self.max_amount_entry.get()
-        
-        # Validate inputs
-        if not code or not max_amount_str:
-            messagebox.showerror("Input Error", "Discount code and maximum amount are required")
-            return
-        
-        try:
-            # Parse max amount
-            max_amount = float(max_amount_str)
-            if max_amount <= 0:
-                raise ValueError("Maximum amount must be positive")
-            
-            # Parse percentage or amount based on type
-            if discount_type == "percentage":
-                percentage_str = self.percentage_entry.get()
-                if not percentage_str:
-                    raise ValueError("Percentage is required")
-                    
-                percentage = float(percentage_str)
-                if percentage <= 0 or percentage > 100:
-                    raise ValueError("Percentage must be between 1 and 100")
-                
-                amount = 0
-            else:
-                amount_str = self.amount_entry.get()
-                if not amount_str:
-                    raise ValueError("Amount is required")
-                    
-                amount = float(amount_str)
-                if amount <= 0:
-                    raise ValueError("Amount must be positive")
-                
-                percentage = 0
-                
-        except ValueError as e:
-            messagebox.showerror("Input Error", str(e))
-            return
-        
-        # Check if discount code already exists (except for this discount)
-        existing_discount = self.data_manager.get_discount_by_code(code)
-        if existing_discount and existing_discount.get_discount_id() != discount.get_discount_id():
-            messagebox.showerror("Input Error", "Discount code already exists")
-            return
-        
-        # Update discount
-        discount.set_discount_code(code)
-        discount.set_discount_percentage(percentage)
-        discount.set_discount_amount(amount)
-        discount.set_max_discount_amount(max_amount)
-        
-        # Update in data manager
-        self.data_manager.update_discount(discount)
-        
-        messagebox.showinfo("Discount Updated", "The discount has been updated successfully")
-        
-        # Return to discounts list
-        self.show_manage_discounts()
-    
-    # Delete discount
-    def delete_discount(self, discount):
-        # Ask for confirmation
-        confirm = messagebox.askyesno("Delete Discount", 
-                                    "Are you sure you want to delete this discount? This action cannot be undone.")
-        
-        if confirm:
-            # Delete discount
-            self.data_manager.delete_discount(discount.get_discount_id())
-            
-            messagebox.showinfo("Discount Deleted", "The discount has been deleted successfully")
-            
-            # Refresh discounts list
-            self.show_manage_discounts()
-    
-    # Show booking reports
-    def show_booking_reports(self):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create header
-        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
-        header_frame.pack(fill='x')
-        
-        reports_label = tk.Label(header_frame, text="Booking Reports", 
-                              font=("Helvetica", 18, "bold"), bg=self.bg_color)
-        reports_label.pack()
-        
-        subtitle_label = tk.Label(header_frame, text="View booking statistics and reports", 
-                               font=("Helvetica", 10), bg=self.bg_color)
-        subtitle_label.pack()
-        
-        # Create tabs for different reports
-        tab_frame = tk.Frame(self.content_frame, bg=self.bg_color)
-        tab_frame.pack(fill='x', padx=20, pady=10)
-        
-        # Tab buttons
-        daily_btn = tk.Button(tab_frame, text="Daily Sales", 
-                           bg=self.accent_color, fg="white", padx=15, pady=5,
-                           command=lambda: self.show_daily_sales())
-        daily_btn.pack(side=tk.LEFT, padx=5)
-        
-        event_btn = tk.Button(tab_frame, text="Sales by Event", 
-                           bg="#f0f0f0", fg="black", padx=15, pady=5,
-                           command=lambda: self.show_event_sales())
-        event_btn.pack(side=tk.LEFT, padx=5)
-        
-        all_bookings_btn = tk.Button(tab_frame, text="All Bookings", 
-                                  bg="#f0f0f0", fg="black", padx=15, pady=5,
-                                  command=lambda: self.show_all_bookings())
-        all_bookings_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Create container for report content
-        self.report_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
-        self.report_container.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Show daily sales by default
-        self.show_daily_sales()
-    
-    # Show daily sales report
-    def show_daily_sales(self):
-        # Clear report container
-        for widget in self.report_container.winfo_children():
-            widget.destroy()
-        
-        # Create report header
-        report_header = tk.Frame(self.report_container, bg="white", pady=15)
-        report_header.pack(fill='x', padx=20)
-        
-        header_label = tk.Label(report_header, text="Daily Ticket Sales", 
-                             font=("Helvetica", 14, "bold"), bg="white")
-        header_label.pack(anchor='w')
-        
-        # Group bookings by date
-        date_sales = {}
-        for booking in self.data_manager.bookings:
-            date_key = booking.get_booking_date().strftime("%Y-%m-%d")
-            
-            if date_key not in date_sales:
-                date_sales[date_key] = {
-                    "count": 0,
-                    "tickets": 0,
-                    "revenue": 0
-                }
-            
-            date_sales[date_key]["count"] += 1
-            date_sales[date_key]["tickets"] += booking.get_number_of_tickets()
-            date_sales[date_key]["revenue"] += booking.get_total_price()
-        
-        # Sort dates
-        sorted_dates = sorted(date_sales.keys(), reverse=True)
-        
-        # Create table header
-        table_frame = tk.Frame(self.report_container, bg="white")
-        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Table header
-        header_frame = tk.Frame(table_frame, bg="#f0f0f0")
-        header_frame.pack(fill='x')
-        
-        date_header = tk.Label(header_frame, text="Date", width=15, font=("Helvetica", 11, "bold"), 
-                            bg="#f0f0f0", padx=10, pady=5)
-        date_header.grid(row=0, column=0, sticky='w')
-        
-        bookings_header = tk.Label(header_frame, text="Bookings", width=10, font=("Helvetica", 11, "bold"), 
-                                bg="#f0f0f0", padx=10, pady=5)
-        bookings_header.grid(row=0, column=1, sticky='w')
-        
-        tickets_header = tk.Label(header_frame, text="Tickets", width=10, font=("Helvetica", 11, "bold"), 
-                               bg="#f0f0f0", padx=10, pady=5)
-        tickets_header.grid(row=0, column=2, sticky='w')
-        
-        revenue_header = tk.Label(header_frame, text="Revenue", width=15, font=("Helvetica", 11, "bold"), 
-                               bg="#f0f0f0", padx=10, pady=5)
-        revenue_header.grid(row=0, column=3, sticky='w')
-        
-        # Configure grid
-        header_frame.columnconfigure(0, weight=0)
-        header_frame.columnconfigure(1, weight=0)
-        header_frame.columnconfigure(2, weight=0)
-        header_frame.columnconfigure(3, weight=1)
-        
-        # Create scrollable table content
-        table_content = tk.Frame(table_frame, bg="white")
-        table_content.pack(fill='both', expand=True)
-        
-        # Create canvas with scrollbar
-        canvas = tk.Canvas(table_content, bg="white", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(table_content, orient="vertical", command=canvas.yview)
-        scrollable_table = tk.Frame(canvas, bg="white")
-        
-        scrollable_table.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_table, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Table rows
-        total_bookings = 0
-        total_tickets = 0
-        total_revenue = 0
-        
-        for i, date in enumerate(sorted_dates):
-            sales = date_sales[date]
-            row_bg = "#f9f9f9" if i % 2 == 0 else "white"
-            
-            # Date
-            date_label = tk.Label(scrollable_table, text=date, width=15, 
-                               bg=row_bg, padx=10, pady=5)
-            date_label.grid(row=i, column=0, sticky='w')
-            
-            # Bookings
-            bookings_label = tk.Label(scrollable_table, text=str(sales["count"]), width=10, 
-                                   bg=row_bg, padx=10, pady=5)
-            bookings_label.grid(row=i, column=1, sticky='w')
-            
-            # Tickets
-            tickets_label = tk.Label(scrollable_table, text=str(sales["tickets"]), width=10, 
-                                  bg=row_bg, padx=10, pady=5)
-            tickets_label.grid(row=i, column=2, sticky='w')
-            
-            # Revenue
-            revenue_label = tk.Label(scrollable_table, text="$" + str(sales["revenue"]), width=15, 
-                                  bg=row_bg, padx=10, pady=5)
-            revenue_label.grid(row=i, column=3, sticky='w')
-            
-            # Update totals
-            total_bookings += sales["count"]
-            total_tickets += sales["tickets"]
-            total_revenue += sales["revenue"]
-            
-            # Configure grid
-            scrollable_table.columnconfigure(0, weight=0)
-            scrollable_table.columnconfigure(1, weight=0)
-            scrollable_table.columnconfigure(2, weight=0)
-            scrollable_table.columnconfigure(3, weight=1)
-        
-        # Add totals row
-        total_separator = ttk.Separator(self.report_container, orient='horizontal')
-        total_separator.pack(fill='x', padx=20)
-        
-        total_frame = tk.Frame(self.report_container, bg="white", pady=10)
-        total_frame.pack(fill='x', padx=20)
-        
-        total_label = tk.Label(total_frame, text="Totals:", font=("Helvetica", 11, "bold"), 
-                            bg="white", width=15)
-        total_label.grid(row=0, column=0, sticky='w', padx=10)
-        
-        total_bookings_label = tk.Label(total_frame, text=str(total_bookings), 
-                                     font=("Helvetica", 11), bg="white", width=10)
-        total_bookings_label.grid(row=0, column=1, sticky='w', padx=10)
-        
-        total_tickets_label = tk.Label(total_frame, text=str(total_tickets), 
-                                    font=("Helvetica", 11), bg="white", width=10)
-        total_tickets_label.grid(row=0, column=2, sticky='w', padx=10)
-        
-        total_revenue_label = tk.Label(total_frame, text="$" + str(total_revenue), 
-                                    font=("Helvetica", 11, "bold"), bg="white", width=15)
-        total_revenue_label.grid(row=0, column=3, sticky='w', padx=10)
-        
-        # Configure grid
-        total_frame.columnconfigure(0, weight=0)
-        total_frame.columnconfigure(1, weight=0)
-        total_frame.columnconfigure(2, weight=0)
-        total_frame.columnconfigure(3, weight=1)
-    
-    # Show sales by event report
-    def show_event_sales(self):
-        # Clear report container
-        for widget in self.report_container.winfo_children():
-            widget.destroy()
-        
-        # Create report header
-        report_header = tk.Frame(self.report_container, bg="white", pady=15)
-        report_header.pack(fill='x', padx=20)
-        
-        header_label = tk.Label(report_header, text="Sales by Event", 
-                             font=("Helvetica", 14, "bold"), bg="white")
-        header_label.pack(anchor='w')
-        
-        # Group bookings by event
-        event_sales = {}
-        for booking in self.data_manager.bookings:
-            event_id = booking.get_event_id()
-            event = self.data_manager.get_event_by_id(event_id)
-            
-            if not event:
-                continue
-                
-            event_key = str(event_id)
-            
-            if event_key not in event_sales:
-                event_sales[event_key] = {
-                    "name": event.get_event_name(),
-                    "date": event.get_event_date(),
-                    "count": 0,
-                    "tickets": 0,
-                    "revenue": 0
-                }
-            
-            event_sales[event_key]["count"] += 1
-            event_sales[event_key]["tickets"] += booking.get_number_of_tickets()
-            event_sales[event_key]["revenue"] += booking.get_total_price()
-        
-        # Sort events by date
-        sorted_events = sorted(event_sales.items(), key=lambda x: x[1]["date"])
-        
-        # Create table header
-        table_frame = tk.Frame(self.report_container, bg="white")
-        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Table header
-        header_frame = tk.Frame(table_frame, bg="#f0f0f0")
-        header_frame.pack(fill='x')
-        
-        event_header = tk.Label(header_frame, text="Event", width=30, font=("Helvetica", 11, "bold"), 
-                             bg="#f0f0f0", padx=10, pady=5)
-        event_header.grid(row=0, column=0, sticky='w')
-        
-        date_header = tk.Label(header_frame, text="Date", width=15, font=("Helvetica", 11, "bold"), 
-                            bg="#f0f0f0", padx=10, pady=5)
-        date_header.grid(row=0, column=1, sticky='w')
-        
-        bookings_header = tk.Label(header_frame, text="Bookings", width=10, font=("Helvetica", 11, "bold"), 
-                                bg="#f0f0f0", padx=10, pady=5)
-        bookings_header.grid(row=0, column=2, sticky='w')
-        
-        tickets_header = tk.Label(header_frame, text="Tickets", width=10, font=("Helvetica", 11, "bold"), 
-                               bg="#f0f0f0", padx=10, pady=5)
-        tickets_header.grid(row=0, column=3, sticky='w')
-        
-        revenue_header = tk.Label(header_frame, text="Revenue", width=15, font=("Helvetica", 11, "bold"), 
-                               bg="#f0f0f0", padx=10, pady=5)
-        revenue_header.grid(row=0, column=4, sticky='w')
-        
-        # Configure grid
-        header_frame.columnconfigure(0, weight=1)
-        header_frame.columnconfigure(1, weight=0)
-        header_frame.columnconfigure(2, weight=0)
-        header_frame.columnconfigure(3, weight=0)
-        header_frame.columnconfigure(4, weight=0)
-        
-        # Create table content
-        content_frame = tk.Frame(table_frame, bg="white")
-        content_frame.pack(fill='both', expand=True)
-        
-        # Table rows
-        total_bookings = 0
-        total_tickets = 0
-        total_revenue = 0
-        
-        for i, (event_id, sales) in enumerate(sorted_events):
-            row_bg = "#f9f9f9" if i % 2 == 0 else "white"
-            
-            # Event
-            event_label = tk.Label(content_frame, text=sales["name"], 
-                                bg=row_bg, padx=10, pady=5, anchor='w')
-            event_label.grid(row=i, column=0, sticky='w')
-            
-            # Date
-            date_label = tk.Label(content_frame, text=sales["date"].strftime("%Y-%m-%d"), 
-                               bg=row_bg, padx=10, pady=5)
-            date_label.grid(row=i, column=1, sticky='w')
-            
-            # Bookings
-            bookings_label = tk.Label(content_frame, text=str(sales["count"]), 
-                                   bg=row_bg, padx=10, pady=5)
-            bookings_label.grid(row=i, column=2, sticky='w')
-            
-            # Tickets
-            tickets_label = tk.Label(content_frame, text=str(sales["tickets"]), 
-                                  bg=row_bg, padx=10, pady=5)
-            tickets_label.grid(row=i, column=3, sticky='w')
-            
-            # Revenue
-            revenue_label = tk.Label(content_frame, text="$" + str(sales["revenue"]), 
-                                  bg=row_bg, padx=10, pady=5)
-            revenue_label.grid(row=i, column=4, sticky='w')
-            
-            # Update totals
-            total_bookings += sales["count"]
-            total_tickets += sales["tickets"]
-            total_revenue += sales["revenue"]
-            
-            # Configure grid
-            content_frame.columnconfigure(0, weight=1)
-            content_frame.columnconfigure(1, weight=0)
-            content_frame.columnconfigure(2, weight=0)
-            content_frame.columnconfigure(3, weight=0)
-            content_frame.columnconfigure(4, weight=0)
-        
-        # Add totals row
-        total_separator = ttk.Separator(self.report_container, orient='horizontal')
-        total_separator.pack(fill='x', padx=20)
-        
-        total_frame = tk.Frame(self.report_container, bg="white", pady=10)
-        total_frame.pack(fill='x', padx=20)
-        
-        total_label = tk.Label(total_frame, text="Totals:", font=("Helvetica", 11, "bold"), 
-                            bg="white")
-        total_label.grid(row=0, column=0, sticky='e', padx=10)
-        
-        total_bookings_label = tk.Label(total_frame, text=str(total_bookings), 
-                                     font=("Helvetica", 11), bg="white", width=10)
-        total_bookings_label.grid(row=0, column=2, sticky='w', padx=10)
-        
-        total_tickets_label = tk.Label(total_frame, text=str(total_tickets), 
-                                    font=("Helvetica", 11), bg="white", width=10)
-        total_tickets_label.grid(row=0, column=3, sticky='w', padx=10)
-        
-        total_revenue_label = tk.Label(total_frame, text="$" + str(total_revenue), 
-                                    font=("Helvetica", 11, "bold"), bg="white", width=15)
-        total_revenue_label.grid(row=0, column=4, sticky='w', padx=10)
-        
-        # Configure grid
-        total_frame.columnconfigure(0, weight=1)
-        total_frame.columnconfigure(1, weight=0)
-        total_frame.columnconfigure(2, weight=0)
-        total_frame.columnconfigure(3, weight=0)
-        total_frame.columnconfigure(4, weight=0)
-    
-    # Show all bookings report
-    def show_all_bookings(self):
-        # Clear report container
-        for widget in self.report_container.winfo_children():
-            widget.destroy()
-        
-        # Create report header
-        report_header = tk.Frame(self.report_container, bg="white", pady=15)
-        report_header.pack(fill='x', padx=20)
-        
-        header_label = tk.Label(report_header, text="All Bookings", 
-                             font=("Helvetica", 14, "bold"), bg="white")
-        header_label.pack(anchor='w')
-        
-        # Create table header
-        table_frame = tk.Frame(self.report_container, bg="white")
-        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        # Table header
-        header_frame = tk.Frame(table_frame, bg="#f0f0f0")
-        header_frame.pack(fill='x')
-        
-        booking_header = tk.Label(header_frame, text="Booking ID", width=10, font=("Helvetica", 11, "bold"), 
-                               bg="#f0f0f0", padx=10, pady=5)
-        booking_header.grid(row=0, column=0, sticky='w')
-        
-        date_header = tk.Label(header_frame, text="Date", width=15, font=("Helvetica", 11, "bold"), 
-                            bg="#f0f0f0", padx=10, pady=5)
-        date_header.grid(row=0, column=1, sticky='w')
-        
-        user_header = tk.Label(header_frame, text="User", width=20, font=("Helvetica", 11, "bold"), 
-                            bg="#f0f0f0", padx=10, pady=5)
-        user_header.grid(row=0, column=2, sticky='w')
-        
-        event_header = tk.Label(header_frame, text="Event", width=25, font=("Helvetica", 11, "bold"), 
-                             bg="#f0f0f0", padx=10, pady=5)
-        event_header.grid(row=0, column=3, sticky='w')
-        
-        tickets_header = tk.Label(header_frame, text="Tickets", width=10, font=("Helvetica", 11, "bold"), 
-                               bg="#f0f0f0", padx=10, pady=5)
-        tickets_header.grid(row=0, column=4, sticky='w')
-        
-        total_header = tk.Label(header_frame, text="Total", width=10, font=("Helvetica", 11, "bold"), 
-                             bg="#f0f0f0", padx=10, pady=5)
-        total_header.grid(row=0, column=5, sticky='w')
-        
-        status_header = tk.Label(header_frame, text="Status", width=10, font=("Helvetica", 11, "bold"), 
-                              bg="#f0f0f0", padx=10, pady=5)
-        status_header.grid(row=0, column=6, sticky='w')
-        
-        # Configure grid
-        header_frame.columnconfigure(0, weight=0)
-        header_frame.columnconfigure(1, weight=0)
-        header_frame.columnconfigure(2, weight=0)
-        header_frame.columnconfigure(3, weight=1)
-        header_frame.columnconfigure(4, weight=0)
-        header_frame.columnconfigure(5, weight=0)
-        header_frame.columnconfigure(6, weight=0)
-        
-        # Create scrollable table content
-        content_container = tk.Frame(table_frame, bg="white")
-        content_container.pack(fill='both', expand=True)
-        
-        # Create canvas with scrollbar
-        canvas = tk.Canvas(content_container, bg="white", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(content_container, orient="vertical", command=canvas.yview)
-        scrollable_content = tk.Frame(canvas, bg="white")
-        
-        scrollable_content.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_content, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Sort bookings by date (newest first)
-        sorted_bookings = sorted(self.data_manager.bookings, key=lambda b: b.get_booking_date(), reverse=True)
-        
-        # Table rows
-        for i, booking in enumerate(sorted_bookings):
-            row_bg = "#f9f9f9" if i % 2 == 0 else "white"
-            
-            # Get related user and event
-            user = self.data_manager.get_customer_by_id(booking.get_user_id())
-            event = self.data_manager.get_event_by_id(booking.get_event_id())
-            
-            if not user or not event:
-                continue
-            
-            # Booking ID
-            booking_label = tk.Label(scrollable_content, text=str(booking.get_booking_id()), 
-                                  bg=row_bg, padx=10, pady=5)
-            booking_label.grid(row=i, column=0, sticky='w')
-            
-            # Date
-            date_label = tk.Label(scrollable_content, text=booking.get_booking_date().strftime("%Y-%m-%d"), 
-                               bg=row_bg, padx=10, pady=5)
-            date_label.grid(row=i, column=1, sticky='w')
-            
-            # User
-            user_label = tk.Label(scrollable_content, text=user.get_user_name(), 
-                               bg=row_bg, padx=10, pady=5)
-            user_label.grid(row=i, column=2, sticky='w')
-            
-            # Event
-            event_label = tk.Label(scrollable_content, text=event.get_event_name(), 
-                                bg=row_bg, padx=10, pady=5)
-            event_label.grid(row=i, column=3, sticky='w')
-            
-            # Tickets
-            tickets_label = tk.Label(scrollable_content, text=str(booking.get_number_of_tickets()), 
-                                  bg=row_bg, padx=10, pady=5)
-            tickets_label.grid(row=i, column=4, sticky='w')
-            
-            # Total
-            total_label = tk.Label(scrollable_content, text="$" + str(booking.get_total_price()), 
-                                bg=row_bg, padx=10, pady=5)
-            total_label.grid(row=i, column=5, sticky='w')
-            
-            # Status (with color)
-            status_text = booking.get_booking_status().value
-            status_color = "green" if booking.get_booking_status() == BookingStatus.CONFIRMED else \
-                          "orange" if booking.get_booking_status() == BookingStatus.PENDING else "red"
-            
-            status_label = tk.Label(scrollable_content, text=status_text, 
-                                 bg=row_bg, fg=status_color, padx=10, pady=5)
-            status_label.grid(row=i, column=6, sticky='w')
-            
-            # Configure grid
-            scrollable_content.columnconfigure(0, weight=0)
-            scrollable_content.columnconfigure(1, weight=0)
-            scrollable_content.columnconfigure(2, weight=0)
-            scrollable_content.columnconfigure(3, weight=1)
-            scrollable_content.columnconfigure(4, weight=0)
-            scrollable_content.columnconfigure(5, weight=0)
-            scrollable_content.columnconfigure(6, weight=0)
-    
-    # Logout
-    def logout(self):
-        self.current_user = None
-        self.is_admin = False
-        self.create_login_frame()
-
-# Main function to run the application
-def main():
-    root = tk.Tk()
-    app = GrandPrixApp(root)
-    root.mainloop()
-
-if __name__ == "__main__":
+import tkinter as tk
+from tkinter import ttk, messagebox, font
+from enum import Enum
+from datetime import datetime, timedelta
+import pickle
+import struct
+import json
+import sqlite3
+import os
+import sys
+import io
+import csv
+import zlib
+import queue
+import threading
+import time
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import deque, namedtuple
+from itertools import repeat, islice, chain
+from operator import methodcaller
+import gc
+import re
+import random
+import uuid
+import bisect
+import heapq
+
+# bz2 and lzma are left out of some Python builds
+try:
+    import bz2
+except ImportError:
+    bz2 = None
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+# fcntl only exists on Unix, elsewhere files are only locked between threads
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# resource only exists on Unix, elsewhere imports do not report peak memory
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# =================================================================
+# ENUM CLASSES
+# =================================================================
+
+# This Enum defines types of payment methods users can choose from
+class PaymentType(Enum):
+    CREDIT_CARD = "Credit Card" # Paying with a credit card
+    DIGITAL = "Digital" # Paying using digital methods like PayPal
+
+# This Enum defines the result of a payment transaction
+class PaymentTransactionStatus(Enum):
+    SUCCESSFUL = "Successful" # Payment was successful
+    FAILED = "Failed" # Payment failed
+    PENDING = "Pending" # Payment is still processing
+
+# This Enum defines the current status of a user's account
+class AccountStatus(Enum):
+    ACTIVE = "Active" # Account is active and usable
+    INACTIVE = "Inactive" # Account exists but is not currently in use
+    SUSPENDED = "Suspended" # Account has been temporarily blocked
+
+# This Enum defines the status of a booking
+class BookingStatus(Enum):
+    PENDING = "Pending" # Booking request is waiting for confirmation
+    CONFIRMED = "Confirmed" # Booking is confirmed
+    CANCELLED = "Cancelled" # Booking has been cancelled
+
+# This Enum defines the types of credit cards accepted
+class CardType(Enum):
+    VISA = "Visa"
+    MASTERCARD = "MasterCard"
+    AMEX = "Amex"
+
+# =================================================================
+# FILE OPERATIONS
+# =================================================================
+
+# Dictionary to store file paths for different data types
+# A collection can be stored compressed with (file name, compression, level)
+# e.g 'tickets': ('tickets.pkl', 'zlib', 1), see COMPRESSORS for the choices
+# Compressed files are recognised when loading, so this can be changed at
+# any time and only affects files written from then on
+# Tickets and payments are the biggest files, zlib level 1 makes them much
+# smaller for little CPU time (python benchmarks.py compression)
+DATA_FILES = {
+    'users': 'users.pkl',
+    'customers': 'customers.pkl',
+    'admins': 'admins.pkl',
+    'events': 'events.pkl',
+    'bookings': 'bookings.pkl',
+    'tickets': ('tickets.pkl', 'zlib', 1),
+    'payments': ('payments.pkl', 'zlib', 1),
+    'discounts': 'discounts.pkl'
+}
+
+# Folder that holds all data files
+DATA_DIR = 'data'
+
+# Storage mode used by the DataManager
+# 'journal' appends every change to a per-collection log file (cheap writes)
+# 'snapshot' re-pickles the whole collection on every change
+STORAGE_MODE = 'journal'
+
+# Format of the snapshot files, one of the names in SERIALIZERS
+# Files are recognised by their first bytes when loading, so changing this
+# only affects files written from now on
+DATA_FORMAT = 'pickle'
+
+# Storage backend used by the app
+# 'pickle' keeps every collection in memory and stores it in pickle files
+# 'sqlite' keeps records in an indexed SQLite database
+STORAGE_BACKEND = 'pickle'
+
+# Database file used by the SQLite backend
+DATABASE_FILE = 'grandprix.db'
+
+# Write changes from a background thread so the GUI never waits for the disk
+BACKGROUND_WRITES = True
+
+# Seconds the background writer waits to collect more changes into one commit
+COMMIT_WINDOW = 0.05
+
+# A log is compacted into a fresh snapshot once it is bigger than this many bytes
+COMPACT_LOG_SIZE = 1024 * 1024
+
+# or once replaying it on startup took longer than this many seconds
+COMPACT_REPLAY_TIME = 0.2
+
+# Seconds spent replaying the log of each (file_key, shard) when it was loaded
+REPLAY_TIMES = {}
+
+# Seconds spent on the last compaction of each (file_key, shard)
+COMPACTION_TIMES = {}
+
+# File that holds a multi collection transaction while it is being committed
+# Every DataManager uses its own file named after this one, e.g
+# transaction-3f2a9c.pkl, so terminals sharing the data folder never
+# finish each other's transactions
+TRANSACTION_FILE = 'transaction.pkl'
+
+# Also append every change to CHANGE_FEED_FILE in the data folder so other
+# processes can follow them with a ChangeFeedReader
+CHANGE_FEED = False
+CHANGE_FEED_FILE = 'changes.log'
+
+# The change feed is moved to changes.1.log once it is bigger than this
+CHANGE_FEED_SIZE = 4 * 1024 * 1024
+
+# Bookings, tickets and payments of events that are over can be moved to
+# read-only files in this folder inside the data folder with
+# DataManager.archive_events (or python Code.py archive YYYY-MM-DD)
+# The reports keep per event totals of everything that was archived
+ARCHIVE_DIR = 'archive'
+
+# Compression of the archive files, they are written once and rarely read
+# so a slower but smaller compression pays off. Falls back to zlib without lzma
+ARCHIVE_COMPRESSION = ('lzma', 6)
+
+# Events are archived once they are this many days in the past
+ARCHIVE_AFTER_DAYS = 30
+
+# New IDs are handed out from a counter per collection kept in this file
+# in the data folder. Every process reserves ID_BLOCK_SIZE IDs at a time
+# and gives them out from memory, so the file is only locked once per
+# block. An ID is never given out twice, even after its record is deleted
+SEQUENCE_FILE = 'sequences.json'
+ID_BLOCK_SIZE = 20
+
+# First ID of each collection that has no records yet
+FIRST_IDS = {
+    'customers': 100,
+    'admins': 1,
+    'events': 201,
+    'bookings': 1001,
+    'payments': 2001,
+    'discounts': 1
+}
+
+# Fields searched by Manage Users, with the weight a match in each one
+# adds to the rank of a customer, see SearchIndex
+SEARCH_FIELDS = {
+    'customers': {'get_user_name': 4, 'get_user_email': 3, 'get_customer_phone': 2, 'get_customer_address': 1}
+}
+
+# A word of a search also matches longer words starting with it once it
+# has this many letters
+SEARCH_MIN_PREFIX = 2
+
+# Most matches shown for a search
+SEARCH_LIMIT = 50
+
+# Counters for the number of files written and bytes written to disk
+STORAGE_STATS = {
+    'writes': 0,
+    'bytes_written': 0,
+    'merges': 0 # Writes that first had to pick up changes from another terminal
+}
+
+# Getter used to find the unique key of each record in a collection
+COLLECTION_KEYS = {
+    'users': 'get_user_id',
+    'customers': 'get_user_id',
+    'admins': 'get_user_id',
+    'events': 'get_event_id',
+    'bookings': 'get_booking_id',
+    'tickets': 'get_ticket_id',
+    'payments': 'get_payment_id',
+    'discounts': 'get_discount_id'
+}
+
+# Collections split into one file per event, e.g data/tickets/202.pkl
+# The value is the getter that returns the event a record belongs to
+SHARDED_COLLECTIONS = {
+    'bookings': 'get_event_id',
+    'tickets': 'get_event_id'
+}
+
+# Return the unique key of a record in the given collection
+def get_record_key(record, file_key):
+    return getattr(record, COLLECTION_KEYS[file_key])()
+
+# Return the shard a record is stored in, None for collections without shards
+def get_record_shard(record, file_key):
+    if file_key not in SHARDED_COLLECTIONS:
+        return None
+    return getattr(record, SHARDED_COLLECTIONS[file_key])()
+
+# Return the file name of a collection from DATA_FILES
+def get_data_file(file_key):
+    entry = DATA_FILES[file_key]
+    return entry if isinstance(entry, str) else entry[0]
+
+# Return (compression, level) of a collection from DATA_FILES
+# compression is None for files that are not compressed and level is
+# None when the compressor's default level should be used
+def get_compression(file_key):
+    entry = DATA_FILES[file_key]
+    if isinstance(entry, str):
+        return None, None
+    return entry[1], entry[2] if len(entry) > 2 else None
+
+# Return the folder that holds the shards of a collection e.g data/tickets
+def get_shard_dir(file_key):
+    return os.path.join(DATA_DIR, os.path.splitext(get_data_file(file_key))[0])
+
+# Return the path of the snapshot file for a collection or one of its shards
+def get_data_path(file_key, shard=None):
+    if shard is None:
+        return os.path.join(DATA_DIR, get_data_file(file_key))
+    return os.path.join(get_shard_dir(file_key), str(shard) + '.pkl')
+
+# Return the path of the change log file for a collection e.g data/tickets.log
+def get_log_path(file_key, shard=None):
+    return os.path.splitext(get_data_path(file_key, shard))[0] + '.log'
+
+# Return the path of the lock file of a collection e.g data/tickets/202.lock
+# It is locked while the files of the collection are used and holds their
+# version counters, see read_file_state
+def get_lock_path(file_key, shard=None):
+    return os.path.splitext(get_data_path(file_key, shard))[0] + '.lock'
+
+# Return the shards of a collection that have files on disk
+def list_shards(file_key):
+    shard_dir = get_shard_dir(file_key)
+    if not os.path.isdir(shard_dir):
+        return []
+    
+    shards = set()
+    for name in os.listdir(shard_dir):
+        stem, extension = os.path.splitext(name)
+        if extension not in ('.pkl', '.log'):
+            continue
+        # Event IDs are numbers, keep any other name as text
+        if stem == 'None':
+            shards.add(None)
+        else:
+            try:
+                shards.add(int(stem))
+            except ValueError:
+                shards.add(stem)
+    return list(shards)
+
+# Locks that stop two threads from using the files of a collection at once
+_FILE_LOCKS = {}
+_FILE_LOCKS_GUARD = threading.Lock()
+
+# Return the lock for the files of a collection or one of its shards
+def get_file_lock(file_key, shard=None):
+    with _FILE_LOCKS_GUARD:
+        if (file_key, shard) not in _FILE_LOCKS:
+            _FILE_LOCKS[(file_key, shard)] = threading.RLock()
+        return _FILE_LOCKS[(file_key, shard)]
+
+# Open lock files of the collections locked by this process
+_LOCK_FILES = {}
+
+# Lock the files of a collection or one of its shards
+# The thread lock keeps other threads out and an fcntl lock on the lock
+# file keeps other processes using the same data folder out. Each shard
+# has its own lock, so terminals selling tickets for different events
+# never wait for each other. Locking again in the same thread is allowed
+@contextmanager
+def lock_files(file_key, shard=None):
+    unit = (file_key, shard)
+    with get_file_lock(file_key, shard):
+        if unit in _LOCK_FILES:
+            yield
+            return
+        
+        lock_path = get_lock_path(file_key, shard)
+        if not os.path.exists(os.path.dirname(lock_path)):
+            os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        file = os.fdopen(os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666), 'r+b')
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            _LOCK_FILES[unit] = file
+            try:
+                yield
+            finally:
+                del _LOCK_FILES[unit]
+        finally:
+            file.close() # Closing the file releases the fcntl lock
+
+# Version counters stored in the lock file of every collection or shard
+# version goes up whenever the records change and generation whenever a
+# new snapshot replaces the old one and the log starts again
+FILE_STATE = struct.Struct('<QQ')
+
+# Return (version, generation, log size) of a collection or shard
+# A DataManager keeps the state it last saw, so a different state means
+# another terminal changed the files since then
+def read_file_state(file_key, shard=None):
+    with lock_files(file_key, shard):
+        file = _LOCK_FILES[(file_key, shard)]
+        file.seek(0)
+        data = file.read(FILE_STATE.size)
+        version, generation = FILE_STATE.unpack(data) if len(data) == FILE_STATE.size else (0, 0)
+        log_path = get_log_path(file_key, shard)
+        log_size = os.path.getsize(log_path) if os.path.exists(log_path) else 0
+        return version, generation, log_size
+
+# Count a change to the files of a collection or shard in its lock file
+# and return the new state
+def _advance_file_state(file_key, shard, changed, new_snapshot):
+    version, generation, _ = read_file_state(file_key, shard)
+    version += 1 if changed else 0
+    generation += 1 if new_snapshot else 0
+    file = _LOCK_FILES[(file_key, shard)]
+    file.seek(0)
+    file.write(FILE_STATE.pack(version, generation))
+    file.flush()
+    return read_file_state(file_key, shard)
+
+# Write a list of records to an open file in DATA_FORMAT, compressed
+# with one of COMPRESSORS unless compression is None
+def dump_records(data, file, compression=None, level=None):
+    if compression is None:
+        SERIALIZERS[DATA_FORMAT].dump(data, file)
+    else:
+        buffer = io.BytesIO()
+        SERIALIZERS[DATA_FORMAT].dump(data, buffer)
+        file.write(COMPRESSORS[compression].compress(buffer.getbuffer(), level))
+
+# Function to save data to a pickle file
+# With sync the file is forced to disk before it replaces the old one
+# changed is False when the records are the same as on disk, e.g when a
+# log is compacted. Returns the new state of the files, see read_file_state
+def save_data(data, file_key, sync=False, shard=None, changed=True):
+    if not isinstance(data, list):
+        data = list(data)
+    with lock_files(file_key, shard):
+        # Create a data directory if it does not exist
+        filepath = get_data_path(file_key, shard)
+        if not os.path.exists(os.path.dirname(filepath)):
+            os.makedirs(os.path.dirname(filepath))
+        
+        # Write to a temporary file first and then swap it in
+        # so a crash never leaves a half written snapshot behind
+        temp_path = filepath + '.tmp'
+        compression, level = get_compression(file_key)
+        with open(temp_path, 'wb') as file:
+            dump_records(data, file, compression, level)
+            STORAGE_STATS['bytes_written'] += file.tell()
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(temp_path, filepath)
+        STORAGE_STATS['writes'] += 1
+        
+        # The snapshot now contains every logged change so the log can be dropped
+        log_path = get_log_path(file_key, shard)
+        if os.path.exists(log_path):
+            os.remove(log_path)
+        return _advance_file_state(file_key, shard, changed, True)
+
+# Function to remove the snapshot and log of a collection or shard
+# The lock file stays behind and gets a new generation, so other terminals
+# that still hold the records reload them (empty) before their next write
+def delete_data(file_key, shard=None):
+    with lock_files(file_key, shard):
+        for path in (get_data_path(file_key, shard), get_log_path(file_key, shard)):
+            if os.path.exists(path):
+                os.remove(path)
+        return _advance_file_state(file_key, shard, True, True)
+
+# Function to save a whole collection, writing every shard of a sharded one
+def save_collection(data, file_key, sync=False):
+    if isinstance(data, ShardedCollection):
+        for shard in data.shard_keys():
+            save_data(list(data.shard(shard)), file_key, sync, shard)
+    else:
+        save_data(list(data), file_key, sync)
+
+# Function to append changes to the log file of a collection
+# entries is a list of (op, key, record) where op is 'add', 'update' or
+# 'delete' and record is None for deletes. The list is written as one
+# log entry so it is either replayed completely or not at all
+# Returns the new state of the files, see read_file_state
+def append_log(file_key, entries, sync=False, shard=None):
+    log_path = get_log_path(file_key, shard)
+    with lock_files(file_key, shard):
+        if not os.path.exists(os.path.dirname(log_path)):
+            os.makedirs(os.path.dirname(log_path))
+        
+        with open(log_path, 'ab') as file:
+            start = file.tell()
+            pickle.dump(entries, file)
+            STORAGE_STATS['bytes_written'] += file.tell() - start
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        STORAGE_STATS['writes'] += 1
+        return _advance_file_state(file_key, shard, True, False)
+
+# Function to read every change stored in the log file of a collection
+# start skips the part of the log that was already read before
+def read_log(file_key, shard=None, start=0):
+    with lock_files(file_key, shard):
+        return _read_log(file_key, shard, start)
+
+def _read_log(file_key, shard, start):
+    entries = []
+    log_path = get_log_path(file_key, shard)
+    if not os.path.exists(log_path):
+        return entries
+    
+    with open(log_path, 'rb') as file:
+        file.seek(start)
+        good_end = start
+        while True:
+            try:
+                batch = pickle.load(file)
+            except EOFError:
+                break
+            except Exception as e:
+                # A crash in the middle of a write leaves a torn last entry
+                print("Ignoring damaged log entry in " + log_path + ": " + str(e))
+                break
+            if isinstance(batch, tuple):
+                entries.append(batch)
+            else:
+                entries.extend(batch)
+            good_end = file.tell()
+    
+    # Cut off a torn entry so changes appended later can still be read
+    if good_end < os.path.getsize(log_path):
+        with open(log_path, 'r+b') as file:
+            file.truncate(good_end)
+    return entries
+
+# Function to apply logged changes on top of a loaded snapshot
+# Adds and updates replace any record with the same key so replaying
+# the same entry twice gives the same result
+def replay_log(data, entries, file_key):
+    if not entries:
+        return data
+    
+    positions = {}
+    for i, record in enumerate(data):
+        positions[get_record_key(record, file_key)] = i
+    
+    deleted = False
+    for op, key, record in entries:
+        if op == 'delete':
+            if key in positions:
+                data[positions.pop(key)] = None
+                deleted = True
+        elif key in positions:
+            data[positions[key]] = record
+        else:
+            positions[key] = len(data)
+            data.append(record)
+    
+    # Drop the holes left by deleted records
+    if deleted:
+        data = [record for record in data if record is not None]
+    return data
+
+# Create the transaction file path of a new DataManager and lock it
+# The lock is held until the DataManager is closed, which tells the other
+# terminals that the transaction file is still in use
+# Returns (transaction file path, open lock file)
+def claim_transaction_file():
+    if not os.path.exists(DATA_DIR):
+        os.makedirs(DATA_DIR, exist_ok=True)
+    stem, extension = os.path.splitext(TRANSACTION_FILE)
+    filepath = os.path.join(DATA_DIR, stem + '-' + uuid.uuid4().hex[:12] + extension)
+    lock = open(os.path.splitext(filepath)[0] + '.lock', 'wb')
+    if fcntl is not None:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+    return filepath, lock
+
+# Release a transaction file taken with claim_transaction_file
+def release_transaction_file(filepath, lock):
+    lock.close()
+    lock_path = os.path.splitext(filepath)[0] + '.lock'
+    if not os.path.exists(filepath) and os.path.exists(lock_path):
+        os.remove(lock_path)
+
+# Function to finish transactions that were interrupted while committing
+# Only files whose DataManager is gone are finished, the lock of a running
+# one is still held. Without fcntl every transaction file is finished
+def recover_transaction():
+    if not os.path.isdir(DATA_DIR):
+        return
+    
+    stem, extension = os.path.splitext(TRANSACTION_FILE)
+    for name in sorted(os.listdir(DATA_DIR)):
+        filepath = os.path.join(DATA_DIR, name)
+        
+        # Files written before every DataManager had its own file have no lock
+        if name == TRANSACTION_FILE:
+            _recover_transaction_file(filepath)
+            continue
+        if not (name.startswith(stem + '-') and name.endswith(extension)):
+            continue
+        
+        lock_path = os.path.splitext(filepath)[0] + '.lock'
+        lock = os.fdopen(os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666), 'r+b')
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue # Its DataManager is still running
+            
+            # Another terminal may have finished it while we waited
+            if os.path.exists(filepath):
+                _recover_transaction_file(filepath)
+            if os.path.exists(lock_path):
+                os.remove(lock_path)
+        finally:
+            lock.close()
+
+# The transaction file holds every change of the transaction, so adding
+# them to the logs again is safe even if some were already written
+def _recover_transaction_file(filepath):
+    try:
+        with open(filepath, 'rb') as file:
+            pending = pickle.load(file)
+    except Exception as e:
+        # The file was not completely written so the commit never started
+        print("Ignoring damaged transaction file: " + str(e))
+        pending = {}
+    
+    for unit, entries in pending.items():
+        # Older transaction files used the collection name on its own
+        if isinstance(unit, str):
+            unit = (unit, None)
+        file_key, shard = unit
+        append_log(file_key, entries, shard=shard)
+    
+    # The feed may already have them, followers see them twice at worst
+    if CHANGE_FEED and pending:
+        append_change_feed(changes_from_pending(pending))
+    os.remove(filepath)
+
+# Function to load data from a pickle file
+# A sharded collection without a shard gives a ShardedCollection that
+# loads each shard the first time it is used
+# When a states dictionary is given the state of the files that were read
+# is stored in it under (file_key, shard), see read_file_state
+def load_data(file_key, shard=None, states=None):
+    if shard is None and file_key in SHARDED_COLLECTIONS:
+        return ShardedCollection(file_key, states)
+    
+    with lock_files(file_key, shard):
+        filepath = get_data_path(file_key, shard)
+        data = []
+        
+        # If the file exists, load the data
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'rb') as file:
+                    data = load_records(file)
+            except Exception as e:
+                print("Error loading data: " + str(e))
+                data = []
+        
+        # Apply any changes that were logged after the snapshot was written
+        start = time.perf_counter()
+        data = replay_log(data, read_log(file_key, shard), file_key)
+        REPLAY_TIMES[(file_key, shard)] = time.perf_counter() - start
+        if states is not None:
+            states[(file_key, shard)] = read_file_state(file_key, shard)
+        return data
+
+# Return True if the log of a collection should be compacted
+def needs_compaction(file_key, shard=None):
+    log_path = get_log_path(file_key, shard)
+    if not os.path.exists(log_path):
+        return False
+    if os.path.getsize(log_path) > COMPACT_LOG_SIZE:
+        return True
+    return REPLAY_TIMES.get((file_key, shard), 0) > COMPACT_REPLAY_TIME
+
+# Function to write a fresh snapshot of a collection and drop its log
+# The snapshot is built from the files, not from memory, so changes of
+# a transaction that has not finished yet never end up in it
+# Returns the number of seconds it took
+def compact_data(file_key, shard=None):
+    start = time.perf_counter()
+    with lock_files(file_key, shard):
+        if os.path.exists(get_log_path(file_key, shard)):
+            save_data(load_data(file_key, shard), file_key, True, shard, changed=False)
+    COMPACTION_TIMES[(file_key, shard)] = time.perf_counter() - start
+    return COMPACTION_TIMES[(file_key, shard)]
+
+# Return (file_key, shard) for every collection or shard that has a log
+def list_logs():
+    logs = []
+    for file_key in DATA_FILES:
+        if os.path.exists(get_log_path(file_key)):
+            logs.append((file_key, None))
+        if file_key in SHARDED_COLLECTIONS:
+            for shard in list_shards(file_key):
+                if os.path.exists(get_log_path(file_key, shard)):
+                    logs.append((file_key, shard))
+    return logs
+
+# Function to load a collection completely including all of its shards
+def load_collection(file_key, states=None):
+    data = load_data(file_key, states=states)
+    if isinstance(data, ShardedCollection):
+        data.load_all()
+    return data
+
+# Records of a collection, or of one shard, held in memory by a DataManager
+# A dictionary of key to record keeps them in the order they were added,
+# like the list in the file, so the GUI sees the same order while finding,
+# replacing or removing a record takes the same time however many there are
+class RecordStore:
+    def __init__(self, file_key, records=()):
+        self._key_getter = COLLECTION_KEYS[file_key]
+        self._records = {}
+        self.extend(records)
+    
+    # Iterate over a copy, so changes merged by the background writer
+    # never break a loop that is running in the GUI
+    def __iter__(self):
+        return iter(list(self._records.values()))
+    
+    def __len__(self):
+        return len(self._records)
+    
+    def __bool__(self):
+        return bool(self._records)
+    
+    # Return the record with the given key, or None
+    def get(self, key):
+        return self._records.get(key)
+    
+    # Add a record at the end, raises ValueError if there is already a
+    # record with the same key, use replace to change a record
+    def append(self, record):
+        key = getattr(record, self._key_getter)()
+        if key in self._records:
+            raise ValueError("Duplicate key " + str(key))
+        self._records[key] = record
+    
+    def extend(self, records):
+        self._records.update(self._by_key(records))
+    
+    # Replace the record with the same key, returns False if there is none
+    def replace(self, record):
+        key = getattr(record, self._key_getter)()
+        if key not in self._records:
+            return False
+        self._records[key] = record
+        return True
+    
+    # Remove the record with the given key and return it, or None
+    def remove(self, key):
+        return self._records.pop(key, None)
+    
+    # Apply (op, key, record) log entries, see append_log
+    def apply(self, entries):
+        for op, key, record in entries:
+            if op == 'delete':
+                self._records.pop(key, None)
+            else:
+                self._records[key] = record
+    
+    # Replace every record at once
+    def reset(self, records):
+        self._records = dict(self._by_key(records))
+    
+    def _by_key(self, records):
+        records = list(records)
+        return zip(map(methodcaller(self._key_getter), records), records)
+
+# Return data loaded with load_data as it is held in memory
+def to_record_store(file_key, data):
+    if isinstance(data, (RecordStore, ShardedCollection)):
+        return data
+    return RecordStore(file_key, data)
+
+# A collection stored as one list per event
+# Only the shards that are used get loaded, so reading or writing the
+# tickets of one event never touches the files of the other events
+# Each loaded shard is held in a RecordStore
+class ShardedCollection:
+    def __init__(self, file_key, states=None):
+        self._file_key = file_key
+        self._shards = {} # Shards loaded so far
+        self._states = states # Where load_data stores the state of each shard
+        
+        # Split an old single file collection into shards the first time
+        if os.path.exists(get_data_path(file_key)) or os.path.exists(get_log_path(file_key)):
+            with lock_files(file_key):
+                # Another terminal may have split it while we waited
+                if os.path.exists(get_data_path(file_key)) or os.path.exists(get_log_path(file_key)):
+                    self._split_single_file()
+        self._shard_keys = set(list_shards(file_key))
+    
+    # Move the records of data/tickets.pkl into one file per event
+    def _split_single_file(self):
+        records = replay_log(self._read_single_file(), read_log(self._file_key), self._file_key)
+        shards = {}
+        for record in records:
+            shards.setdefault(get_record_shard(record, self._file_key), []).append(record)
+        
+        # Records already in a shard win over the old file
+        for shard, shard_records in shards.items():
+            existing = load_data(self._file_key, shard)
+            save_data(replay_log(shard_records, [('add', get_record_key(r, self._file_key), r) for r in existing], self._file_key), self._file_key, shard=shard)
+        
+        for path in (get_data_path(self._file_key), get_log_path(self._file_key)):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def _read_single_file(self):
+        filepath = get_data_path(self._file_key)
+        if not os.path.exists(filepath):
+            return []
+        with open(filepath, 'rb') as file:
+            return load_records(file)
+    
+    # Return the records of one shard, loading them if needed
+    def shard(self, shard):
+        if shard not in self._shards:
+            self._shards[shard] = RecordStore(self._file_key, load_data(self._file_key, shard, self._states))
+            self._shard_keys.add(shard)
+        return self._shards[shard]
+    
+    # Replace the records of one shard
+    def set_shard(self, shard, data):
+        self._shards[shard] = to_record_store(self._file_key, data)
+        self._shard_keys.add(shard)
+    
+    # Forget one shard, e.g after its files were deleted with delete_data
+    def drop_shard(self, shard):
+        self._shards.pop(shard, None)
+        self._shard_keys.discard(shard)
+    
+    # Return every shard of the collection, loaded or not
+    def shard_keys(self):
+        return list(self._shard_keys)
+    
+    # Load every shard that is not loaded yet
+    def load_all(self):
+        for shard in self.shard_keys():
+            self.shard(shard)
+        return self
+    
+    def __iter__(self):
+        for shard in self.shard_keys():
+            yield from self.shard(shard)
+    
+    def __len__(self):
+        return sum(len(self.shard(shard)) for shard in self.shard_keys())
+    
+    def __bool__(self):
+        return any(self.shard(shard) for shard in self.shard_keys())
+
+# =================================================================
+# CORE CLASSES IMPLEMENTATION
+# =================================================================
+
+# Naive datetimes are stored as microseconds since this moment
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+# Version of the compact state written by CompactState.__getstate__
+STATE_VERSION = 1
+
+# Base class for the classes that are saved to the data files
+# Instead of the attribute dictionary, pickle stores a tuple of values in
+# _STATE_FIELDS order with enums as their position in the enum and naive
+# datetimes as whole microseconds since EPOCH, which keeps the field names
+# out of every record. Old pickles that hold a dictionary still load
+# Whole data files are stored by column instead, see CompactRecords
+class CompactState:
+    _STATE_FIELDS = () # Attributes in the order they are stored
+    _DATETIME_FIELDS = () # Attributes that hold datetimes
+    _ENUM_FIELDS = {} # Attributes that hold enums and the enum they use
+    
+    def __getstate__(self):
+        state = self.__dict__
+        values = [STATE_VERSION]
+        for name in self._STATE_FIELDS:
+            value = state.get(name)
+            if name in self._ENUM_FIELDS:
+                if isinstance(value, self._ENUM_FIELDS[name]):
+                    value = self._ENUM_POSITIONS[name][value]
+            elif name in self._DATETIME_FIELDS:
+                if isinstance(value, datetime) and value.tzinfo is None:
+                    delta = value - EPOCH
+                    value = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+            values.append(value)
+        
+        # Keep any attribute that is not listed so nothing is lost
+        extra = {name: value for name, value in state.items() if name not in self._STATE_FIELD_SET}
+        if extra:
+            values.append(extra)
+        return tuple(values)
+    
+    def __setstate__(self, state):
+        # Pickles written before compact state hold the attribute dictionary
+        if isinstance(state, dict):
+            self.__dict__.update(state)
+            return
+        
+        attributes = self.__dict__
+        attributes.update(zip(self._STATE_FIELDS, state[1:]))
+        for name, members in self._ENUM_MEMBERS:
+            value = attributes[name]
+            if value.__class__ is int:
+                attributes[name] = members[value]
+        for name in self._DATETIME_FIELDS:
+            value = attributes[name]
+            if value.__class__ is int:
+                attributes[name] = EPOCH + timedelta(0, 0, value)
+        if len(state) > self._STATE_LENGTH:
+            attributes.update(state[-1])
+    
+    # Build the lookup tables used above once for every class
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._STATE_FIELD_SET = frozenset(cls._STATE_FIELDS)
+        cls._STATE_LENGTH = len(cls._STATE_FIELDS) + 1
+        cls._ENUM_POSITIONS = {name: {member: i for i, member in enumerate(enum)} for name, enum in cls._ENUM_FIELDS.items()}
+        cls._ENUM_MEMBERS = tuple((name, list(enum)) for name, enum in cls._ENUM_FIELDS.items())
+    
+    # Turn one column of attribute values into their compact form
+    @classmethod
+    def _encode_column(cls, name, values):
+        if name in cls._ENUM_FIELDS:
+            positions = cls._ENUM_POSITIONS[name]
+            return [positions.get(value, value) for value in values]
+        if name in cls._DATETIME_FIELDS:
+            return [(value - EPOCH) // MICROSECOND if value.__class__ is datetime else value for value in values]
+        return values
+    
+    # Turn one column written by _encode_column back into attribute values
+    # The map calls handle columns without missing values, anything else
+    # such as None is kept as it is by the slower comprehension
+    @classmethod
+    def _decode_column(cls, name, values):
+        if name in cls._ENUM_FIELDS:
+            members = dict(cls._ENUM_MEMBERS)[name]
+            try:
+                return list(map(members.__getitem__, values))
+            except TypeError:
+                return [members[value] if value.__class__ is int else value for value in values]
+        if name in cls._DATETIME_FIELDS:
+            try:
+                return list(map(EPOCH.__add__, map(timedelta, repeat(0), repeat(0), values)))
+            except TypeError:
+                return [EPOCH + timedelta(0, 0, value) if value.__class__ is int else value for value in values]
+        return values
+
+# Base class for any user in the system
+class User(CompactState):
+    # Attributes saved to the data files, see CompactState
+    _STATE_FIELDS = ('_user_name', '_user_id', '_user_password', '_user_email', '_registration_date')
+    _DATETIME_FIELDS = ('_registration_date',)
+    
+    def __init__(self, user_name, user_id, user_password, user_email, registration_date):
+        self._user_name = user_name # Name of the user
+        self._user_id = user_id # Unique ID for the user
+        self._user_password = user_password # User password should be encrypted
+        self._user_email = user_email # Email address of the user
+        self._registration_date = registration_date # Date user registered
+    
+    # Show user information
+    def display_user_info(self):
+        return "User: " + self._user_name + ", ID: " + str(self._user_id) + ", Email: " + self._user_email + ", Registered: " + str(self._registration_date)
+    
+    # Method to simulate a user requesting a special service
+    def request_special_service(self):
+        print(self._user_name + " requested a special service.")
+    
+    # Method to simulate user giving feedback
+    def provide_feedback(self, feedback):
+        print(self._user_name + " provided feedback: " + feedback)
+    
+    # Getters and setters for user attributes
+    def get_user_name(self): return self._user_name
+    def set_user_name(self, user_name): self._user_name = user_name
+    
+    def get_user_id(self): return self._user_id
+    def set_user_id(self, user_id): self._user_id = user_id
+    
+    def get_user_password(self): return self._user_password
+    def set_user_password(self, user_password): self._user_password = user_password
+    
+    def get_user_email(self): return self._user_email
+    def set_user_email(self, user_email): self._user_email = user_email
+    
+    def get_registration_date(self): return self._registration_date
+    def set_registration_date(self, registration_date): self._registration_date = registration_date
+
+# Represents a customer inherits from User
+class Customer(User):
+    _STATE_FIELDS = User._STATE_FIELDS + ('_customer_address', '_customer_phone', '_payment_info')
+    
+    def __init__(self, user_name, user_id, user_password, user_email, registration_date, customer_address, customer_phone, payment_info):
+        super().__init__(user_name, user_id, user_password, user_email, registration_date)
+        self._customer_address = customer_address # Customer home or billing address
+        self._customer_phone = customer_phone # Contact number
+        self._payment_info = payment_info # Information about payment methods
+    
+    # Show customer details
+    def display_customer_info(self):
+        return self.display_user_info() + ", Address: " + self._customer_address + ", Phone: " + str(self._customer_phone) + ", Payment Info: " + self._payment_info
+    
+    # Getters and setters
+    def get_customer_address(self): return self._customer_address
+    def set_customer_address(self, customer_address): self._customer_address = customer_address
+    
+    def get_customer_phone(self): return self._customer_phone
+    def set_customer_phone(self, customer_phone): self._customer_phone = customer_phone
+    
+    def get_payment_info(self): return self._payment_info
+    def set_payment_info(self, payment_info): self._payment_info = payment_info
+
+# Represents an admin user inherit from User
+class Admin(User):
+    _STATE_FIELDS = User._STATE_FIELDS + ('_admin_role', '_employee_id', '_account_status')
+    _ENUM_FIELDS = {'_account_status': AccountStatus}
+    
+    def __init__(self, user_name, user_id, user_password, user_email, registration_date, admin_role, employee_id, account_status):
+        super().__init__(user_name, user_id, user_password, user_email, registration_date)
+        self._admin_role = admin_role # Role of the admin e.g Manager
+        self._employee_id = employee_id # ID number assigned to employee
+        self._account_status = account_status # Current status of the admin's account
+    
+    # Show admin details
+    def display_admin_info(self):
+        return self.display_user_info() + ", Role: " + self._admin_role + ", Employee ID: " + str(self._employee_id) + ", Account Status: " + self._account_status.value
+    
+    # Getters and setters
+    def get_admin_role(self): return self._admin_role
+    def set_admin_role(self, admin_role): self._admin_role = admin_role
+    
+    def get_employee_id(self): return self._employee_id
+    def set_employee_id(self, employee_id): self._employee_id = employee_id
+    
+    def get_account_status(self): return self._account_status
+    def set_account_status(self, account_status): self._account_status = account_status
+
+# Class that represents a general payment made by a user
+class Payment(CompactState):
+    # Attributes saved to the data files, see CompactState
+    _STATE_FIELDS = ('_booking_id', '_payment_id', '_payment_type', '_transaction_date', '_transaction_status', '_refund_id', '_refund_reason')
+    _DATETIME_FIELDS = ('_transaction_date',)
+    _ENUM_FIELDS = {'_payment_type': PaymentType, '_transaction_status': PaymentTransactionStatus}
+    
+    def __init__(self, booking_id, payment_id, payment_type, transaction_date, transaction_status, refund_id=None, refund_reason=""):
+        # Store all the payment details
+        self._booking_id = booking_id # ID of the booking this payment is for
+        self._payment_id = payment_id # Unique ID of the payment
+        self._payment_type = payment_type # Type of payment Digital or Credit Card
+        self._transaction_date = transaction_date # Date the payment was made
+        self._transaction_status = transaction_status # Status of the payment Success, Failed, etc
+        self._refund_id = refund_id # Optional refund ID if refunded
+        self._refund_reason = refund_reason # Reason for the refund if any
+    
+    # Show payment information in a readable format
+    def display_payment_info(self):
+        return "Payment ID: " + str(self._payment_id) + ", Booking ID: " + str(self._booking_id) + ", Type: " + self._payment_type.value + ", Date: " + str(self._transaction_date) + ", Status: " + self._transaction_status.value + ", Refund ID: " + str(self._refund_id) + ", Reason: " + self._refund_reason
+    
+    # Return the payment details as a dictionary key value pairs
+    def get_payment_details(self):
+        return {
+            "payment_id": self._payment_id,
+            "booking_id": self._booking_id,
+            "payment_type": self._payment_type,
+            "transaction_date": self._transaction_date,
+            "transaction_status": self._transaction_status,
+            "refund_id": self._refund_id,
+            "refund_reason": self._refund_reason,
+        }
+    
+    # Get and set methods for each private attribute
+    def get_payment_id(self): return self._payment_id
+    def set_payment_id(self, payment_id): self._payment_id = payment_id
+    
+    def get_booking_id(self): return self._booking_id
+    def set_booking_id(self, booking_id): self._booking_id = booking_id
+    
+    def get_payment_type(self): return self._payment_type
+    def set_payment_type(self, payment_type): self._payment_type = payment_type
+    
+    def get_transaction_date(self): return self._transaction_date
+    def set_transaction_date(self, transaction_date): self._transaction_date = transaction_date
+    
+    def get_transaction_status(self): return self._transaction_status
+    def set_transaction_status(self, transaction_status): self._transaction_status = transaction_status
+    
+    def get_refund_id(self): return self._refund_id
+    def set_refund_id(self, refund_id): self._refund_id = refund_id
+    
+    def get_refund_reason(self): return self._refund_reason
+    def set_refund_reason(self, refund_reason): self._refund_reason = refund_reason
+
+# Class for handling digital payments like PayPal, Apple Pay
+class DigitalPayment(Payment):
+    _STATE_FIELDS = Payment._STATE_FIELDS + ('_transaction_id', '_account_identifier', '_authorization_code')
+    
+    def __init__(self, booking_id, payment_id, transaction_id, account_identifier, authorization_code, transaction_date, transaction_status):
+        # Call the Payment class constructor and set digital specific values
+        super().__init__(booking_id, payment_id, PaymentType.DIGITAL, transaction_date, transaction_status)
+        self._transaction_id = transaction_id # ID from the payment processor like PayPal
+        self._account_identifier = account_identifier # Account email or username used for payment
+        self._authorization_code = authorization_code # Code confirming authorization
+    
+    # Show all details about the digital payment
+    def display_digital_payment_info(self):
+        return self.display_payment_info() + ", Transaction ID: " + str(self._transaction_id) + ", Account: " + self._account_identifier + ", Auth Code: " + self._authorization_code
+    
+    # Getters and setters for digital payment fields
+    def get_transaction_id(self): return self._transaction_id
+    def set_transaction_id(self, transaction_id): self._transaction_id = transaction_id
+    
+    def get_account_identifier(self): return self._account_identifier
+    def set_account_identifier(self, account_identifier): self._account_identifier = account_identifier
+    
+    def get_authorization_code(self): return self._authorization_code
+    def set_authorization_code(self, authorization_code): self._authorization_code = authorization_code
+
+# Class for credit card payments
+class CreditCard(Payment):
+    _STATE_FIELDS = Payment._STATE_FIELDS + ('_card_number', '_expiry_date', '_card_type')
+    _ENUM_FIELDS = dict(Payment._ENUM_FIELDS, _card_type=CardType)
+    
+    def __init__(self, booking_id, payment_id, card_number, expiry_date, card_type, transaction_date, transaction_status):
+        # Call the Payment constructor and set credit card specific fields
+        super().__init__(booking_id, payment_id, PaymentType.CREDIT_CARD, transaction_date, transaction_status)
+        self._card_number = card_number # Credit card number should be stored securely
+        self._expiry_date = expiry_date # Card expiration date
+        self._card_type = card_type # Visa, MasterCard, etc
+    
+    # Show all credit card payment details
+    def display_credit_card_info(self):
+        return self.display_payment_info() + ", Card Number: " + self._card_number + ", Expiry: " + self._expiry_date + ", Type: " + self._card_type.value
+    
+    # Getters and setters for credit card details
+    def get_card_number(self): return self._card_number
+    def set_card_number(self, card_number): self._card_number = card_number
+    
+    def get_expiry_date(self): return self._expiry_date
+    def set_expiry_date(self, expiry_date): self._expiry_date = expiry_date
+    
+    def get_card_type(self): return self._card_type
+    def set_card_type(self, card_type): self._card_type = card_type
+
+# Represents a booking for an event
+class Booking(CompactState):
+    # Attributes saved to the data files, see CompactState
+    _STATE_FIELDS = ('_user_id', '_event_id', '_booking_id', '_booking_date', '_number_of_tickets', '_total_price', '_booking_status', '_list_reservation')
+    _DATETIME_FIELDS = ('_booking_date',)
+    _ENUM_FIELDS = {'_booking_status': BookingStatus}
+    
+    def __init__(self, user_id, event_id, booking_id, booking_date, number_of_tickets,
+                 total_price, booking_status):
+        # Initialize booking details
+        self._user_id = user_id # ID of the user making the booking
+        self._event_id = event_id # ID of the event
+        self._booking_id = booking_id # Unique ID for the booking
+        self._booking_date = booking_date # Date the booking was made
+        self._number_of_tickets = number_of_tickets # Number of tickets booked
+        self._total_price = total_price # Total price for the booking
+        self._booking_status = booking_status # Status of the booking e.g confirmed, cancelled
+        self._list_reservation = [] # List to hold reservations associated with the booking
+    
+    # Returns a formatted string of booking information
+    def display_booking_info(self):
+        return "Booking ID: " + str(self._booking_id) + ", User ID: " + str(self._user_id) + ", Event ID: " + str(self._event_id) + ", Date: " + str(self._booking_date) + ", Tickets: " + str(self._number_of_tickets) + ", Total Price: " + str(self._total_price) + ", Status: " + self._booking_status.value
+    
+    # Getter and setter methods for each attribute
+    def get_user_id(self): return self._user_id
+    def set_user_id(self, user_id): self._user_id = user_id
+    
+    def get_event_id(self): return self._event_id
+    def set_event_id(self, event_id): self._event_id = event_id
+    
+    def get_booking_id(self): return self._booking_id
+    def set_booking_id(self, booking_id): self._booking_id = booking_id
+    
+    def get_booking_date(self): return self._booking_date
+    def set_booking_date(self, booking_date): self._booking_date = booking_date
+    
+    def get_number_of_tickets(self): return self._number_of_tickets
+    def set_number_of_tickets(self, number_of_tickets): self._number_of_tickets = number_of_tickets
+    
+    def get_total_price(self): return self._total_price
+    def set_total_price(self, total_price): self._total_price = total_price
+    
+    def get_booking_status(self): return self._booking_status
+    def set_booking_status(self, booking_status): self._booking_status = booking_status
+    
+    def get_list_reservation(self): return self._list_reservation
+    def set_list_reservation(self, list_reservation): self._list_reservation = list_reservation
+
+# Represents a discount applied to a booking or ticket
+class Discount(CompactState):
+    # Attributes saved to the data files, see CompactState
+    _STATE_FIELDS = ('_discount_id', '_discount_percentage', '_discount_amount', '_discount_code', '_max_discount_amount')
+    
+    def __init__(self, discount_id, discount_percentage, discount_amount, discount_code,
+                 max_discount_amount):
+        self._discount_id = discount_id # Unique ID for the discount
+        self._discount_percentage = discount_percentage # Percentage discount
+        self._discount_amount = discount_amount # Flat amount discount
+        self._discount_code = discount_code # Code used to apply the discount
+        self._max_discount_amount = max_discount_amount # Max discount value allowed
+    
+    # Display discount information
+    def display_discount_info(self):
+        return "Discount ID: " + str(self._discount_id) + ", Percentage: " + str(self._discount_percentage) + "%, Amount: $" + str(self._discount_amount) + ", Code: " + self._discount_code + ", Max: $" + str(self._max_discount_amount)
+    
+    # Apply the discount to a price
+    def apply_discount(self, original_price):
+        # Calculate discount
+        percentage_discount = original_price * (self._discount_percentage / 100)
+        total_discount = percentage_discount + self._discount_amount
+        
+        # Ensure discount does not exceed maximum allowed
+        if total_discount > self._max_discount_amount:
+            total_discount = self._max_discount_amount
+        
+        # Return the discounted price
+        return original_price - total_discount
+    
+    # Getter and setter methods
+    def get_discount_id(self): return self._discount_id
+    def set_discount_id(self, discount_id): self._discount_id = discount_id
+    
+    def get_discount_percentage(self): return self._discount_percentage
+    def set_discount_percentage(self, discount_percentage): self._discount_percentage = discount_percentage
+    
+    def get_discount_amount(self): return self._discount_amount
+    def set_discount_amount(self, discount_amount): self._discount_amount = discount_amount
+    
+    def get_discount_code(self): return self._discount_code
+    def set_discount_code(self, discount_code): self._discount_code = discount_code
+    
+    def get_max_discount_amount(self): return self._max_discount_amount
+    def set_max_discount_amount(self, max_discount_amount): self._max_discount_amount = max_discount_amount
+
+# Represents a basic ticket for an event
+class Ticket(CompactState):
+    # Attributes saved to the data files, see CompactState
+    _STATE_FIELDS = ('_type_id', '_booking_id', '_ticket_id', '_seat_number', '_ticket_price', '_check_in_time', '_event_id')
+    _DATETIME_FIELDS = ('_check_in_time',)
+    
+    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id=None):
+        self._type_id = type_id # Type of ticket could be general, VIP, etc
+        self._booking_id = booking_id # Associated booking ID
+        self._ticket_id = ticket_id # Unique ticket ID
+        self._seat_number = seat_number # Seat assigned to the ticket
+        self._ticket_price = ticket_price # Price of the ticket
+        self._check_in_time = check_in_time # Check-in time for the ticket holder
+        self._event_id = event_id # ID of the event this ticket belongs to
+    
+    # Returns formatted ticket info
+    def display_ticket_info(self):
+        return "Ticket ID: " + str(self._ticket_id) + ", Booking ID: " + str(self._booking_id) + ", Seat: " + str(self._seat_number) + ", Price: " + str(self._ticket_price) + ", Check-in Time: " + str(self._check_in_time) + ", Event ID: " + str(self._event_id)
+    
+    # Getter and setter methods
+    def get_type_id(self): return self._type_id
+    def set_type_id(self, type_id): self._type_id = type_id
+    
+    def get_booking_id(self): return self._booking_id
+    def set_booking_id(self, booking_id): self._booking_id = booking_id
+    
+    def get_ticket_id(self): return self._ticket_id
+    def set_ticket_id(self, ticket_id): self._ticket_id = ticket_id
+    
+    def get_seat_number(self): return self._seat_number
+    def set_seat_number(self, seat_number): self._seat_number = seat_number
+    
+    def get_ticket_price(self): return self._ticket_price
+    def set_ticket_price(self, ticket_price): self._ticket_price = ticket_price
+    
+    def get_check_in_time(self): return self._check_in_time
+    def set_check_in_time(self, check_in_time): self._check_in_time = check_in_time
+    
+    def get_event_id(self): return self._event_id
+    def set_event_id(self, event_id): self._event_id = event_id
+
+# Represents a group discounted ticket inherits from Ticket
+class GroupDiscount(Ticket):
+    _STATE_FIELDS = Ticket._STATE_FIELDS + ('_group_id', '_group_count', '_group_gifts')
+    
+    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time,
+                 group_id, group_count, group_gifts, event_id):
+        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
+        self._group_id = group_id # ID of the group
+        self._group_count = group_count # Number of people in the group
+        self._group_gifts = group_gifts # Gifts provided to the group
+    
+    # Displays ticket + group discount info
+    def display_group_discount_info(self):
+        return self.display_ticket_info() + ", Group ID: " + str(self._group_id) + ", Group Count: " + str(self._group_count) + ", Group Gifts: " + self._group_gifts
+    
+    # Getter/setter for additional attribute
+    def get_group_id(self): return self._group_id
+    def set_group_id(self, group_id): self._group_id = group_id
+    
+    def get_group_count(self): return self._group_count
+    def set_group_count(self, group_count): self._group_count = group_count
+    
+    def get_group_gifts(self): return self._group_gifts
+    def set_group_gifts(self, group_gifts): self._group_gifts = group_gifts
+
+# Represents a season membership ticket inherit from Ticket
+class SeasonMembership(Ticket):
+    _STATE_FIELDS = Ticket._STATE_FIELDS + ('_member_id', '_member_name', '_included_gifts')
+    
+    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, member_id, member_name, included_gifts, event_id):
+        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
+        self._member_id = member_id # Unique member ID
+        self._member_name = member_name # Member full name
+        self._included_gifts = included_gifts # Gifts included in membership
+    
+    def display_season_membership_info(self):
+        return self.display_ticket_info() + ", Member ID: " + str(self._member_id) + ", Name: " + self._member_name + ", Included Gifts: " + self._included_gifts
+    
+    def get_member_id(self): return self._member_id
+    def set_member_id(self, member_id): self._member_id = member_id
+    
+    def get_member_name(self): return self._member_name
+    def set_member_name(self, member_name): self._member_name = member_name
+    
+    def get_included_gifts(self): return self._included_gifts
+    def set_included_gifts(self, included_gifts): self._included_gifts = included_gifts
+
+# Represents a single-race access pass inherits from Ticket
+class SingleRacePass(Ticket):
+    _STATE_FIELDS = Ticket._STATE_FIELDS + ('_single_race_pass_id', '_pass_expiry', '_pass_benefits')
+    
+    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time,
+                 single_race_pass_id, pass_expiry, pass_benefits, event_id):
+        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
+        self._single_race_pass_id = single_race_pass_id # Unique ID for the pass
+        self._pass_expiry = pass_expiry # Expiration date/time of the pass
+        self._pass_benefits = pass_benefits # Benefits included with the pass
+    
+    def display_single_race_pass_info(self):
+        return self.display_ticket_info() + ", Pass ID: " + str(self._single_race_pass_id) + ", Expiry: " + self._pass_expiry + ", Benefits: " + self._pass_benefits
+    
+    # Getter/setters
+    def get_single_race_pass_id(self): return self._single_race_pass_id
+    def set_single_race_pass_id(self, single_race_pass_id): self._single_race_pass_id = single_race_pass_id
+    
+    def get_pass_expiry(self): return self._pass_expiry
+    def set_pass_expiry(self, pass_expiry): self._pass_expiry = pass_expiry
+    
+    def get_pass_benefits(self): return self._pass_benefits
+    def set_pass_benefits(self, pass_benefits): self._pass_benefits = pass_benefits
+
+# Represents a weekend package ticket with added benefits inherits from Ticket
+class WeekendPackage(Ticket):
+    _STATE_FIELDS = Ticket._STATE_FIELDS + ('_package_id', '_package_type', '_package_benefits')
+    
+    def __init__(self, type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time,
+                 package_id, package_type, package_benefits, event_id):
+        super().__init__(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, event_id)
+        self._package_id = package_id # ID of the package
+        self._package_type = package_type # Type e.g deluxe, standard
+        self._package_benefits = package_benefits # List of benefits included
+    
+    def display_weekend_package_info(self):
+        return self.display_ticket_info() + ", Package ID: " + str(self._package_id) + ", Type: " + self._package_type + ", Benefits: " + self._package_benefits
+    
+    def get_package_id(self): return self._package_id
+    def set_package_id(self, package_id): self._package_id = package_id
+    
+    def get_package_type(self): return self._package_type
+    def set_package_type(self, package_type): self._package_type = package_type
+    
+    def get_package_benefits(self): return self._package_benefits
+    def set_package_benefits(self, package_benefits): self._package_benefits = package_benefits
+
+# Represents an event such as a Grand Prix race
+class Event(CompactState):
+    # Attributes saved to the data files, see CompactState
+    _STATE_FIELDS = ('_event_name', '_event_id', '_event_date', '_event_location', '_event_capacity', '_list_user_tickets', '_next_ticket_id')
+    _DATETIME_FIELDS = ('_event_date',)
+    
+    # Initializes a new Event with details like name, ID, date, location, and capacity
+    def __init__(self, event_name, event_id, event_date, event_location, event_capacity):
+        self._event_name = event_name # Name of the event
+        self._event_id = event_id # Unique identifier for the event
+        self._event_date = event_date # Date of the event
+        self._event_location = event_location # Location of the event
+        self._event_capacity = event_capacity # Total number of tickets available
+        self._list_user_tickets = [] # List to store Ticket objects for this event
+        self._next_ticket_id = 1 # Simple way to generate unique ticket IDs for this event
+    
+    # Method to create a new ticket for this event
+    def create_ticket(self, type_id, booking_id, seat_number, ticket_price, check_in_time):
+        ticket_id = "TKT-" + str(self._event_id) + "-" + str(self._next_ticket_id)
+        new_ticket = Ticket(type_id, booking_id, ticket_id, seat_number, ticket_price, check_in_time, self._event_id)
+        self._list_user_tickets.append(new_ticket)
+        self._next_ticket_id += 1
+        return new_ticket
+    
+    # Returns a formatted string with the event's key information
+    def display_event_info(self):
+        return "Event: " + self._event_name + ", ID: " + str(self._event_id) + ", Date: " + str(self._event_date) + ", Location: " + self._event_location + ", Capacity: " + str(self._event_capacity)
+    
+    # Calculates and returns how many tickets are still available for the event
+    def get_remaining_capacity(self):
+        return self._event_capacity - len(self._list_user_tickets)
+    
+    # Returns the event's start time (simplified as the event date)
+    def get_start_time(self): return self._event_date
+    
+    # Returns the event's end time (simplified as the event date)
+    def get_end_time(self): return self._event_date
+    
+    # Getter and setter for event name
+    def get_event_name(self): return self._event_name
+    def set_event_name(self, event_name): self._event_name = event_name
+    
+    # Getter and setter for event ID
+    def get_event_id(self): return self._event_id
+    def set_event_id(self, event_id): self._event_id = event_id
+    
+    # Getter and setter for event date
+    def get_event_date(self): return self._event_date
+    def set_event_date(self, event_date): self._event_date = event_date
+    
+    # Getter and setter for event location
+    def get_event_location(self): return self._event_location
+    def set_event_location(self, event_location): self._event_location = event_location
+    
+    # Getter and setter for event capacity
+    def get_event_capacity(self): return self._event_capacity
+    def set_event_capacity(self, event_capacity): self._event_capacity = event_capacity
+    
+    # Getter for the list of user tickets
+    def get_tickets(self): return self._list_user_tickets
+    
+    # Setter for the list of user tickets
+    def set_tickets(self, tickets): self._list_user_tickets = tickets
+
+# =================================================================
+# SERIALIZERS
+# =================================================================
+
+# Classes and enums that can be stored by the struct and JSON lines formats
+PERSISTED_CLASSES = {cls.__name__: cls for cls in (
+    User, Customer, Admin, Payment, DigitalPayment, CreditCard, Booking, Discount,
+    Ticket, GroupDiscount, SeasonMembership, SingleRacePass, WeekendPackage, Event
+)}
+
+# Enums are stored by their position in this list, so only add to the end
+PERSISTED_ENUMS = [PaymentType, PaymentTransactionStatus, AccountStatus, BookingStatus, CardType]
+
+# Create an object of a persisted class from its attribute dictionary
+def restore_object(class_name, state):
+    obj = PERSISTED_CLASSES[class_name].__new__(PERSISTED_CLASSES[class_name])
+    obj.__dict__.update(state)
+    return obj
+
+# Rebuild the list saved by CompactRecords
+# Every step runs inside map, zip and list so there is no Python call
+# for each record, which is what makes loading a data file fast
+def restore_records(groups, order):
+    lists = []
+    for cls, names, columns in groups:
+        columns = [cls._decode_column(name, column) for name, column in zip(names, columns)]
+        objects = list(map(cls.__new__, repeat(cls, len(columns[0]) if columns else 0)))
+        deque(map(setattr, objects, repeat('__dict__'), map(dict, map(zip, repeat(names), zip(*columns)))), 0)
+        lists.append(objects)
+    if len(lists) == 1:
+        return lists[0]
+    
+    # Put records of different classes back in their saved order
+    iterators = [iter(objects) for objects in lists]
+    return list(map(next, map(iterators.__getitem__, order)))
+
+# Wraps a list of records so pickle stores it by column
+# Records are grouped by class and attribute names and every group is saved
+# as one list of values per attribute, so names, classes and the per record
+# pickle framing are written once for the whole file. Loading gives back a
+# plain list through restore_records
+class CompactRecords:
+    def __init__(self, records):
+        self.records = records
+    
+    def __reduce__(self):
+        groups = {}
+        order = []
+        for record in self.records:
+            key = (record.__class__, tuple(record.__dict__))
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = (len(groups), [])
+            order.append(group[0])
+            group[1].append(record)
+        
+        saved = []
+        for (cls, names), (_, records) in groups.items():
+            columns = [cls._encode_column(name, [record.__dict__[name] for record in records]) for name in names]
+            saved.append((cls, names, columns))
+        return (restore_records, (saved, bytes(order) if len(groups) < 256 else order))
+
+# Stores a list of records with pickle at the highest protocol
+# Lists of CompactState records are stored by column, see CompactRecords
+class PickleSerializer:
+    def __init__(self, protocol=pickle.HIGHEST_PROTOCOL):
+        self.protocol = protocol
+    
+    def dump(self, records, file):
+        if isinstance(records, list) and all(isinstance(record, CompactState) for record in records):
+            records = CompactRecords(records)
+        pickle.dump(records, file, self.protocol)
+    
+    def load(self, file):
+        return pickle.load(file)
+
+# Stores records as one JSON object per line after a header line
+# Dates, enums and objects are written as small tagged objects
+class JsonLinesSerializer:
+    MAGIC = b'{"format": "grandprix-jsonl"'
+    
+    def dump(self, records, file):
+        lines = [self.MAGIC.decode() + ', "version": 1}']
+        for record in records:
+            lines.append(json.dumps(self._encode(record), separators=(',', ':')))
+        file.write(("\n".join(lines) + "\n").encode('utf-8'))
+    
+    def load(self, file):
+        lines = file.read().decode('utf-8').splitlines()
+        return [self._decode(json.loads(line)) for line in lines[1:] if line]
+    
+    def _encode(self, value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, datetime):
+            return {"$dt": value.isoformat()}
+        if isinstance(value, Enum):
+            return {"$enum": type(value).__name__, "name": value.name}
+        if isinstance(value, list):
+            return [self._encode(item) for item in value]
+        if isinstance(value, tuple):
+            return {"$tuple": [self._encode(item) for item in value]}
+        if isinstance(value, dict):
+            return {"$dict": [[self._encode(k), self._encode(v)] for k, v in value.items()]}
+        return {"$obj": type(value).__name__, "state": {k: self._encode(v) for k, v in value.__dict__.items()}}
+    
+    def _decode(self, value):
+        if isinstance(value, list):
+            return [self._decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$enum" in value:
+            enum_class = next(e for e in PERSISTED_ENUMS if e.__name__ == value["$enum"])
+            return enum_class[value["name"]]
+        if "$tuple" in value:
+            return tuple(self._decode(item) for item in value["$tuple"])
+        if "$dict" in value:
+            return {self._decode(k): self._decode(v) for k, v in value["$dict"]}
+        return restore_object(value["$obj"], {k: self._decode(v) for k, v in value["state"].items()})
+
+# Stores records in a compact binary format built with the struct module
+# Every value starts with a one byte type tag. The attribute names of a
+# class are written once in a schema and objects only store the values.
+# A text that appeared before is stored as a reference to its first copy
+class StructSerializer:
+    MAGIC = b'GPS1'
+    
+    INT = struct.Struct('<q')
+    FLOAT = struct.Struct('<d')
+    LENGTH = struct.Struct('<I')
+    ENUM = struct.Struct('<BH')
+    SCHEMA_ID = struct.Struct('<H')
+    
+    def dump(self, records, file):
+        out = bytearray(self.MAGIC)
+        out += self.LENGTH.pack(len(records))
+        schemas = {}
+        texts = {}
+        for record in records:
+            self._encode(record, out, schemas, texts)
+        file.write(out)
+    
+    def load(self, file):
+        data = memoryview(file.read())
+        if bytes(data[:4]) != self.MAGIC:
+            raise ValueError("Not a struct data file")
+        count = self.LENGTH.unpack_from(data, 4)[0]
+        position = 8
+        schemas = []
+        texts = []
+        records = []
+        for _ in range(count):
+            record, position = self._decode(data, position, schemas, texts)
+            records.append(record)
+        return records
+    
+    def _encode_text(self, text, out):
+        raw = text.encode('utf-8')
+        out += self.LENGTH.pack(len(raw))
+        out += raw
+    
+    def _encode(self, value, out, schemas, texts):
+        if value is None:
+            out += b'N'
+        elif value is True:
+            out += b'T'
+        elif value is False:
+            out += b'F'
+        elif isinstance(value, int) and not isinstance(value, Enum):
+            if -2 ** 63 <= value < 2 ** 63:
+                out += b'i'
+                out += self.INT.pack(value)
+            else:
+                out += b'I'
+                self._encode_text(str(value), out)
+        elif isinstance(value, float):
+            out += b'f'
+            out += self.FLOAT.pack(value)
+        elif isinstance(value, str):
+            if value in texts:
+                out += b'r'
+                out += self.LENGTH.pack(texts[value])
+            else:
+                texts[value] = len(texts)
+                out += b's'
+                self._encode_text(value, out)
+        elif isinstance(value, datetime):
+            if value.tzinfo is None:
+                delta = value - EPOCH
+                out += b'd'
+                out += self.INT.pack((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+            else:
+                out += b'z'
+                self._encode_text(value.isoformat(), out)
+        elif isinstance(value, Enum):
+            enum_class = type(value)
+            out += b'e'
+            out += self.ENUM.pack(PERSISTED_ENUMS.index(enum_class), list(enum_class).index(value))
+        elif isinstance(value, (list, tuple)):
+            out += b'l' if isinstance(value, list) else b't'
+            out += self.LENGTH.pack(len(value))
+            for item in value:
+                self._encode(item, out, schemas, texts)
+        elif isinstance(value, dict):
+            out += b'm'
+            out += self.LENGTH.pack(len(value))
+            for k, v in value.items():
+                self._encode(k, out, schemas, texts)
+                self._encode(v, out, schemas, texts)
+        else:
+            state = value.__dict__
+            schema = (type(value).__name__, tuple(state))
+            if schema not in schemas:
+                # Describe the class the first time it is used
+                schemas[schema] = len(schemas)
+                out += b'S'
+                self._encode_text(schema[0], out)
+                out += self.LENGTH.pack(len(schema[1]))
+                for name in schema[1]:
+                    self._encode_text(name, out)
+            out += b'o'
+            out += self.SCHEMA_ID.pack(schemas[schema])
+            for item in state.values():
+                self._encode(item, out, schemas, texts)
+    
+    def _decode_text(self, data, position):
+        length = self.LENGTH.unpack_from(data, position)[0]
+        position += 4
+        return str(data[position:position + length], 'utf-8'), position + length
+    
+    def _decode(self, data, position, schemas, texts):
+        tag = data[position]
+        position += 1
+        if tag == 0x4E: # N
+            return None, position
+        if tag == 0x54: # T
+            return True, position
+        if tag == 0x46: # F
+            return False, position
+        if tag == 0x69: # i
+            return self.INT.unpack_from(data, position)[0], position + 8
+        if tag == 0x49: # I
+            text, position = self._decode_text(data, position)
+            return int(text), position
+        if tag == 0x66: # f
+            return self.FLOAT.unpack_from(data, position)[0], position + 8
+        if tag == 0x73: # s
+            text, position = self._decode_text(data, position)
+            texts.append(text)
+            return text, position
+        if tag == 0x72: # r
+            return texts[self.LENGTH.unpack_from(data, position)[0]], position + 4
+        if tag == 0x64: # d
+            microseconds = self.INT.unpack_from(data, position)[0]
+            return EPOCH + timedelta(microseconds=microseconds), position + 8
+        if tag == 0x7A: # z
+            text, position = self._decode_text(data, position)
+            return datetime.fromisoformat(text), position
+        if tag == 0x65: # e
+            enum_index, member_index = self.ENUM.unpack_from(data, position)
+            return list(PERSISTED_ENUMS[enum_index])[member_index], position + 3
+        if tag == 0x6C or tag == 0x74: # l or t
+            count = self.LENGTH.unpack_from(data, position)[0]
+            position += 4
+            items = []
+            for _ in range(count):
+                item, position = self._decode(data, position, schemas, texts)
+                items.append(item)
+            return (items if tag == 0x6C else tuple(items)), position
+        if tag == 0x6D: # m
+            count = self.LENGTH.unpack_from(data, position)[0]
+            position += 4
+            result = {}
+            for _ in range(count):
+                k, position = self._decode(data, position, schemas, texts)
+                result[k], position = self._decode(data, position, schemas, texts)
+            return result, position
+        if tag == 0x53: # S, a schema followed by the object that uses it
+            class_name, position = self._decode_text(data, position)
+            count = self.LENGTH.unpack_from(data, position)[0]
+            position += 4
+            names = []
+            for _ in range(count):
+                name, position = self._decode_text(data, position)
+                names.append(name)
+            schemas.append((class_name, names))
+            return self._decode(data, position, schemas, texts)
+        if tag == 0x6F: # o
+            class_name, names = schemas[self.SCHEMA_ID.unpack_from(data, position)[0]]
+            position += 2
+            state = {}
+            for name in names:
+                state[name], position = self._decode(data, position, schemas, texts)
+            return restore_object(class_name, state), position
+        raise ValueError("Unknown type tag " + str(tag) + " in struct data file")
+
+# Serializers that can be chosen with DATA_FORMAT
+SERIALIZERS = {
+    'pickle': PickleSerializer(),
+    'struct': StructSerializer(),
+    'jsonl': JsonLinesSerializer()
+}
+
+# Compresses whole data files with one of the standard library modules
+# magic is the first bytes of every file it writes, used to recognise it
+class Compressor:
+    def __init__(self, module, magic, default_level, level_argument):
+        self.module = module
+        self.magic = magic
+        self.default_level = default_level
+        self.level_argument = level_argument # Name of the level keyword of compress()
+    
+    def compress(self, data, level=None):
+        if level is None:
+            level = self.default_level
+        return self.module.compress(data, **{self.level_argument: level})
+    
+    def decompress(self, data):
+        return self.module.decompress(data)
+
+# Compressors that can be chosen in DATA_FILES
+# zlib streams start with 0x78 for every level, which no serializer uses
+COMPRESSORS = {
+    'zlib': Compressor(zlib, b'\x78', 6, 'level')
+}
+if bz2 is not None:
+    COMPRESSORS['bz2'] = Compressor(bz2, b'BZh', 9, 'compresslevel')
+if lzma is not None:
+    COMPRESSORS['lzma'] = Compressor(lzma, b'\xfd7zXZ\x00', 6, 'preset')
+
+# Collecting garbage while a data file is loaded only walks the new records
+# again and again, so it is paused until every load running has finished
+_gc_pause_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+@contextmanager
+def paused_gc():
+    global _gc_pauses, _gc_was_enabled
+    with _gc_pause_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_pause_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+# Load the records of a data file written in any of the formats above
+# compressed with any of the compressors or not compressed at all
+def load_records(file):
+    with paused_gc():
+        return _load_records(file)
+
+def _load_records(file):
+    header = file.read(len(JsonLinesSerializer.MAGIC))
+    for compressor in COMPRESSORS.values():
+        if header.startswith(compressor.magic):
+            file = io.BytesIO(compressor.decompress(header + file.read()))
+            header = file.read(len(JsonLinesSerializer.MAGIC))
+            break
+    file.seek(0)
+    if header.startswith(StructSerializer.MAGIC):
+        return SERIALIZERS['struct'].load(file)
+    if header == JsonLinesSerializer.MAGIC:
+        return SERIALIZERS['jsonl'].load(file)
+    return pickle.load(file)
+
+# =================================================================
+# CHANGE DATA CAPTURE
+# =================================================================
+
+# One change made through a data manager
+# op is 'add', 'update' or 'delete' and record is the new state of the
+# record, None for deletes. shard is the event of a sharded collection
+# and None for the others. A booking or ticket that moves to another
+# event arrives as a delete from the old shard and an add to the new one
+ChangeRecord = namedtuple('ChangeRecord', ['collection', 'op', 'key', 'record', 'shard'])
+
+# Turn the {(file_key, shard): [(op, key, record)]} changes written by a
+# DataManager into a list of ChangeRecords
+def changes_from_pending(pending):
+    changes = []
+    for unit, entries in pending.items():
+        file_key, shard = unit if isinstance(unit, tuple) else (unit, None)
+        for op, key, record in entries:
+            changes.append(ChangeRecord(file_key, op, key, record, shard))
+    return changes
+
+# Hands every change made through a data manager to its subscribers
+# Subscribers are called in the thread that made the change, so they
+# should only update their own state and return quickly
+class ChangeBus:
+    def __init__(self):
+        self._subscribers = [] # (callback, collections or None for all)
+        self._lock = threading.Lock()
+    
+    # Call callback with a ChangeRecord for every change to the given
+    # collections, or to every collection. Returns a function that ends
+    # the subscription
+    def subscribe(self, callback, collections=None):
+        subscriber = (callback, None if collections is None else frozenset(collections))
+        with self._lock:
+            self._subscribers = self._subscribers + [subscriber]
+        
+        def unsubscribe():
+            with self._lock:
+                self._subscribers = [s for s in self._subscribers if s is not subscriber]
+        return unsubscribe
+    
+    def publish(self, changes):
+        for callback, collections in self._subscribers:
+            for change in changes:
+                if collections is None or change.collection in collections:
+                    try:
+                        callback(change)
+                    except Exception as e:
+                        # A broken subscriber must not stop the change being saved
+                        print("Error in change subscriber: " + str(e))
+
+# Lock that keeps writers of the change feed apart, see lock_files
+_CHANGE_FEED_LOCK = threading.Lock()
+
+@contextmanager
+def lock_change_feed(shared=False):
+    lock_path = os.path.join(DATA_DIR, os.path.splitext(CHANGE_FEED_FILE)[0] + '.lock')
+    with _CHANGE_FEED_LOCK:
+        if not os.path.exists(DATA_DIR):
+            os.makedirs(DATA_DIR, exist_ok=True)
+        with open(lock_path, 'ab') as file:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            yield
+
+# Return the path of the change feed and of the feed it was rotated to
+def get_change_feed_paths():
+    stem, extension = os.path.splitext(CHANGE_FEED_FILE)
+    return os.path.join(DATA_DIR, CHANGE_FEED_FILE), os.path.join(DATA_DIR, stem + '.1' + extension)
+
+# Append a list of ChangeRecords to the change feed as one entry
+def append_change_feed(changes, sync=False):
+    feed_path, rotated_path = get_change_feed_paths()
+    with lock_change_feed():
+        if os.path.exists(feed_path) and os.path.getsize(feed_path) > CHANGE_FEED_SIZE:
+            os.replace(feed_path, rotated_path)
+        with open(feed_path, 'ab') as file:
+            start = file.tell()
+            pickle.dump([tuple(change) for change in changes], file, pickle.HIGHEST_PROTOCOL)
+            STORAGE_STATS['bytes_written'] += file.tell() - start
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        STORAGE_STATS['writes'] += 1
+
+# Follows the change feed written by the data managers of other processes
+# Each call to poll() returns the ChangeRecords written since the last one
+# By default only changes made after the reader was created are returned
+class ChangeFeedReader:
+    def __init__(self, from_start=False):
+        self._inode = None # File being read, the feed is replaced when rotated
+        self._offset = 0 # Position after the last complete entry read
+        if not from_start:
+            feed_path = get_change_feed_paths()[0]
+            with lock_change_feed(shared=True):
+                if os.path.exists(feed_path):
+                    stat = os.stat(feed_path)
+                    self._inode, self._offset = stat.st_ino, stat.st_size
+    
+    # Return the changes written since the last call
+    def poll(self):
+        feed_path, rotated_path = get_change_feed_paths()
+        changes = []
+        with lock_change_feed(shared=True):
+            if not os.path.exists(feed_path):
+                return changes
+            inode = os.stat(feed_path).st_ino
+            if inode != self._inode:
+                # The feed was rotated, finish the file we were reading first
+                if self._inode is not None and os.path.exists(rotated_path) and os.stat(rotated_path).st_ino == self._inode:
+                    changes.extend(self._read(rotated_path))
+                self._inode, self._offset = inode, 0
+            changes.extend(self._read(feed_path))
+        return changes
+    
+    # Call callback with every change until stop_event is set
+    def follow(self, callback, interval=0.5, stop_event=None):
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            for change in self.poll():
+                callback(change)
+            stop_event.wait(interval)
+    
+    def _read(self, path):
+        changes = []
+        with open(path, 'rb') as file:
+            file.seek(self._offset)
+            while True:
+                try:
+                    batch = pickle.load(file)
+                except EOFError:
+                    break
+                except Exception as e:
+                    # A writer that crashed left a torn entry, skip the rest
+                    print("Ignoring damaged change feed entry in " + path + ": " + str(e))
+                    self._offset = os.path.getsize(path)
+                    break
+                changes.extend(ChangeRecord(*change) for change in batch)
+                self._offset = file.tell()
+        return changes
+
+# =================================================================
+# ARCHIVE
+# =================================================================
+
+# Collections whose records are moved to the archive with their event
+ARCHIVED_COLLECTIONS = ('bookings', 'tickets', 'payments')
+
+# Lock that keeps writers of the archive apart, see lock_files
+_ARCHIVE_LOCK = threading.Lock()
+
+@contextmanager
+def lock_archive(shared=False):
+    archive_dir = get_archive_dir()
+    with _ARCHIVE_LOCK:
+        if not os.path.exists(archive_dir):
+            os.makedirs(archive_dir, exist_ok=True)
+        with open(os.path.join(archive_dir, 'archive.lock'), 'ab') as file:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            yield
+
+# Return the archive folder, or the folder of one archived event
+def get_archive_dir(event_id=None):
+    if event_id is None:
+        return os.path.join(DATA_DIR, ARCHIVE_DIR)
+    return os.path.join(DATA_DIR, ARCHIVE_DIR, str(event_id))
+
+# Return the archive file of a collection for one event, e.g
+# data/archive/201/bookings.pkl
+def get_archive_path(event_id, file_key):
+    return os.path.join(get_archive_dir(event_id), file_key + '.pkl')
+
+# Return the ID of every event that has an archive folder
+def list_archived_events():
+    archive_dir = get_archive_dir()
+    if not os.path.isdir(archive_dir):
+        return []
+    event_ids = []
+    for name in os.listdir(archive_dir):
+        if os.path.isdir(os.path.join(archive_dir, name)):
+            # Event IDs are numbers, keep any other name as text
+            try:
+                event_ids.append(int(name))
+            except ValueError:
+                event_ids.append(name)
+    return event_ids
+
+# Write the archived records of a collection for one event
+# The file is made read-only, archive_events replaces it as a whole
+# if an event is archived again
+def write_archive(event_id, file_key, records):
+    filepath = get_archive_path(event_id, file_key)
+    if not os.path.exists(os.path.dirname(filepath)):
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    
+    compression, level = ARCHIVE_COMPRESSION
+    if compression not in COMPRESSORS:
+        compression, level = 'zlib', 9
+    temp_path = filepath + '.tmp'
+    with open(temp_path, 'wb') as file:
+        dump_records(records, file, compression, level)
+        STORAGE_STATS['bytes_written'] += file.tell()
+        file.flush()
+        os.fsync(file.fileno())
+    os.chmod(temp_path, 0o444)
+    os.replace(temp_path, filepath)
+    STORAGE_STATS['writes'] += 1
+
+# Read the archived records of a collection for one event
+def read_archive(event_id, file_key):
+    filepath = get_archive_path(event_id, file_key)
+    if not os.path.exists(filepath):
+        return []
+    with open(filepath, 'rb') as file:
+        return load_records(file)
+
+# Totals of every archived event, kept so reports never have to open
+# the archive files. A dictionary of event ID to the summary built by
+# summarize_event
+def load_archive_summaries():
+    filepath = os.path.join(get_archive_dir(), 'summaries.pkl')
+    if not os.path.exists(filepath):
+        return {}
+    with open(filepath, 'rb') as file:
+        return pickle.load(file)
+
+def save_archive_summaries(summaries):
+    filepath = os.path.join(get_archive_dir(), 'summaries.pkl')
+    temp_path = filepath + '.tmp'
+    with open(temp_path, 'wb') as file:
+        pickle.dump(summaries, file, protocol=pickle.HIGHEST_PROTOCOL)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, filepath)
+
+# Build the totals the reports need for an archived event
+# Only plain values are stored so the summaries load without the classes
+def summarize_event(event, bookings, tickets, payments):
+    daily = {}
+    by_status = {}
+    for booking in bookings:
+        date_key = booking.get_booking_date().strftime("%Y-%m-%d")
+        day = daily.setdefault(date_key, {"count": 0, "tickets": 0, "revenue": 0})
+        day["count"] += 1
+        day["tickets"] += booking.get_number_of_tickets()
+        day["revenue"] += booking.get_total_price()
+        status = booking.get_booking_status().value
+        by_status[status] = by_status.get(status, 0) + 1
+    
+    return {
+        "event_id": event.get_event_id(),
+        "event_name": event.get_event_name(),
+        "event_date": event.get_event_date(),
+        "archived_at": datetime.now(),
+        "bookings": len(bookings),
+        "tickets": sum(day["tickets"] for day in daily.values()),
+        "ticket_records": len(tickets),
+        "payments": len(payments),
+        "revenue": sum(day["revenue"] for day in daily.values()),
+        "by_status": by_status,
+        "daily": daily
+    }
+
+# =================================================================
+# ID SEQUENCES
+# =================================================================
+
+# Lock that keeps writers of the sequence file apart, see lock_files
+_SEQUENCE_LOCK = threading.Lock()
+
+@contextmanager
+def lock_sequences():
+    lock_path = os.path.join(DATA_DIR, os.path.splitext(SEQUENCE_FILE)[0] + '.lock')
+    with _SEQUENCE_LOCK:
+        if not os.path.exists(DATA_DIR):
+            os.makedirs(DATA_DIR, exist_ok=True)
+        with open(lock_path, 'ab') as file:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            yield
+
+# Return the next free ID of every sequence, a dictionary of name to ID
+def load_sequences():
+    filepath = os.path.join(DATA_DIR, SEQUENCE_FILE)
+    if not os.path.exists(filepath):
+        return {}
+    with open(filepath, 'r') as file:
+        return json.load(file)
+
+def save_sequences(sequences):
+    filepath = os.path.join(DATA_DIR, SEQUENCE_FILE)
+    temp_path = filepath + '.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(sequences, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, filepath)
+    STORAGE_STATS['writes'] += 1
+
+# Reserve count IDs of a sequence and return the first of them
+# first() is only called for a sequence that does not exist yet and
+# returns the ID it starts at, e.g one past the largest ID in use. The
+# block never starts below low, which moves the sequence past IDs that
+# were given out another way, e.g by an import
+def reserve_id_block(name, count, first, low=None):
+    with lock_sequences():
+        sequences = load_sequences()
+        start = sequences[name] if name in sequences else first()
+        if low is not None:
+            start = max(start, low)
+        sequences[name] = start + count
+        save_sequences(sequences)
+    return start
+
+# Hands out IDs from blocks reserved with reserve(name, count, first, low)
+# Each process reserves a block of IDs per sequence (the hi part) and
+# counts through it in memory (the lo part), so taking an ID only touches
+# the sequence file once every block_size IDs. IDs left in a block when
+# the process ends are never used, there are gaps but no duplicates
+class IdAllocator:
+    def __init__(self, reserve=reserve_id_block, block_size=None):
+        self._reserve = reserve
+        self._block_size = block_size or ID_BLOCK_SIZE
+        self._blocks = {} # name: [next ID, end of the block]
+        self._lock = threading.Lock()
+    
+    # Return a new ID of the sequence, first() as for reserve_id_block
+    def next_id(self, name, first):
+        with self._lock:
+            block = self._blocks.get(name)
+            if block is None or block[0] >= block[1]:
+                start = self._reserve(name, self._block_size, first)
+                block = self._blocks[name] = [start, start + self._block_size]
+            block[0] += 1
+            return block[0] - 1
+    
+    # Make sure no ID up to last_id is given out from now on
+    # The sequence file is already past every ID below the end of our
+    # block, so only an ID at or past it reserves a new block after it
+    def skip_to(self, name, last_id, first):
+        with self._lock:
+            block = self._blocks.get(name)
+            if block is None or last_id >= block[1]:
+                start = self._reserve(name, self._block_size, first, last_id + 1)
+                block = self._blocks[name] = [start, start + self._block_size]
+            block[0] = max(block[0], last_id + 1)
+
+# =================================================================
+# QUERIES
+# =================================================================
+
+# Fields a query can filter and sort each collection on, with the getter
+# that returns them. The names match INDEXED_FIELDS and SQLITE_TABLES
+QUERY_FIELDS = {
+    'customers': {'user_id': 'get_user_id', 'name': 'get_user_name', 'email': 'get_user_email',
+                  'registration_date': 'get_registration_date', 'address': 'get_customer_address',
+                  'phone': 'get_customer_phone'},
+    'admins': {'user_id': 'get_user_id', 'name': 'get_user_name', 'email': 'get_user_email',
+               'registration_date': 'get_registration_date', 'role': 'get_admin_role',
+               'employee_id': 'get_employee_id', 'status': 'get_account_status'},
+    'events': {'event_id': 'get_event_id', 'name': 'get_event_name', 'event_date': 'get_event_date',
+               'event_location': 'get_event_location', 'capacity': 'get_event_capacity'},
+    'bookings': {'booking_id': 'get_booking_id', 'user_id': 'get_user_id', 'event_id': 'get_event_id',
+                 'booking_date': 'get_booking_date', 'quantity': 'get_number_of_tickets',
+                 'total_price': 'get_total_price', 'status': 'get_booking_status'},
+    'tickets': {'ticket_id': 'get_ticket_id', 'booking_id': 'get_booking_id', 'event_id': 'get_event_id',
+                'type_id': 'get_type_id', 'seat_number': 'get_seat_number', 'price': 'get_ticket_price',
+                'check_in_time': 'get_check_in_time'},
+    'payments': {'payment_id': 'get_payment_id', 'booking_id': 'get_booking_id',
+                 'transaction_date': 'get_transaction_date', 'payment_type': 'get_payment_type',
+                 'status': 'get_transaction_status'},
+    'discounts': {'discount_id': 'get_discount_id', 'code': 'get_discount_code',
+                  'percentage': 'get_discount_percentage', 'amount': 'get_discount_amount',
+                  'max_amount': 'get_max_discount_amount'}
+}
+
+# Collection queried for each record class, subclasses use their parent's
+QUERY_CLASSES = {
+    Customer: 'customers',
+    Admin: 'admins',
+    Event: 'events',
+    Booking: 'bookings',
+    Ticket: 'tickets',
+    Payment: 'payments',
+    Discount: 'discounts'
+}
+QUERY_RECORD_CLASSES = {file_key: cls for cls, file_key in QUERY_CLASSES.items()}
+
+# Return the collection a query is about, given a record class like
+# Booking or a collection name like 'bookings'
+def get_query_collection(collection):
+    if isinstance(collection, str):
+        if collection not in QUERY_FIELDS:
+            raise ValueError("Unknown collection: " + collection)
+        return collection
+    for cls in collection.__mro__:
+        if cls in QUERY_CLASSES:
+            return QUERY_CLASSES[cls]
+    raise ValueError("Unknown record class: " + collection.__name__)
+
+# Return the query field of a collection that holds the record key
+def get_key_field(file_key):
+    for field, getter in QUERY_FIELDS[file_key].items():
+        if getter == COLLECTION_KEYS[file_key]:
+            return field
+
+# Records of one collection that match some conditions, built with
+# data_manager.query(Booking).where(event_id=202).order_by('booking_date').limit(50)
+# Nothing is read until the results are asked for with all(), first(),
+# count() or by iterating. The data manager picks the index that fits the
+# conditions best and scans the collection if there is none, explain()
+# tells which one it used
+class Query:
+    def __init__(self, data_manager, collection):
+        self._data_manager = data_manager
+        self.file_key = get_query_collection(collection)
+        self.equals = {} # field: value
+        self.ranges = {} # field: (start, end), start <= value < end
+        self.predicates = [] # Functions of a record that must return True
+        self.order = None # (field, descending)
+        self.max_records = None
+    
+    def _check_field(self, field):
+        if field not in QUERY_FIELDS[self.file_key]:
+            raise ValueError("Unknown field of " + self.file_key + ": " + field)
+    
+    # Keep the records whose fields have the given values
+    def where(self, **conditions):
+        for field, value in conditions.items():
+            self._check_field(field)
+            self.equals[field] = value
+        return self
+    
+    # Keep the records with start <= field < end, None leaves that side open
+    def between(self, field, start=None, end=None):
+        self._check_field(field)
+        self.ranges[field] = (start, end)
+        return self
+    
+    # Keep the records predicate(record) returns True for. No index can
+    # help with these, they are checked on the records the others found
+    def filter(self, predicate):
+        self.predicates.append(predicate)
+        return self
+    
+    def order_by(self, field, descending=False):
+        self._check_field(field)
+        self.order = (field, descending)
+        return self
+    
+    def limit(self, count):
+        self.max_records = count
+        return self
+    
+    # Return the matching records as a list
+    def all(self):
+        return self._data_manager._run_query(self)
+    
+    def __iter__(self):
+        return iter(self.all())
+    
+    # Return the first matching record, or None
+    def first(self):
+        max_records = self.max_records
+        self.max_records = 1
+        try:
+            records = self.all()
+        finally:
+            self.max_records = max_records
+        return records[0] if records else None
+    
+    def count(self):
+        return len(self.all())
+    
+    # Describe how the records will be found, e.g "index bookings.user_id"
+    # or "scan bookings"
+    def explain(self):
+        return self._data_manager._explain_query(self)
+    
+    # Return a function that gives the value of a field of a record
+    # The method of the record class is called directly, which is a lot
+    # faster than looking it up on every record
+    def getter(self, field):
+        return getattr(QUERY_RECORD_CLASSES[self.file_key], QUERY_FIELDS[self.file_key][field])
+    
+    # Filter, sort and limit the records an index or scan found
+    # ordered is True when they already come in the order asked for, then
+    # no more records are read than the limit needs. Each condition is a
+    # filter of its own so a record is dropped at the first one it fails
+    def apply(self, records, ordered=False):
+        for field, value in self.equals.items():
+            get = self.getter(field)
+            records = filter(lambda record, get=get, value=value: get(record) == value, records)
+        for field, (start, end) in self.ranges.items():
+            get = self.getter(field)
+            if start is not None:
+                records = filter(lambda record, get=get, start=start: get(record) >= start, records)
+            if end is not None:
+                records = filter(lambda record, get=get, end=end: get(record) < end, records)
+        for predicate in self.predicates:
+            records = filter(predicate, records)
+        
+        if self.order is not None and not ordered:
+            field, descending = self.order
+            if self.max_records is not None:
+                # Only keep the few records asked for instead of sorting all
+                select = heapq.nlargest if descending else heapq.nsmallest
+                return select(self.max_records, records, key=self.getter(field))
+            records = sorted(records, key=self.getter(field), reverse=descending)
+        return list(islice(records, self.max_records))
+
+# =================================================================
+# DATA MANAGEMENT CLASS
+# =================================================================
+
+# Return an email address in the form used to compare them, so addresses
+# match whatever their case and surrounding spaces
+def normalize_email(email):
+    return email.strip().lower()
+
+# Collections of accounts that log in with an email address
+EMAIL_COLLECTIONS = ('customers', 'admins')
+
+# Records of a collection grouped by the value of one field, e.g the
+# bookings of each user. Each group is a dictionary of record key to
+# record, so adding, moving and removing a record takes the same time
+# however big the collection is
+class MultiIndex:
+    def __init__(self, file_key, getter, records=()):
+        self._key_getter = COLLECTION_KEYS[file_key]
+        self._getter = getter
+        self._groups = {}
+        self._values = {} # Value each record key is grouped under
+        for record in records:
+            self.add(record)
+    
+    # Add a record or move it to the group of its current value
+    def add(self, record):
+        key = getattr(record, self._key_getter)()
+        value = getattr(record, self._getter)()
+        if self._values.get(key, value) != value:
+            self.remove(key)
+        self._groups.setdefault(value, {})[key] = record
+        self._values[key] = value
+    
+    def remove(self, key):
+        if key not in self._values:
+            return
+        value = self._values.pop(key)
+        group = self._groups[value]
+        del group[key]
+        if not group:
+            del self._groups[value]
+    
+    # Return the records grouped under a value
+    def get(self, value):
+        group = self._groups.get(value)
+        return list(group.values()) if group else []
+    
+    # Return every value that has records
+    def values(self):
+        return list(self._groups)
+
+# Records of a collection in the order of one field, e.g bookings by date
+# A sorted list of (value, key) is searched with bisect, so a range or the
+# last few records are found without sorting the collection. Records added
+# in order, like new bookings, are appended at the end
+class SortedIndex:
+    def __init__(self, file_key, getter, records=()):
+        self._key_getter = COLLECTION_KEYS[file_key]
+        self._getter = getter
+        self._records = {}
+        self._values = {} # Value each record key is sorted by
+        for record in records:
+            key = getattr(record, self._key_getter)()
+            self._records[key] = record
+            self._values[key] = getattr(record, getter)()
+        self._entries = sorted((value, key) for key, value in self._values.items())
+    
+    # Add a record or move it to the place of its current value
+    def add(self, record):
+        key = getattr(record, self._key_getter)()
+        value = getattr(record, self._getter)()
+        if key in self._values:
+            if self._values[key] == value:
+                self._records[key] = record
+                return
+            self.remove(key)
+        bisect.insort(self._entries, (value, key))
+        self._records[key] = record
+        self._values[key] = value
+    
+    def remove(self, key):
+        if key not in self._values:
+            return
+        value = self._values.pop(key)
+        del self._records[key]
+        del self._entries[bisect.bisect_left(self._entries, (value, key))]
+    
+    # Return the positions of the entries with start <= value < end
+    def _bounds(self, start, end):
+        low = 0 if start is None else bisect.bisect_left(self._entries, (start,))
+        high = len(self._entries) if end is None else bisect.bisect_left(self._entries, (end,))
+        return low, high
+    
+    # Return the records with start <= value < end, oldest first, at most
+    # limit of them. start or end None leaves that side of the range open
+    def between(self, start=None, end=None, limit=None):
+        low, high = self._bounds(start, end)
+        if limit is not None:
+            high = min(high, low + limit)
+        records = self._records
+        return [records[key] for value, key in self._entries[low:high]]
+    
+    # Yield the records with start <= value < end one at a time, newest
+    # first with reverse. Used by queries that stop after a few records
+    def scan(self, start=None, end=None, reverse=False):
+        low, high = self._bounds(start, end)
+        entries = self._entries
+        records = self._records
+        for position in (range(high - 1, low - 1, -1) if reverse else range(low, high)):
+            yield records[entries[position][1]]
+    
+    # Return the last n records, newest first, or all of them if n is None
+    def last(self, n=None):
+        records = self._records
+        return [records[key] for value, key in islice(reversed(self._entries), n)]
+    
+    def __len__(self):
+        return len(self._entries)
+
+# Return the words of a text as searched for, in lower case and without
+# punctuation, e.g "Abu Dhabi, UAE" gives abu, dhabi and uae
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+
+def tokenize(text):
+    return _WORD_PATTERN.findall(str(text).lower())
+
+# Return the words a field is indexed under for searching
+# A number written in parts, like the phone number 050-123 4567, is also
+# indexed as one word so it is found however it is typed
+def search_words(value):
+    words = tokenize(value)
+    if len(words) > 1 and "".join(words).isdigit():
+        words.append("".join(words))
+    return words
+
+# Finds records by the words in some of their fields, e.g customers by
+# name, email, phone and address. Every word of a search must be found in
+# a record, either whole or as the start of a word. Records are ranked by
+# the weight of the fields the words were found in, whole words count
+# double. The words of all records are kept in sorted order too, so the
+# words starting with a prefix are found with bisect
+class SearchIndex:
+    def __init__(self, file_key, weights, records=()):
+        self._key_getter = COLLECTION_KEYS[file_key]
+        self._weights = weights # getter: weight of a match in that field
+        self._postings = {} # word: {record key: weight}
+        self._record_words = {} # record key: {word: weight}
+        self._records = {}
+        for record in records:
+            self._add(record)
+        self._words = sorted(self._postings)
+    
+    # Index a record and return the words no other record had
+    def _add(self, record):
+        key = getattr(record, self._key_getter)()
+        words = {}
+        for getter, weight in self._weights.items():
+            for word in search_words(getattr(record, getter)()):
+                if weight > words.get(word, 0):
+                    words[word] = weight
+        
+        new_words = []
+        for word, weight in words.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                new_words.append(word)
+            postings[key] = weight
+        self._record_words[key] = words
+        self._records[key] = record
+        return new_words
+    
+    # Add a record or index it again with its current fields
+    def add(self, record):
+        self.remove(getattr(record, self._key_getter)())
+        for word in self._add(record):
+            bisect.insort(self._words, word)
+    
+    def remove(self, key):
+        words = self._record_words.pop(key, None)
+        if words is None:
+            return
+        del self._records[key]
+        for word in words:
+            postings = self._postings[word]
+            del postings[key]
+            if not postings:
+                del self._postings[word]
+                del self._words[bisect.bisect_left(self._words, word)]
+    
+    # Return the words a search word matches, itself and the longer words
+    # starting with it when prefix is True, and how many records have them
+    # Returns None as soon as more than limit records have them
+    def _expand(self, word, prefix, limit=None):
+        postings = self._postings
+        matches = [word] if word in postings else []
+        count = len(postings[word]) if matches else 0
+        if prefix:
+            words = self._words
+            for position in range(bisect.bisect_right(words, word), len(words)):
+                if limit is not None and count > limit:
+                    break
+                if not words[position].startswith(word):
+                    break
+                matches.append(words[position])
+                count += len(postings[words[position]])
+        if limit is not None and count > limit:
+            return None
+        return matches, count
+    
+    # Return {record key: score} of the records that have the words a
+    # search word matches. Whole words count double
+    def _scores(self, word, matches):
+        scores = {}
+        for match in matches:
+            bonus = 2 if match == word else 1
+            for key, weight in self._postings[match].items():
+                if weight * bonus > scores.get(key, 0):
+                    scores[key] = weight * bonus
+        return scores
+    
+    # Return the score a search word adds to a record with the given words
+    # or 0 if it is not found in them, scored like _scores
+    def _score(self, record_words, word, prefix):
+        weight = record_words.get(word)
+        score = weight * 2 if weight else 0
+        if prefix:
+            for other, weight in record_words.items():
+                if weight > score and other.startswith(word):
+                    score = weight
+        return score
+    
+    # Return the records that match a search, best first, at most limit
+    # Records that rank the same are returned in the order of their keys
+    def search(self, text, limit=None):
+        words = sorted(set(tokenize(text)), key=len, reverse=True)
+        if not words:
+            return []
+        
+        # Checking the words of a record costs about as much as reading this
+        # many postings, so a word found in many more records than the
+        # candidates is checked on them instead of being looked up
+        ratio = 30
+        
+        # Long words are usually found in the fewest records, look them up
+        # first so the others can stop early once they are too common
+        expanded = {}
+        best = None
+        for word in words:
+            found = self._expand(word, len(word) >= SEARCH_MIN_PREFIX, None if best is None else best * ratio)
+            if found is not None:
+                expanded[word] = found
+                best = found[1] if best is None else min(best, found[1])
+        
+        first = min(expanded, key=lambda word: expanded[word][1])
+        scores = self._scores(first, expanded[first][0])
+        for word in words:
+            if word == first or not scores:
+                continue
+            if word in expanded and expanded[word][1] <= len(scores) * ratio:
+                other = self._scores(word, expanded[word][0])
+                scores = {key: score + other[key] for key, score in scores.items() if key in other}
+            else:
+                prefix = len(word) >= SEARCH_MIN_PREFIX
+                remaining = {}
+                for key, score in scores.items():
+                    found = self._score(self._record_words[key], word, prefix)
+                    if found:
+                        remaining[key] = score + found
+                scores = remaining
+        
+        rank = lambda key: (-scores[key], key)
+        keys = sorted(scores, key=rank) if limit is None else heapq.nsmallest(limit, scores, key=rank)
+        return [self._records[key] for key in keys]
+
+# Fields records are looked up by besides their key, with the index used
+# for each one and the getter that returns it. A MultiIndex finds the
+# records with a value, e.g the bookings of a user, a SortedIndex keeps
+# them in order, e.g bookings by date. Looking records up by event needs
+# no index, the sharded collections already keep them per event
+# search is the SearchIndex over the fields in SEARCH_FIELDS
+INDEXED_FIELDS = {
+    'events': {'event_date': (SortedIndex, 'get_event_date'), 'event_location': (MultiIndex, 'get_event_location')},
+    'bookings': {'user_id': (MultiIndex, 'get_user_id'), 'booking_date': (SortedIndex, 'get_booking_date')},
+    'tickets': {'booking_id': (MultiIndex, 'get_booking_id')},
+    'payments': {'booking_id': (MultiIndex, 'get_booking_id'), 'transaction_date': (SortedIndex, 'get_transaction_date')},
+    'customers': {'search': (SearchIndex, SEARCH_FIELDS['customers'])}
+}
+
+# Build the sample events, discounts and admin used on first start
+def create_sample_records():
+    # Create sample events
+    event1 = Event("Grand Prix - Abu Dhabi", 201, datetime(2024, 11, 26), "Abu Dhabi Circuit", 1000)
+    event2 = Event("Grand Prix - Silverstone", 202, datetime(2024, 12, 15), "Silverstone Circuit", 1200)
+    
+    # Create sample discounts
+    discount1 = Discount(1, 10, 0, "EARLY10", 100)  # 10% discount up to $100
+    discount2 = Discount(2, 0, 15, "FLAT15", 15)    # Flat $15 discount
+    
+    # Create admin user
+    admin = Admin("Admin", 1, "111222333444555", "admin@zu.ac.ae", datetime.now(), "System Admin", 1001, AccountStatus.ACTIVE)
+    
+    return [event1, event2], [discount1, discount2], [admin]
+
+# Attribute of DataManager that loads a collection the first time it is read
+# Large collections like tickets and payments are only unpickled when needed
+class LazyCollection:
+    def __init__(self, file_key):
+        self._file_key = file_key
+    
+    def __get__(self, data_manager, owner):
+        if data_manager is None:
+            return self
+        collections = data_manager._collections
+        if self._file_key not in collections:
+            # Only one thread loads a collection, the others wait for it
+            # and check again so a store with changes is never replaced
+            with data_manager._collections_lock:
+                if self._file_key in collections:
+                    return collections[self._file_key]
+                
+                # Use the result of a background load if one was started
+                future = data_manager._loading.pop(self._file_key, None)
+                if future is not None:
+                    data = future.result()
+                else:
+                    data = load_data(self._file_key, states=data_manager._file_states)
+                collections[self._file_key] = to_record_store(self._file_key, data)
+            
+            # A log that was slow to replay is compacted for the next start
+            if needs_compaction(self._file_key):
+                data_manager.compact_in_background([(self._file_key, None)])
+        return collections[self._file_key]
+    
+    def __set__(self, data_manager, data):
+        with data_manager._collections_lock:
+            data_manager._loading.pop(self._file_key, None)
+            data_manager._collections[self._file_key] = to_record_store(self._file_key, data)
+        data_manager._drop_index(self._file_key)
+
+# Background thread that writes changes for a DataManager
+# Changes arriving within COMMIT_WINDOW of each other are merged and every
+# changed collection is written once for the whole group
+# Changes of a write that failed are kept and written again in front of
+# the next group, or when wait() or close() is called
+class PersistenceWorker:
+    def __init__(self, write_function, commit_window=COMMIT_WINDOW):
+        # Called with {file_key: entries}, removes what it wrote from the
+        # dictionary so only the rest is written again after an error
+        self._write_function = write_function
+        self._commit_window = commit_window
+        self._queue = queue.Queue()
+        self._condition = threading.Condition()
+        self._submitted = 0 # Number of change groups handed to the worker
+        self._written = 0 # Number of change groups written to disk
+        self._failed = None # (sequence, changes) left by the last write if it failed
+        self._error = None # Error of the last write, None once one succeeds
+        self._failures = 0 # Number of writes that failed so far
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="PersistenceWorker", daemon=True)
+        self._thread.start()
+    
+    # Queue changes for writing and return their sequence number
+    def submit(self, pending):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("PersistenceWorker is closed")
+            self._submitted += 1
+            sequence = self._submitted
+            self._queue.put((sequence, pending))
+        return sequence
+    
+    # Wait until everything submitted before this call is on disk
+    # Changes of a failed write are tried again first. Returns False if the
+    # timeout ran out. Raises the error if a write fails before they are all
+    # on disk
+    def wait(self, timeout=None):
+        with self._condition:
+            target = self._submitted
+            failures = self._failures
+            if self._error is not None and not self._closed:
+                self._queue.put((target, {}))
+            written = self._condition.wait_for(lambda: self._written >= target or self._failures > failures, timeout)
+            if self._written < target and self._failures > failures:
+                raise self._error
+            return written
+    
+    # Write everything that is still queued, including the changes of a
+    # failed write, and stop the thread. Raises the error if that fails
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            if item is None:
+                stopping = True
+            else:
+                batch.append(item)
+            
+            # Collect the burst of changes that arrive during the commit window
+            deadline = time.monotonic() + self._commit_window
+            while batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            # Changes of a failed write go first so every file gets them in order
+            if self._failed is not None:
+                batch.insert(0, self._failed)
+            if not batch:
+                continue
+            
+            merged = {}
+            for sequence, pending in batch:
+                for file_key, entries in pending.items():
+                    merged.setdefault(file_key, []).extend(entries)
+            
+            try:
+                self._write_function(merged)
+            except Exception as e:
+                print("Error writing data: " + str(e))
+                with self._condition:
+                    self._failed = (batch[-1][0], merged)
+                    self._error = e
+                    self._failures += 1
+                    self._condition.notify_all()
+                continue
+            
+            with self._condition:
+                self._failed = None
+                self._error = None
+                self._written = batch[-1][0]
+                self._condition.notify_all()
+
+class DataManager:
+    # Collections are loaded from their pickle files the first time they are used
+    users = LazyCollection('users')
+    customers = LazyCollection('customers')
+    admins = LazyCollection('admins')
+    events = LazyCollection('events')
+    bookings = LazyCollection('bookings')
+    tickets = LazyCollection('tickets')
+    payments = LazyCollection('payments')
+    discounts = LazyCollection('discounts')
+    
+    def __init__(self, storage_mode=STORAGE_MODE, background_writes=BACKGROUND_WRITES):
+        self.storage_mode = storage_mode
+        
+        # Changes waiting for the end of the current transaction
+        self._pending = None
+        
+        # Subscribers to changes and the changes of the current transaction
+        # that are published when it ends, see subscribe()
+        self._changes = ChangeBus()
+        self._pending_changes = None
+        
+        # State of the files of each (file_key, shard) when this DataManager
+        # last read or wrote them, see read_file_state
+        self._file_states = {}
+        
+        # Keys of records changed in memory but not written yet, counted per
+        # (file_key, shard). Changes from other terminals never replace them
+        self._unwritten = {}
+        self._unwritten_lock = threading.RLock()
+        
+        # Indexes of each collection by (file_key, field), built the first
+        # time records are looked up by that field and kept up to date by
+        # _persist. field None is the dictionary of key to record, the
+        # others are listed in INDEXED_FIELDS. Dropped whenever the
+        # records are replaced another way, e.g by changes merged from
+        # another terminal, see _get_by_key
+        self._indexes = {}
+        self._index_versions = {}
+        self._index_lock = threading.Lock()
+        
+        # Customers and admins by (file_key, normalized email), built on the
+        # first lookup by email like the key indexes, and the email each
+        # account is indexed under so a changed address can be moved
+        self._email_index = None
+        self._indexed_emails = {}
+        
+        # Blocks of new IDs reserved by this DataManager, see next_id
+        self._ids = IdAllocator()
+        
+        # Thread that writes changes to disk, None to write them straight away
+        self._worker = None
+        if background_writes:
+            self._worker = PersistenceWorker(lambda pending: self._write_pending(pending, sync=True))
+            atexit.register(self.close)
+        
+        # Finish transactions that were interrupted by a crash and take a
+        # transaction file of our own
+        recover_transaction()
+        self._transaction_path, self._transaction_lock = claim_transaction_file()
+        
+        # Collections loaded so far, the rest are loaded on first access
+        # The lock is held while a collection is loaded, see LazyCollection
+        self._collections = {}
+        self._collections_lock = threading.Lock()
+        
+        # Futures of collections being loaded in the background by preload()
+        self._loading = {}
+        self._executor = None
+        
+        # Logs waiting to be compacted by the background compaction thread
+        self._compaction_lock = threading.Lock()
+        self._compaction_queue = set()
+        self._compaction_thread = None
+        
+        # Create sample data if nothing exists
+        if not self.events:
+            self._create_sample_data()
+    
+    # Create sample data for testing
+    def _create_sample_data(self):
+        events, discounts, admins = create_sample_records()
+        
+        self.events = events
+        self._file_states[('events', None)] = save_data(self.events, 'events')
+        
+        self.discounts = discounts
+        self._file_states[('discounts', None)] = save_data(self.discounts, 'discounts')
+        
+        self.admins = admins
+        self._file_states[('admins', None)] = save_data(self.admins, 'admins')
+    
+    # Return a new ID for a record of a collection in FIRST_IDS
+    # IDs come from a sequence shared by every terminal, see IdAllocator
+    def next_id(self, file_key):
+        return self._ids.next_id(file_key, lambda: self._first_id(file_key))
+    
+    # Move the ID sequence of a collection past records that were added
+    # with IDs of their own, e.g by an import
+    def skip_ids(self, file_key, last_id):
+        self._ids.skip_to(file_key, last_id, lambda: self._first_id(file_key))
+    
+    # ID a new sequence starts at, one past the largest ID in use
+    # including the archived records, so existing data is never clashed with
+    def _first_id(self, file_key):
+        records = getattr(self, file_key)
+        if file_key in ARCHIVED_COLLECTIONS:
+            records = chain(records, self.get_archived_records(file_key))
+        return max(chain([FIRST_IDS[file_key]], (get_record_key(record, file_key) + 1 for record in records)))
+    
+    # Change a record in memory and write the change to disk
+    # In journal mode only the changed record is appended to the log
+    # In snapshot mode the whole collection is written again
+    # Inside a transaction the change is kept until the transaction ends
+    # Records of sharded collections go to the shard of their event unless
+    # another shard is given, e.g when a record moves to a different event
+    # Returns False if there is no record to update or delete
+    def _persist(self, file_key, op, record, shard=None):
+        key = get_record_key(record, file_key)
+        if op == 'add' and file_key in FIRST_IDS:
+            # Never give out the ID of a record added with an ID of its own
+            self.skip_ids(file_key, key)
+        entry = (op, key, None if op == 'delete' else record)
+        if shard is None:
+            shard = get_record_shard(record, file_key)
+        unit = (file_key, shard)
+        
+        # The record is changed and counted as unwritten in one step, so a
+        # merge of other terminals' writes never sees it uncounted and drops it
+        records = self._get_records(file_key, shard)
+        with self._unwritten_lock:
+            if op == 'add':
+                records.append(record)
+            elif op == 'update':
+                if not records.replace(record):
+                    return False
+            elif records.remove(key) is None:
+                return False
+            self._count_unwritten(unit, [entry], 1)
+        change = ChangeRecord(file_key, op, key, entry[2], shard)
+        
+        index = self._indexes.get((file_key, None))
+        if index is not None:
+            if op == 'delete':
+                index.pop(key, None)
+            else:
+                index[key] = record
+        for field in INDEXED_FIELDS.get(file_key, ()):
+            index = self._indexes.get((file_key, field))
+            if index is not None:
+                if op == 'delete':
+                    index.remove(key)
+                else:
+                    index.add(record)
+        if file_key in EMAIL_COLLECTIONS and self._email_index is not None:
+            self._update_email_index(file_key, op, key, record)
+        
+        if self._pending is not None:
+            self._pending.setdefault(unit, []).append(entry)
+            self._pending_changes.append(change)
+        else:
+            self._flush({unit: [entry]})
+            self._changes.publish([change])
+        return True
+    
+    # Call callback(change) with a ChangeRecord for every add, update and
+    # delete made through this DataManager, limited to the given collections
+    # Changes in a transaction are published when it ends and never if it
+    # fails. Returns a function that ends the subscription
+    def subscribe(self, callback, collections=None):
+        return self._changes.subscribe(callback, collections)
+    
+    # Add step to the count of unwritten changes of each entry's key
+    def _count_unwritten(self, unit, entries, step):
+        with self._unwritten_lock:
+            counts = self._unwritten.setdefault(unit, {})
+            for op, key, record in entries:
+                counts[key] = counts.get(key, 0) + step
+                if counts[key] <= 0:
+                    del counts[key]
+    
+    # Bring the records of one file up to date with changes other terminals
+    # wrote since this DataManager last read or wrote it
+    # Called with the files locked, right before our own changes are written
+    def _merge_other_writes(self, file_key, shard):
+        unit = (file_key, shard)
+        records = self._get_records(file_key, shard)
+        known = self._file_states.get(unit)
+        current = read_file_state(file_key, shard)
+        if known is not None and known[0] == current[0]:
+            self._file_states[unit] = current
+            return
+        
+        # The records are changed in place so code holding them sees the new ones
+        # Our changes are held off meanwhile, see _persist
+        if known is not None and known[1] == current[1] and known[2] <= current[2]:
+            # Same snapshot, so their changes are the end of the log we have not read
+            entries = read_log(file_key, shard, known[2])
+            with self._unwritten_lock:
+                ours = self._unwritten.get(unit, {})
+                records.apply(entry for entry in entries if entry[1] not in ours)
+        else:
+            # A new snapshot replaced the log, so take the records from disk
+            # and keep our own version of the records we changed
+            theirs = load_data(file_key, shard)
+            with self._unwritten_lock:
+                ours = self._unwritten.get(unit, {})
+                mine = [record for record in records if get_record_key(record, file_key) in ours]
+                records.reset([record for record in theirs if get_record_key(record, file_key) not in ours] + mine)
+        self._drop_index(file_key)
+        self._file_states[unit] = current
+        STORAGE_STATS['merges'] += 1
+    
+    # Return the record of a collection with the given key, or None
+    # Uses the index of the collection, building it on the first lookup
+    def _get_by_key(self, file_key, key):
+        index = self._indexes.get((file_key, None))
+        if index is None:
+            index = self._build_index(file_key)
+        return index.get(key)
+    
+    # A sharded record must also have a key no other shard uses, which the
+    # key index knows without loading every shard when it is built
+    def _check_new_key(self, file_key, record):
+        index = self._indexes.get((file_key, None))
+        key = getattr(record, COLLECTION_KEYS[file_key])()
+        if index is not None and key in index:
+            raise ValueError("Duplicate key " + str(key))
+    
+    # Return the list of records of a collection whose field has the value
+    # e.g the bookings of a user, see INDEXED_FIELDS
+    def _get_by_field(self, file_key, field, value):
+        return self._get_index(file_key, field).get(value)
+    
+    # Return the index of a collection on a field, building it if needed
+    def _get_index(self, file_key, field):
+        index = self._indexes.get((file_key, field))
+        if index is None:
+            index = self._build_index(file_key, field)
+        return index
+    
+    def _build_index(self, file_key, field=None):
+        # Load the records before reading the version so the index is
+        # never built from a collection that is still being loaded
+        records = getattr(self, file_key)
+        with self._index_lock:
+            version = self._index_versions.get(file_key, 0)
+        
+        if field is None:
+            getter = COLLECTION_KEYS[file_key]
+            index = {getattr(record, getter)(): record for record in records}
+        else:
+            index_class, getter = INDEXED_FIELDS[file_key][field]
+            index = index_class(file_key, getter, records)
+        
+        # Records replaced by another thread while it was built make it stale
+        with self._index_lock:
+            if self._index_versions.get(file_key, 0) == version:
+                self._indexes[(file_key, field)] = index
+        return index
+    
+    # Start a query over a collection, given a record class like Booking or
+    # a collection name, see Query
+    def query(self, collection):
+        return Query(self, collection)
+    
+    # Pick how to find the records of a query, returns (path, field)
+    # In order of preference: the record with the key, the shard of one
+    # event, the records a MultiIndex has for a value, a SortedIndex over
+    # a range or in the order asked for, and last a scan of everything
+    def _plan_query(self, query):
+        file_key = query.file_key
+        key_field = get_key_field(file_key)
+        if key_field in query.equals:
+            return 'key', key_field
+        
+        fields = QUERY_FIELDS[file_key]
+        if file_key in SHARDED_COLLECTIONS:
+            for field in query.equals:
+                if fields[field] == SHARDED_COLLECTIONS[file_key]:
+                    return 'shard', field
+        
+        indexed = INDEXED_FIELDS.get(file_key, {})
+        for field in query.equals:
+            if field in indexed and indexed[field][0] is MultiIndex:
+                return 'index', field
+        for field in query.ranges:
+            if field in indexed and indexed[field][0] is SortedIndex:
+                return 'sorted', field
+        if query.order is not None and query.order[0] in indexed and indexed[query.order[0]][0] is SortedIndex:
+            return 'sorted', query.order[0]
+        return 'scan', None
+    
+    def _explain_query(self, query):
+        path, field = self._plan_query(query)
+        if path == 'scan':
+            return "scan " + query.file_key
+        if path == 'key':
+            return "key " + query.file_key + "." + field
+        if path == 'shard':
+            return "shard " + query.file_key + "/" + str(query.equals[field])
+        if path == 'index':
+            return "index " + query.file_key + "." + field
+        return "sorted index " + query.file_key + "." + field
+    
+    def _run_query(self, query):
+        file_key = query.file_key
+        path, field = self._plan_query(query)
+        ordered = False
+        if path == 'key':
+            record = self._get_by_key(file_key, query.equals[field])
+            records = [] if record is None else [record]
+        elif path == 'shard':
+            records = getattr(self, file_key).shard(query.equals[field])
+        elif path == 'index':
+            records = self._get_by_field(file_key, field, query.equals[field])
+        elif path == 'sorted':
+            start, end = query.ranges.get(field, (None, None))
+            descending = query.order == (field, True)
+            records = self._get_index(file_key, field).scan(start, end, descending)
+            ordered = query.order is not None and query.order[0] == field
+        else:
+            records = getattr(self, file_key)
+        return query.apply(records, ordered)
+    
+    # Forget the indexes of a collection after its records were replaced
+    # without _persist, they are built again on the next lookup
+    def _drop_index(self, file_key):
+        with self._index_lock:
+            self._index_versions[file_key] = self._index_versions.get(file_key, 0) + 1
+            for field in (None,) + tuple(INDEXED_FIELDS.get(file_key, ())):
+                self._indexes.pop((file_key, field), None)
+            if file_key in EMAIL_COLLECTIONS:
+                self._email_index = None
+    
+    # Return the customer or admin with the given email, or None
+    def _get_by_email(self, file_key, email):
+        index = self._email_index
+        if index is None:
+            index = self._build_email_index()
+        return index.get((file_key, normalize_email(email)))
+    
+    def _build_email_index(self):
+        collections = [(file_key, getattr(self, file_key)) for file_key in EMAIL_COLLECTIONS]
+        with self._index_lock:
+            versions = [self._index_versions.get(file_key, 0) for file_key in EMAIL_COLLECTIONS]
+        
+        index = {}
+        indexed_emails = {}
+        for file_key, records in collections:
+            for record in records:
+                email = normalize_email(record.get_user_email())
+                # The first account with an email wins, like a scan would find
+                index.setdefault((file_key, email), record)
+                indexed_emails[(file_key, record.get_user_id())] = email
+        
+        with self._index_lock:
+            if [self._index_versions.get(file_key, 0) for file_key in EMAIL_COLLECTIONS] == versions:
+                self._email_index = index
+                self._indexed_emails = indexed_emails
+        return index
+    
+    # Move an account to its current email after it was added, changed or deleted
+    def _update_email_index(self, file_key, op, key, record):
+        index = self._email_index
+        old_email = self._indexed_emails.pop((file_key, key), None)
+        if old_email is not None:
+            indexed = index.get((file_key, old_email))
+            if indexed is not None and indexed.get_user_id() == key:
+                del index[(file_key, old_email)]
+        if op != 'delete':
+            email = normalize_email(record.get_user_email())
+            index[(file_key, email)] = record
+            self._indexed_emails[(file_key, key)] = email
+    
+    # Return the list of records stored in one file of a collection
+    def _get_records(self, file_key, shard=None):
+        if shard is None and file_key not in SHARDED_COLLECTIONS:
+            return getattr(self, file_key)
+        return getattr(self, file_key).shard(shard)
+    
+    # Find a record in a sharded collection, looking in the given shard first
+    # Returns (shard, record) or (None, None) if the key is not found
+    def _find_in_shards(self, file_key, key, shard):
+        collection = getattr(self, file_key)
+        shards = collection.shard_keys()
+        if shard in shards:
+            shards.remove(shard)
+            shards.insert(0, shard)
+        for s in shards:
+            record = collection.shard(s).get(key)
+            if record is not None:
+                return s, record
+        return None, None
+    
+    # Replace a record of a sharded collection, moving it if its event changed
+    def _update_sharded(self, file_key, record):
+        key = get_record_key(record, file_key)
+        new_shard = get_record_shard(record, file_key)
+        old_shard, old_record = self._find_in_shards(file_key, key, new_shard)
+        if old_record is None:
+            return False
+        
+        if old_shard == new_shard:
+            return self._persist(file_key, 'update', record)
+        with self.transaction():
+            self._persist(file_key, 'delete', record, old_shard)
+            self._persist(file_key, 'add', record, new_shard)
+        return True
+    
+    # Delete a record of a sharded collection by key
+    def _delete_sharded(self, file_key, key):
+        shard, record = self._find_in_shards(file_key, key, None)
+        if record is None:
+            return False
+        return self._persist(file_key, 'delete', record, shard)
+    
+    # Hand changes to the background writer or write them straight away
+    def _flush(self, pending):
+        if self._worker is not None:
+            self._worker.submit(pending)
+        else:
+            self._write_pending(pending)
+    
+    # Return True if the collection has already been loaded from disk
+    def is_loaded(self, file_key):
+        if file_key in self._loading:
+            return self._loading[file_key].done()
+        return file_key in self._collections
+    
+    # Start loading several collections at the same time in background threads
+    # Returns a dictionary of futures so callers can react as each one arrives
+    # Reading a collection that is still loading waits for its future
+    def preload(self, file_keys=None):
+        if file_keys is None:
+            file_keys = list(DATA_FILES)
+        
+        futures = {}
+        with self._collections_lock:
+            for file_key in file_keys:
+                if file_key in self._collections:
+                    future = Future()
+                    future.set_result(self._collections[file_key])
+                elif file_key in self._loading:
+                    future = self._loading[file_key]
+                else:
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(max_workers=len(DATA_FILES), thread_name_prefix="DataLoader")
+                    future = self._executor.submit(load_collection, file_key, self._file_states)
+                    self._loading[file_key] = future
+                futures[file_key] = future
+        return futures
+    
+    # Wait until every change made so far is written to disk
+    # Returns False if the timeout ran out first and raises the error of
+    # a background write that failed
+    def flush(self, timeout=None):
+        if self._worker is not None:
+            return self._worker.wait(timeout)
+        return True
+    
+    # Write any waiting changes and stop the background threads
+    # Raises the error of a background write that failed, after stopping
+    def close(self):
+        try:
+            if self._worker is not None:
+                self._worker.close()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            thread = self._compaction_thread
+            if thread is not None:
+                thread.join()
+            if self._transaction_lock is not None:
+                release_transaction_file(self._transaction_path, self._transaction_lock)
+                self._transaction_lock = None
+    
+    # Write a fresh snapshot of each collection that has a log and drop the log
+    # units is a list of (file_key, shard), by default every log on disk
+    # Returns the seconds each compaction took
+    def compact(self, units=None):
+        self.flush()
+        report = {}
+        for file_key, shard in (units if units is not None else list_logs()):
+            report[(file_key, shard)] = compact_data(file_key, shard)
+        return report
+    
+    # Compact logs in a background thread so the GUI is never blocked
+    # Readers use the records in memory, which compaction does not touch
+    def compact_in_background(self, units):
+        with self._compaction_lock:
+            self._compaction_queue.update(units)
+            if self._compaction_thread is None:
+                self._compaction_thread = threading.Thread(target=self._run_compaction, name="Compactor", daemon=True)
+                self._compaction_thread.start()
+    
+    def _run_compaction(self):
+        while True:
+            with self._compaction_lock:
+                if not self._compaction_queue:
+                    self._compaction_thread = None
+                    return
+                file_key, shard = self._compaction_queue.pop()
+            try:
+                compact_data(file_key, shard)
+            except Exception as e:
+                print("Error compacting data: " + str(e))
+    
+    # Return how long loading replayed each log and how long compactions took
+    def get_storage_report(self):
+        return {
+            'replay_seconds': dict(REPLAY_TIMES),
+            'compaction_seconds': dict(COMPACTION_TIMES)
+        }
+    
+    # Write the changes of one or more collections to disk
+    # pending maps (file_key, shard) to the changes of that file
+    def _write_pending(self, pending, sync=False):
+        # A change to several collections is first stored in the transaction
+        # file so it can be finished after a crash in the middle of the commit
+        # The file of a write that failed is replaced by what is left of it
+        transaction_path = self._transaction_path
+        transaction = len(pending) > 1 or os.path.exists(transaction_path)
+        if transaction:
+            if not os.path.exists(DATA_DIR):
+                os.makedirs(DATA_DIR)
+            with open(transaction_path + '.tmp', 'wb') as file:
+                pickle.dump(pending, file)
+                STORAGE_STATS['bytes_written'] += file.tell()
+                if sync:
+                    file.flush()
+                    os.fsync(file.fileno())
+            os.replace(transaction_path + '.tmp', transaction_path)
+            STORAGE_STATS['writes'] += 1
+        
+        # Each file stays locked while other terminals' changes are merged
+        # and ours are written, so no terminal's changes are overwritten
+        # Written files are taken out of pending, so after an error it holds
+        # only what still has to be written, see PersistenceWorker
+        written = {}
+        try:
+            for (file_key, shard), entries in list(pending.items()):
+                with lock_files(file_key, shard):
+                    self._merge_other_writes(file_key, shard)
+                    if self.storage_mode == 'journal':
+                        state = append_log(file_key, entries, sync, shard)
+                    else:
+                        # Copy the list so the GUI can keep changing it while it is saved
+                        state = save_data(list(self._get_records(file_key, shard)), file_key, sync, shard)
+                    self._file_states[(file_key, shard)] = state
+                self._count_unwritten((file_key, shard), entries, -1)
+                written[(file_key, shard)] = pending.pop((file_key, shard))
+        finally:
+            # Other processes follow the feed, so only written changes go there
+            if CHANGE_FEED and written:
+                append_change_feed(changes_from_pending(written), sync)
+        
+        if transaction:
+            os.remove(transaction_path)
+        
+        # Keep the logs small so the data folder and startup time stay bounded
+        if self.storage_mode == 'journal':
+            units = [unit for unit in written if needs_compaction(*unit)]
+            if units:
+                self.compact_in_background(units)
+    
+    # Group several changes so each changed collection is written once
+    # If the block raises an error the changed collections are loaded
+    # again from disk, which still holds the state before the transaction
+    @contextmanager
+    def transaction(self):
+        # A nested transaction is part of the outer one
+        if self._pending is not None:
+            yield self
+            return
+        
+        self._pending = {}
+        self._pending_changes = []
+        try:
+            yield self
+        except BaseException:
+            pending = self._pending
+            self._pending = None
+            self._pending_changes = None
+            try:
+                self.flush()
+            except Exception as e:
+                # The error of the block is the one raised below
+                print("Error writing data: " + str(e))
+            for (file_key, shard), entries in pending.items():
+                self._count_unwritten((file_key, shard), entries, -1)
+                if shard is None:
+                    setattr(self, file_key, load_data(file_key, states=self._file_states))
+                else:
+                    getattr(self, file_key).set_shard(shard, load_data(file_key, shard, self._file_states))
+                    self._drop_index(file_key)
+            raise
+        
+        pending = self._pending
+        changes = self._pending_changes
+        self._pending = None
+        self._pending_changes = None
+        if pending:
+            self._flush(pending)
+            self._changes.publish(changes)
+    
+    # User related methods
+    def add_customer(self, customer):
+        self._persist('customers', 'add', customer)
+    
+    def add_admin(self, admin):
+        self._persist('admins', 'add', admin)
+    
+    def get_customer_by_id(self, customer_id):
+        return self._get_by_key('customers', customer_id)
+    
+    def get_admin_by_id(self, admin_id):
+        return self._get_by_key('admins', admin_id)
+    
+    # Emails are matched without case and surrounding spaces, see normalize_email
+    def get_customer_by_email(self, email):
+        return self._get_by_email('customers', email)
+    
+    def get_admin_by_email(self, email):
+        return self._get_by_email('admins', email)
+    
+    def authenticate_user(self, email, password, is_admin=False):
+        if is_admin:
+            admin = self.get_admin_by_email(email)
+            if admin and admin.get_user_password() == password:
+                return admin
+        else:
+            customer = self.get_customer_by_email(email)
+            if customer and customer.get_user_password() == password:
+                return customer
+        return None
+    
+    def update_customer(self, customer):
+        return self._persist('customers', 'update', customer)
+    
+    def update_admin(self, admin):
+        return self._persist('admins', 'update', admin)
+    
+    def delete_customer(self, customer_id):
+        customer = self.customers.get(customer_id)
+        if customer is None:
+            return False
+        return self._persist('customers', 'delete', customer)
+    
+    # Return the customers whose name, email, phone or address have every
+    # word of text, best matches first, see SearchIndex
+    def search_customers(self, text, limit=SEARCH_LIMIT):
+        return self._get_index('customers', 'search').search(text, limit)
+    
+    # Event related methods
+    def add_event(self, event):
+        self._persist('events', 'add', event)
+    
+    def get_event_by_id(self, event_id):
+        return self._get_by_key('events', event_id)
+    
+    # Return the events from start up to but not including end in date
+    # order, at most limit of them. With location only the events there
+    def events_between(self, start=None, end=None, location=None, limit=None):
+        if location is None:
+            return self._get_index('events', 'event_date').between(start, end, limit)
+        events = [event for event in self._get_by_field('events', 'event_location', location)
+                  if (start is None or event.get_event_date() >= start) and (end is None or event.get_event_date() < end)]
+        events.sort(key=lambda event: event.get_event_date())
+        return events[:limit]
+    
+    # Return the events that have not started yet, soonest first
+    def upcoming_events(self, limit=None, location=None):
+        return self.events_between(datetime.now(), None, location, limit)
+    
+    # Return every location that has events, in alphabetical order
+    def get_event_locations(self):
+        return sorted(self._get_index('events', 'event_location').values())
+    
+    def update_event(self, event):
+        return self._persist('events', 'update', event)
+    
+    def delete_event(self, event_id):
+        event = self.events.get(event_id)
+        if event is None:
+            return False
+        return self._persist('events', 'delete', event)
+    
+    # Booking related methods
+    # Bookings are stored per event so only that event's file is written
+    def add_booking(self, booking):
+        self._check_new_key('bookings', booking)
+        self._persist('bookings', 'add', booking)
+        return booking
+    
+    # With include_archive the bookings of archived events are searched too
+    def get_booking_by_id(self, booking_id, include_archive=False):
+        booking = self._get_by_key('bookings', booking_id)
+        if booking is not None:
+            return booking
+        if include_archive:
+            for booking in self.get_archived_records('bookings'):
+                if booking.get_booking_id() == booking_id:
+                    return booking
+        return None
+    
+    def get_bookings_by_user_id(self, user_id, include_archive=False):
+        bookings = self._get_by_field('bookings', 'user_id', user_id)
+        if include_archive:
+            bookings.extend(booking for booking in self.get_archived_records('bookings') if booking.get_user_id() == user_id)
+        return bookings
+    
+    def get_bookings_by_event_id(self, event_id, include_archive=False):
+        bookings = list(self.bookings.shard(event_id))
+        if include_archive:
+            bookings.extend(read_archive(event_id, 'bookings'))
+        return bookings
+    
+    def get_all_bookings(self, include_archive=False):
+        bookings = list(self.bookings)
+        if include_archive:
+            bookings.extend(self.get_archived_records('bookings'))
+        return bookings
+    
+    # Return the bookings made from start up to but not including end,
+    # oldest first. start or end None leaves that side of the range open
+    def bookings_between(self, start=None, end=None):
+        return self._get_index('bookings', 'booking_date').between(start, end)
+    
+    # Return the n most recent bookings, newest first, or all of them if n
+    # is None. With user_id only the bookings of that customer, which are
+    # few enough to sort
+    def latest_bookings(self, n=None, user_id=None, include_archive=False):
+        if user_id is None and not include_archive:
+            return self._get_index('bookings', 'booking_date').last(n)
+        if user_id is None:
+            bookings = self.get_all_bookings(include_archive)
+        else:
+            bookings = self.get_bookings_by_user_id(user_id, include_archive)
+        bookings.sort(key=lambda booking: booking.get_booking_date(), reverse=True)
+        return bookings[:n]
+    
+    def update_booking(self, booking):
+        return self._update_sharded('bookings', booking)
+    
+    def delete_booking(self, booking_id):
+        return self._delete_sharded('bookings', booking_id)
+    
+    # Ticket related methods
+    # Tickets are stored per event so only that event's file is written
+    def add_ticket(self, ticket):
+        self._check_new_key('tickets', ticket)
+        self._persist('tickets', 'add', ticket)
+        return ticket
+    
+    def get_ticket_by_id(self, ticket_id):
+        return self._get_by_key('tickets', ticket_id)
+    
+    def get_tickets_by_booking_id(self, booking_id, include_archive=False):
+        tickets = self._get_by_field('tickets', 'booking_id', booking_id)
+        if include_archive:
+            tickets.extend(ticket for ticket in self.get_archived_records('tickets') if ticket.get_booking_id() == booking_id)
+        return tickets
+    
+    def get_tickets_by_event_id(self, event_id, include_archive=False):
+        tickets = list(self.tickets.shard(event_id))
+        if include_archive:
+            tickets.extend(read_archive(event_id, 'tickets'))
+        return tickets
+    
+    def update_ticket(self, ticket):
+        return self._update_sharded('tickets', ticket)
+    
+    def delete_ticket(self, ticket_id):
+        return self._delete_sharded('tickets', ticket_id)
+    
+    # Payment related methods
+    def add_payment(self, payment):
+        self._persist('payments', 'add', payment)
+        return payment
+    
+    def get_payment_by_id(self, payment_id):
+        return self._get_by_key('payments', payment_id)
+    
+    def get_payments_by_booking_id(self, booking_id, include_archive=False):
+        payments = self._get_by_field('payments', 'booking_id', booking_id)
+        if include_archive:
+            payments.extend(payment for payment in self.get_archived_records('payments') if payment.get_booking_id() == booking_id)
+        return payments
+    
+    # Return the payments made from start up to but not including end, oldest first
+    def payments_between(self, start=None, end=None):
+        return self._get_index('payments', 'transaction_date').between(start, end)
+    
+    # Return the n most recent payments, newest first, or all of them if n is None
+    def latest_payments(self, n=None):
+        return self._get_index('payments', 'transaction_date').last(n)
+    
+    def update_payment(self, payment):
+        return self._persist('payments', 'update', payment)
+    
+    # Discount related methods
+    def add_discount(self, discount):
+        self._persist('discounts', 'add', discount)
+    
+    def get_discount_by_id(self, discount_id):
+        return self._get_by_key('discounts', discount_id)
+    
+    def get_discount_by_code(self, discount_code):
+        for discount in self.discounts:
+            if discount.get_discount_code() == discount_code:
+                return discount
+        return None
+    
+    def update_discount(self, discount):
+        return self._persist('discounts', 'update', discount)
+    
+    def delete_discount(self, discount_id):
+        discount = self.discounts.get(discount_id)
+        if discount is None:
+            return False
+        return self._persist('discounts', 'delete', discount)
+    
+    # Archive related methods
+    # Move the bookings, tickets and payments of every event that took place
+    # before the given datetime into the archive, see ARCHIVE_DIR
+    # The events themselves stay, so do the totals the reports need
+    # Returns the IDs of the events that were archived
+    def archive_events(self, before):
+        archived = []
+        for event in list(self.events):
+            if event.get_event_date() < before and self._archive_event(event):
+                archived.append(event.get_event_id())
+        return archived
+    
+    def _archive_event(self, event):
+        self.flush()
+        event_id = event.get_event_id()
+        bookings = self.bookings.shard(event_id)
+        tickets = self.tickets.shard(event_id)
+        booking_ids = {booking.get_booking_id() for booking in bookings}
+        payments = [payment for payment in self.payments if payment.get_booking_id() in booking_ids]
+        if not bookings and not tickets and not payments:
+            return False
+        
+        # Write the archive before anything is removed, records archived by
+        # an earlier run that stopped half way are kept and replaced
+        with lock_archive():
+            archive = {}
+            for file_key, records in (('bookings', bookings), ('tickets', tickets), ('payments', payments)):
+                entries = [('add', get_record_key(record, file_key), record) for record in records]
+                archive[file_key] = replay_log(read_archive(event_id, file_key), entries, file_key)
+                write_archive(event_id, file_key, archive[file_key])
+            summaries = load_archive_summaries()
+            summaries[event_id] = summarize_event(event, archive['bookings'], archive['tickets'], archive['payments'])
+            save_archive_summaries(summaries)
+        
+        # Drop the event's booking and ticket files as a whole
+        changes = []
+        for file_key, records in (('bookings', bookings), ('tickets', tickets)):
+            changes.extend(ChangeRecord(file_key, 'delete', get_record_key(record, file_key), None, event_id) for record in records)
+            getattr(self, file_key).drop_shard(event_id)
+            self._drop_index(file_key)
+            self._file_states[(file_key, event_id)] = delete_data(file_key, event_id)
+        if CHANGE_FEED:
+            append_change_feed(changes)
+        self._changes.publish(changes)
+        
+        # Payments are not split per event, remove them one by one and
+        # compact the file straight away so it shrinks
+        with self.transaction():
+            for payment in payments:
+                self._persist('payments', 'delete', payment)
+        self.compact([('payments', None)])
+        return True
+    
+    # Return the totals of every archived event, see summarize_event
+    def get_archive_summaries(self):
+        return load_archive_summaries()
+    
+    # Yield the archived records of a collection, of one event or of all
+    # archived events. The archive files are read every time, they are
+    # never kept in memory
+    def get_archived_records(self, file_key, event_id=None):
+        for archived_event_id in (list_archived_events() if event_id is None else [event_id]):
+            yield from read_archive(archived_event_id, file_key)
+
+# =================================================================
+# SQLITE DATA MANAGEMENT CLASS
+# =================================================================
+
+# Tables used by the SQLite backend
+# Each table stores the pickled record in a data column next to its key
+# and the columns the get_*_by_* methods filter on, which are indexed
+SQLITE_TABLES = {
+    'customers': ('user_id', 'get_user_id', {'email': 'get_user_email'}),
+    'admins': ('user_id', 'get_user_id', {'email': 'get_user_email'}),
+    'events': ('event_id', 'get_event_id', {'event_date': 'get_event_date', 'event_location': 'get_event_location'}),
+    'bookings': ('booking_id', 'get_booking_id', {'user_id': 'get_user_id', 'event_id': 'get_event_id', 'booking_date': 'get_booking_date'}),
+    'tickets': ('ticket_id', 'get_ticket_id', {'booking_id': 'get_booking_id', 'event_id': 'get_event_id'}),
+    'payments': ('payment_id', 'get_payment_id', {'booking_id': 'get_booking_id', 'transaction_date': 'get_transaction_date'}),
+    'discounts': ('discount_id', 'get_discount_id', {'code': 'get_discount_code'})
+}
+
+# Indexed columns stored in a normalized form, values looked up in them
+# are normalized the same way first. Dates are stored as ISO text, which
+# sorts in time order
+SQLITE_NORMALIZED_COLUMNS = {
+    'email': normalize_email,
+    'event_date': datetime.isoformat,
+    'booking_date': datetime.isoformat,
+    'transaction_date': datetime.isoformat
+}
+
+# Version of the database layout, kept in PRAGMA user_version
+# 1: emails are stored normalized
+SQLITE_SCHEMA_VERSION = 1
+
+# Read only view over one SQLite table
+# It supports len(), iteration and truth tests like the lists used by
+# DataManager, but reads records from the database one row at a time
+class SQLiteCollection:
+    def __init__(self, connection, table):
+        self._connection = connection
+        self._table = table
+    
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM " + self._table).fetchone()[0]
+    
+    def __bool__(self):
+        return self._connection.execute("SELECT 1 FROM " + self._table + " LIMIT 1").fetchone() is not None
+    
+    def __iter__(self):
+        for row in self._connection.execute("SELECT data FROM " + self._table + " ORDER BY rowid"):
+            yield pickle.loads(row[0])
+
+# Data manager that keeps records in SQLite instead of in memory
+# It has the same public methods as DataManager so the GUI works with both
+class SQLiteDataManager:
+    def __init__(self, database_file=None):
+        if database_file is None:
+            if not os.path.exists(DATA_DIR):
+                os.makedirs(DATA_DIR)
+            database_file = os.path.join(DATA_DIR, DATABASE_FILE)
+        
+        self.connection = sqlite3.connect(database_file)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        
+        # Tables with a full text search table, e.g customers_search for
+        # customers. Empty when SQLite was built without FTS5
+        self._search_tables = set()
+        self._create_tables()
+        
+        # Depth of the current transaction, writes are committed when it is 0
+        self._transaction_depth = 0
+        
+        # Subscribers to changes and the changes not committed yet
+        self._changes = ChangeBus()
+        self._pending_changes = []
+        
+        # Blocks of new IDs reserved by this data manager. They are not kept
+        # in the database, whose write lock is held for a whole transaction
+        self._ids = IdAllocator()
+        
+        # Collections look like the lists of DataManager
+        self.users = []
+        self.customers = SQLiteCollection(self.connection, 'customers')
+        self.admins = SQLiteCollection(self.connection, 'admins')
+        self.events = SQLiteCollection(self.connection, 'events')
+        self.bookings = SQLiteCollection(self.connection, 'bookings')
+        self.tickets = SQLiteCollection(self.connection, 'tickets')
+        self.payments = SQLiteCollection(self.connection, 'payments')
+        self.discounts = SQLiteCollection(self.connection, 'discounts')
+        
+        # Create sample data if nothing exists
+        if not self.events:
+            self._create_sample_data()
+    
+    # Create the tables and indexes if they do not exist yet
+    def _create_tables(self):
+        with self.connection:
+            for table, (key_column, key_getter, columns) in SQLITE_TABLES.items():
+                column_list = "".join(", " + column for column in columns)
+                self.connection.execute("CREATE TABLE IF NOT EXISTS " + table + " (" + key_column + " PRIMARY KEY" + column_list + ", data BLOB NOT NULL)")
+                
+                # Add columns indexed since the database was created
+                existing = {row[1] for row in self.connection.execute("PRAGMA table_info(" + table + ")")}
+                for column, getter in columns.items():
+                    if column not in existing:
+                        self._add_column(table, column, getter)
+                
+                for column in columns:
+                    self.connection.execute("CREATE INDEX IF NOT EXISTS idx_" + table + "_" + column + " ON " + table + " (" + column + ")")
+            
+            # Normalize the emails of a database written before they were
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] < 1:
+                self.connection.create_function("normalize_email", 1, normalize_email)
+                for table, (key_column, key_getter, columns) in SQLITE_TABLES.items():
+                    if 'email' in columns:
+                        self.connection.execute("UPDATE " + table + " SET email = normalize_email(email)")
+            self.connection.execute("PRAGMA user_version = " + str(SQLITE_SCHEMA_VERSION))
+            
+            for table in SEARCH_FIELDS:
+                self._create_search_table(table)
+    
+    # Create the full text search table of a table the first time and fill
+    # it in from the stored records. Its rowid is the key of the record
+    def _create_search_table(self, table):
+        search_table = table + "_search"
+        if self.connection.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (search_table,)).fetchone() is None:
+            columns = [getter[len('get_'):] for getter in SEARCH_FIELDS[table]]
+            try:
+                self.connection.execute("CREATE VIRTUAL TABLE " + search_table + " USING fts5(" + ", ".join(columns) + ", prefix='2 3')")
+            except sqlite3.OperationalError:
+                # No FTS5, search_customers scans the records instead
+                return
+            for row in self.connection.execute("SELECT data FROM " + table).fetchall():
+                self._write_search(table, pickle.loads(row[0]))
+        self._search_tables.add(table)
+    
+    # Add an indexed column to a table and fill it in from the stored records
+    def _add_column(self, table, column, getter):
+        self.connection.execute("ALTER TABLE " + table + " ADD COLUMN " + column)
+        self.connection.create_function("value_of_" + column, 1, lambda data: self._column_value(column, getattr(pickle.loads(data), getter)()))
+        self.connection.execute("UPDATE " + table + " SET " + column + " = value_of_" + column + "(data)")
+    
+    # Create sample data for testing
+    def _create_sample_data(self):
+        events, discounts, admins = create_sample_records()
+        for event in events:
+            self.add_event(event)
+        for discount in discounts:
+            self.add_discount(discount)
+        for admin in admins:
+            self.add_admin(admin)
+    
+    # Return a new ID for a record of a collection, see DataManager.next_id
+    # The sequences are kept in the data folder like those of DataManager
+    def next_id(self, file_key):
+        return self._ids.next_id(file_key, lambda: self._first_id(file_key))
+    
+    def skip_ids(self, file_key, last_id):
+        self._ids.skip_to(file_key, last_id, lambda: self._first_id(file_key))
+    
+    def _first_id(self, file_key):
+        key_column = SQLITE_TABLES[file_key][0]
+        last_id = self.connection.execute("SELECT MAX(" + key_column + ") FROM " + file_key).fetchone()[0]
+        return FIRST_IDS[file_key] if last_id is None else max(FIRST_IDS[file_key], last_id + 1)
+    
+    # Insert or replace a record together with its indexed columns
+    # Adding a key that is already there raises ValueError
+    def _write(self, table, record, op='add'):
+        key_column, key_getter, columns = SQLITE_TABLES[table]
+        names = [key_column] + list(columns)
+        values = [getattr(record, key_getter)()] + [self._column_value(column, getattr(record, getter)()) for column, getter in columns.items()]
+        values.append(pickle.dumps(record, pickle.HIGHEST_PROTOCOL))
+        placeholders = ", ".join("?" for _ in values)
+        if op == 'add' and self.connection.execute("SELECT 1 FROM " + table + " WHERE " + key_column + " = ?", (values[0],)).fetchone():
+            raise ValueError("Duplicate key " + str(values[0]))
+        if op == 'add' and table in FIRST_IDS:
+            self.skip_ids(table, values[0])
+        change = ChangeRecord(table, op, values[0], record, get_record_shard(record, table))
+        if table in self._search_tables:
+            self._write_search(table, record)
+        self._execute_write("INSERT OR REPLACE INTO " + table + " (" + ", ".join(names) + ", data) VALUES (" + placeholders + ")", values, change)
+    
+    # Index the searched fields of a record, committed with the record
+    def _write_search(self, table, record):
+        getters = SEARCH_FIELDS[table]
+        values = [get_record_key(record, table)] + [" ".join(search_words(getattr(record, getter)())) for getter in getters]
+        columns = ["rowid"] + [getter[len('get_'):] for getter in getters]
+        self.connection.execute("INSERT OR REPLACE INTO " + table + "_search (" + ", ".join(columns) + ") VALUES (" + ", ".join("?" for _ in values) + ")", values)
+    
+    # Replace an existing record, returns False if the key is unknown
+    def _update(self, table, record):
+        key_column, key_getter, columns = SQLITE_TABLES[table]
+        if self._fetch_one(table, key_column, getattr(record, key_getter)()) is None:
+            return False
+        self._write(table, record, 'update')
+        return True
+    
+    # Delete a record by key, returns False if the key is unknown
+    def _delete(self, table, key):
+        key_column = SQLITE_TABLES[table][0]
+        record = self._fetch_one(table, key_column, key)
+        if record is None:
+            return False
+        change = ChangeRecord(table, 'delete', key, None, get_record_shard(record, table))
+        if table in self._search_tables:
+            self.connection.execute("DELETE FROM " + table + "_search WHERE rowid = ?", (key,))
+        cursor = self._execute_write("DELETE FROM " + table + " WHERE " + key_column + " = ?", (key,), change)
+        return cursor.rowcount > 0
+    
+    # Run a statement that changes data
+    # Outside a transaction it is committed straight away
+    def _execute_write(self, sql, params, change=None):
+        cursor = self.connection.execute(sql, params)
+        if change is not None:
+            self._pending_changes.append(change)
+        if self._transaction_depth == 0:
+            self._commit()
+        return cursor
+    
+    # Commit the database and publish the changes that were committed
+    def _commit(self):
+        self.connection.commit()
+        changes = self._pending_changes
+        self._pending_changes = []
+        if changes:
+            if CHANGE_FEED:
+                append_change_feed(changes)
+            self._changes.publish(changes)
+    
+    # Call callback(change) for every committed change, see DataManager.subscribe
+    def subscribe(self, callback, collections=None):
+        return self._changes.subscribe(callback, collections)
+    
+    # Group several changes into one database transaction
+    @contextmanager
+    def transaction(self):
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.connection.rollback()
+                self._pending_changes = []
+            raise
+        
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self._commit()
+    
+    # Return a value in the form it is stored in an indexed column
+    def _column_value(self, column, value):
+        if column in SQLITE_NORMALIZED_COLUMNS:
+            return SQLITE_NORMALIZED_COLUMNS[column](value)
+        return value
+    
+    # Return the first record whose column matches the value
+    def _fetch_one(self, table, column, value):
+        row = self.connection.execute("SELECT data FROM " + table + " WHERE " + column + " = ? LIMIT 1", (self._column_value(column, value),)).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+    
+    # Return the records in the order of a column, only those with
+    # start <= value < end when they are given. where is an extra
+    # (column, value) condition and limit the number of records returned
+    def _fetch_ordered(self, table, column, start=None, end=None, descending=False, limit=None, where=None):
+        conditions = []
+        params = []
+        if where is not None:
+            conditions.append(where[0] + " = ?")
+            params.append(self._column_value(where[0], where[1]))
+        if start is not None:
+            conditions.append(column + " >= ?")
+            params.append(self._column_value(column, start))
+        if end is not None:
+            conditions.append(column + " < ?")
+            params.append(self._column_value(column, end))
+        
+        sql = "SELECT data FROM " + table
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY " + column + (" DESC" if descending else "")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [pickle.loads(row[0]) for row in self.connection.execute(sql, params)]
+    
+    # Return every record whose column matches the value
+    def _fetch_all(self, table, column, value):
+        rows = self.connection.execute("SELECT data FROM " + table + " WHERE " + column + " = ? ORDER BY rowid", (self._column_value(column, value),))
+        return [pickle.loads(row[0]) for row in rows]
+    
+    # Start a query over a collection, see DataManager.query
+    def query(self, collection):
+        return Query(self, collection)
+    
+    # Turn a query into SQL, returns (sql, params, ordered)
+    # Conditions on the key and indexed columns go into the WHERE clause
+    # so SQLite can pick an index, the rest are checked on the loaded
+    # records. Only when the SQL does all of the filtering and ordering
+    # can it stop after the limit. ordered is True when it sorts the records
+    def _query_sql(self, query):
+        table = query.file_key
+        key_column, key_getter, columns = SQLITE_TABLES[table]
+        column_of = {getter: column for column, getter in columns.items()}
+        column_of[key_getter] = key_column
+        fields = QUERY_FIELDS[table]
+        
+        conditions = []
+        params = []
+        complete = not query.predicates
+        for field, value in query.equals.items():
+            column = column_of.get(fields[field])
+            if column is None:
+                complete = False
+                continue
+            conditions.append(column + " = ?")
+            params.append(self._column_value(column, value))
+            # Emails are compared normalized, the exact value is checked later
+            if SQLITE_NORMALIZED_COLUMNS.get(column) is normalize_email:
+                complete = False
+        for field, (start, end) in query.ranges.items():
+            column = column_of.get(fields[field])
+            if column is None:
+                complete = False
+                continue
+            if start is not None:
+                conditions.append(column + " >= ?")
+                params.append(self._column_value(column, start))
+            if end is not None:
+                conditions.append(column + " < ?")
+                params.append(self._column_value(column, end))
+        
+        sql = "SELECT data FROM " + table
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        ordered = False
+        if query.order is not None:
+            column = column_of.get(fields[query.order[0]])
+            if column is None:
+                complete = False
+            else:
+                sql += " ORDER BY " + column + (" DESC" if query.order[1] else "")
+                ordered = True
+        if complete and query.max_records is not None:
+            sql += " LIMIT ?"
+            params.append(query.max_records)
+        return sql, params, ordered
+    
+    def _run_query(self, query):
+        sql, params, ordered = self._query_sql(query)
+        records = (pickle.loads(row[0]) for row in self.connection.execute(sql, params))
+        return query.apply(records, ordered)
+    
+    # Describe the plan SQLite picked, e.g
+    # "SEARCH bookings USING INDEX idx_bookings_user_id (user_id=?)"
+    def _explain_query(self, query):
+        sql, params, ordered = self._query_sql(query)
+        rows = self.connection.execute("EXPLAIN QUERY PLAN " + sql, params)
+        return "; ".join(row[-1] for row in rows)
+    
+    # Records are read from the database when needed so nothing has to be loaded
+    def is_loaded(self, file_key):
+        return True
+    
+    def preload(self, file_keys=None):
+        futures = {}
+        for file_key in file_keys or DATA_FILES:
+            futures[file_key] = Future()
+            futures[file_key].set_result(getattr(self, file_key))
+        return futures
+    
+    # Every change is committed when it is made so there is nothing to wait for
+    def flush(self, timeout=None):
+        return True
+    
+    # Close the database connection
+    def close(self):
+        self.connection.close()
+    
+    # User related methods
+    def add_customer(self, customer):
+        self._write('customers', customer)
+    
+    def add_admin(self, admin):
+        self._write('admins', admin)
+    
+    def get_customer_by_id(self, customer_id):
+        return self._fetch_one('customers', 'user_id', customer_id)
+    
+    def get_admin_by_id(self, admin_id):
+        return self._fetch_one('admins', 'user_id', admin_id)
+    
+    def get_customer_by_email(self, email):
+        return self._fetch_one('customers', 'email', email)
+    
+    def get_admin_by_email(self, email):
+        return self._fetch_one('admins', 'email', email)
+    
+    def authenticate_user(self, email, password, is_admin=False):
+        if is_admin:
+            admin = self.get_admin_by_email(email)
+            if admin and admin.get_user_password() == password:
+                return admin
+        else:
+            customer = self.get_customer_by_email(email)
+            if customer and customer.get_user_password() == password:
+                return customer
+        return None
+    
+    def update_customer(self, customer):
+        return self._update('customers', customer)
+    
+    def update_admin(self, admin):
+        return self._update('admins', admin)
+    
+    def delete_customer(self, customer_id):
+        return self._delete('customers', customer_id)
+    
+    # Return the customers matching a search, see DataManager.search_customers
+    # Ranked by SQLite's bm25 with the weights in SEARCH_FIELDS
+    def search_customers(self, text, limit=SEARCH_LIMIT):
+        if 'customers' not in self._search_tables:
+            return SearchIndex('customers', SEARCH_FIELDS['customers'], self.customers).search(text, limit)
+        words = tokenize(text)
+        if not words:
+            return []
+        terms = ['"' + word + '"' + ("*" if len(word) >= SEARCH_MIN_PREFIX else "") for word in words]
+        rank = "bm25(customers_search, " + ", ".join(str(float(weight)) for weight in SEARCH_FIELDS['customers'].values()) + ")"
+        sql = ("SELECT customers.data FROM customers_search JOIN customers ON customers.user_id = customers_search.rowid"
+               " WHERE customers_search MATCH ? ORDER BY " + rank + ", customers.user_id")
+        params = [" ".join(terms)]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [pickle.loads(row[0]) for row in self.connection.execute(sql, params)]
+    
+    # Event related methods
+    def add_event(self, event):
+        self._write('events', event)
+    
+    def get_event_by_id(self, event_id):
+        return self._fetch_one('events', 'event_id', event_id)
+    
+    def events_between(self, start=None, end=None, location=None, limit=None):
+        return self._fetch_ordered('events', 'event_date', start, end, limit=limit,
+                                   where=None if location is None else ('event_location', location))
+    
+    def upcoming_events(self, limit=None, location=None):
+        return self.events_between(datetime.now(), None, location, limit)
+    
+    def get_event_locations(self):
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT event_location FROM events ORDER BY event_location")]
+    
+    def update_event(self, event):
+        return self._update('events', event)
+    
+    def delete_event(self, event_id):
+        return self._delete('events', event_id)
+    
+    # Booking related methods
+    def add_booking(self, booking):
+        self._write('bookings', booking)
+        return booking
+    
+    # The database keeps every record in indexed tables, nothing is archived
+    # so include_archive makes no difference
+    def get_booking_by_id(self, booking_id, include_archive=False):
+        return self._fetch_one('bookings', 'booking_id', booking_id)
+    
+    def get_bookings_by_user_id(self, user_id, include_archive=False):
+        return self._fetch_all('bookings', 'user_id', user_id)
+    
+    def get_bookings_by_event_id(self, event_id, include_archive=False):
+        return self._fetch_all('bookings', 'event_id', event_id)
+    
+    def get_all_bookings(self, include_archive=False):
+        return list(self.bookings)
+    
+    def bookings_between(self, start=None, end=None):
+        return self._fetch_ordered('bookings', 'booking_date', start, end)
+    
+    def latest_bookings(self, n=None, user_id=None, include_archive=False):
+        return self._fetch_ordered('bookings', 'booking_date', descending=True, limit=n,
+                                   where=None if user_id is None else ('user_id', user_id))
+    
+    def update_booking(self, booking):
+        return self._update('bookings', booking)
+    
+    def delete_booking(self, booking_id):
+        return self._delete('bookings', booking_id)
+    
+    # Ticket related methods
+    def add_ticket(self, ticket):
+        self._write('tickets', ticket)
+        return ticket
+    
+    def get_ticket_by_id(self, ticket_id):
+        return self._fetch_one('tickets', 'ticket_id', ticket_id)
+    
+    def get_tickets_by_booking_id(self, booking_id, include_archive=False):
+        return self._fetch_all('tickets', 'booking_id', booking_id)
+    
+    def get_tickets_by_event_id(self, event_id, include_archive=False):
+        return self._fetch_all('tickets', 'event_id', event_id)
+    
+    def update_ticket(self, ticket):
+        return self._update('tickets', ticket)
+    
+    def delete_ticket(self, ticket_id):
+        return self._delete('tickets', ticket_id)
+    
+    # Payment related methods
+    def add_payment(self, payment):
+        self._write('payments', payment)
+        return payment
+    
+    def get_payment_by_id(self, payment_id):
+        return self._fetch_one('payments', 'payment_id', payment_id)
+    
+    def get_payments_by_booking_id(self, booking_id, include_archive=False):
+        return self._fetch_all('payments', 'booking_id', booking_id)
+    
+    def payments_between(self, start=None, end=None):
+        return self._fetch_ordered('payments', 'transaction_date', start, end)
+    
+    def latest_payments(self, n=None):
+        return self._fetch_ordered('payments', 'transaction_date', descending=True, limit=n)
+    
+    def update_payment(self, payment):
+        return self._update('payments', payment)
+    
+    # Discount related methods
+    def add_discount(self, discount):
+        self._write('discounts', discount)
+    
+    def get_discount_by_id(self, discount_id):
+        return self._fetch_one('discounts', 'discount_id', discount_id)
+    
+    def get_discount_by_code(self, discount_code):
+        return self._fetch_one('discounts', 'code', discount_code)
+    
+    def update_discount(self, discount):
+        return self._update('discounts', discount)
+    
+    def delete_discount(self, discount_id):
+        return self._delete('discounts', discount_id)
+    
+    # Archive related methods
+    # Old events stay in the database, its indexes keep them out of the way
+    # Archiving is only done by the pickle backend, so nothing is ever
+    # archived here
+    def archive_events(self, before):
+        raise NotImplementedError("Archiving events is not supported by the SQLite backend")
+    
+    def get_archive_summaries(self):
+        return {}
+    
+    def get_archived_records(self, file_key, event_id=None):
+        return iter(())
+
+# Create the data manager for the configured storage backend
+def create_data_manager():
+    if STORAGE_BACKEND == 'sqlite':
+        return SQLiteDataManager()
+    return DataManager()
+
+# =================================================================
+# BULK IMPORT
+# =================================================================
+
+# Number of rows saved together in one transaction by import_rows
+IMPORT_BATCH_SIZE = 10000
+
+# Number of rejected rows whose reason is kept in the import report
+IMPORT_ERROR_LIMIT = 100
+
+# Ticket classes for the ticket_type column of an import file and the
+# columns that hold the extra attributes of each class
+IMPORT_TICKET_TYPES = {
+    'standard': (SingleRacePass, ('single_race_pass_id', 'pass_expiry', 'pass_benefits')),
+    'vip': (SeasonMembership, ('member_id', 'member_name', 'included_gifts')),
+    'weekend': (WeekendPackage, ('package_id', 'package_type', 'package_benefits')),
+    'group': (GroupDiscount, ('group_id', 'group_count', 'group_gifts'))
+}
+
+# Read the rows of a CSV or JSON lines file one at a time as dictionaries
+# The format comes from the file extension unless it is given
+def read_rows(path, file_format=None):
+    if file_format is None:
+        file_format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+    with open(path, newline='', encoding='utf-8') as file:
+        if file_format == 'csv':
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+# Dates are written as ISO text e.g 2024-11-26 or 2024-11-26T18:30:00
+def _import_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+# Enums can be written by value e.g Confirmed or by name e.g CONFIRMED
+def _import_enum(enum, value):
+    try:
+        return enum(value)
+    except ValueError:
+        pass
+    try:
+        return enum[str(value).upper()]
+    except KeyError:
+        raise ValueError("Unknown " + enum.__name__ + " " + str(value))
+
+# Build a record from one row of an import file
+def customer_from_row(row):
+    return Customer(row['name'], int(row['user_id']), row['password'], row['email'],
+                    _import_datetime(row['registration_date']), row.get('address', ''),
+                    row.get('phone', ''), row.get('payment_info', ''))
+
+def booking_from_row(row):
+    return Booking(int(row['user_id']), int(row['event_id']), int(row['booking_id']),
+                   _import_datetime(row['booking_date']), int(row['number_of_tickets']),
+                   float(row['total_price']), _import_enum(BookingStatus, row.get('status') or 'Confirmed'))
+
+def ticket_from_row(row):
+    ticket_type = row.get('ticket_type') or 'standard'
+    if ticket_type not in IMPORT_TICKET_TYPES:
+        raise ValueError("Unknown ticket_type " + str(ticket_type))
+    ticket_class, columns = IMPORT_TICKET_TYPES[ticket_type]
+    return ticket_class(int(row['type_id']), int(row['booking_id']), row['ticket_id'], row['seat_number'],
+                        float(row['ticket_price']), _import_datetime(row['check_in_time']),
+                        *[row.get(column, '') for column in columns], int(row['event_id']))
+
+# Row parser and DataManager method used for each collection that can be imported
+IMPORTERS = {
+    'customers': (customer_from_row, 'add_customer'),
+    'bookings': (booking_from_row, 'add_booking'),
+    'tickets': (ticket_from_row, 'add_ticket')
+}
+
+# Checks imported records against the records they refer to
+# Keys are looked up in sets built once at the start, so checking a row
+# takes the same time however many records already exist
+class ImportValidator:
+    def __init__(self, data_manager, file_key):
+        self._file_key = file_key
+        self._keys = {get_record_key(record, file_key) for record in getattr(data_manager, file_key)}
+        if file_key == 'customers':
+            self._emails = {normalize_email(customer.get_user_email()) for customer in data_manager.customers}
+        elif file_key == 'bookings':
+            self._events = {event.get_event_id() for event in data_manager.events}
+            self._customers = {customer.get_user_id() for customer in data_manager.customers}
+        elif file_key == 'tickets':
+            self._booking_events = {booking.get_booking_id(): booking.get_event_id() for booking in data_manager.bookings}
+    
+    # Raise ValueError if the record cannot be imported, otherwise remember it
+    # so later rows can refer to it or be found to be duplicates
+    def check(self, record):
+        key = get_record_key(record, self._file_key)
+        if key in self._keys:
+            raise ValueError("Duplicate key " + str(key))
+        
+        if self._file_key == 'customers':
+            email = normalize_email(record.get_user_email())
+            if email in self._emails:
+                raise ValueError("Email already registered " + email)
+            self._emails.add(email)
+        elif self._file_key == 'bookings':
+            if record.get_event_id() not in self._events:
+                raise ValueError("Unknown event " + str(record.get_event_id()))
+            if record.get_user_id() not in self._customers:
+                raise ValueError("Unknown customer " + str(record.get_user_id()))
+        elif self._file_key == 'tickets':
+            if record.get_booking_id() not in self._booking_events:
+                raise ValueError("Unknown booking " + str(record.get_booking_id()))
+            if self._booking_events[record.get_booking_id()] != record.get_event_id():
+                raise ValueError("Ticket event does not match booking " + str(record.get_booking_id()))
+        self._keys.add(key)
+
+# Return the most memory the process has used so far in MB, or None
+def get_peak_memory_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+# Import records into a data manager from an iterable of row dictionaries
+# Rows are read one at a time and saved batch_size at a time in one
+# transaction, so each changed file is written once per batch instead of
+# once per row. Rows that fail to parse or refer to unknown records are
+# skipped and counted. Returns a report of what happened
+def import_rows(data_manager, file_key, rows, batch_size=IMPORT_BATCH_SIZE):
+    parse, method = IMPORTERS[file_key]
+    add = getattr(data_manager, method)
+    start = time.perf_counter()
+    validator = ImportValidator(data_manager, file_key)
+    report = {'rows': 0, 'imported': 0, 'rejected': 0, 'errors': []}
+    
+    batch = []
+    last_id = None # Largest ID in the batch
+    for row_number, row in enumerate(rows, 1):
+        report['rows'] += 1
+        try:
+            record = parse(row)
+            validator.check(record)
+        except (KeyError, ValueError, TypeError) as e:
+            report['rejected'] += 1
+            if len(report['errors']) < IMPORT_ERROR_LIMIT:
+                report['errors'].append((row_number, type(e).__name__ + ": " + str(e)))
+            continue
+        
+        if file_key in FIRST_IDS:
+            key = get_record_key(record, file_key)
+            last_id = key if last_id is None else max(last_id, key)
+        batch.append(record)
+        if len(batch) >= batch_size:
+            _save_import_batch(data_manager, add, batch, file_key, last_id)
+            report['imported'] += len(batch)
+            batch = []
+            last_id = None
+    if batch:
+        _save_import_batch(data_manager, add, batch, file_key, last_id)
+        report['imported'] += len(batch)
+    
+    # Turn the large log appends into snapshots so the next start is fast
+    data_manager.flush()
+    if hasattr(data_manager, 'compact'):
+        data_manager.compact()
+    
+    report['seconds'] = time.perf_counter() - start
+    report['rows_per_second'] = report['rows'] / report['seconds'] if report['seconds'] else 0
+    report['peak_memory_mb'] = get_peak_memory_mb()
+    return report
+
+# The IDs of the batch are skipped first, so adding each record finds its
+# ID already past the sequence and never touches the sequence file
+def _save_import_batch(data_manager, add, batch, file_key, last_id):
+    if last_id is not None:
+        data_manager.skip_ids(file_key, last_id)
+    with data_manager.transaction():
+        for record in batch:
+            add(record)
+
+# Import a CSV or JSON lines file, see read_rows and import_rows
+def import_file(data_manager, file_key, path, file_format=None, batch_size=IMPORT_BATCH_SIZE):
+    return import_rows(data_manager, file_key, read_rows(path, file_format), batch_size)
+
+# =================================================================
+# BULK EXPORT
+# =================================================================
+
+# Columns written for each collection and the attribute each one is read
+# from. Columns with None are worked out by export_rows, e.g the customer
+# and event names of a booking. Records without an attribute, such as the
+# card type of a digital payment, leave the column empty. Passwords and
+# full card numbers are never exported
+EXPORT_COLUMNS = {
+    'users': [('user_id', '_user_id'), ('name', '_user_name'), ('email', '_user_email'),
+              ('registration_date', '_registration_date')],
+    'customers': [('user_id', '_user_id'), ('name', '_user_name'), ('email', '_user_email'),
+                  ('registration_date', '_registration_date'), ('address', '_customer_address'),
+                  ('phone', '_customer_phone')],
+    'admins': [('user_id', '_user_id'), ('name', '_user_name'), ('email', '_user_email'),
+               ('registration_date', '_registration_date'), ('admin_role', '_admin_role'),
+               ('employee_id', '_employee_id'), ('account_status', '_account_status')],
+    'events': [('event_id', '_event_id'), ('event_name', '_event_name'), ('event_date', '_event_date'),
+               ('event_location', '_event_location'), ('event_capacity', '_event_capacity')],
+    'bookings': [('booking_id', '_booking_id'), ('user_id', '_user_id'), ('customer_name', None),
+                 ('event_id', '_event_id'), ('event_name', None), ('booking_date', '_booking_date'),
+                 ('number_of_tickets', '_number_of_tickets'), ('total_price', '_total_price'),
+                 ('status', '_booking_status')],
+    'tickets': [('ticket_id', '_ticket_id'), ('booking_id', '_booking_id'), ('event_id', '_event_id'),
+                ('event_name', None), ('ticket_type', None), ('type_id', '_type_id'),
+                ('seat_number', '_seat_number'), ('ticket_price', '_ticket_price'),
+                ('check_in_time', '_check_in_time')] + [
+                (column, '_' + column) for _, columns in IMPORT_TICKET_TYPES.values() for column in columns],
+    'payments': [('payment_id', '_payment_id'), ('booking_id', '_booking_id'), ('payment_type', '_payment_type'),
+                 ('transaction_date', '_transaction_date'), ('transaction_status', '_transaction_status'),
+                 ('refund_id', '_refund_id'), ('refund_reason', '_refund_reason'), ('card_type', '_card_type'),
+                 ('card_last4', None), ('transaction_id', '_transaction_id')],
+    'discounts': [('discount_id', '_discount_id'), ('discount_code', '_discount_code'),
+                  ('discount_percentage', '_discount_percentage'), ('discount_amount', '_discount_amount'),
+                  ('max_discount_amount', '_max_discount_amount')]
+}
+
+# Number of records turned into rows together by export_rows
+EXPORT_CHUNK_SIZE = 10000
+
+# Value written for each member of the saved enums
+EXPORT_ENUM_VALUES = {member: member.value for enum in PERSISTED_ENUMS for member in enum}
+
+# Types CSV and JSON can hold as they are
+EXPORT_PLAIN_TYPES = {int, float, str, bool, type(None)}
+
+# Return the column names of an export of the collection
+def get_export_columns(file_key):
+    return [column for column, attribute in EXPORT_COLUMNS[file_key]]
+
+# Turn a column of attribute values into values that CSV and JSON can hold
+# Columns holding a single type are converted with map, which is what
+# keeps an export of a million rows within seconds
+def _export_column(values):
+    types = set(map(type, values))
+    if types <= EXPORT_PLAIN_TYPES:
+        return values
+    if types == {datetime}:
+        return list(map(datetime.isoformat, values))
+    return [value.isoformat() if value.__class__ is datetime else EXPORT_ENUM_VALUES.get(value, value)
+            if isinstance(value, Enum) else value for value in values]
+
+# Yield one row tuple per record of a collection, in the order of
+# get_export_columns. Records are read straight from the collection
+# EXPORT_CHUNK_SIZE at a time and every column of a chunk is built in
+# one go. Names are joined through dictionaries built once, so no
+# get_*_by_id scan is made for any row
+def export_rows(data_manager, file_key):
+    # Functions that build the columns without an attribute for a chunk
+    derived = {}
+    if file_key in ('bookings', 'tickets'):
+        event_names = {event.get_event_id(): event.get_event_name() for event in data_manager.events}
+        derived['event_name'] = lambda records, states: list(map(event_names.get, map(dict.get, states, repeat('_event_id'))))
+    if file_key == 'bookings':
+        customer_names = {customer.get_user_id(): customer.get_user_name() for customer in data_manager.customers}
+        derived['customer_name'] = lambda records, states: list(map(customer_names.get, map(dict.get, states, repeat('_user_id'))))
+    if file_key == 'tickets':
+        ticket_types = {ticket_class: name for name, (ticket_class, columns) in IMPORT_TICKET_TYPES.items()}
+        derived['ticket_type'] = lambda records, states: list(map(ticket_types.get, map(type, records)))
+    if file_key == 'payments':
+        derived['card_last4'] = lambda records, states: [(state.get('_card_number') or '')[-4:] or None for state in states]
+    
+    records = iter(getattr(data_manager, file_key))
+    while True:
+        chunk = list(islice(records, EXPORT_CHUNK_SIZE))
+        if not chunk:
+            return
+        states = [record.__dict__ for record in chunk]
+        columns = []
+        for column, attribute in EXPORT_COLUMNS[file_key]:
+            if attribute is None:
+                columns.append(derived[column](chunk, states))
+            else:
+                columns.append(_export_column(list(map(dict.get, states, repeat(attribute)))))
+        yield from zip(*columns)
+
+# Write a collection to a CSV or JSON lines file one chunk at a time
+# The format comes from the file extension unless it is given
+# Garbage collection is paused as while loading, the rows it would scan
+# for are freed as soon as they are written. Returns the number of rows
+def export_file(data_manager, file_key, path, file_format=None):
+    if file_format is None:
+        file_format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+    columns = get_export_columns(file_key)
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as file, paused_gc():
+        rows = export_rows(data_manager, file_key)
+        if file_format == 'csv':
+            writer = csv.writer(file)
+            writer.writerow(columns)
+        encoder = json.JSONEncoder(separators=(',', ':'))
+        while True:
+            chunk = list(islice(rows, EXPORT_CHUNK_SIZE))
+            if not chunk:
+                break
+            if file_format == 'csv':
+                writer.writerows(chunk)
+            else:
+                file.write("\n".join(map(encoder.encode, map(dict, map(zip, repeat(columns), chunk)))) + "\n")
+            count += len(chunk)
+    return count
+
+# =================================================================
+# GUI IMPLEMENTATION
+# =================================================================
+
+class GrandPrixApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Grand Prix Experience Ticket Booking System")
+        self.root.state('zoomed')  # Full screen
+        
+        # Set light blue color as background
+        self.bg_color = "#e6f2ff"
+        self.accent_color = "#4da6ff"
+        self.root.configure(bg=self.bg_color)
+        
+        # Initialize data manager
+        self.data_manager = create_data_manager()
+        
+        # Keep track of current user
+        self.current_user = None
+        self.is_admin = False
+        
+        # Create login frame
+        self.create_login_frame()
+    
+    # Create the login screen
+    def create_login_frame(self):
+        # Clear any existing frames
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        
+        # Create a main frame for the login screen
+        self.login_frame = tk.Frame(self.root, bg=self.bg_color)
+        self.login_frame.pack(expand=True, fill='both', padx=20, pady=20)
+        
+        # Add title
+        title_font = font.Font(family='Helvetica', size=24, weight='bold')
+        title = tk.Label(self.login_frame, text="Grand Prix Experience", font=title_font, bg=self.bg_color)
+        title.pack(pady=(20, 10))
+        
+        subtitle_font = font.Font(family='Helvetica', size=14)
+        subtitle = tk.Label(self.login_frame, text="Ticket Booking System", font=subtitle_font, bg=self.bg_color)
+        subtitle.pack(pady=(0, 30))
+        
+        # Create login container
+        login_container = tk.Frame(self.login_frame, bg=self.bg_color, padx=20, pady=20, bd=1, relief=tk.SOLID)
+        login_container.pack(padx=300, pady=20)
+        
+        # Header
+        header_font = font.Font(family='Helvetica', size=16, weight='bold')
+        login_header = tk.Label(login_container, text="Login to Your Account", font=header_font, bg=self.bg_color)
+        login_header.pack(pady=(0, 20))
+        
+        # Email
+        email_frame = tk.Frame(login_container, bg=self.bg_color)
+        email_frame.pack(fill='x', pady=10)
+        
+        email_label = tk.Label(email_frame, text="Email:", width=15, anchor='w', bg=self.bg_color)
+        email_label.pack(side=tk.LEFT)
+        
+        self.email_entry = tk.Entry(email_frame, width=30)
+        self.email_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Password
+        password_frame = tk.Frame(login_container, bg=self.bg_color)
+        password_frame.pack(fill='x', pady=10)
+        
+        password_label = tk.Label(password_frame, text="Password:", width=15, anchor='w', bg=self.bg_color)
+        password_label.pack(side=tk.LEFT)
+        
+        self.password_entry = tk.Entry(password_frame, show="*", width=30)
+        self.password_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Admin checkbox
+        self.is_admin_var = tk.BooleanVar()
+        admin_check = tk.Checkbutton(login_container, text="Login as Admin", variable=self.is_admin_var, bg=self.bg_color)
+        admin_check.pack(pady=10)
+        
+        # Login button
+        login_button = tk.Button(login_container, text="Login", 
+                                command=self.handle_login,
+                                bg=self.accent_color, fg="white",
+                                width=20, height=2)
+        login_button.pack(pady=10)
+        
+        # Register new account button
+        register_button = tk.Button(login_container, text="Create New Account", 
+                                   command=self.show_registration,
+                                   bg="#ffffff", fg="black",
+                                   width=20, height=2)
+        register_button.pack(pady=10)
+    
+    # Handle login attempt
+    def handle_login(self):
+        email = self.email_entry.get()
+        password = self.password_entry.get()
+        is_admin = self.is_admin_var.get()
+        
+        user = self.data_manager.authenticate_user(email, password, is_admin)
+        
+        if user:
+            self.current_user = user
+            self.is_admin = is_admin
+            messagebox.showinfo("Login Successful", "Welcome " + user.get_user_name() + "!")
+            
+            if is_admin:
+                # Admin screens use every collection so load them all at once
+                self.data_manager.preload()
+                self.show_admin_dashboard()
+            else:
+                self.show_customer_dashboard()
+        else:
+            messagebox.showerror("Login Failed", "Invalid email or password")
+    
+    # Show registration screen
+    def show_registration(self):
+        # Clear login frame
+        self.login_frame.destroy()
+        
+        # Create registration frame
+        self.registration_frame = tk.Frame(self.root, bg=self.bg_color)
+        self.registration_frame.pack(expand=True, fill='both', padx=20, pady=20)
+        
+        # Add title
+        title_font = font.Font(family='Helvetica', size=24, weight='bold')
+        title = tk.Label(self.registration_frame, text="Create Your Account", font=title_font, bg=self.bg_color)
+        title.pack(pady=(20, 30))
+        
+        # Create registration form container
+        form_container = tk.Frame(self.registration_frame, bg=self.bg_color, padx=20, pady=20, bd=1, relief=tk.SOLID)
+        form_container.pack(padx=200, pady=20)
+        
+        # Name field
+        name_frame = tk.Frame(form_container, bg=self.bg_color)
+        name_frame.pack(fill='x', pady=10)
+        
+        name_label = tk.Label(name_frame, text="Full Name:", width=15, anchor='w', bg=self.bg_color)
+        name_label.pack(side=tk.LEFT)
+        
+        self.name_entry = tk.Entry(name_frame, width=40)
+        self.name_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Email field
+        email_frame = tk.Frame(form_container, bg=self.bg_color)
+        email_frame.pack(fill='x', pady=10)
+        
+        email_label = tk.Label(email_frame, text="Email:", width=15, anchor='w', bg=self.bg_color)
+        email_label.pack(side=tk.LEFT)
+        
+        self.reg_email_entry = tk.Entry(email_frame, width=40)
+        self.reg_email_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Password field
+        password_frame = tk.Frame(form_container, bg=self.bg_color)
+        password_frame.pack(fill='x', pady=10)
+        
+        password_label = tk.Label(password_frame, text="Password:", width=15, anchor='w', bg=self.bg_color)
+        password_label.pack(side=tk.LEFT)
+        
+        self.reg_password_entry = tk.Entry(password_frame, show="*", width=40)
+        self.reg_password_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Address field
+        address_frame = tk.Frame(form_container, bg=self.bg_color)
+        address_frame.pack(fill='x', pady=10)
+        
+        address_label = tk.Label(address_frame, text="Address:", width=15, anchor='w', bg=self.bg_color)
+        address_label.pack(side=tk.LEFT)
+        
+        self.address_entry = tk.Entry(address_frame, width=40)
+        self.address_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Phone field
+        phone_frame = tk.Frame(form_container, bg=self.bg_color)
+        phone_frame.pack(fill='x', pady=10)
+        
+        phone_label = tk.Label(phone_frame, text="Phone:", width=15, anchor='w', bg=self.bg_color)
+        phone_label.pack(side=tk.LEFT)
+        
+        self.phone_entry = tk.Entry(phone_frame, width=40)
+        self.phone_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Payment info field
+        payment_frame = tk.Frame(form_container, bg=self.bg_color)
+        payment_frame.pack(fill='x', pady=10)
+        
+        payment_label = tk.Label(payment_frame, text="Payment Info:", width=15, anchor='w', bg=self.bg_color)
+        payment_label.pack(side=tk.LEFT)
+        
+        self.payment_entry = tk.Entry(payment_frame, width=40)
+        self.payment_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Buttons
+        button_frame = tk.Frame(form_container, bg=self.bg_color)
+        button_frame.pack(fill='x', pady=20)
+        
+        # Register button
+        register_button = tk.Button(button_frame, text="Register", 
+                                   command=self.handle_registration,
+                                   bg=self.accent_color, fg="white",
+                                   width=15, height=2)
+        register_button.pack(side=tk.LEFT, padx=10)
+        
+        # Back button
+        back_button = tk.Button(button_frame, text="Back to Login", 
+                               command=self.create_login_frame,
+                               bg="#ffffff", fg="black", 
+                               width=15, height=2)
+        back_button.pack(side=tk.LEFT, padx=10)
+    
+    # Handle registration form submission
+    def handle_registration(self):
+        # Get form values
+        name = self.name_entry.get()
+        email = self.reg_email_entry.get().strip()
+        password = self.reg_password_entry.get()
+        address = self.address_entry.get()
+        phone = self.phone_entry.get()
+        payment_info = self.payment_entry.get()
+        
+        # Validate inputs
+        if not name or not email or not password or not address or not phone:
+            messagebox.showerror("Registration Error", "All fields are required")
+            return
+        
+        # Check if email is already registered
+        if self.data_manager.get_customer_by_email(email) or self.data_manager.get_admin_by_email(email):
+            messagebox.showerror("Registration Error", "Email already registered")
+            return
+        
+        # Validate email format
+        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+            messagebox.showerror("Registration Error", "Invalid email format")
+            return
+        
+        # Create user ID
+        user_id = self.data_manager.next_id('customers')
+        
+        # Create customer object
+        customer = Customer(
+            name, 
+            user_id, 
+            password, 
+            email, 
+            datetime.now(), 
+            address, 
+            phone, 
+            payment_info
+        )
+        
+        # Add customer to data manager
+        self.data_manager.add_customer(customer)
+        
+        messagebox.showinfo("Registration Successful", "Your account has been created. You can now login.")
+        
+        # Return to login screen
+        self.create_login_frame()
+    
+    # Show customer dashboard
+    def show_customer_dashboard(self):
+        # Clear any existing frames
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        
+        # Create dashboard frame
+        self.dashboard_frame = tk.Frame(self.root, bg=self.bg_color)
+        self.dashboard_frame.pack(expand=True, fill='both')
+        
+        # Create sidebar and main content area
+        self.sidebar_frame = tk.Frame(self.dashboard_frame, bg="#d4e6ff", width=200)
+        self.sidebar_frame.pack(side=tk.LEFT, fill='y')
+        
+        # Make sure sidebar maintains its width
+        self.sidebar_frame.pack_propagate(False)
+        
+        # Main content area
+        self.content_frame = tk.Frame(self.dashboard_frame, bg=self.bg_color)
+        self.content_frame.pack(side=tk.RIGHT, expand=True, fill='both')
+        
+        # Add user info to sidebar
+        user_info_frame = tk.Frame(self.sidebar_frame, bg="#d4e6ff", pady=20)
+        user_info_frame.pack(fill='x')
+        
+        # User avatar (placeholder)
+        avatar_label = tk.Label(user_info_frame, text="👤", font=("Helvetica", 24), bg="#d4e6ff")
+        avatar_label.pack()
+        
+        # User name
+        name_label = tk.Label(user_info_frame, text=self.current_user.get_user_name(), font=("Helvetica", 12, "bold"), bg="#d4e6ff")
+        name_label.pack(pady=(5, 0))
+        
+        # User email
+        email_label = tk.Label(user_info_frame, text=self.current_user.get_user_email(), 
+                              font=("Helvetica", 10), bg="#d4e6ff")
+        email_label.pack()
+        
+        # Add separator
+        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
+        
+        # Navigation menu
+        menu_font = font.Font(family='Helvetica', size=11)
+        
+        # Dashboard button (selected by default)
+        dashboard_btn = tk.Button(self.sidebar_frame, text="Dashboard", font=menu_font,
+                               bg="#4da6ff", fg="white", bd=0, pady=8,
+                               command=lambda: self.show_customer_dashboard_content())
+        dashboard_btn.pack(fill='x', pady=2)
+        
+        # Events button
+        events_btn = tk.Button(self.sidebar_frame, text="Browse Events", font=menu_font,
+                            bg="#d4e6ff", fg="black", bd=0, pady=8,
+                            command=lambda: self.show_events_list())
+        events_btn.pack(fill='x', pady=2)
+        
+        # My Bookings button
+        bookings_btn = tk.Button(self.sidebar_frame, text="My Bookings", font=menu_font,
+                              bg="#d4e6ff", fg="black", bd=0, pady=8,
+                              command=lambda: self.show_my_bookings())
+        bookings_btn.pack(fill='x', pady=2)
+        
+        # Account button
+        account_btn = tk.Button(self.sidebar_frame, text="My Account", font=menu_font,
+                             bg="#d4e6ff", fg="black", bd=0, pady=8,
+                             command=lambda: self.show_account_settings())
+        account_btn.pack(fill='x', pady=2)
+        
+        # Add separator
+        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
+        
+        # Logout button at bottom of sidebar
+        logout_btn = tk.Button(self.sidebar_frame, text="Logout", font=menu_font,
+                            bg="#ff6666", fg="white", bd=0, pady=8,
+                            command=lambda: self.logout())
+        logout_btn.pack(fill='x', pady=2, side=tk.BOTTOM)
+        
+        # Show default dashboard content
+        self.show_customer_dashboard_content()
+    
+    # Show main dashboard content for customer
+    def show_customer_dashboard_content(self):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create welcome header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        welcome_label = tk.Label(header_frame, text="Welcome to Grand Prix Experience", 
+                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        welcome_label.pack()
+        
+        date_label = tk.Label(header_frame, text="Today: " + datetime.now().strftime("%B %d, %Y"), 
+                             font=("Helvetica", 10), bg=self.bg_color)
+        date_label.pack()
+        
+        # Create dashboard cards
+        cards_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        cards_frame.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        # Configure grid
+        cards_frame.columnconfigure(0, weight=1)
+        cards_frame.columnconfigure(1, weight=1)
+        cards_frame.rowconfigure(0, weight=1)
+        cards_frame.rowconfigure(1, weight=1)
+        
+        # Card 1: Upcoming Events
+        card1 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        card1.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        
+        card1_title = tk.Label(card1, text="Upcoming Events", font=("Helvetica", 14, "bold"), bg="white")
+        card1_title.pack(anchor='w')
+        
+        ttk.Separator(card1, orient='horizontal').pack(fill='x', pady=5)
+        
+        # Get upcoming events (showing max 3), the first ones by date
+        # including events that already took place
+        upcoming_events = self.data_manager.events_between(limit=3)
+        
+        if upcoming_events:
+            for event in upcoming_events:
+                event_frame = tk.Frame(card1, bg="white", pady=5)
+                event_frame.pack(fill='x')
+                
+                event_name = tk.Label(event_frame, text=event.get_event_name(), font=("Helvetica", 11), bg="white")
+                event_name.pack(anchor='w')
+                
+                event_info = tk.Label(event_frame, text="Date: " + event.get_event_date().strftime("%B %d, %Y") + 
+                                     " • " + event.get_event_location(), font=("Helvetica", 9), bg="white", fg="gray")
+                event_info.pack(anchor='w')
+                
+                ttk.Separator(card1, orient='horizontal').pack(fill='x', pady=2)
+        else:
+            no_events = tk.Label(card1, text="No upcoming events", bg="white")
+            no_events.pack(pady=10)
+        
+        view_all_btn = tk.Button(card1, text="View All Events", bg=self.accent_color, fg="white",
+                              command=lambda: self.show_events_list())
+        view_all_btn.pack(pady=10)
+        
+        # Card 2: My Tickets
+        card2 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        card2.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        
+        card2_title = tk.Label(card2, text="My Tickets", font=("Helvetica", 14, "bold"), bg="white")
+        card2_title.pack(anchor='w')
+        
+        ttk.Separator(card2, orient='horizontal').pack(fill='x', pady=5)
+        
+        # Get user bookings
+        user_bookings = self.data_manager.get_bookings_by_user_id(self.current_user.get_user_id())
+        
+        if user_bookings:
+            ticket_count = sum(booking.get_number_of_tickets() for booking in user_bookings)
+            ticket_label = tk.Label(card2, text="You have " + str(ticket_count) + " tickets", 
+                                 font=("Helvetica", 12), bg="white")
+            ticket_label.pack(pady=10)
+            
+            # Show only the 2 most recent bookings
+            for booking in self.data_manager.latest_bookings(2, self.current_user.get_user_id()):
+                event = self.data_manager.get_event_by_id(booking.get_event_id())
+                if event:
+                    booking_frame = tk.Frame(card2, bg="white", pady=5)
+                    booking_frame.pack(fill='x')
+                    
+                    booking_info = tk.Label(booking_frame, 
+                                          text=event.get_event_name() + " - " + str(booking.get_number_of_tickets()) + " tickets",
+                                          font=("Helvetica", 11), bg="white")
+                    booking_info.pack(anchor='w')
+                    
+                    booking_date = tk.Label(booking_frame, 
+                                          text="Booked on: " + booking.get_booking_date().strftime("%B %d, %Y"),
+                                          font=("Helvetica", 9), bg="white", fg="gray")
+                    booking_date.pack(anchor='w')
+                    
+                    ttk.Separator(card2, orient='horizontal').pack(fill='x', pady=2)
+        else:
+            no_tickets = tk.Label(card2, text="You don't have any tickets yet", bg="white")
+            no_tickets.pack(pady=10)
+        
+        view_tickets_btn = tk.Button(card2, text="View All Tickets", bg=self.accent_color, fg="white",
+                                 command=lambda: self.show_my_bookings())
+        view_tickets_btn.pack(pady=10)
+        
+        # Card 3: Quick Actions
+        card3 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        card3.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
+        
+        card3_title = tk.Label(card3, text="Quick Actions", font=("Helvetica", 14, "bold"), bg="white")
+        card3_title.pack(anchor='w')
+        
+        ttk.Separator(card3, orient='horizontal').pack(fill='x', pady=5)
+        
+        # Quick action buttons
+        book_ticket_btn = tk.Button(card3, text="Book a New Ticket", bg="#4caf50", fg="white", width=20,
+                                 command=lambda: self.show_events_list())
+        book_ticket_btn.pack(pady=5)
+        
+        view_bookings_btn = tk.Button(card3, text="View My Bookings", bg="#2196f3", fg="white", width=20,
+                                    command=lambda: self.show_my_bookings())
+        view_bookings_btn.pack(pady=5)
+        
+        update_profile_btn = tk.Button(card3, text="Update My Profile", bg="#ff9800", fg="white", width=20,
+                                     command=lambda: self.show_account_settings())
+        update_profile_btn.pack(pady=5)
+        
+        # Card 4: Information
+        card4 = tk.Frame(cards_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        card4.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
+        
+        card4_title = tk.Label(card4, text="Information", font=("Helvetica", 14, "bold"), bg="white")
+        card4_title.pack(anchor='w')
+        
+        ttk.Separator(card4, orient='horizontal').pack(fill='x', pady=5)
+        
+        info_text = """
+        Welcome to the Grand Prix Experience Ticket Booking System!
+        
+        Here you can:
+        • Book tickets for upcoming Formula One events
+        • View and manage your bookings
+        • Update your account information
+        
+        Need help? Contact our support team at support@grandprix.com
+        """
+        
+        info_label = tk.Label(card4, text=info_text, bg="white", justify=tk.LEFT, wraplength=300)
+        info_label.pack(pady=10, fill='both', expand=True)
+    
+    # Show events list for booking
+    # Add a bar with location and date filters above an events list
+    # command(location, start, end) shows the list again with the chosen
+    # filters, None for each one left empty. end is the day after the To
+    # date so events on the To date are included
+    def create_event_filters(self, location, start, end, command):
+        filter_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        filter_frame.pack(fill='x', padx=20)
+        
+        location_label = tk.Label(filter_frame, text="Location:", bg=self.bg_color)
+        location_label.pack(side=tk.LEFT)
+        
+        location_var = tk.StringVar(value=location or "All locations")
+        location_dropdown = ttk.Combobox(filter_frame, textvariable=location_var, 
+                                      values=["All locations"] + self.data_manager.get_event_locations(), 
+                                      state="readonly", width=25)
+        location_dropdown.pack(side=tk.LEFT, padx=(5, 15))
+        
+        from_label = tk.Label(filter_frame, text="From (YYYY-MM-DD):", bg=self.bg_color)
+        from_label.pack(side=tk.LEFT)
+        
+        from_entry = tk.Entry(filter_frame, width=12)
+        from_entry.pack(side=tk.LEFT, padx=(5, 15))
+        if start:
+            from_entry.insert(0, start.strftime("%Y-%m-%d"))
+        
+        to_label = tk.Label(filter_frame, text="To:", bg=self.bg_color)
+        to_label.pack(side=tk.LEFT)
+        
+        to_entry = tk.Entry(filter_frame, width=12)
+        to_entry.pack(side=tk.LEFT, padx=(5, 15))
+        if end:
+            to_entry.insert(0, (end - timedelta(days=1)).strftime("%Y-%m-%d"))
+        
+        def apply_filters():
+            try:
+                start_date = datetime.strptime(from_entry.get().strip(), "%Y-%m-%d") if from_entry.get().strip() else None
+                end_date = datetime.strptime(to_entry.get().strip(), "%Y-%m-%d") + timedelta(days=1) if to_entry.get().strip() else None
+            except ValueError:
+                messagebox.showerror("Filter Error", "Dates must be in YYYY-MM-DD format")
+                return
+            command(None if location_var.get() == "All locations" else location_var.get(), start_date, end_date)
+        
+        apply_btn = tk.Button(filter_frame, text="Apply", bg=self.accent_color, fg="white", padx=10, 
+                           command=apply_filters)
+        apply_btn.pack(side=tk.LEFT)
+        
+        clear_btn = tk.Button(filter_frame, text="Clear", bg="#f0f0f0", fg="black", padx=10, 
+                           command=lambda: command())
+        clear_btn.pack(side=tk.LEFT, padx=5)
+    
+    # Events can be filtered by location and dates, see create_event_filters
+    def show_events_list(self, location=None, start=None, end=None):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create events header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        events_label = tk.Label(header_frame, text="Upcoming Events", 
+                              font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        events_label.pack()
+        
+        subtitle_label = tk.Label(header_frame, text="Browse and book tickets for upcoming races", 
+                                font=("Helvetica", 10), bg=self.bg_color)
+        subtitle_label.pack()
+        
+        self.create_event_filters(location, start, end, self.show_events_list)
+        
+        # Create scrollable events list
+        events_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        events_container.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Create canvas with scrollbar for events
+        canvas = tk.Canvas(events_container, bg=self.bg_color, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(events_container, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(
+                scrollregion=canvas.bbox("all")
+            )
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Get the events in date order
+        sorted_events = self.data_manager.events_between(start, end, location)
+        
+        if sorted_events:
+            for event in sorted_events:
+                # Create event card
+                event_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
+                event_card.pack(fill='x', padx=10, pady=10)
+                
+                # Event details
+                event_name = tk.Label(event_card, text=event.get_event_name(), 
+                                    font=("Helvetica", 14, "bold"), bg="white")
+                event_name.grid(row=0, column=0, sticky='w', pady=(0, 5))
+                
+                event_date = tk.Label(event_card, text="Date: " + event.get_event_date().strftime("%B %d, %Y"), 
+                                    bg="white")
+                event_date.grid(row=1, column=0, sticky='w')
+                
+                event_location = tk.Label(event_card, text="Location: " + event.get_event_location(), 
+                                        bg="white")
+                event_location.grid(row=2, column=0, sticky='w')
+                
+                event_capacity = tk.Label(event_card, 
+                                        text="Available Tickets: " + str(event.get_remaining_capacity()) + 
+                                        " of " + str(event.get_event_capacity()),
+                                        bg="white")
+                event_capacity.grid(row=3, column=0, sticky='w')
+                
+                # Book button
+                book_button = tk.Button(event_card, text="Book Tickets", 
+                                      bg=self.accent_color, fg="white",
+                                      command=lambda e=event: self.show_booking_form(e))
+                book_button.grid(row=1, column=1, rowspan=2, padx=(20, 0))
+                
+                # Set grid configuration
+                event_card.columnconfigure(0, weight=1)
+                event_card.columnconfigure(1, weight=0)
+        else:
+            no_events = tk.Label(scrollable_frame, text="No upcoming events available", 
+                              font=("Helvetica", 12), bg=self.bg_color)
+            no_events.pack(pady=50)
+    
+    def show_booking_form(self, event):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create booking form header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=10)
+        header_frame.pack(fill='x')
+        
+        booking_label = tk.Label(header_frame, text="Book Tickets: " + event.get_event_name(), 
+                            font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        booking_label.pack()
+        
+        event_info = tk.Label(header_frame, 
+                            text="Date: " + event.get_event_date().strftime("%B %d, %Y") + 
+                            " • " + event.get_event_location(),
+                            font=("Helvetica", 10), bg=self.bg_color)
+        event_info.pack()
+        
+        # Create main container
+        main_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        main_container.pack(fill='both', expand=True, padx=20, pady=5)
+        
+        # Create canvas with scrollbar
+        canvas = tk.Canvas(main_container, bg=self.bg_color, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
+        
+        # Configure canvas
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Pack canvas and scrollbar
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Create form container inside canvas
+        form_container = tk.Frame(canvas, bg="white", bd=1, relief=tk.SOLID)
+        
+        # Create window in canvas
+        canvas_window = canvas.create_window((0, 0), window=form_container, anchor="nw", width=canvas.winfo_width())
+        
+        # Function to update canvas scroll region
+        def update_scrollregion(event):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            
+        # Function to update form width
+        def update_form_width(event):
+            canvas_width = event.width
+            canvas.itemconfig(canvas_window, width=canvas_width)
+        
+        # Bind events
+        form_container.bind("<Configure>", update_scrollregion)
+        canvas.bind("<Configure>", update_form_width)
+        
+        # Bind mousewheel - using a more reliable approach that's contained to this canvas
+        def on_mousewheel(event):
+            # Only scroll if the canvas is visible and has a scrollable area
+            if canvas.winfo_exists():
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        
+        # Bind only to the canvas widget itself, not globally
+        canvas.bind("<MouseWheel>", on_mousewheel)
+        
+        # Ticket type selection
+        ticket_type_frame = tk.Frame(form_container, bg="white", pady=15)
+        ticket_type_frame.pack(fill='x', padx=20)
+        
+        ticket_type_label = tk.Label(ticket_type_frame, text="Select Ticket Type:", 
+                                    font=("Helvetica", 12, "bold"), bg="white")
+        ticket_type_label.pack(anchor='w')
+        
+        # Ticket types (radio buttons)
+        self.ticket_type_var = tk.StringVar(value="standard")
+        
+        ticket_types_frame = tk.Frame(ticket_type_frame, bg="white", pady=10)
+        ticket_types_frame.pack(fill='x')
+        
+        # Standard ticket
+        standard_frame = tk.Frame(ticket_types_frame, bg="white", pady=5, bd=1, relief=tk.SOLID)
+        standard_frame.pack(fill='x', pady=5)
+        
+        standard_radio = tk.Radiobutton(standard_frame, text="Standard Ticket", 
+                                    variable=self.ticket_type_var, value="standard", bg="white")
+        standard_radio.grid(row=0, column=0, sticky='w', padx=10)
+        
+        standard_price = tk.Label(standard_frame, text="$100", font=("Helvetica", 12, "bold"), bg="white")
+        standard_price.grid(row=0, column=1, sticky='e', padx=10)
+        
+        standard_desc = tk.Label(standard_frame, 
+                            text="Regular seating with good view of the track",
+                            bg="white", wraplength=400, justify=tk.LEFT)
+        standard_desc.grid(row=1, column=0, columnspan=2, sticky='w', padx=35, pady=(0, 5))
+        
+        # VIP ticket
+        vip_frame = tk.Frame(ticket_types_frame, bg="white", pady=5, bd=1, relief=tk.SOLID)
+        vip_frame.pack(fill='x', pady=5)
+        
+        vip_radio = tk.Radiobutton(vip_frame, text="VIP Experience", 
+                                variable=self.ticket_type_var, value="vip", bg="white")
+        vip_radio.grid(row=0, column=0, sticky='w', padx=10)
+        
+        vip_price = tk.Label(vip_frame, text="$250", font=("Helvetica", 12, "bold"), bg="white")
+        vip_price.grid(row=0, column=1, sticky='e', padx=10)
+        
+        vip_desc = tk.Label(vip_frame, 
+                        text="Premium seating with complimentary food and drinks",
+                        bg="white", wraplength=400, justify=tk.LEFT)
+        vip_desc.grid(row=1, column=0, columnspan=2, sticky='w', padx=35, pady=(0, 5))
+        
+        # Weekend package
+        weekend_frame = tk.Frame(ticket_types_frame, bg="white", pady=5, bd=1, relief=tk.SOLID)
+        weekend_frame.pack(fill='x', pady=5)
+        
+        weekend_radio = tk.Radiobutton(weekend_frame, text="Weekend Package", 
+                                    variable=self.ticket_type_var, value="weekend", bg="white")
+        weekend_radio.grid(row=0, column=0, sticky='w', padx=10)
+        
+        weekend_price = tk.Label(weekend_frame, text="$400", font=("Helvetica", 12, "bold"), bg="white")
+        weekend_price.grid(row=0, column=1, sticky='e', padx=10)
+        
+        weekend_desc = tk.Label(weekend_frame, 
+                            text="3-day pass with access to practice, qualifying, and race sessions",
+                            bg="white", wraplength=400, justify=tk.LEFT)
+        weekend_desc.grid(row=1, column=0, columnspan=2, sticky='w', padx=35, pady=(0, 5))
+        
+        # Configure grid columns for all frames
+        standard_frame.columnconfigure(0, weight=1)
+        standard_frame.columnconfigure(1, weight=0)
+        vip_frame.columnconfigure(0, weight=1)
+        vip_frame.columnconfigure(1, weight=0)
+        weekend_frame.columnconfigure(0, weight=1)
+        weekend_frame.columnconfigure(1, weight=0)
+        
+        # Number of tickets
+        quantity_frame = tk.Frame(form_container, bg="white", pady=15)
+        quantity_frame.pack(fill='x', padx=20)
+        
+        quantity_label = tk.Label(quantity_frame, text="Number of Tickets:", 
+                                font=("Helvetica", 12, "bold"), bg="white")
+        quantity_label.pack(anchor='w')
+        
+        # Ticket quantity spinner
+        self.ticket_quantity_var = tk.StringVar(value="1")
+        quantity_spinner = ttk.Spinbox(quantity_frame, from_=1, to=10, textvariable=self.ticket_quantity_var, 
+                                    width=5, state="readonly")
+        quantity_spinner.pack(anchor='w', pady=5)
+        
+        # Add separator
+        ttk.Separator(form_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
+        
+        # Discount code
+        discount_frame = tk.Frame(form_container, bg="white", pady=10)
+        discount_frame.pack(fill='x', padx=20)
+        
+        discount_label = tk.Label(discount_frame, text="Discount Code (if any):", 
+                                font=("Helvetica", 12, "bold"), bg="white")
+        discount_label.pack(anchor='w')
+        
+        self.discount_code_entry = tk.Entry(discount_frame, width=20)
+        self.discount_code_entry.pack(anchor='w', pady=5)
+        
+        # Add separator
+        ttk.Separator(form_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
+        
+        # Payment method
+        payment_frame = tk.Frame(form_container, bg="white", pady=15)
+        payment_frame.pack(fill='x', padx=20)
+        
+        payment_label = tk.Label(payment_frame, text="Payment Method:", 
+                            font=("Helvetica", 12, "bold"), bg="white")
+        payment_label.pack(anchor='w')
+        
+        # Payment type selection
+        self.payment_type_var = tk.StringVar(value="credit_card")
+        
+        credit_card_radio = tk.Radiobutton(payment_frame, text="Credit Card", 
+                                        variable=self.payment_type_var, value="credit_card", 
+                                        bg="white", command=self.toggle_payment_form)
+        credit_card_radio.pack(anchor='w', pady=5)
+        
+        digital_radio = tk.Radiobutton(payment_frame, text="Digital Payment (PayPal, etc)", 
+                                    variable=self.payment_type_var, value="digital", 
+                                    bg="white", command=self.toggle_payment_form)
+        digital_radio.pack(anchor='w')
+        
+        # Credit card form (default)
+        self.credit_card_frame = tk.Frame(payment_frame, bg="white", pady=10)
+        self.credit_card_frame.pack(fill='x')
+        
+        # Card number
+        card_num_frame = tk.Frame(self.credit_card_frame, bg="white")
+        card_num_frame.pack(fill='x', pady=5)
+        
+        card_num_label = tk.Label(card_num_frame, text="Card Number:", width=15, anchor='w', bg="white")
+        card_num_label.pack(side=tk.LEFT)
+        
+        self.card_num_entry = tk.Entry(card_num_frame, width=25)
+        self.card_num_entry.pack(side=tk.LEFT)
+        
+        # Expiry date
+        expiry_frame = tk.Frame(self.credit_card_frame, bg="white")
+        expiry_frame.pack(fill='x', pady=5)
+        
+        expiry_label = tk.Label(expiry_frame, text="Expiry Date (MM/YY):", width=15, anchor='w', bg="white")
+        expiry_label.pack(side=tk.LEFT)
+        
+        self.expiry_entry = tk.Entry(expiry_frame, width=10)
+        self.expiry_entry.pack(side=tk.LEFT)
+        
+        # CVV
+        cvv_frame = tk.Frame(self.credit_card_frame, bg="white")
+        cvv_frame.pack(fill='x', pady=5)
+        
+        cvv_label = tk.Label(cvv_frame, text="CVV:", width=15, anchor='w', bg="white")
+        cvv_label.pack(side=tk.LEFT)
+        
+        self.cvv_entry = tk.Entry(cvv_frame, width=5, show="*")
+        self.cvv_entry.pack(side=tk.LEFT)
+        
+        # Card type
+        card_type_frame = tk.Frame(self.credit_card_frame, bg="white")
+        card_type_frame.pack(fill='x', pady=5)
+        
+        card_type_label = tk.Label(card_type_frame, text="Card Type:", width=15, anchor='w', bg="white")
+        card_type_label.pack(side=tk.LEFT)
+        
+        self.card_type_var = tk.StringVar(value="VISA")
+        card_types = ["VISA", "MASTERCARD", "AMEX"]
+        card_type_dropdown = ttk.Combobox(card_type_frame, textvariable=self.card_type_var, 
+                                    values=card_types, state="readonly", width=12)
+        card_type_dropdown.pack(side=tk.LEFT)
+        
+        # Digital payment form (hidden by default)
+        self.digital_frame = tk.Frame(payment_frame, bg="white", pady=10)
+        
+        # Digital account id
+        account_frame = tk.Frame(self.digital_frame, bg="white")
+        account_frame.pack(fill='x', pady=5)
+        
+        account_label = tk.Label(account_frame, text="Email/Account ID:", width=15, anchor='w', bg="white")
+        account_label.pack(side=tk.LEFT)
+        
+        self.account_entry = tk.Entry(account_frame, width=25)
+        self.account_entry.pack(side=tk.LEFT)
+        
+        # Digital provider
+        provider_frame = tk.Frame(self.digital_frame, bg="white")
+        provider_frame.pack(fill='x', pady=5)
+        
+        provider_label = tk.Label(provider_frame, text="Provider:", width=15, anchor='w', bg="white")
+        provider_label.pack(side=tk.LEFT)
+        
+        self.provider_var = tk.StringVar(value="PayPal")
+        providers = ["PayPal", "Apple Pay", "Google Pay", "Other"]
+        provider_dropdown = ttk.Combobox(provider_frame, textvariable=self.provider_var, 
+                                    values=providers, state="readonly", width=12)
+        provider_dropdown.pack(side=tk.LEFT)
+        
+        # Summary
+        summary_frame = tk.Frame(form_container, bg="#f5f5f5", pady=15)
+        summary_frame.pack(fill='x', padx=20, pady=10)
+        
+        summary_label = tk.Label(summary_frame, text="Booking Summary", 
+                            font=("Helvetica", 12, "bold"), bg="#f5f5f5")
+        summary_label.pack(anchor='w')
+        
+        # Calculate prices based on selection
+        def update_price(*args):
+            ticket_type = self.ticket_type_var.get()
+            quantity = int(self.ticket_quantity_var.get())
+            
+            # Base prices
+            if ticket_type == "standard":
+                base_price = 100
+            elif ticket_type == "vip":
+                base_price = 250
+            else:  # weekend
+                base_price = 400
+            
+            total = base_price * quantity
+            
+            # Update labels
+            base_price_label.config(text="$" + str(base_price) + " × " + str(quantity))
+            subtotal_value_label.config(text="$" + str(total))
+            total_value_label.config(text="$" + str(total))
+        
+        # Track changes to update price
+        self.ticket_type_var.trace_add("write", update_price)
+        self.ticket_quantity_var.trace_add("write", update_price)
+        
+        # Price breakdown
+        price_frame = tk.Frame(summary_frame, bg="#f5f5f5", pady=5)
+        price_frame.pack(fill='x')
+        
+        base_label = tk.Label(price_frame, text="Base Price:", bg="#f5f5f5")
+        base_label.grid(row=0, column=0, sticky='w')
+        
+        base_price_label = tk.Label(price_frame, text="$100 × 1", bg="#f5f5f5")
+        base_price_label.grid(row=0, column=1, sticky='e')
+        
+        subtotal_label = tk.Label(price_frame, text="Subtotal:", bg="#f5f5f5")
+        subtotal_label.grid(row=1, column=0, sticky='w')
+        
+        subtotal_value_label = tk.Label(price_frame, text="$100", bg="#f5f5f5")
+        subtotal_value_label.grid(row=1, column=1, sticky='e')
+        
+        discount_label = tk.Label(price_frame, text="Discount:", bg="#f5f5f5")
+        discount_label.grid(row=2, column=0, sticky='w')
+        
+        discount_value_label = tk.Label(price_frame, text="$0", bg="#f5f5f5")
+        discount_value_label.grid(row=2, column=1, sticky='e')
+        
+        ttk.Separator(price_frame, orient='horizontal').grid(row=3, column=0, columnspan=2, sticky='ew', pady=5)
+        
+        total_label = tk.Label(price_frame, text="Total:", font=("Helvetica", 12, "bold"), bg="#f5f5f5")
+        total_label.grid(row=4, column=0, sticky='w')
+        
+        total_value_label = tk.Label(price_frame, text="$100", font=("Helvetica", 12, "bold"), bg="#f5f5f5")
+        total_value_label.grid(row=4, column=1, sticky='e')
+        
+        # Configure grid
+        price_frame.columnconfigure(0, weight=1)
+        price_frame.columnconfigure(1, weight=1)
+        
+        # Buttons
+        button_frame = tk.Frame(form_container, bg="white", pady=15)
+        button_frame.pack(fill='x', padx=20)
+        
+        # Back button
+        back_button = tk.Button(button_frame, text="Back to Events", 
+                            command=lambda: self.show_events_list(),
+                            bg="#f0f0f0", fg="black", width=15)
+        back_button.pack(side=tk.LEFT, padx=5)
+        
+        # Book button
+        book_button = tk.Button(button_frame, text="Complete Booking", 
+                            command=lambda: self.process_booking(event),
+                            bg="#4caf50", fg="white", width=15)
+        book_button.pack(side=tk.RIGHT, padx=5)
+        
+        # Initialize price
+        update_price()    
+    # Toggle between credit card and digital payment forms
+    def toggle_payment_form(self):
+        payment_type = self.payment_type_var.get()
+        
+        if payment_type == "credit_card":
+            self.digital_frame.pack_forget()
+            self.credit_card_frame.pack(fill='x')
+        else:
+            self.credit_card_frame.pack_forget()
+            self.digital_frame.pack(fill='x')
+    
+    # Process booking submission
+    def process_booking(self, event):
+        # Get form values
+        ticket_type = self.ticket_type_var.get()
+        quantity = int(self.ticket_quantity_var.get())
+        discount_code = self.discount_code_entry.get()
+        payment_type = self.payment_type_var.get()
+        
+        # Calculate prices
+        if ticket_type == "standard":
+            base_price = 100
+            ticket_type_id = 1
+        elif ticket_type == "vip":
+            base_price = 250
+            ticket_type_id = 2
+        else:  # weekend
+            base_price = 400
+            ticket_type_id = 3
+        
+        total_price = base_price * quantity
+        
+        # Check discount code
+        discount = None
+        if discount_code:
+            discount = self.data_manager.get_discount_by_code(discount_code)
+            if discount:
+                total_price = discount.apply_discount(total_price)
+        
+        # Check if enough tickets are available
+        if event.get_remaining_capacity() < quantity:
+            messagebox.showerror("Booking Error", "Not enough tickets available for this event")
+            return
+        
+        # Validate payment details before anything is saved
+        if payment_type == "credit_card":
+            # Get credit card details
+            card_number = self.card_num_entry.get()
+            expiry_date = self.expiry_entry.get()
+            card_type_str = self.card_type_var.get()
+            
+            # Validate card details
+            if not card_number or not expiry_date:
+                messagebox.showerror("Payment Error", "Please enter all card details")
+                return
+        else:
+            # Get digital payment details
+            account = self.account_entry.get()
+            provider = self.provider_var.get()
+            
+            # Validate details
+            if not account:
+                messagebox.showerror("Payment Error", "Please enter your account/email")
+                return
+        
+        # Save the booking, payment and tickets together in one transaction
+        with self.data_manager.transaction():
+            # Create booking ID
+            booking_id = self.data_manager.next_id('bookings')
+            
+            # Create booking
+            new_booking = Booking(
+                self.current_user.get_user_id(),
+                event.get_event_id(),
+                booking_id,
+                datetime.now(),
+                quantity,
+                total_price,
+                BookingStatus.CONFIRMED
+            )
+            
+            # Add booking to data manager
+            self.data_manager.add_booking(new_booking)
+            
+            # Process payment
+            payment_id = self.data_manager.next_id('payments')
+            
+            if payment_type == "credit_card":
+                # Map string to enum
+                card_type_map = {
+                    "VISA": CardType.VISA,
+                    "MASTERCARD": CardType.MASTERCARD,
+                    "AMEX": CardType.AMEX
+                }
+                
+                # Create credit card payment
+                payment = CreditCard(
+                    booking_id,
+                    payment_id,
+                    card_number,
+                    expiry_date,
+                    card_type_map[card_type_str],
+                    datetime.now(),
+                    PaymentTransactionStatus.SUCCESSFUL
+                )
+            else:
+                # Create auth code
+                auth_code = "AUTH-" + str(random.randint(10000, 99999))
+                
+                # Create digital payment
+                payment = DigitalPayment(
+                    booking_id,
+                    payment_id,
+                    random.randint(100000, 999999),  # Transaction ID
+                    account,
+                    auth_code,
+                    datetime.now(),
+                    PaymentTransactionStatus.SUCCESSFUL
+                )
+            
+            # Add payment to data manager
+            self.data_manager.add_payment(payment)
+            
+            # Create tickets
+            seat_prefix = "A" if ticket_type == "standard" else ("B" if ticket_type == "vip" else "C")
+            
+            for i in range(quantity):
+                seat_number = seat_prefix + str(100 + i)
+                
+                # Create ticket based on type
+                if ticket_type == "weekend":
+                    new_ticket = WeekendPackage(
+                        ticket_type_id,
+                        booking_id,
+                        f"T{booking_id}-{i+1}",
+                        seat_number,
+                        base_price,
+                        event.get_event_date(),
+                        random.randint(5001, 5999),  # Package ID
+                        "Standard Weekend",
+                        "Access to all weekend events, pit lane walk, driver autograph session",
+                        event.get_event_id()
+                    )
+                elif ticket_type == "vip":
+                    new_ticket = SeasonMembership(
+                        ticket_type_id,
+                        booking_id,
+                        f"T{booking_id}-{i+1}",
+                        seat_number,
+                        base_price,
+                        event.get_event_date(),
+                        random.randint(3001, 3999),  # Member ID
+                        self.current_user.get_user_name(),
+                        "VIP Lounge access, complimentary food and drinks",
+                        event.get_event_id()
+                    )
+                else:  # standard
+                    new_ticket = SingleRacePass(
+                        ticket_type_id,
+                        booking_id,
+                        f"T{booking_id}-{i+1}",
+                        seat_number,
+                        base_price,
+                        event.get_event_date(),
+                        random.randint(4001, 4999),  # Pass ID
+                        event.get_event_date().strftime("%Y-%m-%d"),
+                        "Standard race day access",
+                        event.get_event_id()
+                    )
+                
+                # Add ticket to data manager
+                self.data_manager.add_ticket(new_ticket)
+        
+        # Only confirm the booking once it is on disk
+        try:
+            self.data_manager.flush()
+        except Exception as e:
+            messagebox.showerror("Booking Error", "Your booking could not be saved: " + str(e))
+            return
+        
+        # Show success message
+        messagebox.showinfo("Booking Successful", 
+                           "Your booking is confirmed! " + str(quantity) + " tickets for " + 
+                           event.get_event_name() + " have been booked.")
+        
+        # Show bookings
+        self.show_my_bookings()
+    
+    # Show user's bookings
+    def show_my_bookings(self):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create bookings header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        bookings_label = tk.Label(header_frame, text="My Bookings", 
+                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        bookings_label.pack()
+        
+        subtitle_label = tk.Label(header_frame, text="View and manage your bookings", 
+                                font=("Helvetica", 10), bg=self.bg_color)
+        subtitle_label.pack()
+        
+        # Create scrollable bookings list
+        bookings_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        bookings_container.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Create canvas with scrollbar for bookings
+        canvas = tk.Canvas(bookings_container, bg=self.bg_color, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(bookings_container, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(
+                scrollregion=canvas.bbox("all")
+            )
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Get user's bookings
+        user_bookings = self.data_manager.get_bookings_by_user_id(self.current_user.get_user_id())
+        
+        if user_bookings:
+            # Bookings by date (newest first)
+            sorted_bookings = self.data_manager.latest_bookings(user_id=self.current_user.get_user_id())
+            
+            for booking in sorted_bookings:
+                # Get related event
+                event = self.data_manager.get_event_by_id(booking.get_event_id())
+                if not event:
+                    continue
+                
+                # Get related tickets
+                tickets = self.data_manager.get_tickets_by_booking_id(booking.get_booking_id())
+                
+                # Create booking card
+                booking_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
+                booking_card.pack(fill='x', padx=10, pady=10)
+                
+                # Booking details
+                booking_title = tk.Label(booking_card, 
+                                       text=event.get_event_name() + " (" + str(len(tickets)) + " tickets)",
+                                       font=("Helvetica", 14, "bold"), bg="white")
+                booking_title.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 10))
+                
+                # Event date and location
+                event_info = tk.Label(booking_card, 
+                                    text="Event: " + event.get_event_date().strftime("%B %d, %Y") + 
+                                    " at " + event.get_event_location(),
+                                    bg="white")
+                event_info.grid(row=1, column=0, sticky='w')
+                
+                # Booking date
+                booking_date = tk.Label(booking_card, 
+                                      text="Booked on: " + booking.get_booking_date().strftime("%B %d, %Y"),
+                                      bg="white")
+                booking_date.grid(row=2, column=0, sticky='w')
+                
+                # Total price
+                price_label = tk.Label(booking_card, 
+                                     text="Total Price: $" + str(booking.get_total_price()),
+                                     bg="white")
+                price_label.grid(row=3, column=0, sticky='w')
+                
+                # Status
+                status_label = tk.Label(booking_card, 
+                                      text="Status: " + booking.get_booking_status().value,
+                                      bg="white", fg="green" if booking.get_booking_status() == BookingStatus.CONFIRMED else "orange")
+                status_label.grid(row=4, column=0, sticky='w')
+                
+                # View tickets button
+                view_button = tk.Button(booking_card, text="View Tickets", 
+                                      bg=self.accent_color, fg="white",
+                                      command=lambda b=booking, e=event: self.show_booking_details(b, e))
+                view_button.grid(row=2, column=1, rowspan=2, padx=(20, 0))
+                
+                # Cancel button (only for upcoming events)
+                if event.get_event_date() > datetime.now() and booking.get_booking_status() != BookingStatus.CANCELLED:
+                    cancel_button = tk.Button(booking_card, text="Cancel Booking", 
+                                           bg="#ff6666", fg="white",
+                                           command=lambda b=booking: self.cancel_booking(b))
+                    cancel_button.grid(row=4, column=1, padx=(20, 0))
+                
+                # Set grid configuration
+                booking_card.columnconfigure(0, weight=1)
+                booking_card.columnconfigure(1, weight=0)
+        else:
+            no_bookings = tk.Label(scrollable_frame, text="You don't have any bookings yet", 
+                                 font=("Helvetica", 12), bg=self.bg_color)
+            no_bookings.pack(pady=50)
+    
+    # Show booking details
+    def show_booking_details(self, booking, event):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create booking details header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=10)
+        header_frame.pack(fill='x')
+        
+        details_label = tk.Label(header_frame, text="Booking Details", 
+                            font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        details_label.pack()
+        
+        event_label = tk.Label(header_frame, text=event.get_event_name(), 
+                            font=("Helvetica", 14), bg=self.bg_color)
+        event_label.pack()
+        
+        # Create main container
+        main_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        main_container.pack(fill='both', expand=True, padx=20, pady=5)
+        
+        # Create canvas with scrollbar
+        canvas = tk.Canvas(main_container, bg=self.bg_color, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
+        
+        # Configure canvas
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Pack canvas and scrollbar
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Create details container inside canvas
+        details_container = tk.Frame(canvas, bg="white", bd=1, relief=tk.SOLID)
+        
+        # Create window in canvas
+        canvas_window = canvas.create_window((0, 0), window=details_container, anchor="nw", width=canvas.winfo_width())
+        
+        # Function to update canvas scroll region
+        def update_scrollregion(event):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            
+        # Function to update details width
+        def update_details_width(event):
+            canvas_width = event.width
+            canvas.itemconfig(canvas_window, width=canvas_width)
+        
+        # Bind events
+        details_container.bind("<Configure>", update_scrollregion)
+        canvas.bind("<Configure>", update_details_width)
+        
+        # Bind mousewheel specifically to this canvas
+        def on_mousewheel(event):
+            if canvas.winfo_exists():
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        
+        canvas.bind("<MouseWheel>", on_mousewheel)
+        
+        # Booking summary
+        summary_frame = tk.Frame(details_container, bg="white", pady=15)
+        summary_frame.pack(fill='x', padx=20)
+        
+        # Booking ID
+        booking_id_label = tk.Label(summary_frame, text="Booking Reference: " + str(booking.get_booking_id()), 
+                                font=("Helvetica", 12, "bold"), bg="white")
+        booking_id_label.pack(anchor='w', pady=(0, 10))
+        
+        # Event details
+        event_date_label = tk.Label(summary_frame, text="Event Date: " + event.get_event_date().strftime("%B %d, %Y"), 
+                                bg="white")
+        event_date_label.pack(anchor='w', pady=2)
+        
+        event_location_label = tk.Label(summary_frame, text="Location: " + event.get_event_location(), 
+                                    bg="white")
+        event_location_label.pack(anchor='w', pady=2)
+        
+        # Booking details
+        booking_date_label = tk.Label(summary_frame, text="Booking Date: " + booking.get_booking_date().strftime("%B %d, %Y"), 
+                                    bg="white")
+        booking_date_label.pack(anchor='w', pady=2)
+        
+        ticket_count_label = tk.Label(summary_frame, text="Number of Tickets: " + str(booking.get_number_of_tickets()), 
+                                    bg="white")
+        ticket_count_label.pack(anchor='w', pady=2)
+        
+        total_price_label = tk.Label(summary_frame, text="Total Price: $" + str(booking.get_total_price()), 
+                                bg="white")
+        total_price_label.pack(anchor='w', pady=2)
+        
+        status_label = tk.Label(summary_frame, text="Status: " + booking.get_booking_status().value, 
+                            bg="white", fg="green" if booking.get_booking_status() == BookingStatus.CONFIRMED else "orange")
+        status_label.pack(anchor='w', pady=2)
+        
+        # Add separator
+        ttk.Separator(details_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
+        
+        # Tickets section
+        tickets_frame = tk.Frame(details_container, bg="white", pady=15)
+        tickets_frame.pack(fill='x', padx=20)
+        
+        tickets_label = tk.Label(tickets_frame, text="Your Tickets", 
+                            font=("Helvetica", 12, "bold"), bg="white")
+        tickets_label.pack(anchor='w', pady=(0, 10))
+        
+        # Get tickets for this booking
+        tickets = self.data_manager.get_tickets_by_booking_id(booking.get_booking_id())
+        
+        if tickets:
+            for i, ticket in enumerate(tickets):
+                ticket_frame = tk.Frame(tickets_frame, bg="#f9f9f9", bd=1, relief=tk.SOLID, padx=10, pady=10)
+                ticket_frame.pack(fill='x', pady=5)
+                
+                # Basic ticket info
+                ticket_id_label = tk.Label(ticket_frame, text="Ticket #" + str(i+1) + ": " + ticket.get_ticket_id(), 
+                                        font=("Helvetica", 11, "bold"), bg="#f9f9f9")
+                ticket_id_label.grid(row=0, column=0, sticky='w')
+                
+                # Determine ticket type and display appropriate info
+                if isinstance(ticket, WeekendPackage):
+                    ticket_type_label = tk.Label(ticket_frame, text="Weekend Package", 
+                                            bg="#f9f9f9", fg="#9c27b0")
+                    ticket_type_label.grid(row=0, column=1, sticky='e')
+                    
+                    benefits_label = tk.Label(ticket_frame, text="Benefits: " + ticket.get_package_benefits(), 
+                                        bg="#f9f9f9", wraplength=400, justify=tk.LEFT)
+                    benefits_label.grid(row=2, column=0, columnspan=2, sticky='w')
+                    
+                elif isinstance(ticket, SeasonMembership):
+                    ticket_type_label = tk.Label(ticket_frame, text="VIP Experience", 
+                                            bg="#f9f9f9", fg="#2196f3")
+                    ticket_type_label.grid(row=0, column=1, sticky='e')
+                    
+                    benefits_label = tk.Label(ticket_frame, text="Benefits: " + ticket.get_included_gifts(), 
+                                        bg="#f9f9f9", wraplength=400, justify=tk.LEFT)
+                    benefits_label.grid(row=2, column=0, columnspan=2, sticky='w')
+                    
+                elif isinstance(ticket, SingleRacePass):
+                    ticket_type_label = tk.Label(ticket_frame, text="Standard Ticket", 
+                                            bg="#f9f9f9", fg="#4caf50")
+                    ticket_type_label.grid(row=0, column=1, sticky='e')
+                    
+                    benefits_label = tk.Label(ticket_frame, text="Benefits: " + ticket.get_pass_benefits(), 
+                                        bg="#f9f9f9", wraplength=400, justify=tk.LEFT)
+                    benefits_label.grid(row=2, column=0, columnspan=2, sticky='w')
+                    
+                else:
+                    ticket_type_label = tk.Label(ticket_frame, text="Regular Ticket", 
+                                            bg="#f9f9f9")
+                    ticket_type_label.grid(row=0, column=1, sticky='e')
+                
+                # Common ticket info
+                seat_label = tk.Label(ticket_frame, text="Seat: " + ticket.get_seat_number(), 
+                                    bg="#f9f9f9")
+                seat_label.grid(row=1, column=0, sticky='w')
+                
+                price_label = tk.Label(ticket_frame, text="Price: $" + str(ticket.get_ticket_price()), 
+                                    bg="#f9f9f9")
+                price_label.grid(row=1, column=1, sticky='e')
+                
+                # Configure grid
+                ticket_frame.columnconfigure(0, weight=1)
+                ticket_frame.columnconfigure(1, weight=1)
+        else:
+            no_tickets = tk.Label(tickets_frame, text="No tickets found for this booking", 
+                                bg="white")
+            no_tickets.pack(pady=20)
+        
+        # Add separator
+        ttk.Separator(details_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
+        
+        # Payment section
+        payment_frame = tk.Frame(details_container, bg="white", pady=15)
+        payment_frame.pack(fill='x', padx=20)
+        
+        payment_label = tk.Label(payment_frame, text="Payment Information", 
+                            font=("Helvetica", 12, "bold"), bg="white")
+        payment_label.pack(anchor='w', pady=(0, 10))
+        
+        # Get payments for this booking
+        payments = self.data_manager.get_payments_by_booking_id(booking.get_booking_id())
+        
+        if payments:
+            for payment in payments:
+                payment_info_frame = tk.Frame(payment_frame, bg="#f9f9f9", bd=1, relief=tk.SOLID, padx=10, pady=10)
+                payment_info_frame.pack(fill='x', pady=5)
+                
+                # Payment ID
+                payment_id_label = tk.Label(payment_info_frame, text="Payment ID: " + str(payment.get_payment_id()), 
+                                        bg="#f9f9f9", font=("Helvetica", 11, "bold"))
+                payment_id_label.pack(anchor='w')
+                
+                # Payment type
+                payment_type_label = tk.Label(payment_info_frame, text="Payment Type: " + payment.get_payment_type().value, 
+                                        bg="#f9f9f9")
+                payment_type_label.pack(anchor='w')
+                
+                # Transaction date
+                transaction_date_label = tk.Label(payment_info_frame, 
+                                            text="Transaction Date: " + payment.get_transaction_date().strftime("%B %d, %Y %H:%M"), 
+                                            bg="#f9f9f9")
+                transaction_date_label.pack(anchor='w')
+                
+                # Transaction status
+                status_color = "green" if payment.get_transaction_status() == PaymentTransactionStatus.SUCCESSFUL else "red"
+                transaction_status_label = tk.Label(payment_info_frame, 
+                                                text="Status: " + payment.get_transaction_status().value, 
+                                                bg="#f9f9f9", fg=status_color)
+                transaction_status_label.pack(anchor='w')
+                
+                # Show additional details based on payment type
+                if isinstance(payment, CreditCard):
+                    card_info_label = tk.Label(payment_info_frame, 
+                                            text="Card: " + payment.get_card_type().value + " ending in " + 
+                                            payment.get_card_number()[-4:], 
+                                            bg="#f9f9f9")
+                    card_info_label.pack(anchor='w')
+                    
+                elif isinstance(payment, DigitalPayment):
+                    digital_info_label = tk.Label(payment_info_frame, 
+                                            text="Account: " + payment.get_account_identifier(),
+                                            bg="#f9f9f9")
+                    digital_info_label.pack(anchor='w')
+        else:
+            no_payment = tk.Label(payment_frame, text="No payment information found", 
+                                bg="white")
+            no_payment.pack(pady=20)
+        
+        # Buttons
+        button_frame = tk.Frame(details_container, bg="white", pady=15)
+        button_frame.pack(fill='x', padx=20)
+        
+        back_button = tk.Button(button_frame, text="Back to My Bookings", 
+                            command=lambda: self.show_my_bookings(),
+                            bg="#f0f0f0", fg="black", width=20)
+        back_button.pack(side=tk.LEFT)
+        
+        # Add print button
+        print_button = tk.Button(button_frame, text="Print Tickets", 
+                            command=lambda: messagebox.showinfo("Print Tickets", "Tickets sent to printer"),
+                            bg=self.accent_color, fg="white", width=20)
+        print_button.pack(side=tk.RIGHT)
+        
+    # Cancel a booking
+    def cancel_booking(self, booking):
+        # Ask for confirmation
+        confirm = messagebox.askyesno("Cancel Booking", 
+                                     "Are you sure you want to cancel this booking? This action cannot be undone.")
+        
+        if confirm:
+            # Update booking status
+            booking.set_booking_status(BookingStatus.CANCELLED)
+            self.data_manager.update_booking(booking)
+            
+            messagebox.showinfo("Booking Cancelled", "Your booking has been cancelled successfully")
+            
+            # Refresh bookings view
+            self.show_my_bookings()
+    
+    # Show account settings
+    def show_account_settings(self):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create account settings header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        settings_label = tk.Label(header_frame, text="Account Settings", 
+                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        settings_label.pack()
+        
+        subtitle_label = tk.Label(header_frame, text="Manage your account information", 
+                                font=("Helvetica", 10), bg=self.bg_color)
+        subtitle_label.pack()
+        
+        # Create settings container
+        settings_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
+        settings_container.pack(fill='both', expand=True, padx=100, pady=20)
+        
+        # User information section
+        user_info_frame = tk.Frame(settings_container, bg="white", pady=15)
+        user_info_frame.pack(fill='x', padx=20)
+        
+        user_info_label = tk.Label(user_info_frame, text="Your Information", 
+                                 font=("Helvetica", 12, "bold"), bg="white")
+        user_info_label.pack(anchor='w', pady=(0, 10))
+        
+        # Form fields - prepopulated with current user data
+        
+        # Name field
+        name_frame = tk.Frame(user_info_frame, bg="white")
+        name_frame.pack(fill='x', pady=10)
+        
+        name_label = tk.Label(name_frame, text="Full Name:", width=15, anchor='w', bg="white")
+        name_label.pack(side=tk.LEFT)
+        
+        self.settings_name_entry = tk.Entry(name_frame, width=40)
+        self.settings_name_entry.insert(0, self.current_user.get_user_name())
+        self.settings_name_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Email field
+        email_frame = tk.Frame(user_info_frame, bg="white")
+        email_frame.pack(fill='x', pady=10)
+        
+        email_label = tk.Label(email_frame, text="Email:", width=15, anchor='w', bg="white")
+        email_label.pack(side=tk.LEFT)
+        
+        self.settings_email_entry = tk.Entry(email_frame, width=40)
+        self.settings_email_entry.insert(0, self.current_user.get_user_email())
+        self.settings_email_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Get customer-specific fields if current user is a customer
+        if isinstance(self.current_user, Customer):
+            # Address field
+            address_frame = tk.Frame(user_info_frame, bg="white")
+            address_frame.pack(fill='x', pady=10)
+            
+            address_label = tk.Label(address_frame, text="Address:", width=15, anchor='w', bg="white")
+            address_label.pack(side=tk.LEFT)
+            
+            self.settings_address_entry = tk.Entry(address_frame, width=40)
+            self.settings_address_entry.insert(0, self.current_user.get_customer_address())
+            self.settings_address_entry.pack(side=tk.LEFT, padx=5)
+            
+            # Phone field
+            phone_frame = tk.Frame(user_info_frame, bg="white")
+            phone_frame.pack(fill='x', pady=10)
+            
+            phone_label = tk.Label(phone_frame, text="Phone:", width=15, anchor='w', bg="white")
+            phone_label.pack(side=tk.LEFT)
+            
+            self.settings_phone_entry = tk.Entry(phone_frame, width=40)
+            self.settings_phone_entry.insert(0, self.current_user.get_customer_phone())
+            self.settings_phone_entry.pack(side=tk.LEFT, padx=5)
+            
+            # Payment info field
+            payment_frame = tk.Frame(user_info_frame, bg="white")
+            payment_frame.pack(fill='x', pady=10)
+            
+            payment_label = tk.Label(payment_frame, text="Payment Info:", width=15, anchor='w', bg="white")
+            payment_label.pack(side=tk.LEFT)
+            
+            self.settings_payment_entry = tk.Entry(payment_frame, width=40)
+            self.settings_payment_entry.insert(0, self.current_user.get_payment_info())
+            self.settings_payment_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Password change section
+        password_section = tk.Frame(settings_container, bg="white", pady=15)
+        password_section.pack(fill='x', padx=20)
+        
+        # Add separator before password section
+        ttk.Separator(settings_container, orient='horizontal').pack(fill='x', padx=20, pady=10)
+        
+        password_label = tk.Label(password_section, text="Change Password", 
+                                font=("Helvetica", 12, "bold"), bg="white")
+        password_label.pack(anchor='w', pady=(0, 10))
+        
+        # Current password field
+        current_pw_frame = tk.Frame(password_section, bg="white")
+        current_pw_frame.pack(fill='x', pady=10)
+        
+        current_pw_label = tk.Label(current_pw_frame, text="Current Password:", width=15, anchor='w', bg="white")
+        current_pw_label.pack(side=tk.LEFT)
+        
+        self.current_pw_entry = tk.Entry(current_pw_frame, width=40, show="*")
+        self.current_pw_entry.pack(side=tk.LEFT, padx=5)
+        
+        # New password field
+        new_pw_frame = tk.Frame(password_section, bg="white")
+        new_pw_frame.pack(fill='x', pady=10)
+        
+        new_pw_label = tk.Label(new_pw_frame, text="New Password:", width=15, anchor='w', bg="white")
+        new_pw_label.pack(side=tk.LEFT)
+        
+        self.new_pw_entry = tk.Entry(new_pw_frame, width=40, show="*")
+        self.new_pw_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Confirm new password field
+        confirm_pw_frame = tk.Frame(password_section, bg="white")
+        confirm_pw_frame.pack(fill='x', pady=10)
+        
+        confirm_pw_label = tk.Label(confirm_pw_frame, text="Confirm Password:", width=15, anchor='w', bg="white")
+        confirm_pw_label.pack(side=tk.LEFT)
+        
+        self.confirm_pw_entry = tk.Entry(confirm_pw_frame, width=40, show="*")
+        self.confirm_pw_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Update buttons
+        button_frame = tk.Frame(settings_container, bg="white", pady=15)
+        button_frame.pack(fill='x', padx=20)
+        
+        # Update profile button
+        update_profile_button = tk.Button(button_frame, text="Update Profile", 
+                                       command=lambda: self.update_user_profile(),
+                                       bg=self.accent_color, fg="white",
+                                       width=15)
+        update_profile_button.pack(side=tk.LEFT, padx=5)
+        
+        # Change password button
+        change_pw_button = tk.Button(button_frame, text="Change Password", 
+                                   command=lambda: self.change_password(),
+                                   bg="#ff9800", fg="white",
+                                   width=15)
+        change_pw_button.pack(side=tk.LEFT, padx=5)
+    
+    # Update user profile
+    def update_user_profile(self):
+        # Get updated values
+        new_name = self.settings_name_entry.get()
+        new_email = self.settings_email_entry.get().strip()
+        
+        # Basic validation
+        if not new_name or not new_email:
+            messagebox.showerror("Update Error", "Name and email cannot be empty")
+            return
+        
+        # Check email format
+        if not re.match(r"[^@]+@[^@]+\.[^@]+", new_email):
+            messagebox.showerror("Update Error", "Invalid email format")
+            return
+        
+        # Check if email is already used by another user
+        if normalize_email(new_email) != normalize_email(self.current_user.get_user_email()):
+            existing_customer = self.data_manager.get_customer_by_email(new_email)
+            existing_admin = self.data_manager.get_admin_by_email(new_email)
+            
+            if (existing_customer and existing_customer.get_user_id() != self.current_user.get_user_id()) or \
+               (existing_admin and existing_admin.get_user_id() != self.current_user.get_user_id()):
+                messagebox.showerror("Update Error", "Email is already used by another account")
+                return
+        
+        # Check customer-specific fields before anything is changed
+        if isinstance(self.current_user, Customer):
+            new_address = self.settings_address_entry.get()
+            new_phone = self.settings_phone_entry.get()
+            new_payment_info = self.settings_payment_entry.get()
+            
+            if not new_address or not new_phone:
+                messagebox.showerror("Update Error", "Address and phone cannot be empty")
+                return
+        
+        # Update user information
+        self.current_user.set_user_name(new_name)
+        self.current_user.set_user_email(new_email)
+        
+        # Update customer-specific fields if applicable
+        if isinstance(self.current_user, Customer):
+            self.current_user.set_customer_address(new_address)
+            self.current_user.set_customer_phone(new_phone)
+            self.current_user.set_payment_info(new_payment_info)
+            
+            # Update in data manager
+            self.data_manager.update_customer(self.current_user)
+        elif isinstance(self.current_user, Admin):
+            # Update in data manager
+            self.data_manager.update_admin(self.current_user)
+        
+        messagebox.showinfo("Profile Updated", "Your profile has been updated successfully")
+    
+    # Change password
+    def change_password(self):
+        current_pw = self.current_pw_entry.get()
+        new_pw = self.new_pw_entry.get()
+        confirm_pw = self.confirm_pw_entry.get()
+        
+        # Validate inputs
+        if not current_pw or not new_pw or not confirm_pw:
+            messagebox.showerror("Password Error", "All password fields are required")
+            return
+        
+        # Check current password
+        if current_pw != self.current_user.get_user_password():
+            messagebox.showerror("Password Error", "Current password is incorrect")
+            return
+        
+        # Check if new passwords match
+        if new_pw != confirm_pw:
+            messagebox.showerror("Password Error", "New passwords do not match")
+            return
+        
+        # Update password
+        self.current_user.set_user_password(new_pw)
+        
+        # Update in data manager
+        if isinstance(self.current_user, Customer):
+            self.data_manager.update_customer(self.current_user)
+        elif isinstance(self.current_user, Admin):
+            self.data_manager.update_admin(self.current_user)
+        
+        messagebox.showinfo("Password Changed", "Your password has been changed successfully")
+        
+        # Clear password fields
+        self.current_pw_entry.delete(0, tk.END)
+        self.new_pw_entry.delete(0, tk.END)
+        self.confirm_pw_entry.delete(0, tk.END)
+    
+    # Show admin dashboard
+    def show_admin_dashboard(self):
+        # Clear any existing frames
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        
+        # Create dashboard frame
+        self.dashboard_frame = tk.Frame(self.root, bg=self.bg_color)
+        self.dashboard_frame.pack(expand=True, fill='both')
+        
+        # Create sidebar and main content area
+        self.sidebar_frame = tk.Frame(self.dashboard_frame, bg="#d4e6ff", width=200)
+        self.sidebar_frame.pack(side=tk.LEFT, fill='y')
+        
+        # Make sure sidebar maintains its width
+        self.sidebar_frame.pack_propagate(False)
+        
+        # Main content area
+        self.content_frame = tk.Frame(self.dashboard_frame, bg=self.bg_color)
+        self.content_frame.pack(side=tk.RIGHT, expand=True, fill='both')
+        
+        # Add admin info to sidebar
+        admin_info_frame = tk.Frame(self.sidebar_frame, bg="#d4e6ff", pady=20)
+        admin_info_frame.pack(fill='x')
+        
+        # Admin avatar (placeholder)
+        avatar_label = tk.Label(admin_info_frame, text="👨‍💼", font=("Helvetica", 24), bg="#d4e6ff")
+        avatar_label.pack()
+        
+        # Admin name
+        name_label = tk.Label(admin_info_frame, text=self.current_user.get_user_name(), 
+                            font=("Helvetica", 12, "bold"), bg="#d4e6ff")
+        name_label.pack(pady=(5, 0))
+        
+        # Admin role
+        role_label = tk.Label(admin_info_frame, text=self.current_user.get_admin_role(), 
+                            font=("Helvetica", 10), bg="#d4e6ff")
+        role_label.pack()
+        
+        # Add separator
+        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
+        
+        # Navigation menu
+        menu_font = font.Font(family='Helvetica', size=11)
+        
+        # Dashboard button (selected by default)
+        dashboard_btn = tk.Button(self.sidebar_frame, text="Dashboard", font=menu_font,
+                               bg="#4da6ff", fg="white", bd=0, pady=8,
+                               command=lambda: self.show_admin_dashboard_content())
+        dashboard_btn.pack(fill='x', pady=2)
+        
+        # Manage events button
+        events_btn = tk.Button(self.sidebar_frame, text="Manage Events", font=menu_font,
+                            bg="#d4e6ff", fg="black", bd=0, pady=8,
+                            command=lambda: self.show_manage_events())
+        events_btn.pack(fill='x', pady=2)
+        
+        # Manage users button
+        users_btn = tk.Button(self.sidebar_frame, text="Manage Users", font=menu_font,
+                           bg="#d4e6ff", fg="black", bd=0, pady=8,
+                           command=lambda: self.show_manage_users())
+        users_btn.pack(fill='x', pady=2)
+        
+        # Manage discounts button
+        discounts_btn = tk.Button(self.sidebar_frame, text="Manage Discounts", font=menu_font,
+                               bg="#d4e6ff", fg="black", bd=0, pady=8,
+                               command=lambda: self.show_manage_discounts())
+        discounts_btn.pack(fill='x', pady=2)
+        
+        # Booking reports button
+        reports_btn = tk.Button(self.sidebar_frame, text="Booking Reports", font=menu_font,
+                             bg="#d4e6ff", fg="black", bd=0, pady=8,
+                             command=lambda: self.show_booking_reports())
+        reports_btn.pack(fill='x', pady=2)
+        
+        # Add separator
+        ttk.Separator(self.sidebar_frame, orient='horizontal').pack(fill='x', pady=10)
+        
+        # Logout button at bottom of sidebar
+        logout_btn = tk.Button(self.sidebar_frame, text="Logout", font=menu_font,
+                            bg="#ff6666", fg="white", bd=0, pady=8,
+                            command=lambda: self.logout())
+        logout_btn.pack(fill='x', pady=2, side=tk.BOTTOM)
+        
+        # Show default admin dashboard content
+        self.show_admin_dashboard_content()
+    
+    # Set the text of a label once a collection has finished loading
+    # Until then the label keeps its placeholder and is checked again shortly
+    def show_when_loaded(self, file_key, label, get_text):
+        if not label.winfo_exists():
+            return
+        if self.data_manager.is_loaded(file_key):
+            label.config(text=get_text())
+        else:
+            self.root.after(50, lambda: self.show_when_loaded(file_key, label, get_text))
+    
+    # Admin dashboard content
+    def show_admin_dashboard_content(self):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create welcome header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        welcome_label = tk.Label(header_frame, text="Admin Dashboard", 
+                              font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        welcome_label.pack()
+        
+        date_label = tk.Label(header_frame, text="Today: " + datetime.now().strftime("%B %d, %Y"), 
+                           font=("Helvetica", 10), bg=self.bg_color)
+        date_label.pack()
+        
+        # Create dashboard stats
+        stats_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        stats_frame.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        # Configure grid
+        stats_frame.columnconfigure(0, weight=1)
+        stats_frame.columnconfigure(1, weight=1)
+        stats_frame.columnconfigure(2, weight=1)
+        stats_frame.rowconfigure(0, weight=1)
+        stats_frame.rowconfigure(1, weight=1)
+        
+        # Stat 1: Total Events
+        stat1 = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        stat1.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        
+        stat1_title = tk.Label(stat1, text="Total Events", font=("Helvetica", 14, "bold"), bg="white")
+        stat1_title.pack()
+        
+        stat1_value = tk.Label(stat1, text="...", 
+                            font=("Helvetica", 24), bg="white", fg="#2196f3")
+        stat1_value.pack()
+        self.show_when_loaded('events', stat1_value, lambda: str(len(self.data_manager.events)))
+        
+        # Stat 2: Total Bookings
+        stat2 = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        stat2.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        
+        stat2_title = tk.Label(stat2, text="Total Bookings", font=("Helvetica", 14, "bold"), bg="white")
+        stat2_title.pack()
+        
+        stat2_value = tk.Label(stat2, text="...", 
+                            font=("Helvetica", 24), bg="white", fg="#4caf50")
+        stat2_value.pack()
+        self.show_when_loaded('bookings', stat2_value, lambda: str(len(self.data_manager.bookings) + sum(summary["bookings"] for summary in self.data_manager.get_archive_summaries().values())))
+        
+        # Stat 3: Total Users
+        stat3 = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        stat3.grid(row=0, column=2, padx=10, pady=10, sticky="nsew")
+        
+        stat3_title = tk.Label(stat3, text="Total Users", font=("Helvetica", 14, "bold"), bg="white")
+        stat3_title.pack()
+        
+        stat3_value = tk.Label(stat3, text="...", 
+                            font=("Helvetica", 24), bg="white", fg="#ff9800")
+        stat3_value.pack()
+        self.show_when_loaded('customers', stat3_value, lambda: str(len(self.data_manager.customers)))
+        
+        # Upcoming events section
+        upcoming_frame = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        upcoming_frame.grid(row=1, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
+        
+        upcoming_title = tk.Label(upcoming_frame, text="Upcoming Events", 
+                               font=("Helvetica", 14, "bold"), bg="white")
+        upcoming_title.pack(anchor='w')
+        
+        ttk.Separator(upcoming_frame, orient='horizontal').pack(fill='x', pady=5)
+        
+        # Get upcoming events
+        upcoming_events = self.data_manager.upcoming_events(5)
+        
+        if upcoming_events:
+            for event in upcoming_events:
+                event_frame = tk.Frame(upcoming_frame, bg="white", pady=5)
+                event_frame.pack(fill='x')
+                
+                event_name = tk.Label(event_frame, text=event.get_event_name(), 
+                                   font=("Helvetica", 11), bg="white")
+                event_name.pack(side=tk.LEFT, anchor='w')
+                
+                event_date = tk.Label(event_frame, text=event.get_event_date().strftime("%B %d, %Y"), 
+                                   bg="white", fg="gray")
+                event_date.pack(side=tk.RIGHT, anchor='e')
+                
+                ttk.Separator(upcoming_frame, orient='horizontal').pack(fill='x', pady=2)
+        else:
+            no_events = tk.Label(upcoming_frame, text="No upcoming events", bg="white")
+            no_events.pack(pady=10)
+        
+        # Quick actions
+        actions_frame = tk.Frame(stats_frame, bg="white", padx=15, pady=15, bd=1, relief=tk.SOLID)
+        actions_frame.grid(row=1, column=2, padx=10, pady=10, sticky="nsew")
+        
+        actions_title = tk.Label(actions_frame, text="Quick Actions", 
+                              font=("Helvetica", 14, "bold"), bg="white")
+        actions_title.pack(anchor='w')
+        
+        ttk.Separator(actions_frame, orient='horizontal').pack(fill='x', pady=5)
+        
+        # Action buttons
+        add_event_btn = tk.Button(actions_frame, text="Add New Event", 
+                               bg="#4caf50", fg="white", width=20,
+                               command=lambda: self.show_add_event_form())
+        add_event_btn.pack(pady=5)
+        
+        view_bookings_btn = tk.Button(actions_frame, text="View All Bookings", 
+                                   bg="#2196f3", fg="white", width=20,
+                                   command=lambda: self.show_booking_reports())
+        view_bookings_btn.pack(pady=5)
+        
+        add_discount_btn = tk.Button(actions_frame, text="Add New Discount", 
+                                  bg="#ff9800", fg="white", width=20,
+                                  command=lambda: self.show_add_discount_form())
+        add_discount_btn.pack(pady=5)
+    
+    # Manage events
+    # Events can be filtered by location and dates, see create_event_filters
+    def show_manage_events(self, location=None, start=None, end=None):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        events_label = tk.Label(header_frame, text="Manage Events", 
+                             font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        events_label.pack()
+        
+        subtitle_label = tk.Label(header_frame, text="Add, edit, or delete events", 
+                               font=("Helvetica", 10), bg=self.bg_color)
+        subtitle_label.pack()
+        
+        # Add event button
+        add_btn = tk.Button(header_frame, text="Add New Event", 
+                         bg="#4caf50", fg="white", padx=10, pady=5,
+                         command=lambda: self.show_add_event_form())
+        add_btn.pack(pady=10)
+        
+        self.create_event_filters(location, start, end, self.show_manage_events)
+        
+        # Create scrollable events list
+        events_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        events_container.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Create canvas with scrollbar for events
+        canvas = tk.Canvas(events_container, bg=self.bg_color, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(events_container, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(
+                scrollregion=canvas.bbox("all")
+            )
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Get the events in date order
+        events_query = self.data_manager.query(Event).between('event_date', start, end).order_by('event_date')
+        if location is not None:
+            events_query.where(event_location=location)
+        sorted_events = events_query.all()
+        
+        if sorted_events:
+            for event in sorted_events:
+                # Create event card
+                event_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
+                event_card.pack(fill='x', padx=10, pady=10)
+                
+                # Event details
+                event_name = tk.Label(event_card, text=event.get_event_name(), 
+                                   font=("Helvetica", 14, "bold"), bg="white")
+                event_name.grid(row=0, column=0, sticky='w', pady=(0, 5))
+                
+                event_id = tk.Label(event_card, text="ID: " + str(event.get_event_id()), 
+                                 bg="white", fg="gray")
+                event_id.grid(row=0, column=1, sticky='e')
+                
+                event_date = tk.Label(event_card, text="Date: " + event.get_event_date().strftime("%B %d, %Y"), 
+                                   bg="white")
+                event_date.grid(row=1, column=0, sticky='w')
+                
+                event_location = tk.Label(event_card, text="Location: " + event.get_event_location(), 
+                                       bg="white")
+                event_location.grid(row=2, column=0, sticky='w')
+                
+                event_capacity = tk.Label(event_card, 
+                                       text="Available Tickets: " + str(event.get_remaining_capacity()) + 
+                                       " of " + str(event.get_event_capacity()),
+                                       bg="white")
+                event_capacity.grid(row=3, column=0, sticky='w')
+                
+                # Edit button
+                edit_button = tk.Button(event_card, text="Edit", 
+                                     bg=self.accent_color, fg="white",
+                                     command=lambda e=event: self.show_edit_event_form(e))
+                edit_button.grid(row=1, column=1, padx=(20, 0))
+                
+                # Delete button
+                delete_button = tk.Button(event_card, text="Delete", 
+                                       bg="#ff6666", fg="white",
+                                       command=lambda e=event: self.delete_event(e))
+                delete_button.grid(row=2, column=1, padx=(20, 0))
+                
+                # Set grid configuration
+                event_card.columnconfigure(0, weight=1)
+                event_card.columnconfigure(1, weight=0)
+        else:
+            no_events = tk.Label(scrollable_frame, text="No events available", 
+                              font=("Helvetica", 12), bg=self.bg_color)
+            no_events.pack(pady=50)
+    
+    # Show add event form
+    def show_add_event_form(self):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        add_label = tk.Label(header_frame, text="Add New Event", 
+                          font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        add_label.pack()
+        
+        # Create form container
+        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
+        form_container.pack(fill='both', expand=True, padx=100, pady=20)
+        
+        # Event name field
+        name_frame = tk.Frame(form_container, bg="white", pady=10)
+        name_frame.pack(fill='x', padx=20)
+        
+        name_label = tk.Label(name_frame, text="Event Name:", width=15, anchor='w', bg="white")
+        name_label.pack(side=tk.LEFT)
+        
+        self.event_name_entry = tk.Entry(name_frame, width=40)
+        self.event_name_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Event ID field
+        id_frame = tk.Frame(form_container, bg="white", pady=10)
+        id_frame.pack(fill='x', padx=20)
+        
+        id_label = tk.Label(id_frame, text="Event ID:", width=15, anchor='w', bg="white")
+        id_label.pack(side=tk.LEFT)
+        
+        # The event ID is taken from the sequence when the event is saved,
+        # so a cancelled form never uses one up
+        self.event_id_entry = tk.Entry(id_frame, width=20)
+        self.event_id_entry.insert(0, "Assigned on save")
+        self.event_id_entry.config(state='readonly')
+        self.event_id_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Event date field
+        date_frame = tk.Frame(form_container, bg="white", pady=10)
+        date_frame.pack(fill='x', padx=20)
+        
+        date_label = tk.Label(date_frame, text="Event Date (YYYY-MM-DD):", width=15, anchor='w', bg="white")
+        date_label.pack(side=tk.LEFT)
+        
+        self.event_date_entry = tk.Entry(date_frame, width=15)
+        self.event_date_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Event location field
+        location_frame = tk.Frame(form_container, bg="white", pady=10)
+        location_frame.pack(fill='x', padx=20)
+        
+        location_label = tk.Label(location_frame, text="Location:", width=15, anchor='w', bg="white")
+        location_label.pack(side=tk.LEFT)
+        
+        self.event_location_entry = tk.Entry(location_frame, width=40)
+        self.event_location_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Capacity field
+        capacity_frame = tk.Frame(form_container, bg="white", pady=10)
+        capacity_frame.pack(fill='x', padx=20)
+        
+        capacity_label = tk.Label(capacity_frame, text="Capacity:", width=15, anchor='w', bg="white")
+        capacity_label.pack(side=tk.LEFT)
+        
+        self.event_capacity_entry = tk.Entry(capacity_frame, width=10)
+        self.event_capacity_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Buttons
+        button_frame = tk.Frame(form_container, bg="white", pady=20)
+        button_frame.pack(fill='x', padx=20)
+        
+        # Back button
+        back_button = tk.Button(button_frame, text="Cancel", 
+                             command=lambda: self.show_manage_events(),
+                             bg="#f0f0f0", fg="black", width=10)
+        back_button.pack(side=tk.LEFT, padx=5)
+        
+        # Save button
+        save_button = tk.Button(button_frame, text="Save Event", 
+                             command=lambda: self.save_event(),
+                             bg="#4caf50", fg="white", width=10)
+        save_button.pack(side=tk.RIGHT, padx=5)
+    
+    # Save new event
+    def save_event(self):
+        # Get form values
+        name = self.event_name_entry.get()
+        date_str = self.event_date_entry.get()
+        location = self.event_location_entry.get()
+        capacity_str = self.event_capacity_entry.get()
+        
+        # Validate inputs
+        if not name or not date_str or not location or not capacity_str:
+            messagebox.showerror("Input Error", "All fields are required")
+            return
+        
+        try:
+            # Parse date
+            date_parts = date_str.split('-')
+            if len(date_parts) != 3:
+                raise ValueError("Invalid date format")
+                
+            year, month, day = map(int, date_parts)
+            date = datetime(year, month, day)
+            
+            # Parse capacity
+            capacity = int(capacity_str)
+            if capacity <= 0:
+                raise ValueError("Capacity must be positive")
+                
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        
+        # Take the event ID now the form is valid, and check it is free
+        event_id = self.data_manager.next_id('events')
+        if self.data_manager.get_event_by_id(event_id):
+            messagebox.showerror("Input Error", "Event ID already exists")
+            return
+        
+        # Create new event
+        new_event = Event(name, event_id, date, location, capacity)
+        
+        # Add to data manager
+        self.data_manager.add_event(new_event)
+        
+        messagebox.showinfo("Event Added", "The event has been added successfully")
+        
+        # Return to events list
+        self.show_manage_events()
+    
+    # Show edit event form
+    def show_edit_event_form(self, event):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        edit_label = tk.Label(header_frame, text="Edit Event", 
+                           font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        edit_label.pack()
+        
+        # Create form container
+        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
+        form_container.pack(fill='both', expand=True, padx=100, pady=20)
+        
+        # Event name field
+        name_frame = tk.Frame(form_container, bg="white", pady=10)
+        name_frame.pack(fill='x', padx=20)
+        
+        name_label = tk.Label(name_frame, text="Event Name:", width=15, anchor='w', bg="white")
+        name_label.pack(side=tk.LEFT)
+        
+        self.event_name_entry = tk.Entry(name_frame, width=40)
+        self.event_name_entry.insert(0, event.get_event_name())
+        self.event_name_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Event ID field
+        id_frame = tk.Frame(form_container, bg="white", pady=10)
+        id_frame.pack(fill='x', padx=20)
+        
+        id_label = tk.Label(id_frame, text="Event ID:", width=15, anchor='w', bg="white")
+        id_label.pack(side=tk.LEFT)
+        
+        self.event_id_entry = tk.Entry(id_frame, width=10)
+        self.event_id_entry.insert(0, str(event.get_event_id()))
+        self.event_id_entry.config(state='readonly')
+        self.event_id_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Event date field
+        date_frame = tk.Frame(form_container, bg="white", pady=10)
+        date_frame.pack(fill='x', padx=20)
+        
+        date_label = tk.Label(date_frame, text="Event Date (YYYY-MM-DD):", width=15, anchor='w', bg="white")
+        date_label.pack(side=tk.LEFT)
+        
+        self.event_date_entry = tk.Entry(date_frame, width=15)
+        self.event_date_entry.insert(0, event.get_event_date().strftime("%Y-%m-%d"))
+        self.event_date_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Event location field
+        location_frame = tk.Frame(form_container, bg="white", pady=10)
+        location_frame.pack(fill='x', padx=20)
+        
+        location_label = tk.Label(location_frame, text="Location:", width=15, anchor='w', bg="white")
+        location_label.pack(side=tk.LEFT)
+        
+        self.event_location_entry = tk.Entry(location_frame, width=40)
+        self.event_location_entry.insert(0, event.get_event_location())
+        self.event_location_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Capacity field
+        capacity_frame = tk.Frame(form_container, bg="white", pady=10)
+        capacity_frame.pack(fill='x', padx=20)
+        
+        capacity_label = tk.Label(capacity_frame, text="Capacity:", width=15, anchor='w', bg="white")
+        capacity_label.pack(side=tk.LEFT)
+        
+        self.event_capacity_entry = tk.Entry(capacity_frame, width=10)
+        self.event_capacity_entry.insert(0, str(event.get_event_capacity()))
+        self.event_capacity_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Buttons
+        button_frame = tk.Frame(form_container, bg="white", pady=20)
+        button_frame.pack(fill='x', padx=20)
+        
+        # Back button
+        back_button = tk.Button(button_frame, text="Cancel", 
+                             command=lambda: self.show_manage_events(),
+                             bg="#f0f0f0", fg="black", width=10)
+        back_button.pack(side=tk.LEFT, padx=5)
+        
+        # Update button
+        update_button = tk.Button(button_frame, text="Update Event", 
+                               command=lambda: self.update_event(event),
+                               bg="#4caf50", fg="white", width=10)
+        update_button.pack(side=tk.RIGHT, padx=5)
+    
+    # Update existing event
+    def update_event(self, event):
+        # Get form values
+        name = self.event_name_entry.get()
+        date_str = self.event_date_entry.get()
+        location = self.event_location_entry.get()
+        capacity_str = self.event_capacity_entry.get()
+        
+        # Validate inputs
+        if not name or not date_str or not location or not capacity_str:
+            messagebox.showerror("Input Error", "All fields are required")
+            return
+        
+        try:
+            # Parse date
+            date_parts = date_str.split('-')
+            if len(date_parts) != 3:
+                raise ValueError("Invalid date format")
+                
+            year, month, day = map(int, date_parts)
+            date = datetime(year, month, day)
+            
+            # Parse capacity
+            capacity = int(capacity_str)
+            if capacity <= 0:
+                raise ValueError("Capacity must be positive")
+                
+            # Check if new capacity is less than tickets sold
+            tickets_sold = event.get_event_capacity() - event.get_remaining_capacity()
+            if capacity < tickets_sold:
+                raise ValueError("New capacity cannot be less than tickets already sold")
+                
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        
+        # Update event
+        event.set_event_name(name)
+        event.set_event_date(date)
+        event.set_event_location(location)
+        event.set_event_capacity(capacity)
+        
+        # Update in data manager
+        self.data_manager.update_event(event)
+        
+        messagebox.showinfo("Event Updated", "The event has been updated successfully")
+        
+        # Return to events list
+        self.show_manage_events()
+    
+    # Delete event
+    def delete_event(self, event):
+        # Check if there are bookings for this event
+        event_booking = self.data_manager.query(Booking).where(event_id=event.get_event_id()).first()
+        
+        if event_booking:
+            messagebox.showerror("Delete Error", 
+                              "Cannot delete this event because there are bookings associated with it")
+            return
+        
+        # Ask for confirmation
+        confirm = messagebox.askyesno("Delete Event", 
+                                    "Are you sure you want to delete this event? This action cannot be undone.")
+        
+        if confirm:
+            # Delete event
+            self.data_manager.delete_event(event.get_event_id())
+            
+            messagebox.showinfo("Event Deleted", "The event has been deleted successfully")
+            
+            # Refresh events list
+            self.show_manage_events()
+    
+    # Manage users
+    # With search only the customers matching it are listed, best first
+    def show_manage_users(self, search=None):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        users_label = tk.Label(header_frame, text="Manage Users", 
+                            font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        users_label.pack()
+        
+        subtitle_label = tk.Label(header_frame, text="View and manage user accounts", 
+                               font=("Helvetica", 10), bg=self.bg_color)
+        subtitle_label.pack()
+        
+        # Search box, matches names, emails, phone numbers and addresses
+        search_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        search_frame.pack(fill='x', padx=20)
+        
+        search_label = tk.Label(search_frame, text="Search:", bg=self.bg_color)
+        search_label.pack(side=tk.LEFT)
+        
+        search_entry = tk.Entry(search_frame, width=40)
+        search_entry.pack(side=tk.LEFT, padx=(5, 15))
+        if search:
+            search_entry.insert(0, search)
+        search_entry.bind("<Return>", lambda e: self.show_manage_users(search_entry.get().strip() or None))
+        search_entry.focus_set()
+        
+        search_btn = tk.Button(search_frame, text="Search", bg=self.accent_color, fg="white", padx=10, 
+                            command=lambda: self.show_manage_users(search_entry.get().strip() or None))
+        search_btn.pack(side=tk.LEFT)
+        
+        clear_btn = tk.Button(search_frame, text="Clear", bg="#f0f0f0", fg="black", padx=10, 
+                           command=lambda: self.show_manage_users())
+        clear_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Create scrollable users list
+        users_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        users_container.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Create canvas with scrollbar for users
+        canvas = tk.Canvas(users_container, bg=self.bg_color, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(users_container, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.bg_color)
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(
+                scrollregion=canvas.bbox("all")
+            )
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        if search:
+            # Best matches first
+            sorted_customers = self.data_manager.search_customers(search)
+            
+            results_label = tk.Label(search_frame, text=str(len(sorted_customers)) + " matching users" + 
+                                  (" (best " + str(SEARCH_LIMIT) + " shown)" if len(sorted_customers) == SEARCH_LIMIT else ""), 
+                                  bg=self.bg_color, fg="gray")
+            results_label.pack(side=tk.LEFT, padx=10)
+        else:
+            # Get sorted customers by name
+            sorted_customers = sorted(self.data_manager.customers, key=lambda c: c.get_user_name())
+        
+        if sorted_customers:
+            for customer in sorted_customers:
+                # Create user card
+                user_card = tk.Frame(scrollable_frame, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
+                user_card.pack(fill='x', padx=10, pady=10)
+                
+                # User details
+                user_name = tk.Label(user_card, text=customer.get_user_name(), 
+                                  font=("Helvetica", 14, "bold"), bg="white")
+                user_name.grid(row=0, column=0, sticky='w', pady=(0, 5))
+                
+                user_id = tk.Label(user_card, text="ID: " + str(customer.get_user_id()), 
+                                bg="white", fg="gray")
+                user_id.grid(row=0, column=1, sticky='e')
+                
+                user_email = tk.Label(user_card, text="Email: " + customer.get_user_email(), 
+                                   bg="white")
+                user_email.grid(row=1, column=0, sticky='w')
+                
+                user_phone = tk.Label(user_card, text="Phone: " + str(customer.get_customer_phone()), 
+                                   bg="white")
+                user_phone.grid(row=2, column=0, sticky='w')
+                
+                user_address = tk.Label(user_card, text="Address: " + customer.get_customer_address(), 
+                                     bg="white")
+                user_address.grid(row=3, column=0, sticky='w')
+                
+                user_registered = tk.Label(user_card, 
+                                        text="Registered: " + customer.get_registration_date().strftime("%B %d, %Y"),
+                                        bg="white")
+                user_registered.grid(row=4, column=0, sticky='w')
+                
+                # View bookings button
+                bookings_button = tk.Button(user_card, text="View Bookings", 
+                                         bg=self.accent_color, fg="white",
+                                         command=lambda c=customer: self.show_user_bookings(c))
+                bookings_button.grid(row=1, column=1, padx=(20, 0))
+                
+                # Delete button
+                delete_button = tk.Button(user_card, text="Delete User", 
+                                       bg="#ff6666", fg="white",
+                                       command=lambda c=customer: self.delete_user(c))
+                delete_button.grid(row=2, column=1, padx=(20, 0))
+                
+                # Set grid configuration
+                user_card.columnconfigure(0, weight=1)
+                user_card.columnconfigure(1, weight=0)
+        else:
+            no_users = tk.Label(scrollable_frame, text="No users match your search" if search else "No users available", 
+                             font=("Helvetica", 12), bg=self.bg_color)
+            no_users.pack(pady=50)
+    
+    # Show user's bookings
+    def show_user_bookings(self, customer):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        bookings_label = tk.Label(header_frame, text="Bookings for " + customer.get_user_name(), 
+                               font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        bookings_label.pack()
+        
+        # Back button
+        back_button = tk.Button(header_frame, text="Back to Users", 
+                             command=lambda: self.show_manage_users(),
+                             bg="#f0f0f0", fg="black")
+        back_button.pack(pady=10)
+        
+        # Create scrollable bookings list
+        bookings_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        bookings_container.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Get user's bookings by date (newest first)
+        sorted_bookings = self.data_manager.query(Booking).where(user_id=customer.get_user_id()).order_by('booking_date', descending=True).all()
+        
+        if sorted_bookings:
+            for booking in sorted_bookings:
+                # Get related event
+                event = self.data_manager.get_event_by_id(booking.get_event_id())
+                if not event:
+                    continue
+                
+                # Create booking card
+                booking_card = tk.Frame(bookings_container, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
+                booking_card.pack(fill='x', padx=10, pady=10)
+                
+                # Booking details
+                booking_title = tk.Label(booking_card, 
+                                      text="Booking ID: " + str(booking.get_booking_id()),
+                                      font=("Helvetica", 14, "bold"), bg="white")
+                booking_title.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 10))
+                
+                # Event name
+                event_name = tk.Label(booking_card, text="Event: " + event.get_event_name(), bg="white")
+                event_name.grid(row=1, column=0, sticky='w')
+                
+                # Event date and location
+                event_info = tk.Label(booking_card, 
+                                   text="Date: " + event.get_event_date().strftime("%B %d, %Y") + 
+                                   " at " + event.get_event_location(),
+                                   bg="white")
+                event_info.grid(row=2, column=0, sticky='w')
+                
+                # Booking date
+                booking_date = tk.Label(booking_card, 
+                                     text="Booked on: " + booking.get_booking_date().strftime("%B %d, %Y"),
+                                     bg="white")
+                booking_date.grid(row=3, column=0, sticky='w')
+                
+                # Ticket count
+                tickets_label = tk.Label(booking_card, text="Tickets: " + str(booking.get_number_of_tickets()), 
+                                      bg="white")
+                tickets_label.grid(row=4, column=0, sticky='w')
+                
+                # Total price
+                price_label = tk.Label(booking_card, text="Total Price: $" + str(booking.get_total_price()), 
+                                    bg="white")
+                price_label.grid(row=5, column=0, sticky='w')
+                
+                # Status
+                status_label = tk.Label(booking_card, 
+                                     text="Status: " + booking.get_booking_status().value,
+                                     bg="white", 
+                                     fg="green" if booking.get_booking_status() == BookingStatus.CONFIRMED 
+                                     else "orange" if booking.get_booking_status() == BookingStatus.PENDING
+                                     else "red")
+                status_label.grid(row=6, column=0, sticky='w')
+                
+                # Set grid configuration
+                booking_card.columnconfigure(0, weight=1)
+                booking_card.columnconfigure(1, weight=0)
+        else:
+            no_bookings = tk.Label(bookings_container, text="This user has no bookings", 
+                                font=("Helvetica", 12), bg=self.bg_color)
+            no_bookings.pack(pady=50)
+    
+    # Delete user
+    def delete_user(self, customer):
+        # Check if there are bookings for this user
+        user_booking = self.data_manager.query(Booking).where(user_id=customer.get_user_id()).first()
+        
+        if user_booking:
+            messagebox.showerror("Delete Error", 
+                              "Cannot delete this user because they have bookings associated with them")
+            return
+        
+        # Ask for confirmation
+        confirm = messagebox.askyesno("Delete User", 
+                                    "Are you sure you want to delete this user? This action cannot be undone.")
+        
+        if confirm:
+            # Delete user
+            self.data_manager.delete_customer(customer.get_user_id())
+            
+            messagebox.showinfo("User Deleted", "The user has been deleted successfully")
+            
+            # Refresh users list
+            self.show_manage_users()
+    
+    # Manage discounts
+    def show_manage_discounts(self):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        discounts_label = tk.Label(header_frame, text="Manage Discounts", 
+                                font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        discounts_label.pack()
+        
+        subtitle_label = tk.Label(header_frame, text="Add, edit, or delete discount codes", 
+                               font=("Helvetica", 10), bg=self.bg_color)
+        subtitle_label.pack()
+        
+        # Add discount button
+        add_btn = tk.Button(header_frame, text="Add New Discount", 
+                         bg="#4caf50", fg="white", padx=10, pady=5,
+                         command=lambda: self.show_add_discount_form())
+        add_btn.pack(pady=10)
+        
+        # Create discount list
+        discounts_container = tk.Frame(self.content_frame, bg=self.bg_color)
+        discounts_container.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Get discounts
+        if self.data_manager.discounts:
+            for discount in self.data_manager.discounts:
+                # Create discount card
+                discount_card = tk.Frame(discounts_container, bg="white", bd=1, relief=tk.SOLID, padx=15, pady=15)
+                discount_card.pack(fill='x', padx=10, pady=10)
+                
+                # Discount details
+                discount_code = tk.Label(discount_card, text=discount.get_discount_code(), 
+                                      font=("Helvetica", 14, "bold"), bg="white")
+                discount_code.grid(row=0, column=0, sticky='w', pady=(0, 5))
+                
+                discount_id = tk.Label(discount_card, text="ID: " + str(discount.get_discount_id()), 
+                                    bg="white", fg="gray")
+                discount_id.grid(row=0, column=1, sticky='e')
+                
+                # Display percentage or fixed amount
+                if discount.get_discount_percentage() > 0:
+                    discount_value = tk.Label(discount_card, 
+                                           text="Discount: " + str(discount.get_discount_percentage()) + "%", 
+                                           bg="white")
+                else:
+                    discount_value = tk.Label(discount_card, 
+                                           text="Discount: $" + str(discount.get_discount_amount()), 
+                                           bg="white")
+                discount_value.grid(row=1, column=0, sticky='w')
+                
+                # Max amount
+                max_amount = tk.Label(discount_card, 
+                                   text="Maximum Discount: $" + str(discount.get_max_discount_amount()),
+                                   bg="white")
+                max_amount.grid(row=2, column=0, sticky='w')
+                
+                # Edit button
+                edit_button = tk.Button(discount_card, text="Edit", 
+                                     bg=self.accent_color, fg="white",
+                                     command=lambda d=discount: self.show_edit_discount_form(d))
+                edit_button.grid(row=1, column=1, padx=(20, 0))
+                
+                # Delete button
+                delete_button = tk.Button(discount_card, text="Delete", 
+                                       bg="#ff6666", fg="white",
+                                       command=lambda d=discount: self.delete_discount(d))
+                delete_button.grid(row=2, column=1, padx=(20, 0))
+                
+                # Set grid configuration
+                discount_card.columnconfigure(0, weight=1)
+                discount_card.columnconfigure(1, weight=0)
+        else:
+            no_discounts = tk.Label(discounts_container, text="No discounts available", 
+                                 font=("Helvetica", 12), bg=self.bg_color)
+            no_discounts.pack(pady=50)
+    
+    # Show add discount form
+    def show_add_discount_form(self):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        add_label = tk.Label(header_frame, text="Add New Discount", 
+                          font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        add_label.pack()
+        
+        # Create form container
+        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
+        form_container.pack(fill='both', expand=True, padx=100, pady=20)
+        
+        # Discount code field
+        code_frame = tk.Frame(form_container, bg="white", pady=10)
+        code_frame.pack(fill='x', padx=20)
+        
+        code_label = tk.Label(code_frame, text="Discount Code:", width=15, anchor='w', bg="white")
+        code_label.pack(side=tk.LEFT)
+        
+        self.discount_code_entry = tk.Entry(code_frame, width=20)
+        self.discount_code_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Discount ID field
+        id_frame = tk.Frame(form_container, bg="white", pady=10)
+        id_frame.pack(fill='x', padx=20)
+        
+        id_label = tk.Label(id_frame, text="Discount ID:", width=15, anchor='w', bg="white")
+        id_label.pack(side=tk.LEFT)
+        
+        # The discount ID is taken from the sequence when the discount is saved,
+        # so a cancelled form never uses one up
+        self.discount_id_entry = tk.Entry(id_frame, width=20)
+        self.discount_id_entry.insert(0, "Assigned on save")
+        self.discount_id_entry.config(state='readonly')
+        self.discount_id_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Discount type selection
+        type_frame = tk.Frame(form_container, bg="white", pady=10)
+        type_frame.pack(fill='x', padx=20)
+        
+        type_label = tk.Label(type_frame, text="Discount Type:", width=15, anchor='w', bg="white")
+        type_label.pack(side=tk.LEFT)
+        
+        self.discount_type_var = tk.StringVar(value="percentage")
+        
+        percentage_radio = tk.Radiobutton(type_frame, text="Percentage", 
+                                        variable=self.discount_type_var, value="percentage", 
+                                        bg="white", command=self.toggle_discount_fields)
+        percentage_radio.pack(side=tk.LEFT, padx=5)
+        
+        amount_radio = tk.Radiobutton(type_frame, text="Fixed Amount", 
+                                    variable=self.discount_type_var, value="amount", 
+                                    bg="white", command=self.toggle_discount_fields)
+        amount_radio.pack(side=tk.LEFT, padx=5)
+        
+        # Percentage field
+        self.percentage_frame = tk.Frame(form_container, bg="white", pady=10)
+        self.percentage_frame.pack(fill='x', padx=20)
+        
+        percentage_label = tk.Label(self.percentage_frame, text="Percentage (%):", width=15, anchor='w', bg="white")
+        percentage_label.pack(side=tk.LEFT)
+        
+        self.percentage_entry = tk.Entry(self.percentage_frame, width=10)
+        self.percentage_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Amount field (hidden by default)
+        self.amount_frame = tk.Frame(form_container, bg="white", pady=10)
+        
+        amount_label = tk.Label(self.amount_frame, text="Amount ($):", width=15, anchor='w', bg="white")
+        amount_label.pack(side=tk.LEFT)
+        
+        self.amount_entry = tk.Entry(self.amount_frame, width=10)
+        self.amount_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Maximum discount amount field
+        max_frame = tk.Frame(form_container, bg="white", pady=10)
+        max_frame.pack(fill='x', padx=20)
+        
+        max_label = tk.Label(max_frame, text="Max Amount ($):", width=15, anchor='w', bg="white")
+        max_label.pack(side=tk.LEFT)
+        
+        self.max_amount_entry = tk.Entry(max_frame, width=10)
+        self.max_amount_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Buttons
+        button_frame = tk.Frame(form_container, bg="white", pady=20)
+        button_frame.pack(fill='x', padx=20)
+        
+        # Back button
+        back_button = tk.Button(button_frame, text="Cancel", 
+                             command=lambda: self.show_manage_discounts(),
+                             bg="#f0f0f0", fg="black", width=10)
+        back_button.pack(side=tk.LEFT, padx=5)
+        
+        # Save button
+        save_button = tk.Button(button_frame, text="Save Discount", 
+                             command=lambda: self.save_discount(),
+                             bg="#4caf50", fg="white", width=10)
+        save_button.pack(side=tk.RIGHT, padx=5)
+    
+    # Toggle between percentage and amount discount fields
+    def toggle_discount_fields(self):
+        discount_type = self.discount_type_var.get()
+        
+        if discount_type == "percentage":
+            self.amount_frame.pack_forget()
+            self.percentage_frame.pack(fill='x', padx=20, after=self.discount_type_var.get())
+        else:
+            self.percentage_frame.pack_forget()
+            self.amount_frame.pack(fill='x', padx=20, after=self.discount_type_var.get())
+    
+    # Save new discount
+    def save_discount(self):
+        # Get form values
+        code = self.discount_code_entry.get()
+        discount_type = self.discount_type_var.get()
+        max_amount_str = self.max_amount_entry.get()
+        
+        # Validate inputs
+        if not code or not max_amount_str:
+            messagebox.showerror("Input Error", "Discount code and maximum amount are required")
+            return
+        
+        try:
+            # Parse max amount
+            max_amount = float(max_amount_str)
+            if max_amount <= 0:
+                raise ValueError("Maximum amount must be positive")
+            
+            # Parse percentage or amount based on type
+            if discount_type == "percentage":
+                percentage_str = self.percentage_entry.get()
+                if not percentage_str:
+                    raise ValueError("Percentage is required")
+                    
+                percentage = float(percentage_str)
+                if percentage <= 0 or percentage > 100:
+                    raise ValueError("Percentage must be between 1 and 100")
+                
+                amount = 0
+            else:
+                amount_str = self.amount_entry.get()
+                if not amount_str:
+                    raise ValueError("Amount is required")
+                    
+                amount = float(amount_str)
+                if amount <= 0:
+                    raise ValueError("Amount must be positive")
+                
+                percentage = 0
+                
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        
+        # Check if discount code already exists
+        if self.data_manager.get_discount_by_code(code):
+            messagebox.showerror("Input Error", "Discount code already exists")
+            return
+        
+        # Take the discount ID now the form is valid, and check it is free
+        discount_id = self.data_manager.next_id('discounts')
+        if self.data_manager.get_discount_by_id(discount_id):
+            messagebox.showerror("Input Error", "Discount ID already exists")
+            return
+        
+        # Create new discount
+        new_discount = Discount(discount_id, percentage, amount, code, max_amount)
+        
+        # Add to data manager
+        self.data_manager.add_discount(new_discount)
+        
+        messagebox.showinfo("Discount Added", "The discount has been added successfully")
+        
+        # Return to discounts list
+        self.show_manage_discounts()
+    
+    # Show edit discount form
+    def show_edit_discount_form(self, discount):
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        edit_label = tk.Label(header_frame, text="Edit Discount", 
+                           font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        edit_label.pack()
+        
+        # Create form container
+        form_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
+        form_container.pack(fill='both', expand=True, padx=100, pady=20)
+        
+        # Discount code field
+        code_frame = tk.Frame(form_container, bg="white", pady=10)
+        code_frame.pack(fill='x', padx=20)
+        
+        code_label = tk.Label(code_frame, text="Discount Code:", width=15, anchor='w', bg="white")
+        code_label.pack(side=tk.LEFT)
+        
+        self.discount_code_entry = tk.Entry(code_frame, width=20)
+        self.discount_code_entry.insert(0, discount.get_discount_code())
+        self.discount_code_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Discount ID field
+        id_frame = tk.Frame(form_container, bg="white", pady=10)
+        id_frame.pack(fill='x', padx=20)
+        
+        id_label = tk.Label(id_frame, text="Discount ID:", width=15, anchor='w', bg="white")
+        id_label.pack(side=tk.LEFT)
+        
+        self.discount_id_entry = tk.Entry(id_frame, width=10)
+        self.discount_id_entry.insert(0, str(discount.get_discount_id()))
+        self.discount_id_entry.config(state='readonly')
+        self.discount_id_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Discount type selection
+        type_frame = tk.Frame(form_container, bg="white", pady=10)
+        type_frame.pack(fill='x', padx=20)
+        
+        type_label = tk.Label(type_frame, text="Discount Type:", width=15, anchor='w', bg="white")
+        type_label.pack(side=tk.LEFT)
+        
+        # Determine current discount type
+        current_type = "percentage" if discount.get_discount_percentage() > 0 else "amount"
+        self.discount_type_var = tk.StringVar(value=current_type)
+        
+        percentage_radio = tk.Radiobutton(type_frame, text="Percentage", 
+                                        variable=self.discount_type_var, value="percentage", 
+                                        bg="white", command=self.toggle_discount_fields)
+        percentage_radio.pack(side=tk.LEFT, padx=5)
+        
+        amount_radio = tk.Radiobutton(type_frame, text="Fixed Amount", 
+                                    variable=self.discount_type_var, value="amount", 
+                                    bg="white", command=self.toggle_discount_fields)
+        amount_radio.pack(side=tk.LEFT, padx=5)
+        
+        # Percentage field
+        self.percentage_frame = tk.Frame(form_container, bg="white", pady=10)
+        
+        percentage_label = tk.Label(self.percentage_frame, text="Percentage (%):", width=15, anchor='w', bg="white")
+        percentage_label.pack(side=tk.LEFT)
+        
+        self.percentage_entry = tk.Entry(self.percentage_frame, width=10)
+        self.percentage_entry.insert(0, str(discount.get_discount_percentage()))
+        self.percentage_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Amount field
+        self.amount_frame = tk.Frame(form_container, bg="white", pady=10)
+        
+        amount_label = tk.Label(self.amount_frame, text="Amount ($):", width=15, anchor='w', bg="white")
+        amount_label.pack(side=tk.LEFT)
+        
+        self.amount_entry = tk.Entry(self.amount_frame, width=10)
+        self.amount_entry.insert(0, str(discount.get_discount_amount()))
+        self.amount_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Show appropriate frame based on current discount type
+        if current_type == "percentage":
+            self.percentage_frame.pack(fill='x', padx=20)
+        else:
+            self.amount_frame.pack(fill='x', padx=20)
+        
+        # Maximum discount amount field
+        max_frame = tk.Frame(form_container, bg="white", pady=10)
+        max_frame.pack(fill='x', padx=20)
+        
+        max_label = tk.Label(max_frame, text="Max Amount ($):", width=15, anchor='w', bg="white")
+        max_label.pack(side=tk.LEFT)
+        
+        self.max_amount_entry = tk.Entry(max_frame, width=10)
+        self.max_amount_entry.insert(0, str(discount.get_max_discount_amount()))
+        self.max_amount_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Buttons
+        button_frame = tk.Frame(form_container, bg="white", pady=20)
+        button_frame.pack(fill='x', padx=20)
+        
+        # Back button
+        back_button = tk.Button(button_frame, text="Cancel", 
+                             command=lambda: self.show_manage_discounts(),
+                             bg="#f0f0f0", fg="black", width=10)
+        back_button.pack(side=tk.LEFT, padx=5)
+        
+        # Update button
+        update_button = tk.Button(button_frame, text="Update Discount", 
+                               command=lambda: self.update_discount(discount),
+                               bg="#4caf50", fg="white", width=10)
+        update_button.pack(side=tk.RIGHT, padx=5)
+    
+    # Update existing discount
+    def update_discount(self, discount):
+        # Get form values
+        code = self.discount_code_entry.get()
+        discount_type = self.discount_type_var.get()
+        max_amount_str = self.max_amount_entry.get()
+        
+        # Validate inputs
+        if not code or not max_amount_str:
+            messagebox.showerror("Input Error", "Discount code and maximum amount are required")
+            return
+        
+        try:
+            # Parse max amount
+            max_amount = float(max_amount_str)
+            if max_amount <= 0:
+                raise ValueError("Maximum amount must be positive")
+            
+            # Parse percentage or amount based on type
+            if discount_type == "percentage":
+                percentage_str = self.percentage_entry.get()
+                if not percentage_str:
+                    raise ValueError("Percentage is required")
+                    
+                percentage = float(percentage_str)
+                if percentage <= 0 or percentage > 100:
+                    raise ValueError("Percentage must be between 1 and 100")
+                
+                amount = 0
+            else:
+                amount_str = self.amount_entry.get()
+                if not amount_str:
+                    raise ValueError("Amount is required")
+                    
+                amount = float(amount_str)
+                if amount <= 0:
+                    raise ValueError("Amount must be positive")
+                
+                percentage = 0
+                
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        
+        # Check if discount code already exists (except for this discount)
+        existing_discount = self.data_manager.get_discount_by_code(code)
+        if existing_discount and existing_discount.get_discount_id() != discount.get_discount_id():
+            messagebox.showerror("Input Error", "Discount code already exists")
+            return
+        
+        # Update discount
+        discount.set_discount_code(code)
+        discount.set_discount_percentage(percentage)
+        discount.set_discount_amount(amount)
+        discount.set_max_discount_amount(max_amount)
+        
+        # Update in data manager
+        self.data_manager.update_discount(discount)
+        
+        messagebox.showinfo("Discount Updated", "The discount has been updated successfully")
+        
+        # Return to discounts list
+        self.show_manage_discounts()
+    
+    # Delete discount
+    def delete_discount(self, discount):
+        # Ask for confirmation
+        confirm = messagebox.askyesno("Delete Discount", 
+                                    "Are you sure you want to delete this discount? This action cannot be undone.")
+        
+        if confirm:
+            # Delete discount
+            self.data_manager.delete_discount(discount.get_discount_id())
+            
+            messagebox.showinfo("Discount Deleted", "The discount has been deleted successfully")
+            
+            # Refresh discounts list
+            self.show_manage_discounts()
+    
+    # Show booking reports
+    def show_booking_reports(self):
+        # Load the collections used by the reports together
+        self.data_manager.preload(['events', 'bookings', 'customers'])
+        
+        # Clear content frame
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+        
+        # Create header
+        header_frame = tk.Frame(self.content_frame, bg=self.bg_color, pady=20)
+        header_frame.pack(fill='x')
+        
+        reports_label = tk.Label(header_frame, text="Booking Reports", 
+                              font=("Helvetica", 18, "bold"), bg=self.bg_color)
+        reports_label.pack()
+        
+        subtitle_label = tk.Label(header_frame, text="View booking statistics and reports", 
+                               font=("Helvetica", 10), bg=self.bg_color)
+        subtitle_label.pack()
+        
+        # Create tabs for different reports
+        tab_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        tab_frame.pack(fill='x', padx=20, pady=10)
+        
+        # Tab buttons
+        daily_btn = tk.Button(tab_frame, text="Daily Sales", 
+                           bg=self.accent_color, fg="white", padx=15, pady=5,
+                           command=lambda: self.show_daily_sales())
+        daily_btn.pack(side=tk.LEFT, padx=5)
+        
+        event_btn = tk.Button(tab_frame, text="Sales by Event", 
+                           bg="#f0f0f0", fg="black", padx=15, pady=5,
+                           command=lambda: self.show_event_sales())
+        event_btn.pack(side=tk.LEFT, padx=5)
+        
+        all_bookings_btn = tk.Button(tab_frame, text="All Bookings", 
+                                  bg="#f0f0f0", fg="black", padx=15, pady=5,
+                                  command=lambda: self.show_all_bookings())
+        all_bookings_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Create container for report content
+        self.report_container = tk.Frame(self.content_frame, bg="white", bd=1, relief=tk.SOLID)
+        self.report_container.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Show daily sales by default
+        self.show_daily_sales()
+    
+    # Show daily sales report
+    def show_daily_sales(self):
+        # Clear report container
+        for widget in self.report_container.winfo_children():
+            widget.destroy()
+        
+        # Create report header
+        report_header = tk.Frame(self.report_container, bg="white", pady=15)
+        report_header.pack(fill='x', padx=20)
+        
+        header_label = tk.Label(report_header, text="Daily Ticket Sales", 
+                             font=("Helvetica", 14, "bold"), bg="white")
+        header_label.pack(anchor='w')
+        
+        # Group bookings by date
+        date_sales = {}
+        for booking in self.data_manager.bookings:
+            date_key = booking.get_booking_date().strftime("%Y-%m-%d")
+            
+            if date_key not in date_sales:
+                date_sales[date_key] = {
+                    "count": 0,
+                    "tickets": 0,
+                    "revenue": 0
+                }
+            
+            date_sales[date_key]["count"] += 1
+            date_sales[date_key]["tickets"] += booking.get_number_of_tickets()
+            date_sales[date_key]["revenue"] += booking.get_total_price()
+        
+        # Add the totals kept for archived events
+        for summary in self.data_manager.get_archive_summaries().values():
+            for date_key, day in summary["daily"].items():
+                if date_key not in date_sales:
+                    date_sales[date_key] = {
+                        "count": 0,
+                        "tickets": 0,
+                        "revenue": 0
+                    }
+                
+                date_sales[date_key]["count"] += day["count"]
+                date_sales[date_key]["tickets"] += day["tickets"]
+                date_sales[date_key]["revenue"] += day["revenue"]
+        
+        # Sort dates
+        sorted_dates = sorted(date_sales.keys(), reverse=True)
+        
+        # Create table header
+        table_frame = tk.Frame(self.report_container, bg="white")
+        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Table header
+        header_frame = tk.Frame(table_frame, bg="#f0f0f0")
+        header_frame.pack(fill='x')
+        
+        date_header = tk.Label(header_frame, text="Date", width=15, font=("Helvetica", 11, "bold"), 
+                            bg="#f0f0f0", padx=10, pady=5)
+        date_header.grid(row=0, column=0, sticky='w')
+        
+        bookings_header = tk.Label(header_frame, text="Bookings", width=10, font=("Helvetica", 11, "bold"), 
+                                bg="#f0f0f0", padx=10, pady=5)
+        bookings_header.grid(row=0, column=1, sticky='w')
+        
+        tickets_header = tk.Label(header_frame, text="Tickets", width=10, font=("Helvetica", 11, "bold"), 
+                               bg="#f0f0f0", padx=10, pady=5)
+        tickets_header.grid(row=0, column=2, sticky='w')
+        
+        revenue_header = tk.Label(header_frame, text="Revenue", width=15, font=("Helvetica", 11, "bold"), 
+                               bg="#f0f0f0", padx=10, pady=5)
+        revenue_header.grid(row=0, column=3, sticky='w')
+        
+        # Configure grid
+        header_frame.columnconfigure(0, weight=0)
+        header_frame.columnconfigure(1, weight=0)
+        header_frame.columnconfigure(2, weight=0)
+        header_frame.columnconfigure(3, weight=1)
+        
+        # Create scrollable table content
+        table_content = tk.Frame(table_frame, bg="white")
+        table_content.pack(fill='both', expand=True)
+        
+        # Create canvas with scrollbar
+        canvas = tk.Canvas(table_content, bg="white", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(table_content, orient="vertical", command=canvas.yview)
+        scrollable_table = tk.Frame(canvas, bg="white")
+        
+        scrollable_table.bind(
+            "<Configure>",
+            lambda e: canvas.configure(
+                scrollregion=canvas.bbox("all")
+            )
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_table, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Table rows
+        total_bookings = 0
+        total_tickets = 0
+        total_revenue = 0
+        
+        for i, date in enumerate(sorted_dates):
+            sales = date_sales[date]
+            row_bg = "#f9f9f9" if i % 2 == 0 else "white"
+            
+            # Date
+            date_label = tk.Label(scrollable_table, text=date, width=15, 
+                               bg=row_bg, padx=10, pady=5)
+            date_label.grid(row=i, column=0, sticky='w')
+            
+            # Bookings
+            bookings_label = tk.Label(scrollable_table, text=str(sales["count"]), width=10, 
+                                   bg=row_bg, padx=10, pady=5)
+            bookings_label.grid(row=i, column=1, sticky='w')
+            
+            # Tickets
+            tickets_label = tk.Label(scrollable_table, text=str(sales["tickets"]), width=10, 
+                                  bg=row_bg, padx=10, pady=5)
+            tickets_label.grid(row=i, column=2, sticky='w')
+            
+            # Revenue
+            revenue_label = tk.Label(scrollable_table, text="$" + str(sales["revenue"]), width=15, 
+                                  bg=row_bg, padx=10, pady=5)
+            revenue_label.grid(row=i, column=3, sticky='w')
+            
+            # Update totals
+            total_bookings += sales["count"]
+            total_tickets += sales["tickets"]
+            total_revenue += sales["revenue"]
+            
+            # Configure grid
+            scrollable_table.columnconfigure(0, weight=0)
+            scrollable_table.columnconfigure(1, weight=0)
+            scrollable_table.columnconfigure(2, weight=0)
+            scrollable_table.columnconfigure(3, weight=1)
+        
+        # Add totals row
+        total_separator = ttk.Separator(self.report_container, orient='horizontal')
+        total_separator.pack(fill='x', padx=20)
+        
+        total_frame = tk.Frame(self.report_container, bg="white", pady=10)
+        total_frame.pack(fill='x', padx=20)
+        
+        total_label = tk.Label(total_frame, text="Totals:", font=("Helvetica", 11, "bold"), 
+                            bg="white", width=15)
+        total_label.grid(row=0, column=0, sticky='w', padx=10)
+        
+        total_bookings_label = tk.Label(total_frame, text=str(total_bookings), 
+                                     font=("Helvetica", 11), bg="white", width=10)
+        total_bookings_label.grid(row=0, column=1, sticky='w', padx=10)
+        
+        total_tickets_label = tk.Label(total_frame, text=str(total_tickets), 
+                                    font=("Helvetica", 11), bg="white", width=10)
+        total_tickets_label.grid(row=0, column=2, sticky='w', padx=10)
+        
+        total_revenue_label = tk.Label(total_frame, text="$" + str(total_revenue), 
+                                    font=("Helvetica", 11, "bold"), bg="white", width=15)
+        total_revenue_label.grid(row=0, column=3, sticky='w', padx=10)
+        
+        # Configure grid
+        total_frame.columnconfigure(0, weight=0)
+        total_frame.columnconfigure(1, weight=0)
+        total_frame.columnconfigure(2, weight=0)
+        total_frame.columnconfigure(3, weight=1)
+    
+    # Show sales by event report
+    def show_event_sales(self):
+        # Clear report container
+        for widget in self.report_container.winfo_children():
+            widget.destroy()
+        
+        # Create report header
+        report_header = tk.Frame(self.report_container, bg="white", pady=15)
+        report_header.pack(fill='x', padx=20)
+        
+        header_label = tk.Label(report_header, text="Sales by Event", 
+                             font=("Helvetica", 14, "bold"), bg="white")
+        header_label.pack(anchor='w')
+        
+        # Group bookings by event
+        event_sales = {}
+        for booking in self.data_manager.bookings:
+            event_id = booking.get_event_id()
+            event = self.data_manager.get_event_by_id(event_id)
+            
+            if not event:
+                continue
+                
+            event_key = str(event_id)
+            
+            if event_key not in event_sales:
+                event_sales[event_key] = {
+                    "name": event.get_event_name(),
+                    "date": event.get_event_date(),
+                    "count": 0,
+                    "tickets": 0,
+                    "revenue": 0
+                }
+            
+            event_sales[event_key]["count"] += 1
+            event_sales[event_key]["tickets"] += booking.get_number_of_tickets()
+            event_sales[event_key]["revenue"] += booking.get_total_price()
+        
+        # Add the totals kept for archived events
+        for event_id, summary in self.data_manager.get_archive_summaries().items():
+            event_key = str(event_id)
+            
+            if event_key not in event_sales:
+                event_sales[event_key] = {
+                    "name": summary["event_name"],
+                    "date": summary["event_date"],
+                    "count": 0,
+                    "tickets": 0,
+                    "revenue": 0
+                }
+            
+            event_sales[event_key]["count"] += summary["bookings"]
+            event_sales[event_key]["tickets"] += summary["tickets"]
+            event_sales[event_key]["revenue"] += summary["revenue"]
+        
+        # Sort events by date
+        sorted_events = sorted(event_sales.items(), key=lambda x: x[1]["date"])
+        
+        # Create table header
+        table_frame = tk.Frame(self.report_container, bg="white")
+        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Table header
+        header_frame = tk.Frame(table_frame, bg="#f0f0f0")
+        header_frame.pack(fill='x')
+        
+        event_header = tk.Label(header_frame, text="Event", width=30, font=("Helvetica", 11, "bold"), 
+                             bg="#f0f0f0", padx=10, pady=5)
+        event_header.grid(row=0, column=0, sticky='w')
+        
+        date_header = tk.Label(header_frame, text="Date", width=15, font=("Helvetica", 11, "bold"), 
+                            bg="#f0f0f0", padx=10, pady=5)
+        date_header.grid(row=0, column=1, sticky='w')
+        
+        bookings_header = tk.Label(header_frame, text="Bookings", width=10, font=("Helvetica", 11, "bold"), 
+                                bg="#f0f0f0", padx=10, pady=5)
+        bookings_header.grid(row=0, column=2, sticky='w')
+        
+        tickets_header = tk.Label(header_frame, text="Tickets", width=10, font=("Helvetica", 11, "bold"), 
+                               bg="#f0f0f0", padx=10, pady=5)
+        tickets_header.grid(row=0, column=3, sticky='w')
+        
+        revenue_header = tk.Label(header_frame, text="Revenue", width=15, font=("Helvetica", 11, "bold"), 
+                               bg="#f0f0f0", padx=10, pady=5)
+        revenue_header.grid(row=0, column=4, sticky='w')
+        
+        # Configure grid
+        header_frame.columnconfigure(0, weight=1)
+        header_frame.columnconfigure(1, weight=0)
+        header_frame.columnconfigure(2, weight=0)
+        header_frame.columnconfigure(3, weight=0)
+        header_frame.columnconfigure(4, weight=0)
+        
+        # Create table content
+        content_frame = tk.Frame(table_frame, bg="white")
+        content_frame.pack(fill='both', expand=True)
+        
+        # Table rows
+        total_bookings = 0
+        total_tickets = 0
+        total_revenue = 0
+        
+        for i, (event_id, sales) in enumerate(sorted_events):
+            row_bg = "#f9f9f9" if i % 2 == 0 else "white"
+            
+            # Event
+            event_label = tk.Label(content_frame, text=sales["name"], 
+                                bg=row_bg, padx=10, pady=5, anchor='w')
+            event_label.grid(row=i, column=0, sticky='w')
+            
+            # Date
+            date_label = tk.Label(content_frame, text=sales["date"].strftime("%Y-%m-%d"), 
+                               bg=row_bg, padx=10, pady=5)
+            date_label.grid(row=i, column=1, sticky='w')
+            
+            # Bookings
+            bookings_label = tk.Label(content_frame, text=str(sales["count"]), 
+                                   bg=row_bg, padx=10, pady=5)
+            bookings_label.grid(row=i, column=2, sticky='w')
+            
+            # Tickets
+            tickets_label = tk.Label(content_frame, text=str(sales["tickets"]), 
+                                  bg=row_bg, padx=10, pady=5)
+            tickets_label.grid(row=i, column=3, sticky='w')
+            
+            # Revenue
+            revenue_label = tk.Label(content_frame, text="$" + str(sales["revenue"]), 
+                                  bg=row_bg, padx=10, pady=5)
+            revenue_label.grid(row=i, column=4, sticky='w')
+            
+            # Update totals
+            total_bookings += sales["count"]
+            total_tickets += sales["tickets"]
+            total_revenue += sales["revenue"]
+            
+            # Configure grid
+            content_frame.columnconfigure(0, weight=1)
+            content_frame.columnconfigure(1, weight=0)
+            content_frame.columnconfigure(2, weight=0)
+            content_frame.columnconfigure(3, weight=0)
+            content_frame.columnconfigure(4, weight=0)
+        
+        # Add totals row
+        total_separator = ttk.Separator(self.report_container, orient='horizontal')
+        total_separator.pack(fill='x', padx=20)
+        
+        total_frame = tk.Frame(self.report_container, bg="white", pady=10)
+        total_frame.pack(fill='x', padx=20)
+        
+        total_label = tk.Label(total_frame, text="Totals:", font=("Helvetica", 11, "bold"), 
+                            bg="white")
+        total_label.grid(row=0, column=0, sticky='e', padx=10)
+        
+        total_bookings_label = tk.Label(total_frame, text=str(total_bookings), 
+                                     font=("Helvetica", 11), bg="white", width=10)
+        total_bookings_label.grid(row=0, column=2, sticky='w', padx=10)
+        
+        total_tickets_label = tk.Label(total_frame, text=str(total_tickets), 
+                                    font=("Helvetica", 11), bg="white", width=10)
+        total_tickets_label.grid(row=0, column=3, sticky='w', padx=10)
+        
+        total_revenue_label = tk.Label(total_frame, text="$" + str(total_revenue), 
+                                    font=("Helvetica", 11, "bold"), bg="white", width=15)
+        total_revenue_label.grid(row=0, column=4, sticky='w', padx=10)
+        
+        # Configure grid
+        total_frame.columnconfigure(0, weight=1)
+        total_frame.columnconfigure(1, weight=0)
+        total_frame.columnconfigure(2, weight=0)
+        total_frame.columnconfigure(3, weight=0)
+        total_frame.columnconfigure(4, weight=0)
+    
+    # Show all bookings report
+    def show_all_bookings(self, include_archive=False):
+        # Clear report container
+        for widget in self.report_container.winfo_children():
+            widget.destroy()
+        
+        # Create report header
+        report_header = tk.Frame(self.report_container, bg="white", pady=15)
+        report_header.pack(fill='x', padx=20)
+        
+        header_label = tk.Label(report_header, text="All Bookings", 
+                             font=("Helvetica", 14, "bold"), bg="white")
+        header_label.pack(side=tk.LEFT)
+        
+        # Bookings of archived events are read from the archive files only when asked
+        include_archive_var = tk.BooleanVar(value=include_archive)
+        archive_check = tk.Checkbutton(report_header, text="Include archived events", variable=include_archive_var, bg="white",
+                                    command=lambda: self.show_all_bookings(include_archive_var.get()))
+        archive_check.pack(side=tk.RIGHT)
+        
+        # Create table header
+        table_frame = tk.Frame(self.report_container, bg="white")
+        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        # Table header
+        header_frame = tk.Frame(table_frame, bg="#f0f0f0")
+        header_frame.pack(fill='x')
+        
+        booking_header = tk.Label(header_frame, text="Booking ID", width=10, font=("Helvetica", 11, "bold"), 
+                               bg="#f0f0f0", padx=10, pady=5)
+        booking_header.grid(row=0, column=0, sticky='w')
+        
+        date_header = tk.Label(header_frame, text="Date", width=15, font=("Helvetica", 11, "bold"), 
+                            bg="#f0f0f0", padx=10, pady=5)
+        date_header.grid(row=0, column=1, sticky='w')
+        
+        user_header = tk.Label(header_frame, text="User", width=20, font=("Helvetica", 11, "bold"), 
+                            bg="#f0f0f0", padx=10, pady=5)
+        user_header.grid(row=0, column=2, sticky='w')
+        
+        event_header = tk.Label(header_frame, text="Event", width=25, font=("Helvetica", 11, "bold"), 
+                             bg="#f0f0f0", padx=10, pady=5)
+        event_header.grid(row=0, column=3, sticky='w')
+        
+        tickets_header = tk.Label(header_frame, text="Tickets", width=10, font=("Helvetica", 11, "bold"), 
+                               bg="#f0f0f0", padx=10, pady=5)
+        tickets_header.grid(row=0, column=4, sticky='w')
+        
+        total_header = tk.Label(header_frame, text="Total", width=10, font=("Helvetica", 11, "bold"), 
+                             bg="#f0f0f0", padx=10, pady=5)
+        total_header.grid(row=0, column=5, sticky='w')
+        
+        status_header = tk.Label(header_frame, text="Status", width=10, font=("Helvetica", 11, "bold"), 
+                              bg="#f0f0f0", padx=10, pady=5)
+        status_header.grid(row=0, column=6, sticky='w')
+        
+        # Configure grid
+        header_frame.columnconfigure(0, weight=0)
+        header_frame.columnconfigure(1, weight=0)
+        header_frame.columnconfigure(2, weight=0)
+        header_frame.columnconfigure(3, weight=1)
+        header_frame.columnconfigure(4, weight=0)
+        header_frame.columnconfigure(5, weight=0)
+        header_frame.columnconfigure(6, weight=0)
+        
+        # Create scrollable table content
+        content_container = tk.Frame(table_frame, bg="white")
+        content_container.pack(fill='both', expand=True)
+        
+        # Create canvas with scrollbar
+        canvas = tk.Canvas(content_container, bg="white", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(content_container, orient="vertical", command=canvas.yview)
+        scrollable_content = tk.Frame(canvas, bg="white")
+        
+        scrollable_content.bind(
+            "<Configure>",
+            lambda e: canvas.configure(
+                scrollregion=canvas.bbox("all")
+            )
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_content, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Sort bookings by date (newest first)
+        sorted_bookings = self.data_manager.latest_bookings(include_archive=include_archive)
+        
+        # Table rows
+        for i, booking in enumerate(sorted_bookings):
+            row_bg = "#f9f9f9" if i % 2 == 0 else "white"
+            
+            # Get related user and event
+            user = self.data_manager.get_customer_by_id(booking.get_user_id())
+            event = self.data_manager.get_event_by_id(booking.get_event_id())
+            
+            if not user or not event:
+                continue
+            
+            # Booking ID
+            booking_label = tk.Label(scrollable_content, text=str(booking.get_booking_id()), 
+                                  bg=row_bg, padx=10, pady=5)
+            booking_label.grid(row=i, column=0, sticky='w')
+            
+            # Date
+            date_label = tk.Label(scrollable_content, text=booking.get_booking_date().strftime("%Y-%m-%d"), 
+                               bg=row_bg, padx=10, pady=5)
+            date_label.grid(row=i, column=1, sticky='w')
+            
+            # User
+            user_label = tk.Label(scrollable_content, text=user.get_user_name(), 
+                               bg=row_bg, padx=10, pady=5)
+            user_label.grid(row=i, column=2, sticky='w')
+            
+            # Event
+            event_label = tk.Label(scrollable_content, text=event.get_event_name(), 
+                                bg=row_bg, padx=10, pady=5)
+            event_label.grid(row=i, column=3, sticky='w')
+            
+            # Tickets
+            tickets_label = tk.Label(scrollable_content, text=str(booking.get_number_of_tickets()), 
+                                  bg=row_bg, padx=10, pady=5)
+            tickets_label.grid(row=i, column=4, sticky='w')
+            
+            # Total
+            total_label = tk.Label(scrollable_content, text="$" + str(booking.get_total_price()), 
+                                bg=row_bg, padx=10, pady=5)
+            total_label.grid(row=i, column=5, sticky='w')
+            
+            # Status (with color)
+            status_text = booking.get_booking_status().value
+            status_color = "green" if booking.get_booking_status() == BookingStatus.CONFIRMED else \
+                          "orange" if booking.get_booking_status() == BookingStatus.PENDING else "red"
+            
+            status_label = tk.Label(scrollable_content, text=status_text, 
+                                 bg=row_bg, fg=status_color, padx=10, pady=5)
+            status_label.grid(row=i, column=6, sticky='w')
+            
+            # Configure grid
+            scrollable_content.columnconfigure(0, weight=0)
+            scrollable_content.columnconfigure(1, weight=0)
+            scrollable_content.columnconfigure(2, weight=0)
+            scrollable_content.columnconfigure(3, weight=1)
+            scrollable_content.columnconfigure(4, weight=0)
+            scrollable_content.columnconfigure(5, weight=0)
+            scrollable_content.columnconfigure(6, weight=0)
+    
+    # Logout
+    def logout(self):
+        self.current_user = None
+        self.is_admin = False
+        self.create_login_frame()
+
+# Command line tools, main() runs them instead of the GUI when the first
+# argument names one of them
+
+# Import files from the command line, e.g
+#   python Code.py import customers customers.csv
+#   python Code.py import bookings bookings.csv tickets tickets.jsonl
+def import_command(arguments):
+    data_manager = create_data_manager()
+    try:
+        for file_key, path in zip(arguments[::2], arguments[1::2]):
+            report = import_file(data_manager, file_key, path)
+            print(file_key + " from " + path + ": " + str(report['imported']) + " imported, " +
+                  str(report['rejected']) + " rejected, %.0f rows/s" % report['rows_per_second'] +
+                  ("" if report['peak_memory_mb'] is None else ", peak memory %.0f MB" % report['peak_memory_mb']))
+            for row_number, error in report['errors']:
+                print("  row " + str(row_number) + ": " + error)
+    finally:
+        data_manager.close()
+
+# Export collections from the command line, e.g
+#   python Code.py export bookings bookings.csv payments payments.jsonl
+def export_command(arguments):
+    data_manager = create_data_manager()
+    try:
+        for file_key, path in zip(arguments[::2], arguments[1::2]):
+            start = time.perf_counter()
+            count = export_file(data_manager, file_key, path)
+            print(file_key + " to " + path + ": " + str(count) + " rows in %.1fs" % (time.perf_counter() - start))
+    finally:
+        data_manager.close()
+
+# Archive the events that took place before a date from the command line, e.g
+#   python Code.py archive 2024-12-01
+# Without a date events older than ARCHIVE_AFTER_DAYS days are archived
+def archive_command(arguments):
+    if arguments:
+        before = datetime.strptime(arguments[0], "%Y-%m-%d")
+    else:
+        before = datetime.now() - timedelta(days=ARCHIVE_AFTER_DAYS)
+    data_manager = create_data_manager()
+    try:
+        start = time.perf_counter()
+        archived = data_manager.archive_events(before)
+        print("Archived " + str(len(archived)) + " events in %.1fs" % (time.perf_counter() - start) +
+              ("" if not archived else ": " + ", ".join(str(event_id) for event_id in archived)))
+    except NotImplementedError as e:
+        print(str(e))
+        sys.exit(1)
+    finally:
+        data_manager.close()
+
+# Main function to run the application
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'import':
+        import_command(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'export':
+        export_command(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'archive':
+        archive_command(sys.argv[2:])
+        return
+    
+    root = tk.Tk()
+    app = GrandPrixApp(root)
+    root.mainloop()
+    
+    # Write any changes still waiting in the background before exiting
+    try:
+        app.data_manager.close()
+    except Exception as e:
+        print("Changes could not be saved: " + str(e))
+        sys.exit(1)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,902 @@
+# =================================================================
+# STORAGE BENCHMARKS
+# =================================================================
+# Benchmarks for the storage layer of the Grand Prix booking system
+# Run all of them with:   python benchmarks.py
+# Run one of them with:   python benchmarks.py booking_write_volume
+
+import contextlib
+import csv
+import gc
+import io
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from operator import methodcaller
+
+import Code
+from Code import (DataManager, Booking, BookingStatus, CreditCard, CardType,
+                  PaymentTransactionStatus, SingleRacePass, STORAGE_STATS)
+
+
+# Point the storage layer at a new empty data folder and return its path
+def use_temp_data_dir():
+    path = tempfile.mkdtemp(prefix='grandprix-bench-')
+    Code.DATA_DIR = path
+    return path
+
+
+# Build a booking with its payment and tickets like process_booking does
+def make_booking(booking_id, quantity, event_id=201, user_id=100):
+    booking = Booking(user_id, event_id, booking_id, datetime.now(), quantity, 100 * quantity, BookingStatus.CONFIRMED)
+    payment = CreditCard(booking_id, booking_id + 1000, "4111111111111111", "12/30", CardType.VISA,
+                         datetime.now(), PaymentTransactionStatus.SUCCESSFUL)
+    tickets = []
+    for i in range(quantity):
+        tickets.append(SingleRacePass(1, booking_id, "T" + str(booking_id) + "-" + str(i + 1), "A" + str(100 + i),
+                                      100, datetime.now(), 4001, "2024-11-26", "Standard race day access", event_id))
+    return booking, payment, tickets
+
+
+# Store a booking the same way process_booking does
+def save_booking(data_manager, booking, payment, tickets):
+    data_manager.add_booking(booking)
+    data_manager.add_payment(payment)
+    for ticket in tickets:
+        data_manager.add_ticket(ticket)
+
+
+# Fill a data manager with existing bookings so every collection has some size
+def fill_bookings(data_manager, count, quantity=2):
+    with data_manager.transaction():
+        for booking_id in range(1001, 1001 + count):
+            save_booking(data_manager, *make_booking(booking_id, quantity))
+
+
+# Compare the bytes written for one booking with and without a transaction
+# The write volume inside a transaction should not grow with the quantity
+def benchmark_booking_write_volume(existing_bookings=2000):
+    print("Write volume per booking (" + str(existing_bookings) + " existing bookings)")
+    print("%-10s %-12s %8s %8s %14s" % ("mode", "transaction", "tickets", "writes", "bytes written"))
+
+    for storage_mode in ('snapshot', 'journal'):
+        for use_transaction in (False, True):
+            for quantity in (1, 5, 10, 20):
+                path = use_temp_data_dir()
+                data_manager = DataManager(storage_mode, background_writes=False)
+                fill_bookings(data_manager, existing_bookings)
+                booking, payment, tickets = make_booking(1000000, quantity)
+
+                writes = STORAGE_STATS['writes']
+                bytes_written = STORAGE_STATS['bytes_written']
+                if use_transaction:
+                    with data_manager.transaction():
+                        save_booking(data_manager, booking, payment, tickets)
+                else:
+                    save_booking(data_manager, booking, payment, tickets)
+
+                print("%-10s %-12s %8d %8d %14d" % (storage_mode, use_transaction, quantity,
+                                                     STORAGE_STATS['writes'] - writes,
+                                                     STORAGE_STATS['bytes_written'] - bytes_written))
+                shutil.rmtree(path)
+
+
+# Write a data folder holding the given number of bookings as snapshots
+def build_data_dir(bookings, quantity=2):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    fill_bookings(data_manager, bookings, quantity)
+    for file_key in Code.DATA_FILES:
+        Code.save_collection(getattr(data_manager, file_key), file_key)
+    return path
+
+
+# Time from starting the app to showing the login screen as the data grows
+# The login screen only needs the DataManager to exist, so with lazy loading
+# this should stay flat while loading every collection grows with the data
+def benchmark_startup_time(sizes=(1000, 10000, 100000), repeat=3):
+    print("Time to login screen (best of " + str(repeat) + ")")
+    print("%10s %12s %12s %14s" % ("bookings", "lazy ms", "login ms", "load all ms"))
+
+    for size in sizes:
+        path = build_data_dir(size)
+        lazy_times, login_times, eager_times = [], [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data_manager = DataManager(background_writes=False)
+            lazy_times.append(time.perf_counter() - start)
+
+            # Logging in as admin only needs the admins collection
+            data_manager.authenticate_user("admin@zu.ac.ae", "111222333444555", True)
+            login_times.append(time.perf_counter() - start)
+
+            # The old constructor unpickled every collection up front
+            for file_key in Code.DATA_FILES:
+                len(getattr(data_manager, file_key))
+            eager_times.append(time.perf_counter() - start)
+
+            # Free the loaded data before the next run so it is not timed
+            del data_manager
+            gc.collect()
+
+        print("%10d %12.2f %12.2f %14.2f" % (size, min(lazy_times) * 1000, min(login_times) * 1000,
+                                             min(eager_times) * 1000))
+        shutil.rmtree(path)
+
+
+# Ask the kernel to drop the cached pages of every data file
+# Needs a platform with posix_fadvise, otherwise the cache stays warm
+def drop_page_cache(path):
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    os.sync()
+    for folder, _, names in os.walk(path):
+        for name in names:
+            fd = os.open(os.path.join(folder, name), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+    return True
+
+
+# Compare loading every collection one after another with preload()
+# on a cold and on a warm page cache
+def benchmark_parallel_load(size=100000, repeat=3):
+    path = build_data_dir(size)
+    print("Loading all collections (" + str(size) + " bookings, best of " + str(repeat) + ")")
+    print("%-6s %14s %14s %9s" % ("cache", "sequential ms", "parallel ms", "speedup"))
+
+    for cache in ('cold', 'warm'):
+        sequential_times, parallel_times = [], []
+        for _ in range(repeat):
+            for times in (sequential_times, parallel_times):
+                if cache == 'cold' and not drop_page_cache(path):
+                    cache = 'warm*'
+                gc.collect()
+                data_manager = DataManager(background_writes=False)
+                start = time.perf_counter()
+                if times is parallel_times:
+                    data_manager.preload()
+                for file_key in Code.DATA_FILES:
+                    len(getattr(data_manager, file_key))
+                times.append(time.perf_counter() - start)
+                data_manager.close()
+                del data_manager
+
+        sequential = min(sequential_times)
+        parallel = min(parallel_times)
+        print("%-6s %14.1f %14.1f %8.2fx" % (cache, sequential * 1000, parallel * 1000, sequential / parallel))
+
+    print("(warm* means the page cache could not be dropped on this platform)")
+    shutil.rmtree(path)
+
+
+# Round trip bookings and tickets through every serializer and report
+# the bytes written and the time to dump and load them
+def benchmark_serializers(count=100000):
+    bookings, tickets = [], []
+    for booking_id in range(1001, 1001 + count):
+        booking, payment, booking_tickets = make_booking(booking_id, 1)
+        bookings.append(booking)
+        tickets.extend(booking_tickets)
+
+    print("Serializer round trip (" + str(count) + " records each)")
+    print("%-9s %-8s %12s %10s %10s" % ("records", "format", "bytes", "dump ms", "load ms"))
+    for label, records in (("bookings", bookings), ("tickets", tickets)):
+        for name, serializer in Code.SERIALIZERS.items():
+            gc.collect()
+            file = io.BytesIO()
+            start = time.perf_counter()
+            serializer.dump(records, file)
+            dump_time = time.perf_counter() - start
+
+            file.seek(0)
+            start = time.perf_counter()
+            loaded = Code.load_records(file)
+            load_time = time.perf_counter() - start
+
+            # Make sure the format really gives back the same records
+            if len(loaded) != len(records) or loaded[-1].__dict__ != records[-1].__dict__:
+                raise AssertionError(name + " did not round trip " + label)
+            print("%-9s %-8s %12d %10.1f %10.1f" % (label, name, file.getbuffer().nbytes, dump_time * 1000, load_time * 1000))
+
+
+# Pickle records the way they were stored before CompactState, with the
+# attribute dictionary of every object
+@contextlib.contextmanager
+def dict_state():
+    getstate = Code.CompactState.__getstate__
+    setstate = Code.CompactState.__setstate__
+    del Code.CompactState.__getstate__, Code.CompactState.__setstate__
+    try:
+        yield
+    finally:
+        Code.CompactState.__getstate__ = getstate
+        Code.CompactState.__setstate__ = setstate
+
+
+# Compare the size and load time of a pickled data file holding attribute
+# dictionaries, compact tuples per record and whole columns (CompactRecords)
+def benchmark_compact_state(count=100000, repeat=3):
+    collections = {'bookings': [], 'payments': [], 'tickets': []}
+    for booking_id in range(1001, 1001 + count):
+        booking, payment, tickets = make_booking(booking_id, 1)
+        collections['bookings'].append(booking)
+        collections['payments'].append(payment)
+        collections['tickets'].extend(tickets)
+
+    layouts = (
+        ('dict', dict_state, lambda records, file: pickle.dump(records, file, pickle.HIGHEST_PROTOCOL)),
+        ('tuple', contextlib.nullcontext, lambda records, file: pickle.dump(records, file, pickle.HIGHEST_PROTOCOL)),
+        ('columns', contextlib.nullcontext, Code.SERIALIZERS['pickle'].dump),
+    )
+    print("Pickled state layout (" + str(count) + " records each, best of " + str(repeat) + ")")
+    print("%-9s %-8s %12s %10s %10s %14s" % ("records", "layout", "bytes", "dump ms", "load ms", "load+gc ms"))
+    for label, records in collections.items():
+        for name, state, dump in layouts:
+            with state():
+                file = io.BytesIO()
+                start = time.perf_counter()
+                dump(records, file)
+                dump_time = time.perf_counter() - start
+
+                # load_records pauses garbage collection, plain pickle.load does not
+                load_times, gc_times = [], []
+                for _ in range(repeat):
+                    for times, load in ((load_times, Code.load_records), (gc_times, pickle.load)):
+                        gc.collect()
+                        file.seek(0)
+                        start = time.perf_counter()
+                        loaded = load(file)
+                        times.append(time.perf_counter() - start)
+
+            if len(loaded) != len(records) or loaded[-1].__dict__ != records[-1].__dict__:
+                raise AssertionError(name + " did not round trip " + label)
+            del loaded
+            print("%-9s %-8s %12d %10.1f %10.1f %14.1f" % (label, name, file.getbuffer().nbytes, dump_time * 1000,
+                                                         min(load_times) * 1000, min(gc_times) * 1000))
+
+
+# Measure the write (with fsync) and cold read speed of the disk that
+# holds the given folder in MB/s
+def measure_disk_speed(path, size=64 * 1024 * 1024):
+    filepath = os.path.join(path, 'disk-speed.tmp')
+    block = os.urandom(1024 * 1024)
+    start = time.perf_counter()
+    with open(filepath, 'wb') as file:
+        for _ in range(size // len(block)):
+            file.write(block)
+        file.flush()
+        os.fsync(file.fileno())
+    write_speed = size / (time.perf_counter() - start) / 1e6
+
+    drop_page_cache(path)
+    start = time.perf_counter()
+    with open(filepath, 'rb') as file:
+        while file.read(len(block)):
+            pass
+    read_speed = size / (time.perf_counter() - start) / 1e6
+    os.remove(filepath)
+    return write_speed, read_speed
+
+
+# Compare the CPU time spent compressing data files with the disk time it
+# saves. Save and load times are estimated as the time to compress or
+# decompress plus the time to move the bytes at each disk speed, which
+# includes the speed measured for the disk that holds the data folder
+def benchmark_compression(count=100000, disk_speeds=(5, 20, 100)):
+    collections = {'bookings': [], 'payments': [], 'tickets': []}
+    for booking_id in range(1001, 1001 + count):
+        booking, payment, tickets = make_booking(booking_id, 1)
+        collections['bookings'].append(booking)
+        collections['payments'].append(payment)
+        collections['tickets'].extend(tickets)
+
+    path = use_temp_data_dir()
+    write_speed, read_speed = measure_disk_speed(path)
+    shutil.rmtree(path)
+    print("This disk: write %.0f MB/s with fsync, read %.0f MB/s (cold cache if it could be dropped)" % (write_speed, read_speed))
+
+    options = [(None, None)]
+    for name, levels in (('zlib', (1, 6, 9)), ('bz2', (1, 9)), ('lzma', (0, 6))):
+        if name in Code.COMPRESSORS:
+            options.extend((name, level) for level in levels)
+
+    speeds = [("disk", write_speed, read_speed)] + [(str(speed) + "MB/s", speed, speed) for speed in disk_speeds]
+    print("Compression of " + str(count) + " records, estimated save / load ms at each disk speed")
+    print("%-9s %-7s %10s %6s %8s %8s" % ("records", "method", "bytes", "ratio", "pack ms", "unpack ms")
+          + "".join(" %15s" % label for label, _, _ in speeds))
+    for label, records in collections.items():
+        buffer = io.BytesIO()
+        Code.SERIALIZERS[Code.DATA_FORMAT].dump(records, buffer)
+        raw = buffer.getvalue()
+
+        for name, level in options:
+            compress_time = decompress_time = 0
+            data = raw
+            if name is not None:
+                compressor = Code.COMPRESSORS[name]
+                start = time.perf_counter()
+                data = compressor.compress(raw, level)
+                compress_time = time.perf_counter() - start
+                start = time.perf_counter()
+                if compressor.decompress(data) != raw:
+                    raise AssertionError(name + " did not round trip " + label)
+                decompress_time = time.perf_counter() - start
+
+            method = "none" if name is None else name + "-" + str(level)
+            line = "%-9s %-7s %10d %5.1fx %8.0f %8.0f" % (label, method, len(data), len(raw) / len(data),
+                                                       compress_time * 1000, decompress_time * 1000)
+            for _, write, read in speeds:
+                save = compress_time + len(data) / (write * 1e6)
+                load = decompress_time + len(data) / (read * 1e6)
+                line += " %7.0f/%-7.0f" % (save * 1000, load * 1000)
+            print(line)
+
+
+# Run one box office terminal that sells the given number of bookings
+# Used by benchmark_concurrent_terminals in its own process
+def run_terminal(path, storage_mode, terminal, count, event_id, start_event):
+    Code.DATA_DIR = path
+    data_manager = DataManager(storage_mode, background_writes=False)
+    start_event.wait()
+    for i in range(count):
+        booking_id = (terminal + 1) * 1000000 + i
+        with data_manager.transaction():
+            save_booking(data_manager, *make_booking(booking_id, 2, event_id))
+    data_manager.close()
+
+
+# Several terminals selling at the same time against one data folder
+# Every booking must survive, and terminals selling different events
+# only lock the files of their own event so they should not slow down
+def benchmark_concurrent_terminals(terminals=4, count=200):
+    print("Concurrent terminals (" + str(terminals) + " terminals, " + str(count) + " bookings each)")
+    print("%-9s %-10s %10s %14s %10s" % ("mode", "events", "seconds", "bookings/s", "lost"))
+    for storage_mode in ('journal', 'snapshot'):
+        for layout in ('separate', 'same'):
+            path = use_temp_data_dir()
+            DataManager(background_writes=False).close() # Create the sample data once
+
+            start_event = multiprocessing.Event()
+            processes = []
+            for terminal in range(terminals):
+                event_id = 300 + terminal if layout == 'separate' else 300
+                processes.append(multiprocessing.Process(target=run_terminal, args=(path, storage_mode, terminal, count, event_id, start_event)))
+            for process in processes:
+                process.start()
+            time.sleep(0.5) # Let every terminal start up before the clock starts
+            start = time.perf_counter()
+            start_event.set()
+            for process in processes:
+                process.join()
+            elapsed = time.perf_counter() - start
+
+            data_manager = DataManager(background_writes=False)
+            lost = terminals * count - len(data_manager.bookings)
+            lost_tickets = terminals * count * 2 - len(data_manager.tickets)
+            lost_payments = terminals * count - len(data_manager.payments)
+            data_manager.close()
+            if lost or lost_tickets or lost_payments:
+                raise AssertionError("Lost %d bookings, %d tickets and %d payments" % (lost, lost_tickets, lost_payments))
+            print("%-9s %-10s %10.2f %14.0f %10d" % (storage_mode, layout, elapsed, terminals * count / elapsed, lost))
+            shutil.rmtree(path)
+
+
+# Write import files with the given number of customers, bookings and tickets
+def write_import_files(folder, customers, bookings):
+    paths = {key: os.path.join(folder, name) for key, name in
+             (('customers', 'customers.csv'), ('bookings', 'bookings.csv'), ('tickets', 'tickets.jsonl'))}
+    with open(paths['customers'], 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['user_id', 'name', 'email', 'password', 'registration_date', 'address', 'phone', 'payment_info'])
+        for user_id in range(100, 100 + customers):
+            writer.writerow([user_id, 'Customer ' + str(user_id), 'customer' + str(user_id) + '@example.com',
+                             'secret', '2023-01-01T10:00:00', 'Abu Dhabi', '0500000000', ''])
+    with open(paths['bookings'], 'w', newline='') as file, open(paths['tickets'], 'w') as tickets:
+        writer = csv.writer(file)
+        writer.writerow(['booking_id', 'user_id', 'event_id', 'booking_date', 'number_of_tickets', 'total_price', 'status'])
+        for booking_id in range(1001, 1001 + bookings):
+            event_id = 201 + booking_id % 2
+            writer.writerow([booking_id, 100 + booking_id % customers, event_id, '2024-06-01T12:00:00', 1, 100, 'Confirmed'])
+            tickets.write(json.dumps({'ticket_id': 'T' + str(booking_id) + '-1', 'booking_id': booking_id, 'event_id': event_id,
+                                      'ticket_type': 'standard', 'type_id': 1, 'seat_number': 'A100', 'ticket_price': 100,
+                                      'check_in_time': '2024-11-26', 'single_race_pass_id': 4001,
+                                      'pass_expiry': '2024-11-26', 'pass_benefits': 'Standard race day access'}) + "\n")
+    return paths
+
+
+# Import historical customers, bookings and tickets with the bulk loader
+# and compare with adding the same bookings one row at a time
+def benchmark_bulk_import(bookings=200000, customers=10000, row_by_row=2000):
+    folder = tempfile.mkdtemp(prefix='grandprix-import-')
+    paths = write_import_files(folder, customers, bookings)
+
+    print("Bulk import (" + str(customers) + " customers, " + str(bookings) + " bookings and tickets)")
+    print("%-10s %10s %10s %10s %12s %10s" % ("file", "rows", "rejected", "seconds", "rows/s", "peak MB"))
+    path = use_temp_data_dir()
+    data_manager = DataManager()
+    for file_key in ('customers', 'bookings', 'tickets'):
+        report = Code.import_file(data_manager, file_key, paths[file_key])
+        if report['imported'] != report['rows']:
+            raise AssertionError(file_key + " rejected rows: " + str(report['errors'][:3]))
+        print("%-10s %10d %10d %10.2f %12.0f %10s" % (file_key, report['rows'], report['rejected'], report['seconds'],
+                                                     report['rows_per_second'], "%.0f" % report['peak_memory_mb']
+                                                     if report['peak_memory_mb'] is not None else "-"))
+    data_manager.close()
+    shutil.rmtree(path)
+
+    # The old way: one add_booking call and one write per row
+    print("Row by row add_booking (" + str(row_by_row) + " rows)")
+    for storage_mode in ('journal', 'snapshot'):
+        path = use_temp_data_dir()
+        data_manager = DataManager(storage_mode, background_writes=False)
+        Code.import_file(data_manager, 'customers', paths['customers'])
+        rows = Code.read_rows(paths['bookings'])
+        start = time.perf_counter()
+        for _, row in zip(range(row_by_row), rows):
+            data_manager.add_booking(Code.booking_from_row(row))
+        elapsed = time.perf_counter() - start
+        print("%-10s %10d rows %10.0f rows/s" % (storage_mode, row_by_row, row_by_row / elapsed))
+        data_manager.close()
+        shutil.rmtree(path)
+    shutil.rmtree(folder)
+
+
+# Export bookings, tickets and payments the way the nightly finance
+# extract does, with bookings joined to customer and event names
+def benchmark_bulk_export(count=1000000, customers=10000):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+
+    # Put the records straight into memory, only the export is measured
+    data_manager.customers = [Code.Customer("Customer " + str(user_id), user_id, "secret", "c" + str(user_id) + "@example.com",
+                                            datetime.now(), "Abu Dhabi", "0500000000", "") for user_id in range(100, 100 + customers)]
+    for booking_id in range(1001, 1001 + count):
+        booking, payment, tickets = make_booking(booking_id, 1, 201 + booking_id % 2, 100 + booking_id % customers)
+        data_manager.bookings.shard(booking.get_event_id()).append(booking)
+        data_manager.tickets.shard(booking.get_event_id()).extend(tickets)
+        data_manager.payments.append(payment)
+
+    print("Bulk export (" + str(count) + " rows each)")
+    print("%-10s %-6s %10s %10s %12s %10s" % ("records", "format", "rows", "seconds", "rows/s", "MB"))
+    for file_key in ('bookings', 'tickets', 'payments'):
+        for file_format in ('csv', 'jsonl'):
+            export_path = os.path.join(path, file_key + '.' + file_format)
+            start = time.perf_counter()
+            rows = Code.export_file(data_manager, file_key, export_path)
+            elapsed = time.perf_counter() - start
+            print("%-10s %-6s %10d %10.2f %12.0f %10.1f" % (file_key, file_format, rows, elapsed, rows / elapsed,
+                                                           os.path.getsize(export_path) / 1e6))
+    shutil.rmtree(path)
+
+
+# Time the work that grows with the hot data before and after the bookings
+# of past events are moved to the archive
+def measure_hot_set(path, user_id):
+    drop_page_cache(path)
+    data_manager = DataManager(background_writes=False)
+    start = time.perf_counter()
+    for file_key in ('bookings', 'tickets', 'payments'):
+        len(getattr(data_manager, file_key))
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data_manager.get_bookings_by_user_id(user_id)
+    lookup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Code.save_data(data_manager.payments, 'payments')
+    save_time = time.perf_counter() - start
+    data_manager.close()
+    return load_time, lookup_time, save_time
+
+
+def benchmark_archive(count=200000, upcoming=0.1):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    data_manager.add_event(Code.Event("Grand Prix - Monaco", 203, datetime.now() + Code.timedelta(days=60), "Circuit de Monaco", 100000))
+    with data_manager.transaction():
+        for booking_id in range(1001, 1001 + count):
+            event_id = 203 if booking_id % int(1 / upcoming) == 0 else 201 + booking_id % 2
+            save_booking(data_manager, *make_booking(booking_id, 2, event_id, 100 + booking_id % 1000))
+    for file_key in ('bookings', 'tickets', 'payments'):
+        Code.save_collection(getattr(data_manager, file_key), file_key)
+    data_manager.close()
+
+    print("Archive (" + str(count) + " bookings, " + str(int(upcoming * 100)) + "% for upcoming events)")
+    print("%-8s %10s %12s %14s %16s" % ("", "bookings", "load ms", "lookup ms", "payments save ms"))
+    before = measure_hot_set(path, 100)
+
+    data_manager = DataManager(background_writes=False)
+    start = time.perf_counter()
+    data_manager.archive_events(datetime.now())
+    archive_time = time.perf_counter() - start
+    hot_bookings = len(data_manager.bookings)
+    data_manager.close()
+    after = measure_hot_set(path, 100)
+
+    for label, bookings, times in (("before", count, before), ("after", hot_bookings, after)):
+        print("%-8s %10d %12.1f %14.2f %16.1f" % ((label, bookings) + tuple(t * 1000 for t in times)))
+    print("archiving took %.1fs" % archive_time)
+    shutil.rmtree(path)
+
+
+# Time looking records up by ID with a scan of the list, like the
+# get_*_by_id methods used to, and with the dictionary index
+def benchmark_id_lookups(count=100000, lookups=1000):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    data_manager.customers = [Code.Customer("Customer " + str(user_id), user_id, "secret", "c" + str(user_id) + "@example.com",
+                                            datetime.now(), "Abu Dhabi", "0500000000", "") for user_id in range(100, 100 + count)]
+    for booking_id in range(1001, 1001 + count):
+        booking, payment, tickets = make_booking(booking_id, 1, 201 + booking_id % 2, 100 + booking_id % count)
+        data_manager.bookings.shard(booking.get_event_id()).append(booking)
+        data_manager.payments.append(payment)
+
+    print("Lookup by ID (" + str(count) + " records, " + str(lookups) + " lookups of random IDs)")
+    print("%-10s %12s %14s %14s %10s" % ("records", "scan ms", "first index ms", "index ms", "speedup"))
+    lookups_by_collection = (
+        ('customers', 'get_user_id', data_manager.get_customer_by_id, 100),
+        ('bookings', 'get_booking_id', data_manager.get_booking_by_id, 1001),
+        ('payments', 'get_payment_id', data_manager.get_payment_by_id, 2001),
+    )
+    for file_key, getter, get_by_id, first_id in lookups_by_collection:
+        keys = [first_id + (i * 7919) % count for i in range(lookups)]
+        records = getattr(data_manager, file_key)
+
+        start = time.perf_counter()
+        for key in keys:
+            next(record for record in records if getattr(record, getter)() == key)
+        scan_time = time.perf_counter() - start
+
+        # The first lookup builds the index
+        start = time.perf_counter()
+        get_by_id(keys[0])
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            get_by_id(key)
+        index_time = time.perf_counter() - start
+        print("%-10s %12.1f %14.1f %14.3f %9.0fx" % (file_key, scan_time * 1000, build_time * 1000,
+                                                    index_time * 1000, scan_time / index_time))
+    data_manager.close()
+    shutil.rmtree(path)
+
+
+# Time what show_my_bookings does for one customer, the customer's bookings
+# and the tickets and payments of each one, with list scans like the
+# get_*_by_*_id methods used to and with the foreign key indexes
+def benchmark_foreign_key_lookups(count=100000, customers=10000, pages=20):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    for booking_id in range(1001, 1001 + count):
+        booking, payment, tickets = make_booking(booking_id, 2, 201 + booking_id % 2, 100 + booking_id % customers)
+        data_manager.bookings.shard(booking.get_event_id()).append(booking)
+        data_manager.tickets.shard(booking.get_event_id()).extend(tickets)
+        data_manager.payments.append(payment)
+
+    def scan_page(user_id):
+        for booking in [b for b in data_manager.bookings if b.get_user_id() == user_id]:
+            [t for t in data_manager.tickets if t.get_booking_id() == booking.get_booking_id()]
+            [p for p in data_manager.payments if p.get_booking_id() == booking.get_booking_id()]
+
+    def index_page(user_id):
+        for booking in data_manager.get_bookings_by_user_id(user_id):
+            data_manager.get_tickets_by_booking_id(booking.get_booking_id())
+            data_manager.get_payments_by_booking_id(booking.get_booking_id())
+
+    print("My Bookings page (" + str(count) + " bookings, " + str(count // customers) + " per customer)")
+    print("%-8s %12s %14s %14s" % ("", "pages", "first page ms", "per page ms"))
+    user_ids = [100 + (i * 7919) % customers for i in range(pages)]
+    for label, page in (("scan", scan_page), ("index", index_page)):
+        start = time.perf_counter()
+        page(user_ids[0])
+        first_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for user_id in user_ids[1:]:
+            page(user_id)
+        per_page = (time.perf_counter() - start) / (len(user_ids) - 1)
+        print("%-8s %12d %14.1f %14.3f" % (label, pages, first_time * 1000, per_page * 1000))
+    data_manager.close()
+    shutil.rmtree(path)
+
+
+# Time reading bookings in date order by sorting the collection, like the
+# booking lists used to on every render, and with the sorted date index
+def benchmark_time_ordered(count=100000, repeat=20):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    start_date = datetime(2025, 1, 1)
+    for booking_id in range(1001, 1001 + count):
+        booking, payment, tickets = make_booking(booking_id, 1, 201 + booking_id % 2)
+        # Spread the bookings over a year, out of order like imported ones
+        booking.set_booking_date(start_date + Code.timedelta(minutes=(booking_id * 7919) % (365 * 24 * 60)))
+        data_manager.bookings.shard(booking.get_event_id()).append(booking)
+    day_start, day_end = start_date + Code.timedelta(days=100), start_date + Code.timedelta(days=101)
+
+    def timed(function):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        return (time.perf_counter() - start) / repeat * 1000
+
+    print("Bookings in date order (" + str(count) + " bookings, average of " + str(repeat) + ")")
+    print("%-30s %12s %12s" % ("", "sort ms", "index ms"))
+    start = time.perf_counter()
+    data_manager.latest_bookings(1)
+    print("%-30s %12s %12.1f" % ("build index", "", (time.perf_counter() - start) * 1000))
+    print("%-30s %12.2f %12.2f" % ("all bookings, newest first",
+                                   timed(lambda: sorted(data_manager.bookings, key=lambda b: b.get_booking_date(), reverse=True)),
+                                   timed(lambda: data_manager.latest_bookings())))
+    print("%-30s %12.2f %12.3f" % ("latest 50",
+                                   timed(lambda: sorted(data_manager.bookings, key=lambda b: b.get_booking_date(), reverse=True)[:50]),
+                                   timed(lambda: data_manager.latest_bookings(50))))
+    print("%-30s %12.2f %12.3f" % ("one day",
+                                   timed(lambda: sorted((b for b in data_manager.bookings if day_start <= b.get_booking_date() < day_end),
+                                                        key=lambda b: b.get_booking_date())),
+                                   timed(lambda: data_manager.bookings_between(day_start, day_end))))
+
+    # New bookings arrive in date order and are appended to the index
+    added = 1000
+    start = time.perf_counter()
+    for booking_id in range(1001 + count, 1001 + count + added):
+        data_manager.add_booking(make_booking(booking_id, 1)[0])
+    print("%-30s %12s %12.3f" % ("add a booking (with writing)", "", (time.perf_counter() - start) / added * 1000))
+    data_manager.close()
+    shutil.rmtree(path)
+
+
+# Time updating and deleting records in a list, finding each one with
+# enumerate like the update_* and delete_* methods used to, and through
+# the RecordStore the DataManager now keeps them in
+def benchmark_updates_deletes(count=100000, changes=1000):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    payments = [make_booking(booking_id, 1)[1] for booking_id in range(1001, 1001 + count)]
+    payment_ids = [2001 + (i * 7919) % count for i in range(changes)]
+
+    def list_update(records, payment):
+        for i, p in enumerate(records):
+            if p.get_payment_id() == payment.get_payment_id():
+                records[i] = payment
+                return True
+        return False
+
+    def list_delete(records, payment_id):
+        for i, p in enumerate(records):
+            if p.get_payment_id() == payment_id:
+                del records[i]
+                return True
+        return False
+
+    print("Update and delete (" + str(count) + " payments, " + str(changes) + " of each)")
+    print("%-8s %12s %12s" % ("", "update ms", "delete ms"))
+    records = list(payments)
+    start = time.perf_counter()
+    for payment_id in payment_ids:
+        list_update(records, payments[payment_id - 2001])
+    update_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for payment_id in payment_ids:
+        list_delete(records, payment_id)
+    print("%-8s %12.1f %12.1f" % ("list", update_time * 1000, (time.perf_counter() - start) * 1000))
+
+    store = Code.RecordStore('payments', payments)
+    start = time.perf_counter()
+    for payment_id in payment_ids:
+        store.replace(payments[payment_id - 2001])
+    update_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for payment_id in payment_ids:
+        store.remove(payment_id)
+    print("%-8s %12.1f %12.1f" % ("store", update_time * 1000, (time.perf_counter() - start) * 1000))
+
+    # The same through the DataManager, including writing each change
+    data_manager.payments = payments
+    start = time.perf_counter()
+    for payment_id in payment_ids:
+        data_manager.update_payment(payments[payment_id - 2001])
+    print("%-8s %12.1f %12s" % ("manager", (time.perf_counter() - start) * 1000, ""))
+    data_manager.close()
+    shutil.rmtree(path)
+
+
+# Take IDs for new bookings in one terminal, used by benchmark_id_allocation
+def allocate_ids(path, block_size, count, start_event, results):
+    Code.DATA_DIR = path
+    Code.ID_BLOCK_SIZE = block_size
+    data_manager = DataManager(background_writes=False)
+    start_event.wait()
+    results.put([data_manager.next_id('bookings') for _ in range(count)])
+    data_manager.close()
+
+
+# Several terminals taking booking IDs at the same time
+# len(bookings) + 1001 hands out the same ID again after a delete and to
+# terminals that have not seen each other's bookings yet. The sequence
+# never does, and bigger blocks mean fewer trips to the sequence file
+def benchmark_id_allocation(terminals=4, count=5000, block_sizes=(1, 20, 100)):
+    print("ID allocation (" + str(terminals) + " terminals, " + str(count) + " IDs each)")
+    print("%-8s %10s %14s %12s" % ("block", "seconds", "IDs/s", "duplicates"))
+    for block_size in block_sizes:
+        path = use_temp_data_dir()
+        DataManager(background_writes=False).close() # Create the sample data once
+
+        start_event = multiprocessing.Event()
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=allocate_ids, args=(path, block_size, count, start_event, results))
+                     for _ in range(terminals)]
+        for process in processes:
+            process.start()
+        time.sleep(0.5) # Let every terminal start up before the clock starts
+        start = time.perf_counter()
+        start_event.set()
+        ids = []
+        for _ in processes:
+            ids.extend(results.get())
+        elapsed = time.perf_counter() - start
+        for process in processes:
+            process.join()
+
+        duplicates = len(ids) - len(set(ids))
+        if duplicates:
+            raise AssertionError("%d IDs were given out twice" % duplicates)
+        print("%-8d %10.2f %14.0f %12d" % (block_size, elapsed, len(ids) / elapsed, duplicates))
+        shutil.rmtree(path)
+
+
+# The same filters written as a list comprehension over every booking and
+# as a query, with the index the query planner picked for each
+def benchmark_queries(count=100000, customers=1000, repeat=20):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    start_date = datetime(2025, 1, 1)
+    for booking_id in range(1001, 1001 + count):
+        booking = make_booking(booking_id, 1, 201 + booking_id % 4, 100 + booking_id % customers)[0]
+        booking.set_booking_date(start_date + Code.timedelta(minutes=(booking_id * 7919) % (365 * 24 * 60)))
+        if booking_id % 10 == 0:
+            booking.set_booking_status(BookingStatus.CANCELLED)
+        data_manager.bookings.shard(booking.get_event_id()).append(booking)
+    day_start, day_end = start_date + Code.timedelta(days=100), start_date + Code.timedelta(days=101)
+    confirmed = BookingStatus.CONFIRMED
+    date_of = methodcaller('get_booking_date')
+
+    def timed(function):
+        function() # Build the indexes first
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        return (time.perf_counter() - start) / repeat * 1000
+
+    cases = [
+        ("event, confirmed, first 50",
+         lambda: sorted((b for b in data_manager.bookings if b.get_event_id() == 202 and b.get_booking_status() == confirmed), key=date_of)[:50],
+         data_manager.query(Booking).where(event_id=202, status=confirmed).order_by('booking_date').limit(50)),
+        ("one customer, newest first",
+         lambda: sorted((b for b in data_manager.bookings if b.get_user_id() == 150), key=date_of, reverse=True),
+         data_manager.query(Booking).where(user_id=150).order_by('booking_date', descending=True)),
+        ("one day, confirmed",
+         lambda: [b for b in data_manager.bookings if day_start <= b.get_booking_date() < day_end and b.get_booking_status() == confirmed],
+         data_manager.query(Booking).between('booking_date', day_start, day_end).where(status=confirmed)),
+        ("latest 10 cancelled",
+         lambda: sorted((b for b in data_manager.bookings if b.get_booking_status() == BookingStatus.CANCELLED), key=date_of, reverse=True)[:10],
+         data_manager.query(Booking).where(status=BookingStatus.CANCELLED).order_by('booking_date', descending=True).limit(10)),
+        ("all over 2 tickets",
+         lambda: [b for b in data_manager.bookings if b.get_number_of_tickets() > 2],
+         data_manager.query(Booking).filter(lambda b: b.get_number_of_tickets() > 2)),
+    ]
+
+    print("Queries (" + str(count) + " bookings, average of " + str(repeat) + ")")
+    print("%-28s %12s %12s  %s" % ("", "list ms", "query ms", "plan"))
+    for name, comprehension, query in cases:
+        if len(comprehension()) != query.count():
+            raise AssertionError("The query for " + name + " found different bookings")
+        print("%-28s %12.2f %12.3f  %s" % (name, timed(comprehension), timed(query.all), query.explain()))
+    data_manager.close()
+    shutil.rmtree(path)
+
+
+# Build a customer with a made up name, email, phone number and address
+def make_customer(user_id, first_names, last_names, cities):
+    first = first_names[user_id % len(first_names)]
+    last = last_names[(user_id // len(first_names)) % len(last_names)]
+    return Code.Customer(first + " " + last, user_id, "secret",
+                         first.lower() + "." + last.lower() + str(user_id) + "@example.com", datetime(2024, 1, 1),
+                         str(user_id % 500) + " " + last + " Street, " + cities[user_id % len(cities)],
+                         "050-" + str(1000000 + user_id * 37 % 9000000), "")
+
+
+# Find customers in Manage Users by scanning every one of them for the
+# words of a search, and with the SearchIndex of the DataManager
+def benchmark_customer_search(count=200000, repeat=20):
+    path = use_temp_data_dir()
+    data_manager = DataManager(background_writes=False)
+    first_names = ["Ahmed", "Fatima", "John", "Maria", "Omar", "Aisha", "Liam", "Sara", "Yusuf", "Emma",
+                   "Khalid", "Noor", "Lucas", "Mariam", "Ali", "Hana", "James", "Layla", "Hassan", "Olivia"]
+    last_names = ["Al Mansoori", "Smith", "Khan", "Garcia", "Haddad", "Brown", "Al Nuaimi", "Rossi", "Patel",
+                  "Nguyen", "Al Zaabi", "Murphy", "Schmidt", "Silva", "Kowalski", "Tanaka", "Dubois", "Ahmed"]
+    cities = ["Abu Dhabi", "Dubai", "Sharjah", "Al Ain", "Ajman", "Fujairah"]
+    data_manager.customers = [make_customer(user_id, first_names, last_names, cities) for user_id in range(100, 100 + count)]
+    sample = data_manager.get_customer_by_id(100 + count // 2)
+    searches = ["john smith", "fatima khan dubai", "ahm", sample.get_user_email(),
+                sample.get_customer_phone(), sample.get_customer_phone().replace("-", ""), "zzz"]
+
+    def scan(text):
+        words = Code.tokenize(text)
+        found = []
+        for customer in data_manager.customers:
+            customer_words = [word for getter in Code.SEARCH_FIELDS['customers']
+                              for word in Code.search_words(getattr(customer, getter)())]
+            if all(any(word == other or other.startswith(word) for other in customer_words) for word in words):
+                found.append(customer)
+        return found
+
+    def timed(function, times=repeat):
+        start = time.perf_counter()
+        for _ in range(times):
+            function()
+        return (time.perf_counter() - start) / times * 1000
+
+    print("Customer search (" + str(count) + " customers, index average of " + str(repeat) + ")")
+    start = time.perf_counter()
+    data_manager.search_customers("")
+    data_manager._get_index('customers', 'search')
+    print("%-22s %12s %12.1f" % ("build index", "", (time.perf_counter() - start) * 1000))
+    print("%-22s %12s %12s %10s" % ("search", "scan ms", "index ms", "matches"))
+    for text in searches:
+        matches = data_manager.search_customers(text, None)
+        if len(matches) != len(scan(text)):
+            raise AssertionError("The search for " + text + " found different customers")
+        print("%-22s %12.1f %12.3f %10d" % (text[:22], timed(lambda: scan(text), 1), timed(lambda: data_manager.search_customers(text)), len(matches)))
+
+    # The index is kept up to date by add_customer, update_customer and delete_customer
+    added = 1000
+    start = time.perf_counter()
+    for user_id in range(100 + count, 100 + count + added):
+        data_manager.add_customer(make_customer(user_id, first_names, last_names, cities))
+    print("%-22s %12s %12.3f" % ("add a customer", "", (time.perf_counter() - start) / added * 1000))
+    data_manager.close()
+    shutil.rmtree(path)
+
+
+BENCHMARKS = {
+    'booking_write_volume': benchmark_booking_write_volume,
+    'startup_time': benchmark_startup_time,
+    'parallel_load': benchmark_parallel_load,
+    'serializers': benchmark_serializers,
+    'compact_state': benchmark_compact_state,
+    'compression': benchmark_compression,
+    'concurrent_terminals': benchmark_concurrent_terminals,
+    'bulk_import': benchmark_bulk_import,
+    'bulk_export': benchmark_bulk_export,
+    'archive': benchmark_archive,
+    'id_lookups': benchmark_id_lookups,
+    'foreign_key_lookups': benchmark_foreign_key_lookups,
+    'time_ordered': benchmark_time_ordered,
+    'updates_deletes': benchmark_updates_deletes,
+    'id_allocation': benchmark_id_allocation,
+    'queries': benchmark_queries,
+    'customer_search': benchmark_customer_search,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        start = time.perf_counter()
+        BENCHMARKS[name]()
+        print("(" + name + " took %.1fs)" % (time.perf_counter() - start))
+        print()
+
+
+if __name__ == "__main__":
+    main()
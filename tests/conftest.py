@@ -0,0 +1,33 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Code
+
+
+# Point the data folder at an empty temporary folder for each test
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    path = str(tmp_path / 'data')
+    monkeypatch.setattr(Code, 'DATA_DIR', path)
+    monkeypatch.setattr(Code, 'CHANGE_FEED', False)
+    Code.REPLAY_TIMES.clear()
+    return path
+
+
+# A DataManager on the temporary data folder that writes straight away
+@pytest.fixture
+def data_manager(data_dir):
+    manager = Code.DataManager(background_writes=False)
+    yield manager
+    manager.close()
+
+
+def make_customer(user_id, name=None):
+    name = name or "Customer " + str(user_id)
+    return Code.Customer(name, user_id, "secret", "c" + str(user_id) + "@example.com",
+                         datetime(2024, 1, 1), "Abu Dhabi", "0500000" + str(user_id), "Visa")
@@ -0,0 +1,90 @@
+import os
+
+import Code
+from conftest import make_customer
+
+
+def names(records):
+    return [record.get_user_name() for record in records]
+
+
+def test_log_is_replayed_over_snapshot(data_dir):
+    Code.save_data([make_customer(1), make_customer(2)], 'customers')
+    Code.append_log('customers', [('update', 1, make_customer(1, "Changed"))])
+    Code.append_log('customers', [('delete', 2, None), ('add', 3, make_customer(3))])
+
+    records = Code.load_data('customers')
+
+    assert names(records) == ["Changed", "Customer 3"]
+
+
+def test_replaying_an_entry_twice_gives_the_same_records(data_dir):
+    Code.save_data([make_customer(1)], 'customers')
+    entries = [('add', 2, make_customer(2)), ('update', 1, make_customer(1, "Changed"))]
+    Code.append_log('customers', entries)
+    Code.append_log('customers', entries)
+
+    assert names(Code.load_data('customers')) == ["Changed", "Customer 2"]
+
+
+def test_torn_last_log_entry_is_dropped(data_dir):
+    Code.save_data([make_customer(1)], 'customers')
+    Code.append_log('customers', [('add', 2, make_customer(2))])
+    Code.append_log('customers', [('add', 3, make_customer(3))])
+
+    # Cut the last entry in half as a crash in the middle of a write would
+    log_path = Code.get_log_path('customers')
+    size = os.path.getsize(log_path)
+    with open(log_path, 'r+b') as file:
+        file.seek(0, os.SEEK_END)
+        file.truncate(size - 10)
+
+    assert names(Code.load_data('customers')) == ["Customer 1", "Customer 2"]
+
+    # The damaged part is cut off so later changes can be read again
+    Code.append_log('customers', [('add', 4, make_customer(4))])
+    assert names(Code.load_data('customers')) == ["Customer 1", "Customer 2", "Customer 4"]
+
+
+def test_partial_entry_with_garbage_is_dropped(data_dir):
+    Code.append_log('customers', [('add', 1, make_customer(1))])
+    with open(Code.get_log_path('customers'), 'ab') as file:
+        file.write(b'\x80\x04\x95garbage')
+
+    assert names(Code.load_data('customers')) == ["Customer 1"]
+
+
+def test_snapshot_without_log(data_dir):
+    Code.save_data([make_customer(1), make_customer(2)], 'customers')
+
+    assert not os.path.exists(Code.get_log_path('customers'))
+    assert names(Code.load_data('customers')) == ["Customer 1", "Customer 2"]
+
+
+def test_log_without_snapshot(data_dir):
+    Code.append_log('customers', [('add', 1, make_customer(1))])
+
+    assert names(Code.load_data('customers')) == ["Customer 1"]
+
+
+def test_saving_a_snapshot_drops_the_log(data_dir):
+    Code.append_log('customers', [('add', 1, make_customer(1))])
+    Code.save_data(Code.load_data('customers'), 'customers')
+
+    assert not os.path.exists(Code.get_log_path('customers'))
+    assert names(Code.load_data('customers')) == ["Customer 1"]
+
+
+def test_data_manager_changes_survive_reopening(data_dir):
+    manager = Code.DataManager(background_writes=False)
+    manager.add_customer(make_customer(100))
+    manager.update_customer(make_customer(100, "Changed"))
+    manager.add_customer(make_customer(101))
+    manager.delete_customer(101)
+    manager.close()
+
+    manager = Code.DataManager(background_writes=False)
+    try:
+        assert names(manager.customers) == ["Changed"]
+    finally:
+        manager.close()
@@ -0,0 +1,126 @@
+import threading
+
+import Code
+from conftest import make_customer
+
+
+def ids(records):
+    return sorted(record.get_user_id() for record in records)
+
+
+def test_writes_of_two_managers_are_merged(data_dir):
+    first = Code.DataManager(background_writes=False)
+    second = Code.DataManager(background_writes=False)
+    try:
+        # Load the collection in both before either writes
+        assert list(first.customers) == list(second.customers) == []
+
+        first.add_customer(make_customer(100))
+        second.add_customer(make_customer(200))
+        first.add_customer(make_customer(101))
+        second.update_customer(make_customer(200, "Changed"))
+
+        # Each sees the other's writes once it writes again
+        assert ids(second.customers) == [100, 101, 200]
+        assert first.get_customer_by_id(200).get_user_name() == "Customer 200"
+        first.add_customer(make_customer(102))
+        assert ids(first.customers) == [100, 101, 102, 200]
+        assert first.get_customer_by_id(200).get_user_name() == "Changed"
+    finally:
+        first.close()
+        second.close()
+
+    assert ids(Code.load_data('customers')) == [100, 101, 102, 200]
+
+
+def test_writes_of_two_managers_survive_compaction(data_dir):
+    first = Code.DataManager(background_writes=False)
+    second = Code.DataManager(background_writes=False)
+    try:
+        list(first.customers)
+        list(second.customers)
+        first.add_customer(make_customer(100))
+        first.compact()
+
+        # The second manager merges from the new snapshot and keeps its own
+        second.add_customer(make_customer(200))
+        second.compact()
+        first.add_customer(make_customer(101))
+        first.delete_customer(100)
+        second.update_customer(make_customer(200, "Changed"))
+        first.compact()
+        second.compact()
+    finally:
+        first.close()
+        second.close()
+
+    records = Code.load_data('customers')
+    assert ids(records) == [101, 200]
+    assert [c.get_user_name() for c in records if c.get_user_id() == 200] == ["Changed"]
+
+
+def test_changes_made_during_a_merge_are_kept(data_dir):
+    first = Code.DataManager(background_writes=True)
+    second = Code.DataManager(background_writes=False)
+    try:
+        list(first.customers)
+        # The other manager compacts often, so merges reload the snapshot
+        for user_id in range(200, 260):
+            second.add_customer(make_customer(user_id))
+            second.compact()
+
+        def other():
+            for user_id in range(260, 320):
+                second.add_customer(make_customer(user_id))
+                second.compact()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        for user_id in range(100, 160):
+            first.add_customer(make_customer(user_id))
+        thread.join()
+        first.flush()
+        assert set(range(100, 160)) <= set(ids(first.customers))
+    finally:
+        first.close()
+        second.close()
+
+    assert ids(Code.load_data('customers')) == list(range(100, 160)) + list(range(200, 320))
+
+
+def test_merge_during_an_add_keeps_the_new_record(data_dir, monkeypatch):
+    first = Code.DataManager(background_writes=False)
+    second = Code.DataManager(background_writes=False)
+    try:
+        store = first.customers
+        list(second.customers)
+        second.add_customer(make_customer(200))
+        second.compact()
+
+        # Merge the new snapshot from another thread right after the record
+        # is added to the store, as the background writer could
+        append = store.append
+        threads = []
+
+        def merge():
+            with Code.lock_files('customers'):
+                first._merge_other_writes('customers', None)
+
+        def append_and_merge(record):
+            append(record)
+            thread = threading.Thread(target=merge)
+            thread.start()
+            thread.join(0.2)
+            threads.append(thread)
+
+        monkeypatch.setattr(store, 'append', append_and_merge)
+        first.add_customer(make_customer(100))
+        for thread in threads:
+            thread.join()
+
+        assert ids(first.customers) == [100, 200]
+    finally:
+        first.close()
+        second.close()
+
+    assert ids(Code.load_data('customers')) == [100, 200]
@@ -0,0 +1,154 @@
+import pytest
+
+import Code
+from conftest import make_customer
+
+
+# A write function that fails while failing is True and otherwise keeps
+# what it was given, taking it out of the dictionary like _write_pending
+class FlakyWriter:
+    def __init__(self, failing=False):
+        self.failing = failing
+        self.calls = 0
+        self.written = []
+
+    def __call__(self, pending):
+        self.calls += 1
+        if self.failing:
+            raise OSError("disk full")
+        for unit in list(pending):
+            self.written.extend(pending.pop(unit))
+
+
+def test_wait_raises_when_a_write_fails():
+    writer = FlakyWriter(failing=True)
+    worker = Code.PersistenceWorker(writer, commit_window=0)
+    worker.submit({'a': [1]})
+    with pytest.raises(OSError):
+        worker.wait()
+    writer.failing = False
+    worker.close()
+
+
+def test_failed_changes_are_written_by_the_next_wait():
+    writer = FlakyWriter(failing=True)
+    worker = Code.PersistenceWorker(writer, commit_window=0)
+    worker.submit({'a': [1]})
+    with pytest.raises(OSError):
+        worker.wait()
+
+    writer.failing = False
+    assert worker.wait() is True
+    assert writer.written == [1]
+    worker.close()
+
+
+def test_failed_changes_go_first_in_the_next_write():
+    writer = FlakyWriter(failing=True)
+    worker = Code.PersistenceWorker(writer, commit_window=0)
+    worker.submit({'a': [1]})
+    with pytest.raises(OSError):
+        worker.wait()
+
+    writer.failing = False
+    worker.submit({'a': [2], 'b': [3]})
+    assert worker.wait() is True
+    assert writer.written == [1, 2, 3]
+    worker.close()
+
+
+def test_later_writes_are_not_reported_as_failed():
+    writer = FlakyWriter(failing=True)
+    worker = Code.PersistenceWorker(writer, commit_window=0)
+    worker.submit({'a': [1]})
+    with pytest.raises(OSError):
+        worker.wait()
+
+    writer.failing = False
+    worker.submit({'a': [2]})
+    worker.wait()
+    worker.submit({'a': [3]})
+    assert worker.wait() is True
+    worker.close()
+    assert writer.written == [1, 2, 3]
+
+
+def test_close_raises_when_the_last_write_fails():
+    writer = FlakyWriter()
+    worker = Code.PersistenceWorker(writer, commit_window=0)
+    worker.submit({'a': [1]})
+    worker.wait()
+
+    writer.failing = True
+    worker.submit({'a': [2]})
+    with pytest.raises(OSError):
+        worker.close()
+    assert writer.written == [1]
+
+
+def test_close_writes_failed_changes_again():
+    writer = FlakyWriter(failing=True)
+    worker = Code.PersistenceWorker(writer, commit_window=0)
+    worker.submit({'a': [1]})
+    with pytest.raises(OSError):
+        worker.wait()
+
+    writer.failing = False
+    worker.close()
+    assert writer.written == [1]
+
+
+def test_only_unwritten_files_are_written_again():
+    calls = []
+
+    # Write the first file and fail on the second one
+    def write(pending):
+        calls.append(dict(pending))
+        if len(calls) == 1:
+            pending.pop('a')
+            raise OSError("disk full")
+        pending.clear()
+
+    worker = Code.PersistenceWorker(write, commit_window=0)
+    worker.submit({'a': [1], 'b': [2]})
+    with pytest.raises(OSError):
+        worker.wait()
+    worker.close()
+    assert calls == [{'a': [1], 'b': [2]}, {'b': [2]}]
+
+
+def test_data_manager_flush_and_close_raise_for_failed_writes(data_dir, monkeypatch):
+    manager = Code.DataManager(background_writes=True)
+    manager.flush()
+
+    def append_log(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Code, 'append_log', append_log)
+    manager.add_customer(make_customer(100))
+    with pytest.raises(OSError):
+        manager.flush()
+    with pytest.raises(OSError):
+        manager.close()
+
+
+def test_data_manager_writes_failed_changes_once_the_disk_works(data_dir, monkeypatch):
+    manager = Code.DataManager(background_writes=True)
+    manager.flush()
+
+    append_log = Code.append_log
+
+    def failing_append_log(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Code, 'append_log', failing_append_log)
+    manager.add_customer(make_customer(100))
+    with pytest.raises(OSError):
+        manager.flush()
+
+    monkeypatch.setattr(Code, 'append_log', append_log)
+    manager.add_customer(make_customer(101))
+    assert manager.flush() is True
+    manager.close()
+
+    assert sorted(c.get_user_id() for c in Code.load_data('customers')) == [100, 101]
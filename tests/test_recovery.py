@@ -0,0 +1,116 @@
+import os
+import pickle
+import threading
+from datetime import datetime
+
+import Code
+from conftest import make_customer
+
+
+def write_transaction_file(name, pending):
+    os.makedirs(Code.DATA_DIR, exist_ok=True)
+    path = os.path.join(Code.DATA_DIR, name)
+    with open(path, 'wb') as file:
+        pickle.dump(pending, file)
+    return path
+
+
+def test_interrupted_transaction_is_finished(data_dir):
+    customer = make_customer(1)
+    event = Code.Event("Monza", 900, datetime(2030, 9, 1), "Monza", 100)
+    pending = {('customers', None): [('add', 1, customer)], ('events', None): [('add', 900, event)]}
+    path = write_transaction_file('transaction-crashed.pkl', pending)
+
+    # The crash came after the first file was written and before the second
+    Code.append_log('customers', pending[('customers', None)])
+
+    Code.recover_transaction()
+
+    assert not os.path.exists(path)
+    assert [c.get_user_id() for c in Code.load_data('customers')] == [1]
+    assert [e.get_event_id() for e in Code.load_data('events')] == [900]
+
+
+def test_old_transaction_file_is_finished(data_dir):
+    pending = {'customers': [('add', 1, make_customer(1))]}
+    path = write_transaction_file(Code.TRANSACTION_FILE, pending)
+
+    Code.recover_transaction()
+
+    assert not os.path.exists(path)
+    assert [c.get_user_id() for c in Code.load_data('customers')] == [1]
+
+
+def test_damaged_transaction_file_is_ignored(data_dir):
+    path = os.path.join(data_dir, 'transaction-damaged.pkl')
+    os.makedirs(data_dir)
+    with open(path, 'wb') as file:
+        file.write(pickle.dumps({('customers', None): [('add', 1, make_customer(1))]})[:20])
+
+    Code._recover_transaction_file(path)
+
+    assert not os.path.exists(path)
+    assert Code.load_data('customers') == []
+
+
+def test_transaction_file_of_running_manager_is_left_alone(data_manager):
+    pending = {('customers', None): [('add', 1, make_customer(1))]}
+    with open(data_manager._transaction_path, 'wb') as file:
+        pickle.dump(pending, file)
+
+    Code.recover_transaction()
+
+    assert os.path.exists(data_manager._transaction_path)
+    assert Code.load_data('customers') == []
+    os.remove(data_manager._transaction_path)
+
+
+def test_transaction_is_recovered_when_the_next_manager_starts(data_dir):
+    pending = {('customers', None): [('add', 1, make_customer(1))],
+               ('events', None): [('add', 900, Code.Event("Monza", 900, datetime(2030, 9, 1), "Monza", 100))]}
+    write_transaction_file('transaction-crashed.pkl', pending)
+
+    manager = Code.DataManager(background_writes=False)
+    try:
+        assert manager.get_customer_by_id(1) is not None
+        assert manager.get_event_by_id(900) is not None
+    finally:
+        manager.close()
+
+
+def test_compaction_while_log_is_appended(data_dir):
+    Code.save_data([], 'customers')
+    count = 300
+    errors = []
+
+    def append():
+        try:
+            for user_id in range(count):
+                Code.append_log('customers', [('add', user_id, make_customer(user_id))])
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=append)
+    thread.start()
+    while thread.is_alive():
+        Code.compact_data('customers')
+    thread.join()
+
+    assert errors == []
+    assert sorted(c.get_user_id() for c in Code.load_data('customers')) == list(range(count))
+    Code.compact_data('customers')
+    assert not os.path.exists(Code.get_log_path('customers'))
+    assert len(Code.load_data('customers')) == count
+
+
+def test_background_compaction_while_manager_writes(data_manager, monkeypatch):
+    # Compact after every write so compactions and writes overlap
+    monkeypatch.setattr(Code, 'COMPACT_LOG_SIZE', 0)
+    for user_id in range(100, 300):
+        data_manager.add_customer(make_customer(user_id))
+        data_manager.update_customer(make_customer(user_id, "Changed " + str(user_id)))
+    data_manager.close()
+
+    records = Code.load_data('customers')
+    assert sorted(c.get_user_id() for c in records) == list(range(100, 300))
+    assert all(c.get_user_name() == "Changed " + str(c.get_user_id()) for c in records)